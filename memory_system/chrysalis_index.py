@@ -0,0 +1,373 @@
+"""
+Chrysalis Memory System - Memory Indexes
+Secondary indexes over the append-only memory stores
+
+Provides:
+- Token inverted index with BM25 ranking
+- Secondary indexes by memory type and importance
+- Embedding matrix for top-k cosine search (NumPy when available)
+- Incremental sync after CRDT merges (stores only grow at the tail;
+  items merged in place are re-indexed)
+"""
+
+import heapq
+import math
+import re
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens used by the inverted index"""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class MemoryIndex:
+    """
+    Indexes for one memory store (a list that only grows at the tail)
+
+    Items are addressed by their position in the store, so positional
+    lists stay valid as long as the store is append-only. ``sync`` checks
+    that the indexed prefix still matches the store (by memory ID) and
+    indexes only the new tail; anything else triggers a full rebuild.
+    CRDT merges also mutate existing items in place (e.g. a semantic
+    memory gains alternate phrasings), so each position keeps a digest of
+    its indexed values and ``sync`` re-indexes prefix items whose digest
+    changed.
+
+    - Inverted index: term -> {position: term frequency}, scored with
+      Okapi BM25 (k1, b)
+    - By type: memory type -> ascending positions
+    - By importance: sorted (importance, position) pairs
+    - Embeddings: L2-normalized rows in a growable float32 matrix
+    """
+
+    def __init__(
+        self,
+        key: Callable[[Any], str],
+        text: Optional[Callable[[Any], str]] = None,
+        kind: Optional[Callable[[Any], Any]] = None,
+        importance: Optional[Callable[[Any], float]] = None,
+        embedding: Optional[Callable[[Any], Optional[Sequence[float]]]] = None,
+        k1: float = 1.5,
+        b: float = 0.75,
+    ):
+        """
+        Initialize an empty index
+
+        Args:
+            key: Stable identifier of an item (memoryId / knowledgeId)
+            text: Text to index for BM25 (None disables the inverted index)
+            kind: Value for the type index (None disables it)
+            importance: Value for the importance index (None disables it)
+            embedding: Item embedding (None disables vector search)
+            k1: BM25 term frequency saturation
+            b: BM25 length normalization
+        """
+        self._key = key
+        self._text = text
+        self._kind = kind
+        self._importance = importance
+        self._embedding = embedding
+        self.k1 = k1
+        self.b = b
+        self.clear()
+
+    def clear(self):
+        """Drop all indexed items"""
+        self.items: List[Any] = []
+        self._ids: List[str] = []
+        self._digests: List[Tuple[Any, ...]] = []  # Indexed values per position
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._lengths: List[int] = []
+        self._total_length = 0
+        self._by_kind: Dict[Any, List[int]] = {}
+        self._by_importance: List[Tuple[float, int]] = []
+        self._dimension: Optional[int] = None
+        self._matrix = None  # NumPy rows (capacity grows by doubling)
+        self._vectors: List[Optional[Tuple[float, ...]]] = []  # Fallback without NumPy
+        self._has_vector: List[bool] = []
+        self._vector_mask = None  # NumPy copy of _has_vector, rebuilt after adds
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    # ==========================================================================
+    # Maintenance
+    # ==========================================================================
+
+    def add(self, item: Any):
+        """Index an item appended to the end of the store"""
+        position = len(self.items)
+        digest = self._digest(item)
+        text, kind, importance, vector = digest
+        self.items.append(item)
+        self._ids.append(self._key(item))
+        self._digests.append(digest)
+
+        if self._text is not None:
+            self._lengths.append(0)
+            self._index_text(position, text)
+
+        if self._kind is not None:
+            self._by_kind.setdefault(kind, []).append(position)
+
+        if self._importance is not None:
+            insort(self._by_importance, (importance, position))
+
+        if self._embedding is not None:
+            self._has_vector.append(False)
+            if np is None:
+                self._vectors.append(None)
+            self._set_vector(position, vector)
+
+    def _reindex(self, position: int, item: Any, digest: Tuple[Any, ...]):
+        """Update the indexes of an item whose indexed values changed in place"""
+        old_text, old_kind, old_importance, old_vector = self._digests[position]
+        text, kind, importance, vector = digest
+        self.items[position] = item
+        self._digests[position] = digest
+
+        if text != old_text:
+            for term in set(tokenize(old_text)):
+                posting = self._postings[term]
+                del posting[position]
+                if not posting:
+                    del self._postings[term]
+            self._index_text(position, text)
+
+        if kind != old_kind:
+            self._by_kind[old_kind].remove(position)
+            insort(self._by_kind.setdefault(kind, []), position)
+
+        if importance != old_importance:
+            self._by_importance.remove((old_importance, position))
+            insort(self._by_importance, (importance, position))
+
+        if vector is not old_vector:
+            self._set_vector(position, vector)
+
+    def _digest(self, item: Any) -> Tuple[Any, ...]:
+        """
+        (text, kind, importance, embedding) as indexed for an item
+
+        The embedding is compared by identity: merges replace vectors
+        rather than editing them.
+        """
+        return (
+            (self._text(item) or "") if self._text is not None else "",
+            self._kind(item) if self._kind is not None else None,
+            self._importance(item) if self._importance is not None else None,
+            self._embedding(item) if self._embedding is not None else None,
+        )
+
+    def _index_text(self, position: int, text: str):
+        counts = Counter(tokenize(text))
+        for term, tf in counts.items():
+            self._postings.setdefault(term, {})[position] = tf
+        length = sum(counts.values())
+        self._total_length += length - self._lengths[position]
+        self._lengths[position] = length
+
+    def sync(self, items: List[Any]) -> int:
+        """
+        Bring the index in line with the store
+
+        Returns:
+            Number of items (re)indexed
+        """
+        indexed = len(self.items)
+        if len(items) < indexed or any(
+            self._key(items[i]) != self._ids[i] for i in range(indexed)
+        ):
+            self.rebuild(items)
+            return len(items)
+        # Same objects may have been replaced by merged copies or merged in place
+        changed = 0
+        for position in range(indexed):
+            item = items[position]
+            digest = self._digest(item)
+            if digest != self._digests[position]:
+                self._reindex(position, item, digest)
+                changed += 1
+            else:
+                self.items[position] = item
+        for item in items[indexed:]:
+            self.add(item)
+        return changed + len(items) - indexed
+
+    def rebuild(self, items: Iterable[Any]):
+        """Rebuild every index from the store"""
+        self.clear()
+        for item in items:
+            self.add(item)
+
+    def _set_vector(self, position: int, vector: Optional[Sequence[float]]):
+        if vector is not None and len(vector) and self._dimension is None:
+            self._dimension = len(vector)
+        usable = vector is not None and len(vector) == self._dimension
+        norm = math.sqrt(sum(x * x for x in vector)) if usable else 0.0
+        usable = usable and norm > 0.0
+        self._has_vector[position] = usable
+        self._vector_mask = None
+
+        if np is None:
+            self._vectors[position] = tuple(x / norm for x in vector) if usable else None
+            return
+        if self._dimension is None:
+            return
+        if self._matrix is None:
+            self._matrix = np.zeros((max(64, len(self.items)), self._dimension), dtype=np.float32)
+        elif position >= self._matrix.shape[0]:
+            grown = np.zeros((self._matrix.shape[0] * 2, self._dimension), dtype=np.float32)
+            grown[:self._matrix.shape[0]] = self._matrix
+            self._matrix = grown
+        if usable:
+            self._matrix[position] = np.asarray(vector, dtype=np.float32) / norm
+        else:
+            self._matrix[position] = 0.0
+
+    # ==========================================================================
+    # Queries
+    # ==========================================================================
+
+    def select(
+        self,
+        kind: Any = None,
+        min_importance: float = 0.0
+    ) -> Optional[List[int]]:
+        """
+        Positions matching the filters, in store order
+
+        Returns:
+            Ascending positions, or None when no filter applies
+        """
+        by_kind = self._by_kind.get(kind, []) if kind is not None else None
+        by_importance = None
+        if min_importance > 0.0:
+            start = bisect_left(self._by_importance, (min_importance, -1))
+            by_importance = self._by_importance[start:]
+
+        if by_kind is None and by_importance is None:
+            return None
+        if by_importance is None:
+            return by_kind
+        if by_kind is None:
+            return sorted(position for _, position in by_importance)
+        # Filter the smaller candidate set by the other predicate
+        if len(by_kind) <= len(by_importance):
+            return [p for p in by_kind if self._importance(self.items[p]) >= min_importance]
+        return sorted(p for _, p in by_importance if self._kind(self.items[p]) == kind)
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = 10,
+        candidates: Optional[Iterable[int]] = None,
+        match_all: bool = False
+    ) -> List[Tuple[int, float]]:
+        """
+        BM25 search over the inverted index
+
+        Args:
+            query: Free-text query
+            limit: Maximum results (None for all matches)
+            candidates: Restrict to these positions
+            match_all: Only return items containing every query term
+
+        Returns:
+            (position, score) pairs, best first
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not self.items:
+            return []
+        postings = [self._postings.get(term) for term in terms]
+        if match_all and not all(postings):
+            return []
+
+        allowed = set(candidates) if candidates is not None else None
+        if match_all:
+            # Intersect starting from the rarest term
+            ordered = sorted(postings, key=len)
+            matched = set(ordered[0]) if allowed is None else allowed.intersection(ordered[0])
+            for posting in ordered[1:]:
+                matched.intersection_update(posting)
+            allowed = matched
+            if not allowed:
+                return []
+
+        n = len(self.items)
+        avg_length = self._total_length / n if n else 0.0
+        k1, b = self.k1, self.b
+        lengths = self._lengths
+        scores: Dict[int, float] = {}
+        for posting in postings:
+            if not posting:
+                continue
+            df = len(posting)
+            idf = math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+            for position, tf in posting.items():
+                if allowed is not None and position not in allowed:
+                    continue
+                norm = k1 * (1.0 - b + b * lengths[position] / avg_length) if avg_length else k1
+                scores[position] = scores.get(position, 0.0) + idf * tf * (k1 + 1.0) / (tf + norm)
+
+        key = lambda pair: (pair[1], -pair[0])
+        if limit is None:
+            return sorted(scores.items(), key=key, reverse=True)
+        return heapq.nlargest(limit, scores.items(), key=key)
+
+    def search_vectors(
+        self,
+        query: Sequence[float],
+        limit: int = 10,
+        candidates: Optional[List[int]] = None
+    ) -> List[Tuple[int, float]]:
+        """
+        Top-k cosine similarity over indexed embeddings
+
+        Returns:
+            (position, similarity) pairs, best first
+        """
+        if self._dimension is None or limit <= 0:
+            return []
+        if len(query) != self._dimension:
+            raise ValueError(f"Query has dimension {len(query)}, index has {self._dimension}")
+        norm = math.sqrt(sum(x * x for x in query))
+        if norm == 0.0:
+            return []
+
+        if np is None:
+            positions = candidates if candidates is not None else range(len(self.items))
+            unit = [x / norm for x in query]
+            scored = (
+                (p, sum(a * b for a, b in zip(unit, self._vectors[p])))
+                for p in positions if self._vectors[p] is not None
+            )
+            return heapq.nlargest(limit, scored, key=lambda pair: pair[1])
+
+        unit = np.asarray(query, dtype=np.float32) / norm
+        if self._vector_mask is None:
+            self._vector_mask = np.asarray(self._has_vector, dtype=bool)
+        has_vector = self._vector_mask
+        if candidates is None:
+            rows = np.flatnonzero(has_vector)
+        else:
+            rows = np.asarray(candidates, dtype=np.int64)
+            rows = rows[has_vector[rows]] if len(rows) else rows
+        if not len(rows):
+            return []
+        similarities = self._matrix[rows] @ unit
+        k = min(limit, len(rows))
+        top = np.argpartition(-similarities, k - 1)[:k]
+        top = top[np.argsort(-similarities[top], kind="stable")]
+        return [(int(rows[i]), float(similarities[i])) for i in top]
@@ -5,11 +5,13 @@ Combines all universal patterns into unified memory interface
 This is the production-ready Chrysalis-native memory system
 """
 
-from typing import List, Dict, Optional, Set
+from typing import Any, Iterable, List, Dict, Optional, Set, Tuple, Union
 from datetime import datetime
 from dataclasses import asdict
 
 from .chrysalis_types import (
+    MemoryFingerprint,
+    MemorySignature,
     MemoryType,
     MemorySource,
     WorkingMemory,
@@ -23,10 +25,11 @@ from .chrysalis_types import (
     ByzantineValidation,
     CRDTMetadata,
 )
-from .identity import MemoryIdentity, KeyPairManager
+from .identity import MemoryIdentity, KeyPairManager, MemorySigner, SignatureVerifier
 from .gossip import MemoryGossipProtocol, GossipConfig, GossipPeer
 from .byzantine import ByzantineMemoryValidator, ValidationVote
 from .crdt_merge import MemoryCRDTMerger
+from .chrysalis_index import MemoryIndex
 
 
 class ChrysalisMemory:
@@ -43,6 +46,10 @@ class ChrysalisMemory:
     - Pattern #9 (Time): Logical time ordering
     - Pattern #10 (CRDT): Conflict-free merging
     
+    Retrieval is served from MemoryIndex instances (inverted index with
+    BM25, type and importance indexes, embedding matrix) maintained on
+    create_* and re-synced whenever the state is replaced (load, merge).
+    
     This is NOT a traditional memory system - it's memory built on
     universal patterns from distributed systems, cryptography, and nature.
     """
@@ -72,6 +79,9 @@ class ChrysalisMemory:
         self.instance_index = instance_index
         self.total_instances = total_instances
         
+        # Last wall time handed out; fingerprints hash it (see _next_timestamp)
+        self._last_timestamp = 0.0
+        
         # Generate or use provided keypair (Pattern #2)
         if private_key is None:
             self.private_key, self.public_key = KeyPairManager.generate_keypair()
@@ -79,6 +89,24 @@ class ChrysalisMemory:
             self.private_key = private_key
             self.public_key = KeyPairManager.public_key_from_private(private_key)
         
+        # Retrieval indexes (Pattern #10 stores are append-only)
+        self._working_index = MemoryIndex(
+            key=lambda m: m.memoryId,
+            kind=lambda m: m.memoryType,
+            importance=lambda m: m.importance,
+        )
+        self._episodic_index = MemoryIndex(
+            key=lambda m: m.memoryId,
+            text=lambda m: m.content,
+            kind=lambda m: m.memoryType,
+            importance=lambda m: m.importance,
+            embedding=lambda m: m.embedding,
+        )
+        self._semantic_index = MemoryIndex(
+            key=lambda k: k.knowledgeId,
+            text=lambda k: " ".join([k.fact, *k.alternatePhrasings]),
+        )
+        
         # Initialize memory state
         self.state = MemoryState(
             instanceId=instance_id,
@@ -94,6 +122,50 @@ class ChrysalisMemory:
         
         # Initialize validator (Pattern #8)
         self.validator = ByzantineMemoryValidator()
+        
+        # Signing key loaded once; verification is lazy and cached (Pattern #2)
+        self.signer = MemorySigner(self.private_key, instance_id)
+        self.verifier = SignatureVerifier()
+    
+    @property
+    def state(self) -> MemoryState:
+        """Memory state (assigning a new state re-syncs the indexes)"""
+        return self._state
+    
+    @state.setter
+    def state(self, state: MemoryState):
+        self._state = state
+        self.sync_indexes()
+    
+    def sync_indexes(self):
+        """
+        Bring the retrieval indexes in line with the state
+        
+        Memories appended since the last sync (e.g. by a CRDT merge) are
+        indexed incrementally; a store that no longer extends the indexed
+        prefix is re-indexed from scratch.
+        """
+        self._working_index.sync(self._state.workingMemories)
+        self._episodic_index.sync(self._state.episodicMemories)
+        self._semantic_index.sync(self._state.semanticMemories)
+    
+    def _next_timestamp(self) -> float:
+        """
+        Wall time for a new memory, strictly increasing per instance
+        
+        The fingerprint hashes content, type and timestamp, so two memories
+        with the same content created within one clock tick would otherwise
+        share a memoryId.
+        """
+        timestamp = max(datetime.now().timestamp(), self._last_timestamp + 1e-6)
+        self._last_timestamp = timestamp
+        return timestamp
+    
+    def _fresh(self, index: MemoryIndex, memories: List) -> MemoryIndex:
+        """Pick up memories appended to the state directly"""
+        if len(index) != len(memories):
+            index.sync(memories)
+        return index
     
     # ==========================================================================
     # Core Memory Creation (Pattern #1 + #2 + #9)
@@ -115,7 +187,7 @@ class ChrysalisMemory:
         - Pattern #5: Causality (DAG)
         """
         # Generate fingerprint (Pattern #1)
-        timestamp = datetime.now().timestamp()
+        timestamp = self._next_timestamp()
         fingerprint = MemoryIdentity.generate_fingerprint(
             content,
             memory_type.value,
@@ -140,11 +212,7 @@ class ChrysalisMemory:
         )
         
         # Sign memory (Pattern #2)
-        signature = MemoryIdentity.sign_memory(
-            fingerprint.fingerprint,
-            self.private_key,
-            self.instance_id
-        )
+        signature = self.signer.sign(fingerprint.fingerprint)
         
         # Create memory
         memory = WorkingMemory(
@@ -161,7 +229,9 @@ class ChrysalisMemory:
         )
         
         # Add to working memory
+        self._fresh(self._working_index, self.state.workingMemories)
         self.state.workingMemories.append(memory)
+        self._working_index.add(memory)
         
         return memory
     
@@ -172,7 +242,8 @@ class ChrysalisMemory:
         memory_type: MemoryType = MemoryType.OBSERVATION,
         source: MemorySource = MemorySource.AGENT,
         importance: float = 0.5,
-        parent_memories: List[str] = None
+        parent_memories: List[str] = None,
+        embedding: Optional[List[float]] = None
     ) -> EpisodicMemory:
         """
         Create episodic memory with:
@@ -183,13 +254,95 @@ class ChrysalisMemory:
         - Pattern #10: CRDT metadata
         """
         # Generate fingerprint
-        timestamp = datetime.now().timestamp()
+        timestamp = self._next_timestamp()
         fingerprint = MemoryIdentity.generate_fingerprint(
             content,
             memory_type.value,
             timestamp
         )
         
+        # Sign memory
+        signature = self.signer.sign(fingerprint.fingerprint)
+        
+        memory = self._build_episodic(
+            fingerprint, signature, timestamp, content, summary,
+            memory_type, source, importance, parent_memories, embedding
+        )
+        
+        # Add to episodic memory
+        self._fresh(self._episodic_index, self.state.episodicMemories)
+        self.state.episodicMemories.append(memory)
+        self._episodic_index.add(memory)
+        
+        return memory
+    
+    def bulk_add(
+        self,
+        items: Iterable[Union[str, Dict[str, Any]]],
+        merkle: bool = True,
+        max_workers: Optional[int] = None
+    ) -> List[EpisodicMemory]:
+        """
+        Create many episodic memories at once (bulk import, replay)
+        
+        Each item is a content string or a dict of create_episodic_memory
+        keyword arguments (content, summary, memory_type, source,
+        importance, parent_memories, embedding).
+        
+        - Pattern #1: fingerprints computed in one batch pass
+        - Pattern #2: with merkle=True one Ed25519 signature covers a
+          Merkle root over the batch and each memory carries its
+          inclusion proof; otherwise every memory is signed, on a process
+          pool of max_workers when given
+        
+        Nothing is verified here; use verify_memory on read.
+        """
+        specs = [{'content': item} if isinstance(item, str) else dict(item) for item in items]
+        if not specs:
+            return []
+        for spec in specs:
+            spec.setdefault('memory_type', MemoryType.OBSERVATION)
+            spec['timestamp'] = self._next_timestamp()
+        
+        fingerprints = MemoryIdentity.generate_fingerprints([
+            (spec['content'], spec['memory_type'].value, spec['timestamp'], None) for spec in specs
+        ])
+        ids = [fp.fingerprint for fp in fingerprints]
+        if merkle:
+            signatures = self.signer.sign_merkle_batch(ids)
+        else:
+            signatures = self.signer.sign_many(ids, max_workers=max_workers)
+        
+        memories = [
+            self._build_episodic(
+                fingerprint, signature, spec['timestamp'], spec['content'], spec.get('summary'),
+                spec['memory_type'], spec.get('source', MemorySource.AGENT), spec.get('importance', 0.5),
+                spec.get('parent_memories'), spec.get('embedding')
+            )
+            for spec, fingerprint, signature in zip(specs, fingerprints, signatures)
+        ]
+        
+        self._fresh(self._episodic_index, self.state.episodicMemories)
+        self.state.episodicMemories.extend(memories)
+        for memory in memories:
+            self._episodic_index.add(memory)
+        
+        return memories
+    
+    def _build_episodic(
+        self,
+        fingerprint: MemoryFingerprint,
+        signature: MemorySignature,
+        timestamp: float,
+        content: str,
+        summary: Optional[str],
+        memory_type: MemoryType,
+        source: MemorySource,
+        importance: float,
+        parent_memories: Optional[List[str]],
+        embedding: Optional[List[float]]
+    ) -> EpisodicMemory:
+        """Assemble an episodic memory (ticks the clocks)"""
         # Create logical time
         lamport_time = self.state.tick_lamport()
         vector_time = self.state.tick_vector(self.instance_index)
@@ -206,13 +359,6 @@ class ChrysalisMemory:
             parentMemories=parent_memories or []
         )
         
-        # Sign memory
-        signature = MemoryIdentity.sign_memory(
-            fingerprint.fingerprint,
-            self.private_key,
-            self.instance_id
-        )
-        
         # Create gossip metadata (Pattern #4)
         gossip_meta = GossipMetadata(
             originInstance=self.instance_id,
@@ -234,11 +380,12 @@ class ChrysalisMemory:
         )
         
         # Create memory
-        memory = EpisodicMemory(
+        return EpisodicMemory(
             memoryId=fingerprint.fingerprint,
             fingerprint=fingerprint,
             content=content,
             summary=summary or content[:100],
+            embedding=embedding,
             crdt=crdt_meta,
             gossip=gossip_meta,
             validation=validation,
@@ -250,11 +397,15 @@ class ChrysalisMemory:
             importance=importance,
             instanceId=self.instance_id
         )
+    
+    def verify_memory(self, memory) -> bool:
+        """
+        Pattern #2: Verify a memory's signature (lazy, cached)
         
-        # Add to episodic memory
-        self.state.episodicMemories.append(memory)
-        
-        return memory
+        Batch-signed memories are checked against their Merkle root; the
+        root signature itself is verified once per batch.
+        """
+        return self.verifier.verify(memory.fingerprint.fingerprint, memory.signature)
     
     # ==========================================================================
     # Gossip Operations (Pattern #4)
@@ -347,14 +498,10 @@ class ChrysalisMemory:
     ) -> List[WorkingMemory]:
         """Get working memories with optional filters"""
         memories = self.state.workingMemories
-        
-        if memory_type:
-            memories = [m for m in memories if m.memoryType == memory_type]
-        
-        if min_importance > 0.0:
-            memories = [m for m in memories if m.importance >= min_importance]
-        
-        return memories
+        positions = self._fresh(self._working_index, memories).select(memory_type, min_importance)
+        if positions is None:
+            return memories
+        return [memories[p] for p in positions]
     
     def get_episodic_memories(
         self,
@@ -364,12 +511,9 @@ class ChrysalisMemory:
     ) -> List[EpisodicMemory]:
         """Get episodic memories with optional filters"""
         memories = self.state.episodicMemories
-        
-        if memory_type:
-            memories = [m for m in memories if m.memoryType == memory_type]
-        
-        if min_importance > 0.0:
-            memories = [m for m in memories if m.importance >= min_importance]
+        positions = self._fresh(self._episodic_index, memories).select(memory_type, min_importance)
+        if positions is not None:
+            memories = [memories[p] for p in positions]
         
         if verified_only:
             memories = [m for m in memories if m.validation.threshold]
@@ -379,17 +523,98 @@ class ChrysalisMemory:
     def search_by_content(
         self,
         query: str,
-        memory_types: List[str] = None
+        memory_types: List[str] = None,
+        limit: Optional[int] = None
     ) -> List[EpisodicMemory]:
-        """Simple content search (case-insensitive)"""
-        query_lower = query.lower()
-        results = []
+        """
+        Content search over the inverted index (case-insensitive)
         
-        for memory in self.state.episodicMemories:
-            if query_lower in memory.content.lower() and (not memory_types or memory.memoryType.value in memory_types):
-                results.append(memory)
+        Returns episodic memories containing every word of the query,
+        best BM25 match first.
+        """
+        return [
+            memory for memory, _ in self.search_episodic(
+                query, limit=limit, memory_types=memory_types, match_all=True
+            )
+        ]
+    
+    def search_episodic(
+        self,
+        query: str,
+        limit: Optional[int] = 10,
+        memory_types: List[str] = None,
+        min_importance: float = 0.0,
+        match_all: bool = False
+    ) -> List[Tuple[EpisodicMemory, float]]:
+        """
+        Ranked (BM25) search over episodic memory content
+        
+        Args:
+            query: Free-text query
+            limit: Maximum results (None for all matches)
+            memory_types: Restrict to these MemoryType values
+            min_importance: Minimum importance
+            match_all: Require every query word (default: any word)
+        
+        Returns:
+            (memory, score) pairs, best first
+        """
+        index = self._fresh(self._episodic_index, self.state.episodicMemories)
+        candidates = self._episodic_candidates(index, memory_types, min_importance)
+        if candidates is not None and not candidates:
+            return []
+        hits = index.search(query, limit=limit, candidates=candidates, match_all=match_all)
+        return [(index.items[p], score) for p, score in hits]
+    
+    def search_by_embedding(
+        self,
+        query_embedding: List[float],
+        limit: int = 10,
+        memory_types: List[str] = None,
+        min_importance: float = 0.0
+    ) -> List[Tuple[EpisodicMemory, float]]:
+        """
+        Top-k cosine similarity over episodic memory embeddings
         
-        return results
+        Memories without an embedding (or with a different dimension than
+        the first embedded memory) are not searchable.
+        
+        Returns:
+            (memory, similarity) pairs, best first
+        """
+        index = self._fresh(self._episodic_index, self.state.episodicMemories)
+        candidates = self._episodic_candidates(index, memory_types, min_importance)
+        if candidates is not None and not candidates:
+            return []
+        hits = index.search_vectors(query_embedding, limit=limit, candidates=candidates)
+        return [(index.items[p], score) for p, score in hits]
+    
+    def search_semantic(
+        self,
+        query: str,
+        limit: Optional[int] = 10
+    ) -> List[Tuple[SemanticMemory, float]]:
+        """Ranked (BM25) search over semantic facts and their alternate phrasings"""
+        index = self._fresh(self._semantic_index, self.state.semanticMemories)
+        return [(index.items[p], score) for p, score in index.search(query, limit=limit)]
+    
+    def _episodic_candidates(
+        self,
+        index: MemoryIndex,
+        memory_types: Optional[List[str]],
+        min_importance: float
+    ) -> Optional[List[int]]:
+        """Positions allowed by type/importance filters (None = all)"""
+        if not memory_types:
+            return index.select(None, min_importance)
+        positions: List[int] = []
+        for value in set(memory_types):
+            try:
+                memory_type = MemoryType(value)
+            except ValueError:
+                continue
+            positions.extend(index.select(memory_type, min_importance) or [])
+        return sorted(positions)
     
     # ==========================================================================
     # Statistics & Monitoring
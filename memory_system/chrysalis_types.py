@@ -72,6 +72,12 @@ class MemorySignature:
     timestamp: float  # When signed
     algorithm: Literal['ed25519'] = 'ed25519'
     
+    # Batch signing: signature covers a Merkle root over the batch's
+    # fingerprints; merkleProof holds sibling hashes ("L<hex>"/"R<hex>",
+    # leaf to root) proving this memory's inclusion
+    merkleRoot: str = ""
+    merkleProof: List[str] = field(default_factory=list)
+    
     def __post_init__(self):
         """Validate signature format"""
         if len(self.signature) != 64:
@@ -7,6 +7,7 @@ Components:
 - DocumentConverter: Convert documents to text (PDF, HTML, Markdown)
 - CodeConverter: Extract semantic information from source code
 - ChunkConverter: Split content into semantic chunks
+- ConverterCache: Content-hash result cache (CodeChunkCache, DocumentCache)
 
 Usage:
     from memory_system.converters import DocumentConverter, ChunkConverter
@@ -20,15 +21,19 @@ Usage:
     chunks = chunker.split(text)
 """
 
-from .document import DocumentConverter, ConversionResult
-from .code import CodeConverter, CodeChunk
+from .document import DocumentConverter, ConversionResult, DocumentCache
+from .code import CodeConverter, CodeChunk, CodeChunkCache
 from .chunk import ChunkConverter, Chunk
+from .cache import ConverterCache
 
 __all__ = [
     "DocumentConverter",
     "ConversionResult",
+    "DocumentCache",
     "CodeConverter",
     "CodeChunk",
+    "CodeChunkCache",
     "ChunkConverter",
     "Chunk",
+    "ConverterCache",
 ]
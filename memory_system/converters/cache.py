@@ -0,0 +1,172 @@
+"""
+Converter Cache - Content-hash result cache shared by the converters.
+
+Stores one JSON record per (content hash, format, converter fingerprint)
+key in a bounded in-memory LRU, optionally backed by SQLite, plus a
+per-path index of (mtime, size, content hash, format) that lets batch
+APIs skip reading files that have not changed since they were converted.
+"""
+
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+
+class ConverterCache:
+    """
+    Cache of conversion records keyed by content hash.
+
+    Subclasses set TABLE_PREFIX so several converters can share one
+    database file without their records colliding.
+
+    Usage:
+        cache = ConverterCache(Path("./cache/converters.db"))
+        record = cache.get(key)
+        if record is None:
+            cache.set(key, convert(content))
+        cache.flush()
+    """
+
+    TABLE_PREFIX = "converter"
+    DEFAULT_MAX_ENTRIES = 4096
+
+    def __init__(
+        self,
+        cache_path: Optional[Union[str, Path]] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """
+        Initialize converter cache.
+
+        Args:
+            cache_path: Path to SQLite database (None for memory-only)
+            max_entries: Results kept in memory
+        """
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.max_entries = max_entries
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._files: Dict[str, Tuple[int, int, str, str]] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+        self._conn: Optional[sqlite3.Connection] = None
+        if self.cache_path:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.cache_path), check_same_thread=False)
+            self._init_schema()
+
+    def _init_schema(self) -> None:
+        """Initialize database schema."""
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {self.TABLE_PREFIX}_records (
+                key TEXT PRIMARY KEY,
+                record TEXT NOT NULL,
+                created_at TEXT NOT NULL
+            )
+        """)
+        self._conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {self.TABLE_PREFIX}_files (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                content_hash TEXT NOT NULL,
+                format TEXT NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached conversion record."""
+        with self._lock:
+            record = self._memory.get(key)
+            if record is not None:
+                self._memory.move_to_end(key)
+                self._hits += 1
+                return record
+
+            if self._conn is not None:
+                row = self._conn.execute(
+                    f"SELECT record FROM {self.TABLE_PREFIX}_records WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    record = json.loads(row[0])
+                    self._remember(key, record)
+                    self._hits += 1
+                    return record
+
+            self._misses += 1
+            return None
+
+    def set(self, key: str, record: Dict[str, Any]) -> None:
+        """Store a conversion record (committed on flush)."""
+        with self._lock:
+            self._remember(key, record)
+            if self._conn is not None:
+                self._conn.execute(
+                    f"INSERT OR REPLACE INTO {self.TABLE_PREFIX}_records VALUES (?, ?, ?)",
+                    (key, json.dumps(record), datetime.now().isoformat()),
+                )
+
+    def _remember(self, key: str, record: Dict[str, Any]) -> None:
+        self._memory[key] = record
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get_file(self, path: str) -> Optional[Tuple[int, int, str, str]]:
+        """Get (mtime_ns, size, content_hash, format) last recorded for a file."""
+        with self._lock:
+            entry = self._files.get(path)
+            if entry is None and self._conn is not None:
+                row = self._conn.execute(
+                    f"SELECT mtime_ns, size, content_hash, format FROM {self.TABLE_PREFIX}_files WHERE path = ?",
+                    (path,),
+                ).fetchone()
+                if row is not None:
+                    entry = self._files[path] = tuple(row)
+            return entry
+
+    def set_file(self, path: str, mtime_ns: int, size: int, content_hash: str, format: str) -> None:
+        """Record a file's stat and content hash (committed on flush)."""
+        with self._lock:
+            self._files[path] = (mtime_ns, size, content_hash, format)
+            if self._conn is not None:
+                self._conn.execute(
+                    f"INSERT OR REPLACE INTO {self.TABLE_PREFIX}_files VALUES (?, ?, ?, ?, ?)",
+                    (path, mtime_ns, size, content_hash, format),
+                )
+
+    def flush(self) -> None:
+        """Commit pending writes to SQLite."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.commit()
+
+    def close(self) -> None:
+        """Flush and close the database."""
+        self.flush()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / total if total else 0.0,
+                "entries": len(self._memory),
+                "persistent": self._conn is not None,
+            }
+
+
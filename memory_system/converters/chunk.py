@@ -6,18 +6,130 @@ Splits content into semantic chunks for embedding and retrieval:
 - Paragraph-based chunking
 - Token-aware chunking
 - Overlap handling
+- Streaming input and process-pool fan-out for many documents
 
 Ported from Ludwig's chunker.py with enhancements.
 """
 
 import logging
+import pickle
 import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Callable
+from itertools import repeat
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Callable, Sequence, Tuple, Union
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# Splitters are compiled once and shared by every strategy
+_SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
+_PARAGRAPH_SPLIT = re.compile(r'\n\s*\n')
+_SECTION_SPLIT = re.compile(r'(?=^#{1,6}\s|\n---\n|\n\*\*\*\n|\n___\n)', re.MULTILINE)
+_HEADING = re.compile(r'^(#{1,6})\s+(.+?)$', re.MULTILINE)
+_WORD_CHAR = re.compile(r'\w')
+
+# Characters buffered from a stream before it is cut at a boundary
+STREAM_BLOCK_SIZE = 64 * 1024
+
+TextSource = Union[str, Iterable[str]]
+
+# Sentence pending in the token splitter: (start_char, text, token_count, tokens)
+_Sentence = Tuple[int, str, int, Sequence[Any]]
+
+
+def _iter_blocks(
+    pattern: "re.Pattern[str]",
+    pieces: Iterable[str],
+    block_size: Optional[int],
+) -> Iterator[Tuple[int, str]]:
+    """
+    Re-cut a stream of text pieces into blocks that end on a boundary.
+
+    Yields (offset, block) pairs. Each block ends just after the last
+    match of pattern seen so far; the unmatched tail is carried into the
+    next block. With block_size=None the input is consumed whole.
+    """
+    tail = ""
+    base = 0
+    pending: List[str] = []
+    pending_len = 0
+    for piece in pieces:
+        if not piece:
+            continue
+        pending.append(piece)
+        pending_len += len(piece)
+        if block_size is None or pending_len < block_size:
+            continue
+        buf = tail + "".join(pending)
+        pending, pending_len = [], 0
+        cut = 0
+        for match in pattern.finditer(buf):
+            cut = match.end()
+        if cut:
+            yield base, buf[:cut]
+            base += cut
+        tail = buf[cut:]
+    buf = tail + "".join(pending)
+    if buf:
+        yield base, buf
+
+
+def _iter_spans(pattern: "re.Pattern[str]", text: str, base: int = 0) -> Iterator[Tuple[int, str]]:
+    """Yield (offset, stripped unit) for the non-blank pieces between matches."""
+    prev = 0
+    for match in pattern.finditer(text):
+        if match.start() == prev and match.end() == prev:
+            continue
+        unit = text[prev:match.start()]
+        stripped = unit.strip()
+        if stripped:
+            yield base + prev + len(unit) - len(unit.lstrip()), stripped
+        prev = match.end()
+    unit = text[prev:]
+    stripped = unit.strip()
+    if stripped:
+        yield base + prev + len(unit) - len(unit.lstrip()), stripped
+
+
+def _iter_units(
+    pattern: "re.Pattern[str]",
+    pieces: Iterable[str],
+    block_size: Optional[int],
+) -> Iterator[str]:
+    """Yield units (sentences, paragraphs, sections) from a stream."""
+    for _, block in _iter_blocks(pattern, pieces, block_size):
+        yield from pattern.split(block)
+
+
+def _token_offsets(text: str, tokens: Sequence[Any]) -> Optional[List[int]]:
+    """
+    Map each token to its start offset in text.
+
+    Works for tokenizers whose tokens are substrings of the input (word,
+    regex and most pre-tokenizers). Returns None when a token cannot be
+    located or the alignment would skip over word characters, in which
+    case overlap falls back to whole sentences.
+    """
+    offsets = []
+    pos = 0
+    find = text.find
+    for token in tokens:
+        if not isinstance(token, str):
+            return None
+        idx = find(token, pos)
+        if idx != pos:
+            if idx < 0 or (not text[pos:idx].isspace() and _WORD_CHAR.search(text, pos, idx)):
+                return None
+        offsets.append(idx)
+        pos = idx + len(token)
+    return offsets
+
+
+def _split_document(converter: "ChunkConverter", text: str, source: Optional[str]) -> List["Chunk"]:
+    """Process-pool entry point for ChunkConverter.split_many."""
+    return converter.split(text, source)
+
 
 class ChunkStrategy(Enum):
     """Chunking strategy."""
@@ -97,6 +209,12 @@ class ChunkConverter:
             strategy=ChunkStrategy.TOKEN,
             tokenizer=my_tokenizer
         )
+
+        # Stream a large file, or fan documents out to worker processes
+        with open("corpus.md") as f:
+            for chunk in chunker.iter_split(f, source="corpus.md"):
+                index(chunk)
+        per_document = chunker.split_many(documents, max_workers=4)
     """
     
     def __init__(
@@ -144,72 +262,157 @@ class ChunkConverter:
         """
         if not text or not text.strip():
             return []
+        return list(self.iter_split(text, source))
+    
+    def iter_split(
+        self,
+        text: TextSource,
+        source: Optional[str] = None,
+        block_size: int = STREAM_BLOCK_SIZE,
+    ) -> Iterator[Chunk]:
+        """
+        Lazily yield chunks from a string or a stream of text pieces.
+        
+        A stream (an open file, a generator of lines, ...) is buffered
+        only up to about block_size characters past the last boundary,
+        so large documents are chunked without holding them in memory.
+        Chunk offsets are relative to the start of the stream.
+        
+        Args:
+            text: Text, or an iterable of text pieces
+            source: Source identifier for metadata
+            block_size: Characters to buffer before cutting a stream
+            
+        Yields:
+            Chunk objects in document order
+        """
+        if isinstance(text, str):
+            pieces: Iterable[str] = (text,)
+            block: Optional[int] = None
+        else:
+            pieces = text
+            block = max(block_size, self.chunk_size)
         
         # Choose strategy
-        if self.strategy == ChunkStrategy.FIXED:
-            chunks = self._split_fixed(text)
-        elif self.strategy == ChunkStrategy.SENTENCE:
-            chunks = self._split_sentence(text)
+        if self.strategy == ChunkStrategy.SENTENCE:
+            chunks = self._split_sentence(_iter_units(_SENTENCE_SPLIT, pieces, block))
         elif self.strategy == ChunkStrategy.PARAGRAPH:
-            chunks = self._split_paragraph(text)
+            chunks = self._split_paragraph(_iter_units(_PARAGRAPH_SPLIT, pieces, block))
         elif self.strategy == ChunkStrategy.SEMANTIC:
-            chunks = self._split_semantic(text)
+            chunks = self._split_semantic(_iter_units(_SECTION_SPLIT, pieces, block))
         elif self.strategy == ChunkStrategy.TOKEN:
-            chunks = self._split_token(text)
+            chunks = self._split_token(pieces, block)
         else:
-            chunks = self._split_fixed(text)
+            chunks = self._split_fixed(pieces, block)
         
-        # Add source metadata
-        if source:
-            for chunk in chunks:
+        for chunk in chunks:
+            # Add source metadata
+            if source:
                 chunk.source = source
+            yield chunk
+    
+    def split_many(
+        self,
+        texts: Iterable[str],
+        sources: Optional[Iterable[Optional[str]]] = None,
+        max_workers: Optional[int] = None,
+        chunksize: int = 1,
+    ) -> List[List[Chunk]]:
+        """
+        Split many documents, in parallel across a process pool.
+        
+        The converter (including its tokenizer) is pickled to each worker,
+        so the tokenizer must be a module-level callable; otherwise, or
+        with max_workers=1, documents are split in this process.
         
-        return chunks
+        Args:
+            texts: Documents to split
+            sources: Optional source identifier per document
+            max_workers: Worker processes (default: CPU count)
+            chunksize: Documents handed to a worker per task
+            
+        Returns:
+            One list of chunks per document, in input order
+        """
+        texts = list(texts)
+        sources = list(sources) if sources is not None else [None] * len(texts)
+        if len(sources) != len(texts):
+            raise ValueError("sources must have one entry per text")
+        
+        if max_workers == 1 or len(texts) < 2 or not self._picklable():
+            return [self.split(text, source) for text, source in zip(texts, sources)]
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(_split_document, repeat(self), texts, sources, chunksize=chunksize))
     
-    def _split_fixed(self, text: str) -> List[Chunk]:
+    def _picklable(self) -> bool:
+        try:
+            pickle.dumps(self)
+        except Exception as e:
+            logger.debug(f"ChunkConverter not picklable ({e}), splitting in-process")
+            return False
+        return True
+    
+    def _split_fixed(self, pieces: Iterable[str], block_size: Optional[int]) -> Iterator[Chunk]:
         """Split by fixed character size."""
-        chunks = []
+        buf = ""
+        base = 0  # Offset of buf[0] in the full text
         start = 0
         index = 0
+        pieces = iter(pieces)
+        done = False
+        # Buffer enough to know whether the next window ends the text
+        lookahead = max(block_size or 0, self.chunk_size + 1)
         
-        while start < len(text):
-            end = min(start + self.chunk_size, len(text))
-            
-            # Try to end at word boundary
-            if end < len(text):
-                space_idx = text.rfind(" ", start, end)
-                if space_idx > start + self.min_chunk_size:
-                    end = space_idx
-            
-            content = text[start:end].strip()
+        while not done:
+            needed = start + lookahead
+            parts = [buf]
+            size = len(buf)
+            while size < needed:
+                piece = next(pieces, None)
+                if piece is None:
+                    done = True
+                    break
+                parts.append(piece)
+                size += len(piece)
+            buf = "".join(parts)
             
-            if len(content) >= self.min_chunk_size:
-                # Calculate overlap
-                overlap_start = 0
-                if index > 0 and self.overlap > 0:
-                    overlap_start = self.overlap
+            while start < len(buf) and (done or len(buf) - start > self.chunk_size):
+                end = min(start + self.chunk_size, len(buf))
                 
-                chunks.append(Chunk(
-                    content=content,
-                    index=index,
-                    start_char=start,
-                    end_char=end,
-                    overlap_start=overlap_start,
-                ))
-                index += 1
+                # Try to end at word boundary
+                if end < len(buf):
+                    space_idx = buf.rfind(" ", start, end)
+                    if space_idx > start + self.min_chunk_size:
+                        end = space_idx
+                
+                content = buf[start:end].strip()
+                
+                if len(content) >= self.min_chunk_size:
+                    # Calculate overlap
+                    overlap_start = 0
+                    if index > 0 and self.overlap > 0:
+                        overlap_start = self.overlap
+                    
+                    yield Chunk(
+                        content=content,
+                        index=index,
+                        start_char=base + start,
+                        end_char=base + end,
+                        overlap_start=overlap_start,
+                    )
+                    index += 1
+                
+                # Move start, accounting for overlap
+                start = end - self.overlap if self.overlap < (end - start) else end
             
-            # Move start, accounting for overlap
-            start = end - self.overlap if self.overlap < (end - start) else end
-        
-        return chunks
+            # Drop consumed text
+            buf = buf[start:]
+            base += start
+            start = 0
     
-    def _split_sentence(self, text: str) -> List[Chunk]:
+    def _split_sentence(self, sentences: Iterable[str]) -> Iterator[Chunk]:
         """Split by sentence boundaries."""
-        # Sentence splitting regex
-        sentence_pattern = r'(?<=[.!?])\s+(?=[A-Z])'
-        sentences = re.split(sentence_pattern, text)
-
-        chunks = []
         current_chunk = ""
         current_start = 0
         index = 0
@@ -224,12 +427,12 @@ class ChunkConverter:
             if current_chunk and len(current_chunk) + len(sentence) + 1 > self.chunk_size:
                 # Save current chunk
                 if len(current_chunk) >= self.min_chunk_size:
-                    chunks.append(Chunk(
+                    yield Chunk(
                         content=current_chunk,
                         index=index,
                         start_char=current_start,
                         end_char=char_pos,
-                    ))
+                    )
                     index += 1
 
                 # Start new chunk with overlap
@@ -256,21 +459,15 @@ class ChunkConverter:
 
         # Add remaining chunk
         if current_chunk and len(current_chunk) >= self.min_chunk_size:
-            chunks.append(Chunk(
+            yield Chunk(
                 content=current_chunk,
                 index=index,
                 start_char=current_start,
                 end_char=char_pos,
-            ))
-
-        return chunks
+            )
     
-    def _split_paragraph(self, text: str) -> List[Chunk]:
+    def _split_paragraph(self, paragraphs: Iterable[str]) -> Iterator[Chunk]:
         """Split by paragraph boundaries."""
-        # Split on double newlines
-        paragraphs = re.split(r'\n\s*\n', text)
-        
-        chunks = []
         current_chunk = ""
         current_start = 0
         index = 0
@@ -285,12 +482,12 @@ class ChunkConverter:
             if current_chunk and len(current_chunk) + len(para) + 2 > self.chunk_size:
                 # Save current chunk
                 if len(current_chunk) >= self.min_chunk_size:
-                    chunks.append(Chunk(
+                    yield Chunk(
                         content=current_chunk,
                         index=index,
                         start_char=current_start,
                         end_char=char_pos,
-                    ))
+                    )
                     index += 1
                 
                 # Start new chunk
@@ -307,26 +504,16 @@ class ChunkConverter:
         
         # Add remaining chunk
         if current_chunk and len(current_chunk) >= self.min_chunk_size:
-            chunks.append(Chunk(
+            yield Chunk(
                 content=current_chunk,
                 index=index,
                 start_char=current_start,
                 end_char=char_pos,
-            ))
+            )
         
-        return chunks
     
-    def _split_semantic(self, text: str) -> List[Chunk]:
-        """Split by semantic boundaries (headings, sections)."""
-        # Identify semantic boundaries
-        # - Markdown headings
-        # - Section dividers
-        # - List items
-
-        boundary_pattern = r'(?=^#{1,6}\s|\n---\n|\n\*\*\*\n|\n___\n)'
-        sections = re.split(boundary_pattern, text, flags=re.MULTILINE)
-
-        chunks = []
+    def _split_semantic(self, sections: Iterable[str]) -> Iterator[Chunk]:
+        """Split by semantic boundaries (headings, sections, dividers)."""
         current_chunk = ""
         current_start = 0
         current_section = None
@@ -338,9 +525,7 @@ class ChunkConverter:
             if not section:
                 continue
 
-            if heading_match := re.match(
-                r'^(#{1,6})\s+(.+?)$', section, re.MULTILINE
-            ):
+            if heading_match := _HEADING.match(section):
                 section_name = heading_match[2]
             else:
                 section_name = None
@@ -349,13 +534,13 @@ class ChunkConverter:
             if current_chunk and len(current_chunk) + len(section) + 2 > self.chunk_size:
                 # Save current chunk
                 if len(current_chunk) >= self.min_chunk_size:
-                    chunks.append(Chunk(
+                    yield Chunk(
                         content=current_chunk,
                         index=index,
                         start_char=current_start,
                         end_char=char_pos,
                         section=current_section,
-                    ))
+                    )
                     index += 1
 
                 # Start new chunk
@@ -374,86 +559,108 @@ class ChunkConverter:
 
         # Add remaining chunk
         if current_chunk and len(current_chunk) >= self.min_chunk_size:
-            chunks.append(Chunk(
+            yield Chunk(
                 content=current_chunk,
                 index=index,
                 start_char=current_start,
                 end_char=char_pos,
                 section=current_section,
-            ))
-
-        return chunks
+            )
     
-    def _split_token(self, text: str) -> List[Chunk]:
-        """Split by token count."""
-        if not self.tokenizer:
-            return self._split_sentence(text)
-        
-        # Tokenize full text
-        tokens = self.tokenizer(text)
-        total_tokens = len(tokens)
-        
-        if total_tokens <= self.chunk_size:
-            return [Chunk(
-                content=text,
-                index=0,
-                start_char=0,
-                end_char=len(text),
-                token_count=total_tokens,
-            )]
+    def _split_token(self, pieces: Iterable[str], block_size: Optional[int]) -> Iterator[Chunk]:
+        """
+        Split by token count.
         
-        # Split by sentences first, then group by token count
-        sentence_pattern = r'(?<=[.!?])\s+(?=[A-Z])'
-        sentences = re.split(sentence_pattern, text)
+        Every sentence is tokenized exactly once and its tokens are kept
+        with the pending chunk, so the overlap carried into the next chunk
+        is cut at a token offset without tokenizing anything again.
+        """
+        if not self.tokenizer:
+            yield from self._split_sentence(_iter_units(_SENTENCE_SPLIT, pieces, block_size))
+            return
         
-        chunks = []
-        current_sentences = []
+        current: List[_Sentence] = []
         current_tokens = 0
+        overlap_chars = 0
         index = 0
-        char_pos = 0
+        whole: Optional[Tuple[int, str]] = None  # Sole block while no chunk was cut
         
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if not sentence:
-                continue
-            
-            sentence_tokens = len(self.tokenizer(sentence))
-            
-            if current_tokens + sentence_tokens > self.chunk_size and current_sentences:
-                # Save current chunk
-                content = " ".join(current_sentences)
-                if len(content) >= self.min_chunk_size:
-                    chunks.append(Chunk(
-                        content=content,
-                        index=index,
-                        start_char=char_pos - len(content),
-                        end_char=char_pos,
-                        token_count=current_tokens,
-                    ))
-                    index += 1
+        for blocks_seen, (base, text) in enumerate(_iter_blocks(_SENTENCE_SPLIT, pieces, block_size)):
+            whole = (base, text) if blocks_seen == 0 else None
+            for start, sentence in _iter_spans(_SENTENCE_SPLIT, text, base):
+                tokens = self.tokenizer(sentence)
+                sentence_tokens = len(tokens)
                 
-                # Reset
-                current_sentences = [sentence]
-                current_tokens = sentence_tokens
-            else:
-                current_sentences.append(sentence)
+                if current_tokens + sentence_tokens > self.chunk_size and current:
+                    whole = None
+                    # Save current chunk
+                    content = " ".join(item[1] for item in current)
+                    if len(content) >= self.min_chunk_size:
+                        yield Chunk(
+                            content=content,
+                            index=index,
+                            start_char=current[0][0],
+                            end_char=current[-1][0] + len(current[-1][1]),
+                            token_count=current_tokens,
+                            overlap_start=overlap_chars,
+                        )
+                        index += 1
+                    
+                    # Reset, carrying the trailing tokens as overlap
+                    current = self._token_overlap(current, self.chunk_size - sentence_tokens)
+                    current_tokens = sum(item[2] for item in current)
+                    overlap_chars = len(" ".join(item[1] for item in current)) + 1 if current else 0
+                
+                current.append((start, sentence, sentence_tokens, tokens))
                 current_tokens += sentence_tokens
-            
-            char_pos += len(sentence) + 1
+        
+        if whole is not None and current and current_tokens <= self.chunk_size:
+            # Everything fits in one chunk: keep the text as-is
+            base, text = whole
+            yield Chunk(
+                content=text,
+                index=0,
+                start_char=base,
+                end_char=base + len(text),
+                token_count=current_tokens,
+            )
+            return
         
         # Add remaining chunk
-        if current_sentences:
-            content = " ".join(current_sentences)
+        if current:
+            content = " ".join(item[1] for item in current)
             if len(content) >= self.min_chunk_size:
-                chunks.append(Chunk(
+                yield Chunk(
                     content=content,
                     index=index,
-                    start_char=char_pos - len(content),
-                    end_char=char_pos,
+                    start_char=current[0][0],
+                    end_char=current[-1][0] + len(current[-1][1]),
                     token_count=current_tokens,
-                ))
-        
-        return chunks
+                    overlap_start=overlap_chars,
+                )
+    
+    def _token_overlap(self, sentences: List[_Sentence], room: int) -> List[_Sentence]:
+        """Return up to `overlap` trailing tokens of a chunk that fit in room."""
+        needed = min(self.overlap, room)
+        carried: List[_Sentence] = []
+        for start, text, count, tokens in reversed(sentences):
+            if needed <= 0:
+                break
+            if count <= needed:
+                carried.append((start, text, count, tokens))
+                needed -= count
+                continue
+            # Cut the sentence at the first overlapping token
+            offsets = _token_offsets(text, tokens)
+            if offsets is not None:
+                cut = offsets[count - needed]
+                carried.append((start + cut, text[cut:], needed, tokens[count - needed:]))
+            break
+        if len(carried) == len(sentences) and carried[-1][0] == sentences[0][0]:
+            # Never carry a whole chunk forward
+            carried.pop()
+        carried.reverse()
+        return carried
     
     def estimate_chunks(self, text: str) -> int:
         """
@@ -7,18 +7,37 @@ Extracts semantic information from source code:
 - Comments and docstrings
 - Call relationships
 
+Python files are analyzed in a single AST pass. Results are cached by
+content hash and converter version, optionally persisted to SQLite, so
+re-indexing a tree only re-extracts files that changed.
+
 Ported from Ludwig's code_analyzer.py with enhancements.
 """
 
 import ast
+import hashlib
 import logging
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from itertools import repeat
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from .cache import ConverterCache
 
 logger = logging.getLogger(__name__)
 
+# Bump when extraction output changes so cached results are not reused
+CONVERTER_VERSION = 2
+
+# Directories never descended into by CodeConverter.extract_tree
+DEFAULT_EXCLUDED_DIRS = frozenset([
+    ".git", ".hg", ".svn", "__pycache__", "node_modules", ".venv", "venv",
+    ".mypy_cache", ".pytest_cache", ".tox", "build", "dist", "target",
+])
+
 
 @dataclass
 class CodeChunk:
@@ -50,6 +69,137 @@ class CodeChunk:
             "imports": self.imports,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CodeChunk":
+        """Create from dictionary (list fields are copied)."""
+        data = dict(data)
+        for key in ("decorators", "calls", "imports"):
+            data[key] = list(data.get(key) or [])
+        return cls(**data)
+
+
+class CodeChunkCache(ConverterCache):
+    """
+    Cache of CodeConverter extraction records.
+
+    Keys combine the SHA-256 of the file content, the language and the
+    converter fingerprint (CONVERTER_VERSION plus extraction options), so
+    a result is only reused for byte-identical input. The file index lets
+    extract_tree skip reading unchanged files entirely.
+
+    Usage:
+        cache = CodeChunkCache(Path("./cache/code_chunks.db"))
+        converter = CodeConverter(cache=cache)
+        chunks_by_file = converter.extract_tree("src/")
+    """
+
+    TABLE_PREFIX = "code"
+
+
+class _PythonVisitor(ast.NodeVisitor):
+    """
+    Single-pass collector for imports, definitions and call sites.
+
+    Chunks are produced for top-level functions and classes and for the
+    methods directly inside top-level classes; definitions nested in
+    if/try/with blocks are scanned for imports only. The body of each of those
+    functions is walked once for both its call sites (including those in
+    nested functions) and any imports it contains.
+    """
+
+    def __init__(self, converter: "CodeConverter", lines: List[str]):
+        self.converter = converter
+        self.lines = lines
+        self.imports: List[CodeChunk] = []
+        self.import_roots: List[str] = []
+        self.definitions: List[CodeChunk] = []
+        self._class: Optional[str] = None
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            self.imports.append(CodeChunk(
+                name=alias.asname or alias.name,
+                kind="import",
+                content=f"import {alias.name}" + (f" as {alias.asname}" if alias.asname else ""),
+                start_line=node.lineno,
+                end_line=node.lineno,
+                imports=[alias.name],
+            ))
+            self.import_roots.append(alias.name.split(".")[0])
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        module = node.module or ""
+        for alias in node.names:
+            full_name = f"{module}.{alias.name}" if module else alias.name
+            self.imports.append(CodeChunk(
+                name=alias.asname or alias.name,
+                kind="import",
+                content=f"from {module} import {alias.name}" + (f" as {alias.asname}" if alias.asname else ""),
+                start_line=node.lineno,
+                end_line=node.lineno,
+                imports=[full_name],
+            ))
+        if node.module:
+            self.import_roots.append(node.module.split(".")[0])
+
+    def visit_Module(self, node: ast.Module) -> None:
+        for child in node.body:
+            if isinstance(child, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef,
+                                  ast.Import, ast.ImportFrom)):
+                self.visit(child)
+            else:
+                # Only module-level definitions are chunked
+                self._walk(child, None)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self.definitions.append(self.converter._python_chunk(node, self.lines, "class"))
+        self._class = node.name
+        for child in node.body:
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                self.visit(child)
+            else:
+                # Only methods directly in the class body are chunked
+                self._walk(child, None)
+        self._class = None
+
+    def visit_FunctionDef(self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> None:
+        kind = "async_function" if isinstance(node, ast.AsyncFunctionDef) else "function"
+        chunk = self.converter._python_chunk(node, self.lines, kind)
+        if self._class is not None:
+            chunk.parent = self._class
+            chunk.kind = "method"
+        self.definitions.append(chunk)
+
+        calls: Optional[List[str]] = [] if self.converter.extract_calls else None
+        self._walk(node, calls)
+        if calls:
+            chunk.calls = list(dict.fromkeys(calls))
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def _walk(self, node: ast.AST, calls: Optional[List[str]]) -> None:
+        """Collect imports and (optionally) call names below a definition."""
+        for child in ast.walk(node):
+            if isinstance(child, ast.Call):
+                if calls is not None:
+                    if isinstance(child.func, ast.Name):
+                        calls.append(child.func.id)
+                    elif isinstance(child.func, ast.Attribute):
+                        calls.append(child.func.attr)
+            elif isinstance(child, ast.Import):
+                self.visit_Import(child)
+            elif isinstance(child, ast.ImportFrom):
+                self.visit_ImportFrom(child)
+
+
+def _extract_file(converter: "CodeConverter", path: str) -> Tuple[str, int, int, str, str, Dict[str, Any]]:
+    """Process-pool entry point for CodeConverter.extract_tree."""
+    stat = os.stat(path)
+    raw = Path(path).read_bytes()
+    language = converter.LANGUAGE_MAP.get(Path(path).suffix.lower(), "unknown")
+    record = converter._analyze(raw.decode("utf-8", errors="replace"), language)
+    return path, stat.st_mtime_ns, stat.st_size, hashlib.sha256(raw).hexdigest(), language, record
+
 
 class CodeConverter:
     """
@@ -75,6 +225,9 @@ class CodeConverter:
             
         # Get imports
         imports = converter.get_imports("src/main.py")
+
+        # Index a tree; unchanged files are served from the cache
+        chunks_by_file = converter.extract_tree("src/", max_workers=4)
     """
     
     # Language detection by extension
@@ -105,6 +258,9 @@ class CodeConverter:
         include_comments: bool = True,
         extract_calls: bool = True,
         max_chunk_lines: int = 200,
+        cache: Optional[CodeChunkCache] = None,
+        cache_path: Optional[Union[str, Path]] = None,
+        enable_cache: bool = True,
     ):
         """
         Initialize code converter.
@@ -113,10 +269,28 @@ class CodeConverter:
             include_comments: Include standalone comments
             extract_calls: Extract function calls
             max_chunk_lines: Maximum lines per chunk
+            cache: Chunk cache to use (shared between converters)
+            cache_path: SQLite path for a persistent chunk cache
+            enable_cache: Cache extraction results by content hash
         """
         self.include_comments = include_comments
         self.extract_calls = extract_calls
         self.max_chunk_lines = max_chunk_lines
+        
+        if cache is None and enable_cache:
+            cache = CodeChunkCache(cache_path)
+        self.cache = cache if enable_cache else None
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # Worker processes only need the extraction options
+        state = self.__dict__.copy()
+        state["cache"] = None
+        return state
+    
+    @property
+    def fingerprint(self) -> str:
+        """Converter version and options that affect extraction output."""
+        return f"v{CONVERTER_VERSION}:{int(self.include_comments)}:{int(self.extract_calls)}:{self.max_chunk_lines}"
     
     def extract(
         self, 
@@ -133,21 +307,136 @@ class CodeConverter:
         Returns:
             List of CodeChunk objects
         """
-        # Check if source is a file
+        return [CodeChunk.from_dict(c) for c in self._load(source, language)["chunks"]]
+    
+    def extract_tree(
+        self,
+        root: Union[str, Path],
+        suffixes: Optional[Iterable[str]] = None,
+        exclude_dirs: Iterable[str] = DEFAULT_EXCLUDED_DIRS,
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, List[CodeChunk]]:
+        """
+        Extract chunks for every source file under a directory.
+        
+        Files whose mtime and size match the cache's file index are not
+        read at all; files whose content hash is cached are not parsed.
+        The remaining files are extracted across a process pool.
+        
+        Args:
+            root: Directory to scan recursively
+            suffixes: File suffixes to include (default: LANGUAGE_MAP)
+            exclude_dirs: Directory names to skip
+            max_workers: Worker processes (default: CPU count; 1 for in-process)
+            
+        Returns:
+            Mapping of file path to its chunks, sorted by path
+        """
+        suffixes = set(suffixes or self.LANGUAGE_MAP)
+        exclude_dirs = set(exclude_dirs)
+        paths = []
+        for directory, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(d for d in dirnames if d not in exclude_dirs and not d.startswith("."))
+            paths.extend(
+                os.path.join(directory, name) for name in sorted(filenames)
+                if os.path.splitext(name)[1].lower() in suffixes
+            )
+        
+        records: Dict[str, Dict[str, Any]] = {}
+        changed = []
+        for path in paths:
+            record = self._cached_file(path)
+            if record is None:
+                changed.append(path)
+            else:
+                records[path] = record
+        
+        if changed:
+            if max_workers == 1 or len(changed) == 1:
+                results = map(_extract_file, repeat(self), changed)
+                self._store_extracted(results, records)
+            else:
+                with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                    chunksize = max(1, len(changed) // ((max_workers or os.cpu_count() or 1) * 4))
+                    results = pool.map(_extract_file, repeat(self), changed, chunksize=chunksize)
+                    self._store_extracted(results, records)
+        if self.cache:
+            self.cache.flush()
+        
+        return {
+            path: [CodeChunk.from_dict(c) for c in records[path]["chunks"]]
+            for path in sorted(records)
+        }
+    
+    def _cached_file(self, path: str) -> Optional[Dict[str, Any]]:
+        """Return the cached record for an unchanged file, else None."""
+        if not self.cache:
+            return None
+        known = self.cache.get_file(path)
+        if known is None:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        mtime_ns, size, digest, language = known
+        if (stat.st_mtime_ns, stat.st_size) != (mtime_ns, size):
+            return None
+        return self.cache.get(self._cache_key(digest, language))
+    
+    def _store_extracted(
+        self,
+        results: Iterable[Tuple[str, int, int, str, str, Dict[str, Any]]],
+        records: Dict[str, Dict[str, Any]],
+    ) -> None:
+        for path, mtime_ns, size, digest, language, record in results:
+            records[path] = record
+            if self.cache:
+                self.cache.set(self._cache_key(digest, language), record)
+                self.cache.set_file(path, mtime_ns, size, digest, language)
+    
+    def _cache_key(self, digest: str, language: str) -> str:
+        return f"{digest}:{language}:{self.fingerprint}"
+    
+    def _load(self, source: str, language: Optional[str]) -> Dict[str, Any]:
+        """Read a file or code string and return its (cached) analysis record."""
+        # Check if source is a file (long code strings are not valid paths)
         path = Path(source)
-        if path.is_file():
-            content = path.read_text(encoding="utf-8", errors="replace")
+        try:
+            is_file = path.is_file()
+        except OSError:
+            is_file = False
+        if is_file:
+            raw = path.read_bytes()
+            content = raw.decode("utf-8", errors="replace")
             if language is None:
                 language = self.LANGUAGE_MAP.get(path.suffix.lower(), "unknown")
         else:
             content = source
+            raw = content.encode("utf-8", errors="surrogatepass")
             language = language or "python"
         
-        # Extract based on language
+        if not self.cache:
+            return self._analyze(content, language)
+        
+        key = self._cache_key(hashlib.sha256(raw).hexdigest(), language)
+        record = self.cache.get(key)
+        if record is None:
+            record = self._analyze(content, language)
+            self.cache.set(key, record)
+        return record
+    
+    def _analyze(self, content: str, language: str) -> Dict[str, Any]:
+        """Extract chunks and imports together."""
         if language == "python":
-            return self._extract_python(content)
+            chunks, imports = self._extract_python(content)
         else:
-            return self._extract_generic(content, language)
+            chunks = self._extract_generic(content, language)
+            if language in ("javascript", "typescript"):
+                imports = self._get_js_imports(content)
+            else:
+                imports = []
+        return {"chunks": [c.to_dict() for c in chunks], "imports": imports}
     
     def get_imports(
         self, 
@@ -164,21 +453,7 @@ class CodeConverter:
         Returns:
             List of imported module/package names
         """
-        path = Path(source)
-        if path.is_file():
-            content = path.read_text(encoding="utf-8", errors="replace")
-            if language is None:
-                language = self.LANGUAGE_MAP.get(path.suffix.lower(), "unknown")
-        else:
-            content = source
-            language = language or "python"
-        
-        if language == "python":
-            return self._get_python_imports(content)
-        elif language in ("javascript", "typescript"):
-            return self._get_js_imports(content)
-        else:
-            return []
+        return list(self._load(source, language)["imports"])
     
     def get_definitions(
         self, 
@@ -205,8 +480,8 @@ class CodeConverter:
         
         return definitions
     
-    def _extract_python(self, content: str) -> List[CodeChunk]:
-        """Extract chunks from Python code using AST."""
+    def _extract_python(self, content: str) -> Tuple[List[CodeChunk], List[str]]:
+        """Extract chunks and top-level import names from Python code in one AST pass."""
         chunks = []
         lines = content.split("\n")
 
@@ -214,16 +489,13 @@ class CodeConverter:
             tree = ast.parse(content)
         except SyntaxError as e:
             logger.warning(f"Python syntax error: {e}")
-            return self._extract_generic(content, "python")
+            return self._extract_generic(content, "python"), self._get_python_imports(content)
 
         # Extract module-level docstring
         if (tree.body and isinstance(tree.body[0], ast.Expr) and 
-            isinstance(tree.body[0].value, (ast.Str, ast.Constant))):
+            isinstance(tree.body[0].value, ast.Constant)):
             doc_node = tree.body[0]
-            if isinstance(doc_node.value, ast.Str):
-                docstring = doc_node.value.s
-            else:
-                docstring = str(doc_node.value.value)
+            docstring = str(doc_node.value.value)
 
             chunks.append(CodeChunk(
                 name="__module__",
@@ -234,99 +506,25 @@ class CodeConverter:
                 docstring=docstring,
             ))
 
-        # Extract imports
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    chunks.append(CodeChunk(
-                        name=alias.asname or alias.name,
-                        kind="import",
-                        content=f"import {alias.name}" + (f" as {alias.asname}" if alias.asname else ""),
-                        start_line=node.lineno,
-                        end_line=node.lineno,
-                        imports=[alias.name],
-                    ))
-
-            elif isinstance(node, ast.ImportFrom):
-                module = node.module or ""
-                for alias in node.names:
-                    full_name = f"{module}.{alias.name}" if module else alias.name
-                    chunks.append(CodeChunk(
-                        name=alias.asname or alias.name,
-                        kind="import",
-                        content=f"from {module} import {alias.name}" + (f" as {alias.asname}" if alias.asname else ""),
-                        start_line=node.lineno,
-                        end_line=node.lineno,
-                        imports=[full_name],
-                    ))
-
-        # Extract classes and functions
-        for node in ast.iter_child_nodes(tree):
-            if isinstance(node, ast.ClassDef):
-                chunks.extend(self._extract_python_class(node, lines))
-            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                chunks.append(self._extract_python_function(node, lines))
-
-        return chunks
-    
-    def _extract_python_class(
-        self, 
-        node: ast.ClassDef, 
-        lines: List[str]
-    ) -> List[CodeChunk]:
-        """Extract class and its methods."""
-        # Class chunk
-        start = node.lineno
-        end = node.end_lineno or start
-        content = "\n".join(lines[start - 1:end])
-
-        # Get docstring
-        docstring = ast.get_docstring(node)
-
-        # Get decorators
-        decorators = []
-        for dec in node.decorator_list:
-            if isinstance(dec, ast.Name):
-                decorators.append(dec.id)
-            elif isinstance(dec, ast.Call) and isinstance(dec.func, ast.Name):
-                decorators.append(dec.func.id)
-            elif isinstance(dec, ast.Attribute):
-                decorators.append(dec.attr)
-
-        chunks = [
-            CodeChunk(
-                name=node.name,
-                kind="class",
-                content=content,
-                start_line=start,
-                end_line=end,
-                docstring=docstring,
-                decorators=decorators,
-            )
-        ]
-        # Extract methods
-        for item in node.body:
-            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                method_chunk = self._extract_python_function(item, lines)
-                method_chunk.parent = node.name
-                method_chunk.kind = "method"
-                chunks.append(method_chunk)
+        # Imports, classes, functions and calls
+        visitor = _PythonVisitor(self, lines)
+        visitor.visit(tree)
+        chunks.extend(visitor.imports)
+        chunks.extend(visitor.definitions)
 
-        return chunks
+        return chunks, list(dict.fromkeys(visitor.import_roots))
     
-    def _extract_python_function(
+    def _python_chunk(
         self, 
-        node: ast.FunctionDef | ast.AsyncFunctionDef, 
-        lines: List[str]
+        node: Union[ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef], 
+        lines: List[str],
+        kind: str,
     ) -> CodeChunk:
-        """Extract function definition."""
+        """Build the chunk for a class or function definition."""
         start = node.lineno
         end = node.end_lineno or start
         content = "\n".join(lines[start - 1:end])
         
-        # Get docstring
-        docstring = ast.get_docstring(node)
-        
         # Get decorators
         decorators = []
         for dec in node.decorator_list:
@@ -337,55 +535,28 @@ class CodeConverter:
             elif isinstance(dec, ast.Attribute):
                 decorators.append(dec.attr)
         
-        # Extract calls if enabled
-        calls = []
-        if self.extract_calls:
-            for child in ast.walk(node):
-                if isinstance(child, ast.Call):
-                    if isinstance(child.func, ast.Name):
-                        calls.append(child.func.id)
-                    elif isinstance(child.func, ast.Attribute):
-                        calls.append(child.func.attr)
-        
-        kind = "function"
-        if isinstance(node, ast.AsyncFunctionDef):
-            kind = "async_function"
-        
         return CodeChunk(
             name=node.name,
             kind=kind,
             content=content,
             start_line=start,
             end_line=end,
-            docstring=docstring,
+            docstring=ast.get_docstring(node),
             decorators=decorators,
-            calls=list(set(calls)),
         )
     
     def _get_python_imports(self, content: str) -> List[str]:
-        """Extract Python imports."""
+        """Extract Python imports with a regex (for files that do not parse)."""
         imports = []
 
-        try:
-            tree = ast.parse(content)
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    imports.extend(alias.name.split(".")[0] for alias in node.names)
-                elif isinstance(node, ast.ImportFrom):
-                    if node.module:
-                        imports.append(node.module.split(".")[0])
-
-        except SyntaxError:
-            # Fallback to regex
-            import_pattern = r'^(?:from\s+(\w+)|import\s+(\w+))'
-            for match in re.finditer(import_pattern, content, re.MULTILINE):
-                if match.group(1):
-                    imports.append(match.group(1))
-                elif match.group(2):
-                    imports.append(match.group(2))
+        import_pattern = r'^(?:from\s+(\w+)|import\s+(\w+))'
+        for match in re.finditer(import_pattern, content, re.MULTILINE):
+            if match.group(1):
+                imports.append(match.group(1))
+            elif match.group(2):
+                imports.append(match.group(2))
 
-        return list(set(imports))
+        return list(dict.fromkeys(imports))
     
     def _get_js_imports(self, content: str) -> List[str]:
         """Extract JavaScript/TypeScript imports."""
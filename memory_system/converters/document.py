@@ -7,18 +7,33 @@ Converts documents to plain text for semantic processing:
 - Markdown parsing
 - Plain text passthrough
 
+Batches of files can be converted across a process pool with per-file
+timeouts and per-worker memory caps; results are cached by content hash
+so unchanged documents are not converted again.
+
 Ported from Ludwig's document_processor.py with enhancements.
 """
 
+import hashlib
 import logging
+import os
 import re
-from dataclasses import dataclass, field
+import signal
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .cache import ConverterCache
 
 logger = logging.getLogger(__name__)
 
+# Bump when conversion output changes so cached results are not reused
+CONVERTER_VERSION = 1
+
 # Conditional imports for optional dependencies
 try:
     import pypdf
@@ -41,6 +56,13 @@ except ImportError:
     MARKDOWN_AVAILABLE = False
     markdown = None
 
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:  # Windows
+    RESOURCE_AVAILABLE = False
+    resource = None
+
 
 @dataclass
 class ConversionResult:
@@ -75,6 +97,71 @@ class ConversionResult:
         }
 
 
+class DocumentCache(ConverterCache):
+    """
+    Cache of DocumentConverter results.
+
+    Keys combine the SHA-256 of the file bytes, the detected format and
+    the converter fingerprint (CONVERTER_VERSION, options and which
+    optional parsers are installed). Only successful conversions are
+    stored.
+
+    Usage:
+        converter = DocumentConverter(cache_path=Path("./cache/documents.db"))
+        for path, result in converter.convert_many(paths, max_workers=8):
+            ...
+    """
+
+    TABLE_PREFIX = "document"
+
+
+class _ConversionTimeout(BaseException):
+    """Raised by SIGALRM; a BaseException so converters' handlers don't swallow it."""
+
+
+def _raise_timeout(signum, frame):
+    raise _ConversionTimeout()
+
+
+def _file_sha256(path: Union[str, Path]) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _limit_worker_memory(memory_limit_mb: Optional[int]) -> None:
+    """Process-pool initializer capping the worker's address space."""
+    if memory_limit_mb and RESOURCE_AVAILABLE:
+        limit = memory_limit_mb * 1024 * 1024
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def _terminated(batch: Sequence[Tuple[int, str, str]]) -> List[Tuple[int, ConversionResult]]:
+    """Failed results for a batch whose worker process died."""
+    return [
+        (index, ConversionResult(
+            success=False,
+            error="Worker process terminated during conversion",
+            format=file_format,
+        ))
+        for index, _, file_format in batch
+    ]
+
+
+def _convert_batch(
+    converter: "DocumentConverter",
+    batch: List[Tuple[int, str, str]],
+    timeout: Optional[float],
+) -> List[Tuple[int, "ConversionResult"]]:
+    """Process-pool entry point for DocumentConverter.convert_many."""
+    return [(index, converter._convert_with_timeout(path, format, timeout)) for index, path, format in batch]
+
+
 class DocumentConverter:
     """
     Multi-format document converter.
@@ -99,6 +186,10 @@ class DocumentConverter:
             
         # Convert from string
         result = converter.convert_html("<html><body>Hello</body></html>")
+        
+        # Convert a folder across worker processes
+        for path, result in converter.convert_many(paths, max_workers=8, timeout=30):
+            print(path, result.word_count)
     """
     
     # File extension to format mapping
@@ -130,6 +221,8 @@ class DocumentConverter:
         self,
         strip_whitespace: bool = True,
         preserve_structure: bool = True,
+        cache: Optional[DocumentCache] = None,
+        cache_path: Optional[Union[str, Path]] = None,
     ):
         """
         Initialize document converter.
@@ -137,9 +230,29 @@ class DocumentConverter:
         Args:
             strip_whitespace: Remove excessive whitespace
             preserve_structure: Keep paragraph/section breaks
+            cache: Result cache for file conversions (shared between converters)
+            cache_path: SQLite path for a persistent result cache
         """
         self.strip_whitespace = strip_whitespace
         self.preserve_structure = preserve_structure
+        
+        if cache is None and cache_path is not None:
+            cache = DocumentCache(cache_path)
+        self.cache = cache
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # Worker processes only need the conversion options
+        state = self.__dict__.copy()
+        state["cache"] = None
+        return state
+    
+    @property
+    def fingerprint(self) -> str:
+        """Converter version, options and parsers that affect conversion output."""
+        return (
+            f"v{CONVERTER_VERSION}:{int(self.strip_whitespace)}:{int(self.preserve_structure)}:"
+            f"{int(PYPDF_AVAILABLE)}{int(BS4_AVAILABLE)}{int(MARKDOWN_AVAILABLE)}"
+        )
     
     def convert(
         self, 
@@ -156,16 +269,250 @@ class DocumentConverter:
         Returns:
             ConversionResult with extracted text
         """
-        # Determine if source is a file path
+        # Determine if source is a file path (long content is not a valid path)
         path = Path(source)
-        is_file = path.is_file()
+        try:
+            is_file = path.is_file()
+        except OSError:
+            is_file = False
         
         if is_file:
-            return self._convert_file(path, format)
+            if self.cache is None:
+                return self._convert_file(path, format)
+            format = format or self._detect_format(path)
+            digest = _file_sha256(path)
+            result = self._cached_result(digest, format)
+            if result is None:
+                result = self._convert_file(path, format)
+                self._store_result(digest, format, result)
+            return result
         else:
             # Treat as content string
             return self._convert_content(source, format or "text")
     
+    def convert_many(
+        self,
+        paths: Iterable[Union[str, Path]],
+        format: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        chunksize: int = 4,
+        timeout: Optional[float] = None,
+        memory_limit_mb: Optional[int] = None,
+        ordered: bool = True,
+    ) -> Iterator[Tuple[str, ConversionResult]]:
+        """
+        Convert many files across a process pool.
+        
+        Files whose mtime and size match the cache's file index, or whose
+        content hash is cached, are returned without converting them. The
+        rest are submitted in chunks of ``chunksize`` with at most two
+        chunks per worker in flight, so huge folders are not queued up
+        front. A worker that dies (e.g. killed for memory) fails only its
+        in-flight files; the pool is restarted for the rest.
+        
+        Args:
+            paths: Files to convert
+            format: Override format detection for every file
+            max_workers: Worker processes (default: CPU count; 1 for in-process)
+            chunksize: Files per submitted task
+            timeout: Seconds allowed per file (POSIX only; enforced in the worker)
+            memory_limit_mb: Address-space cap per worker, including what it
+                inherits from this process (POSIX only)
+            ordered: Yield in input order; otherwise as files complete
+            
+        Yields:
+            (path, ConversionResult) tuples
+        """
+        paths = [str(p) for p in paths]
+        results: Dict[int, ConversionResult] = {}
+        pending: List[Tuple[int, str, str]] = []
+        hashes: Dict[int, Tuple[int, int, str, str]] = {}
+        for index, path in enumerate(paths):
+            file_format = format or self._detect_format(Path(path))
+            cached = self._cached_file(path, file_format, hashes, index)
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.append((index, path, file_format))
+        
+        next_index = 0
+        
+        def release(completed: Iterable[Tuple[int, ConversionResult]]) -> Iterator[Tuple[str, ConversionResult]]:
+            nonlocal next_index
+            for index, result in completed:
+                if index in hashes:
+                    mtime_ns, size, digest, file_format = hashes.pop(index)
+                    if self._store_result(digest, file_format, result):
+                        self.cache.set_file(paths[index], mtime_ns, size, digest, file_format)
+                if not ordered:
+                    yield paths[index], result
+                else:
+                    results[index] = result
+            while ordered and next_index in results:
+                yield paths[next_index], results.pop(next_index)
+                next_index += 1
+        
+        if not ordered:
+            cached = sorted(results.items())
+            results.clear()
+            yield from release(cached)
+        
+        try:
+            if max_workers == 1 or len(pending) <= 1:
+                for index, path, file_format in pending:
+                    yield from release([(index, self._convert_with_timeout(path, file_format, timeout))])
+            else:
+                yield from self._convert_pool(pending, max_workers, chunksize, timeout, memory_limit_mb, release)
+            yield from release([])
+        finally:
+            if self.cache is not None:
+                self.cache.flush()
+    
+    def _convert_pool(
+        self,
+        pending: Sequence[Tuple[int, str, str]],
+        max_workers: Optional[int],
+        chunksize: int,
+        timeout: Optional[float],
+        memory_limit_mb: Optional[int],
+        release: Callable[[Iterable[Tuple[int, ConversionResult]]], Iterator[Tuple[str, ConversionResult]]],
+    ) -> Iterator[Tuple[str, ConversionResult]]:
+        """
+        Run pending conversions on a process pool, restarting it if a worker dies.
+        
+        A dead worker breaks every batch in flight, so those batches are
+        re-run one at a time on the next pool; only a batch that breaks the
+        pool on its own is failed.
+        """
+        workers = max_workers or os.cpu_count() or 1
+        batches = [list(pending[i:i + chunksize]) for i in range(0, len(pending), max(1, chunksize))]
+        batches.reverse()
+        suspects: List[List[Tuple[int, str, str]]] = []
+        while batches or suspects:
+            pool = ProcessPoolExecutor(
+                max_workers=workers, initializer=_limit_worker_memory, initargs=(memory_limit_mb,)
+            )
+            broken = False
+            try:
+                while suspects and not broken:
+                    batch = suspects.pop()
+                    try:
+                        completed = pool.submit(_convert_batch, self, batch, timeout).result()
+                    except BrokenProcessPool:
+                        broken = True
+                        completed = _terminated(batch)
+                    yield from release(completed)
+                
+                in_flight = {}
+                while (batches or in_flight) and not broken:
+                    while batches and len(in_flight) < workers * 2:
+                        batch = batches.pop()
+                        in_flight[pool.submit(_convert_batch, self, batch, timeout)] = batch
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    broken = any(isinstance(future.exception(), BrokenProcessPool) for future in done)
+                    if broken:
+                        # The rest of the in-flight futures fail (or finish) promptly
+                        wait(in_flight)
+                        done = set(in_flight)
+                    broken_batches = []
+                    for future in done:
+                        batch = in_flight.pop(future)
+                        if isinstance(future.exception(), BrokenProcessPool):
+                            broken_batches.append(batch)
+                        else:
+                            yield from release(future.result())
+                    if len(broken_batches) == 1:
+                        # Nothing else was running: this batch killed the worker
+                        yield from release(_terminated(broken_batches[0]))
+                    else:
+                        suspects.extend(broken_batches)
+            finally:
+                pool.shutdown(wait=True, cancel_futures=True)
+    
+    def _convert_with_timeout(
+        self, 
+        path: str, 
+        format: str, 
+        timeout: Optional[float]
+    ) -> ConversionResult:
+        """Convert a file, failing it if it takes longer than timeout seconds."""
+        if (not timeout or not hasattr(signal, "setitimer")
+                or threading.current_thread() is not threading.main_thread()):
+            return self._convert_file(Path(path), format)
+        
+        previous = signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+        try:
+            return self._convert_file(Path(path), format)
+        except _ConversionTimeout:
+            return ConversionResult(
+                success=False,
+                error=f"Conversion timed out after {timeout}s",
+                format=format,
+            )
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+    
+    def _cached_file(
+        self,
+        path: str,
+        format: str,
+        hashes: Dict[int, Tuple[int, int, str, str]],
+        index: int,
+    ) -> Optional[ConversionResult]:
+        """
+        Return the cached result for a file, or None if it must be converted.
+        
+        The content hash is only computed when the file index does not
+        match; it is left in ``hashes`` so the new result can be stored.
+        """
+        if self.cache is None:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        known = self.cache.get_file(path)
+        if known is not None and known[3] == format and (stat.st_mtime_ns, stat.st_size) == known[:2]:
+            result = self._cached_result(known[2], format)
+            if result is not None:
+                return result
+        
+        try:
+            digest = _file_sha256(path)
+        except OSError:
+            return None
+        result = self._cached_result(digest, format)
+        if result is not None:
+            self.cache.set_file(path, stat.st_mtime_ns, stat.st_size, digest, format)
+            return result
+        hashes[index] = (stat.st_mtime_ns, stat.st_size, digest, format)
+        return None
+    
+    def _cached_result(self, digest: str, format: str) -> Optional[ConversionResult]:
+        if self.cache is None:
+            return None
+        record = self.cache.get(f"{digest}:{format}:{self.fingerprint}")
+        if record is None:
+            return None
+        return ConversionResult(**{**record, "metadata": dict(record["metadata"])})
+    
+    def _store_result(self, digest: str, format: str, result: ConversionResult) -> bool:
+        """Cache a successful conversion; failures (timeouts, parser errors) are retried."""
+        if self.cache is None or not result.success:
+            return False
+        self.cache.set(f"{digest}:{format}:{self.fingerprint}", asdict(result))
+        return True
+    
+    def _detect_format(self, path: Path) -> str:
+        """Detect a file's format from its extension."""
+        ext = path.suffix.lower()
+        format = self.FORMAT_MAP.get(ext)
+        if format is None:
+            format = "code" if ext in self.CODE_EXTENSIONS else "text"
+        return format
+    
     def _convert_file(
         self, 
         path: Path, 
@@ -174,11 +521,7 @@ class DocumentConverter:
         """Convert a file to text."""
         # Detect format
         if format is None:
-            ext = path.suffix.lower()
-            format = self.FORMAT_MAP.get(ext)
-
-        if format is None:
-            format = "code" if ext in self.CODE_EXTENSIONS else "text"
+            format = self._detect_format(path)
         # Read and convert based on format
         try:
             if format == "pdf":
@@ -3,12 +3,17 @@ Core memory abstractions and interfaces
 """
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Protocol
+from typing import List, Dict, Any, Optional, Protocol, Callable
 from datetime import datetime
 import uuid
 from .sanitization import MemorySanitizer
 
 
+def estimate_tokens(text: str) -> int:
+    """Approximate token count (~4 characters per token)"""
+    return len(text) // 4 + 1
+
+
 @dataclass
 class MemoryEntry:
     """A single memory entry"""
@@ -40,6 +45,59 @@ class RetrievalResult:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class MemoryFilter:
+    """
+    Filter expression for memory retrieval
+    
+    Stores that support pushdown translate it into their native filter
+    (Chroma ``where``, FAISS ID selectors); ``matches`` evaluates it in
+    Python for anything a store could not push down.
+    """
+    memory_types: Optional[List[str]] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    since: Optional[datetime] = None
+    until: Optional[datetime] = None
+    
+    @property
+    def is_empty(self) -> bool:
+        return not (self.memory_types or self.metadata or self.since or self.until)
+    
+    def matches(self, entry: MemoryEntry) -> bool:
+        """Evaluate the filter against an entry"""
+        if self.memory_types and entry.memory_type not in self.memory_types:
+            return False
+        if self.since and entry.timestamp < self.since:
+            return False
+        if self.until and entry.timestamp > self.until:
+            return False
+        return all(entry.metadata.get(key) == value for key, value in self.metadata.items())
+    
+    def to_chroma_where(self, include_time: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Translate to a Chroma ``where`` clause
+        
+        Metadata values Chroma cannot compare (non-scalars) are left to
+        ``matches``. Time bounds use the numeric ``timestamp_epoch`` field.
+        """
+        clauses: List[Dict[str, Any]] = []
+        if self.memory_types:
+            if len(self.memory_types) == 1:
+                clauses.append({"memory_type": self.memory_types[0]})
+            else:
+                clauses.append({"memory_type": {"$in": list(self.memory_types)}})
+        for key, value in self.metadata.items():
+            if isinstance(value, (str, int, float, bool)):
+                clauses.append({key: value})
+        if include_time and self.since:
+            clauses.append({"timestamp_epoch": {"$gte": self.since.timestamp()}})
+        if include_time and self.until:
+            clauses.append({"timestamp_epoch": {"$lte": self.until.timestamp()}})
+        if not clauses:
+            return None
+        return clauses[0] if len(clauses) == 1 else {"$and": clauses}
+
+
 class MemoryStore(Protocol):
     """
     Protocol for memory storage backends.
@@ -120,9 +178,12 @@ class Memory:
     - Core Memory: Persistent context (structured blocks)
     """
     
-    def __init__(self, config: MemoryConfig):
+    def __init__(self, config: MemoryConfig, tokenizer: Optional[Callable[[str], int]] = None):
+        from .stores import WorkingMemory
+        
         self.config = config
-        self._working_memory: List[MemoryEntry] = []
+        self.tokenizer = tokenizer or estimate_tokens
+        self._working_memory = WorkingMemory(config.working_memory_size, tokenizer=self.tokenizer)
         self._core_memory: Dict[str, str] = {}
         self._vector_store: Optional[MemoryStore] = None
         self._embedding_provider = None
@@ -157,17 +218,12 @@ class Memory:
     def add_to_working_memory(self, content: str, metadata: Optional[Dict] = None) -> MemoryEntry:
         """Add to working memory (recent context buffer)"""
         entry = MemoryEntry.create(content, "working", metadata)
-        self._working_memory.append(entry)
-        
-        # Keep only recent items
-        if len(self._working_memory) > self.config.working_memory_size:
-            self._working_memory.pop(0)
-        
+        self._working_memory.add(entry)
         return entry
     
     def get_working_memory(self) -> List[MemoryEntry]:
         """Get current working memory context"""
-        return self._working_memory.copy()
+        return self._working_memory.get_all()
     
     def clear_working_memory(self):
         """Clear working memory"""
@@ -281,7 +337,12 @@ class Memory:
         return self._vector_store.retrieve(query, limit=limit, memory_types=memory_types)
     
     # Context assembly
-    def get_context(self, query: Optional[str] = None, include_working: bool = True) -> str:
+    def get_context(
+        self,
+        query: Optional[str] = None,
+        include_working: bool = True,
+        token_budget: Optional[int] = None,
+    ) -> str:
         """
         Assemble context for LLM
         
@@ -289,39 +350,101 @@ class Memory:
         - Core memory (always)
         - Working memory (if include_working)
         - Retrieved relevant memories (if query provided)
+        
+        Without a token_budget the 5 most recent working entries and 3
+        retrieved memories are included. With a budget, core memory is
+        counted first and the remaining tokens are packed greedily with
+        the highest-value items. Retrieved memories are valued by rank
+        (stores return best matches first; their scores are distances)
+        and working entries by recency, both as 1 / (1 + position).
+        Each source stops at its first item that no longer fits, so
+        assembly touches only the items that end up in the context.
         """
+        core_lines = [f"{key}: {value}" for key, value in self._core_memory.items()]
+        
+        results = None
+        if query:
+            self._ensure_initialized()
+            results = self.search(query, limit=3)
+        
+        if token_budget is None:
+            working = self._working_memory.get_recent(5) if include_working else []
+            retrieved = list(results.entries) if results else []
+        else:
+            remaining = token_budget - sum(self.tokenizer(line) for line in core_lines)
+            working, retrieved = self._pack_context(
+                results, include_working, remaining
+            )
+        
         context_parts = []
-
+        
         # Core memory
-        if self._core_memory:
+        if core_lines:
             context_parts.append("=== Core Memory ===")
-            context_parts.extend(
-                f"{key}: {value}" for key, value in self._core_memory.items()
-            )
+            context_parts.extend(core_lines)
             context_parts.append("")
-
+        
         # Working memory
-        if include_working and self._working_memory:
+        if working:
             context_parts.append("=== Recent Context ===")
+            context_parts.extend(f"- {entry.content}" for entry in working)
+            context_parts.append("")
+        
+        # Retrieved memories
+        if retrieved:
+            context_parts.append("=== Relevant Memories ===")
             context_parts.extend(
-                f"- {entry.content}" for entry in self._working_memory[-5:]
+                f"- [{entry.memory_type}] {entry.content}"
+                for entry in retrieved
             )
             context_parts.append("")
-
-        # Retrieved memories
-        if query:
-            self._ensure_initialized()
-            results = self.search(query, limit=3)
-            if results.entries:
-                context_parts.append("=== Relevant Memories ===")
-                context_parts.extend(
-                    f"- [{entry.memory_type}] {entry.content}"
-                    for entry in results.entries
-                )
-                context_parts.append("")
-
+        
         return "\n".join(context_parts)
     
+    def _pack_context(
+        self,
+        results: Optional[RetrievalResult],
+        include_working: bool,
+        budget: int,
+    ) -> "tuple[List[MemoryEntry], List[MemoryEntry]]":
+        """Greedily select working and retrieved entries within a token budget"""
+        # Both candidate streams are already in descending value order,
+        # so packing is a merge that touches only as many items as fit.
+        retrieved_candidates = iter(enumerate(results.entries if results else []))
+        working_candidates = self._working_memory.iter_newest() if include_working else iter(())
+        
+        working: List[MemoryEntry] = []
+        retrieved: List[MemoryEntry] = []
+        age = 0
+        next_working = next(working_candidates, None)
+        next_retrieved = next(retrieved_candidates, None)
+        while budget > 0 and (next_working is not None or next_retrieved is not None):
+            working_value = 1.0 / (1 + age) if next_working is not None else -1.0
+            retrieved_value = 1.0 / (1 + next_retrieved[0]) if next_retrieved is not None else -1.0
+            if working_value >= retrieved_value:
+                entry, tokens = next_working
+                cost = tokens + 1  # "- " prefix and newline
+                if cost > budget:
+                    next_working = None
+                    continue
+                working.append(entry)
+                budget -= cost
+                age += 1
+                next_working = next(working_candidates, None)
+            else:
+                _, entry = next_retrieved
+                cost = self.tokenizer(entry.content) + 3  # "[type]" tag
+                if cost > budget:
+                    next_retrieved = None
+                    continue
+                retrieved.append(entry)
+                budget -= cost
+                next_retrieved = next(retrieved_candidates, None)
+        
+        # Present working entries oldest-first, as in the unbudgeted context
+        working.reverse()
+        return working, retrieved
+    
     # Statistics
     def get_stats(self) -> Dict[str, Any]:
         """Get memory system statistics"""
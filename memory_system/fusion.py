@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any, Dict, Iterable, List, Optional, TYPE_CHECKING
+from typing import Any, Awaitable, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
 
 from memory_system.beads import BeadsService
 from memory_system.hooks import ZepHooks
@@ -31,14 +32,31 @@ class FusionRetriever:
     - High-importance beads are auto-promoted via BeadsService promotion hook
     - Fireproof provides durable local cache with offline fallback
     - Remote Zep failures fall back to Fireproof local search
+
+    retrieve_async() queries the sources concurrently, running the
+    blocking embedder and Zep calls in worker threads. Each source has its
+    own deadline (see DEFAULT_SOURCE_TIMEOUTS); a source that misses it is
+    reported in ``timed_out`` and contributes no results.
     """
 
+    # Per-source deadlines in seconds for retrieve_async (None = no deadline).
+    # "remote" covers query embedding plus the Zep search; "fallback" is the
+    # Fireproof local vector search used when the remote fails or times out.
+    DEFAULT_SOURCE_TIMEOUTS: Dict[str, Optional[float]] = {
+        "beads": None,
+        "fireproof": 2.0,
+        "remote": 2.0,
+        "fallback": 1.0,
+        "kg": 2.0,
+    }
+
     def __init__(
         self,
         beads: BeadsService,
         embedder: Optional[EmbeddingService] = None,
         zep_hooks: Optional[ZepHooks] = None,
         fireproof: Optional[FireproofService] = None,
+        source_timeouts: Optional[Dict[str, Optional[float]]] = None,
     ) -> None:
         """
         Initialize FusionRetriever.
@@ -48,11 +66,13 @@ class FusionRetriever:
             embedder: EmbeddingService for vector generation
             zep_hooks: ZepHooks for remote long-term storage
             fireproof: FireproofService for durable local cache (optional)
+            source_timeouts: Overrides for DEFAULT_SOURCE_TIMEOUTS
         """
         self.beads = beads
         self.embedder = embedder
         self.zep_hooks = zep_hooks
         self.fireproof = fireproof
+        self.source_timeouts = {**self.DEFAULT_SOURCE_TIMEOUTS, **(source_timeouts or {})}
 
     def ingest(
         self,
@@ -220,6 +240,7 @@ class FusionRetriever:
         used_fallback = False
 
         if include_remote and self.embedder and self.zep_hooks:
+            qvec: Optional[List[float]] = None
             try:
                 qvec = self.embedder.embed(query)
                 remote_matches = self.zep_hooks.on_retrieve_embeddings(qvec, k=remote_k)
@@ -228,7 +249,8 @@ class FusionRetriever:
                 
                 # Fallback: Use Fireproof local vector search
                 if self.fireproof and self.fireproof.config.local_vector_cache:
-                    qvec = self.embedder.embed(query)
+                    if qvec is None:
+                        qvec = self.embedder.embed(query)
                     
                     async def local_search() -> List[Dict[str, Any]]:
                         return await self.fireproof.local_similarity_search(
@@ -277,62 +299,109 @@ class FusionRetriever:
         """
         Async version of retrieve for better performance.
         
+        Beads, Fireproof, the remote embedding search and KG retrieval run
+        concurrently, with blocking calls offloaded to threads. The query
+        is embedded once and shared by the remote search and the Fireproof
+        fallback. Sources that exceed their deadline in
+        ``self.source_timeouts`` are listed in the result's ``timed_out``
+        instead of delaying the response (a blocking call that overruns
+        keeps running in its thread until it returns).
+        
         See retrieve() for parameter documentation.
         """
+        timed_out: List[str] = []
+        
         # 1. Short-term: Recent beads (sync operation)
-        beads_recent = self.beads.recent(limit=bead_limit, min_importance=min_importance)
+        async def beads_source() -> List[Dict[str, Any]]:
+            return await asyncio.to_thread(
+                self.beads.recent, limit=bead_limit, min_importance=min_importance
+            )
         
         # 2. Hybrid: Fireproof durable cache
-        fireproof_results: List[Dict[str, Any]] = []
-        if include_fireproof and self.fireproof:
-            try:
-                fireproof_results = await self.fireproof.query_beads(
-                    limit=fireproof_limit,
-                    min_importance=min_importance,
-                )
-            except Exception as exc:
-                logger.warning("fusion.retrieve.fireproof_failed", extra={"error": str(exc)})
+        async def fireproof_source() -> List[Dict[str, Any]]:
+            if not (include_fireproof and self.fireproof):
+                return []
+            return await self.fireproof.query_beads(
+                limit=fireproof_limit,
+                min_importance=min_importance,
+            )
         
         # 3. Long-term: Remote Zep (with Fireproof fallback)
-        remote_matches: List[Dict[str, Any]] = []
-        kg_result: Optional[Dict[str, Any]] = None
-        used_fallback = False
-
-        if include_remote and self.embedder and self.zep_hooks:
-            try:
-                qvec = self.embedder.embed(query)
-                remote_matches = self.zep_hooks.on_retrieve_embeddings(qvec, k=remote_k)
-            except Exception as exc:
-                logger.warning("fusion.retrieve.remote_failed", extra={"error": str(exc)})
+        async def remote_source() -> Tuple[List[Dict[str, Any]], bool]:
+            if not (include_remote and self.embedder and self.zep_hooks):
+                return [], False
+            
+            # Embed once; shielded so the fallback can reuse it after a remote timeout
+            qvec_future = asyncio.ensure_future(asyncio.to_thread(self.embedder.embed, query))
+            qvec_future.add_done_callback(_retrieve_exception)
+            
+            async def remote_search() -> List[Dict[str, Any]]:
+                qvec = await asyncio.shield(qvec_future)
+                return await asyncio.to_thread(
+                    self.zep_hooks.on_retrieve_embeddings, qvec, k=remote_k
+                )
+            
+            ok, matches = await self._run_source("remote", remote_search(), timed_out)
+            if ok:
+                return matches, False
+            
+            # Fallback to Fireproof
+            if self.fireproof and self.fireproof.config.local_vector_cache:
+                async def local_search() -> List[Dict[str, Any]]:
+                    qvec = await asyncio.shield(qvec_future)
+                    return await self.fireproof.local_similarity_search(qvec, k=remote_k)
                 
-                # Fallback to Fireproof
-                if self.fireproof and self.fireproof.config.local_vector_cache:
-                    try:
-                        qvec = self.embedder.embed(query)
-                        remote_matches = await self.fireproof.local_similarity_search(
-                            qvec, k=remote_k
-                        )
-                        used_fallback = True
-                        logger.info("fusion.retrieve.used_fireproof_fallback")
-                    except Exception as fallback_exc:
-                        logger.warning(
-                            "fusion.retrieve.fallback_failed",
-                            extra={"error": str(fallback_exc)}
-                        )
-
+                ok, matches = await self._run_source("fallback", local_search(), timed_out)
+                if ok:
+                    logger.info("fusion.retrieve.used_fireproof_fallback")
+                    return matches, True
+            return [], False
+        
         # 4. KG retrieval
-        if self.zep_hooks and kg_node_ids:
-            try:
-                kg_result = self.zep_hooks.on_retrieve_kg(
-                    node_ids=kg_node_ids, predicates=kg_predicates, hops=kg_hops
-                )
-            except Exception as exc:
-                logger.warning("fusion.retrieve.kg_failed", extra={"error": str(exc)})
+        async def kg_source() -> Optional[Dict[str, Any]]:
+            if not (self.zep_hooks and kg_node_ids):
+                return None
+            return await asyncio.to_thread(
+                self.zep_hooks.on_retrieve_kg,
+                node_ids=kg_node_ids, predicates=kg_predicates, hops=kg_hops,
+            )
+        
+        beads_out, fireproof_out, remote_out, kg_out = await asyncio.gather(
+            self._run_source("beads", beads_source(), timed_out),
+            self._run_source("fireproof", fireproof_source(), timed_out),
+            remote_source(),
+            self._run_source("kg", kg_source(), timed_out),
+        )
+        remote_matches, used_fallback = remote_out
 
         return {
-            "beads": beads_recent,
-            "fireproof": fireproof_results,
+            "beads": beads_out[1] or [],
+            "fireproof": fireproof_out[1] or [],
             "remote_embeddings": remote_matches,
-            "kg": kg_result,
+            "kg": kg_out[1],
             "used_fallback": used_fallback,
-        }
\ No newline at end of file
+            "timed_out": timed_out,
+        }
+    
+    async def _run_source(
+        self,
+        name: str,
+        awaitable: Awaitable[Any],
+        timed_out: List[str],
+    ) -> Tuple[bool, Any]:
+        """Await one retrieval source under its deadline; failures yield (False, None)."""
+        timeout = self.source_timeouts.get(name)
+        try:
+            return True, await asyncio.wait_for(awaitable, timeout)
+        except asyncio.TimeoutError:
+            timed_out.append(name)
+            logger.warning(f"fusion.retrieve.{name}_timeout", extra={"timeout": timeout})
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.warning(f"fusion.retrieve.{name}_failed", extra={"error": str(exc)})
+        return False, None
+
+
+def _retrieve_exception(future: asyncio.Future) -> None:
+    # The shared query embedding may fail after every consumer timed out
+    if not future.cancelled():
+        future.exception()
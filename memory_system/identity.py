@@ -5,12 +5,17 @@ Pattern #1 (Hash) + Pattern #2 (Signatures)
 Provides:
 - SHA-384 fingerprinting for memories
 - Ed25519 signatures for authentication
-- Verification and tamper detection
+- Batch signing: per-item in a worker pool, or one signature over a
+  Merkle root with per-item inclusion proofs
+- Verification (cached) and tamper detection
 """
 
 import hashlib
 import json
-from typing import Any, Dict
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from datetime import datetime
 
 try:
@@ -28,6 +33,16 @@ except ImportError:
 from .chrysalis_types import MemoryFingerprint, MemorySignature
 
 
+# One encoder for all metadata hashes (json.dumps builds a new one per call
+# when given options); output is identical to json.dumps(..., sort_keys=True)
+_METADATA_ENCODER = json.JSONEncoder(sort_keys=True)
+
+# Merkle tree domain separation (leaf vs interior node vs signed root)
+_MERKLE_LEAF = b"\x00"
+_MERKLE_NODE = b"\x01"
+_MERKLE_ROOT_CONTEXT = b"chrysalis-merkle-root:"
+
+
 class MemoryIdentity:
     """
     Pattern #1 + #2: Cryptographic Identity for Memories
@@ -67,7 +82,7 @@ class MemoryIdentity:
             'timestamp': timestamp,
             **(metadata or {})
         }
-        metadata_str = json.dumps(metadata_dict, sort_keys=True)
+        metadata_str = _METADATA_ENCODER.encode(metadata_dict)
         metadata_hash = hashlib.sha384(metadata_str.encode('utf-8')).hexdigest()
         
         # Combined fingerprint (hash of content + metadata hashes)
@@ -81,6 +96,35 @@ class MemoryIdentity:
             metadataHash=metadata_hash
         )
     
+    @staticmethod
+    def generate_fingerprints(
+        records: Sequence[Tuple[str, str, float, Optional[Dict[str, Any]]]]
+    ) -> List[MemoryFingerprint]:
+        """
+        Pattern #1: Fingerprint many memories in one pass
+        
+        Same result as generate_fingerprint for each
+        (content, memory_type, timestamp, metadata) record, with the
+        hashing and encoding callables bound once for the batch.
+        """
+        sha384 = hashlib.sha384
+        encode = _METADATA_ENCODER.encode
+        fingerprints = []
+        append = fingerprints.append
+        for content, memory_type, timestamp, metadata in records:
+            content_hash = sha384(content.encode('utf-8')).hexdigest()
+            metadata_dict = {'type': memory_type, 'timestamp': timestamp}
+            if metadata:
+                metadata_dict.update(metadata)
+            metadata_hash = sha384(encode(metadata_dict).encode('utf-8')).hexdigest()
+            append(MemoryFingerprint(
+                fingerprint=sha384(f"{content_hash}{metadata_hash}".encode('utf-8')).hexdigest(),
+                algorithm='sha384',
+                contentHash=content_hash,
+                metadataHash=metadata_hash
+            ))
+        return fingerprints
+    
     @staticmethod
     def sign_memory(
         fingerprint: str,
@@ -142,7 +186,21 @@ class MemoryIdentity:
         - Signature is valid
         - Memory hasn't been tampered with
         - Signature matches public key
+        
+        Batch-signed memories (merkleRoot set) must also prove inclusion
+        of the fingerprint in the signed root.
         """
+        if signature.merkleRoot:
+            if not verify_merkle_proof(fingerprint, signature.merkleProof, signature.merkleRoot):
+                return False
+            message = merkle_root_message(signature.merkleRoot)
+        else:
+            message = fingerprint.encode('utf-8')
+        return MemoryIdentity.verify_message(message, signature)
+    
+    @staticmethod
+    def verify_message(message: bytes, signature: MemorySignature) -> bool:
+        """Verify the Ed25519 signature over a raw message"""
         if not HAS_CRYPTO:
             # Fallback: always verify in dev mode
             return True
@@ -152,7 +210,6 @@ class MemoryIdentity:
             public_key = Ed25519PublicKey.from_public_bytes(signature.publicKey)
             
             # Verify signature
-            message = fingerprint.encode('utf-8')
             public_key.verify(signature.signature, message)
             
             return True
@@ -185,6 +242,236 @@ class MemoryIdentity:
         return new_fingerprint.fingerprint != fingerprint.fingerprint
 
 
+# ==============================================================================
+# Merkle Batches
+# ==============================================================================
+
+def _merkle_leaf(fingerprint: str) -> bytes:
+    return hashlib.sha384(_MERKLE_LEAF + fingerprint.encode('utf-8')).digest()
+
+
+def _merkle_node(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha384(_MERKLE_NODE + left + right).digest()
+
+
+def merkle_root_message(root: str) -> bytes:
+    """Message signed for a Merkle root (never mistakable for a fingerprint)"""
+    return _MERKLE_ROOT_CONTEXT + root.encode('utf-8')
+
+
+def build_merkle_tree(fingerprints: Sequence[str]) -> Tuple[str, List[List[str]]]:
+    """
+    Build a SHA-384 Merkle tree over fingerprints
+    
+    An unpaired node is promoted to the next level unchanged (never
+    duplicated), so every tree shape has exactly one root per leaf set.
+    
+    Returns:
+        (root hex, inclusion proof per fingerprint)
+    """
+    if not fingerprints:
+        raise ValueError("Cannot build a Merkle tree over an empty batch")
+    levels = [[_merkle_leaf(fp) for fp in fingerprints]]
+    while len(levels[-1]) > 1:
+        level = levels[-1]
+        parents = [_merkle_node(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            parents.append(level[-1])
+        levels.append(parents)
+    
+    proofs = []
+    for leaf in range(len(fingerprints)):
+        proof = []
+        index = leaf
+        for level in levels[:-1]:
+            sibling = index ^ 1
+            if sibling < len(level):
+                proof.append(("L" if sibling < index else "R") + level[sibling].hex())
+            index //= 2
+        proofs.append(proof)
+    return levels[-1][0].hex(), proofs
+
+
+def verify_merkle_proof(fingerprint: str, proof: Sequence[str], root: str) -> bool:
+    """Check that fingerprint is included in the tree with this root"""
+    try:
+        node = _merkle_leaf(fingerprint)
+        for step in proof:
+            sibling = bytes.fromhex(step[1:])
+            if step[0] == "L":
+                node = _merkle_node(sibling, node)
+            elif step[0] == "R":
+                node = _merkle_node(node, sibling)
+            else:
+                return False
+        return node.hex() == root
+    except (ValueError, IndexError):
+        return False
+
+
+# ==============================================================================
+# Batch Signing & Cached Verification
+# ==============================================================================
+
+def _sign_batch(private_key: bytes, instance_id: str, fingerprints: List[str]) -> List[MemorySignature]:
+    """Process pool worker: sign a slice of fingerprints"""
+    return MemorySigner(private_key, instance_id).sign_many(fingerprints)
+
+
+class MemorySigner:
+    """
+    Pattern #2: Ed25519 signer for one instance
+    
+    Loads the private key and derives the public key once, instead of on
+    every MemoryIdentity.sign_memory call. Signatures are identical.
+    """
+    
+    def __init__(self, private_key: bytes, instance_id: str):
+        self.private_key = private_key
+        self.instance_id = instance_id
+        if HAS_CRYPTO:
+            try:
+                self._key = Ed25519PrivateKey.from_private_bytes(private_key)
+            except Exception as e:
+                raise ValueError(f"Invalid Ed25519 private key: {e}") from e
+            self.public_key = self._key.public_key().public_bytes(
+                encoding=serialization.Encoding.Raw,
+                format=serialization.PublicFormat.Raw
+            )
+        else:
+            self._key = None
+            self.public_key = b'\x00' * 32
+    
+    def _sign(self, message: bytes) -> bytes:
+        if self._key is None:
+            # Fallback: dummy signature
+            return b'\x00' * 64
+        return self._key.sign(message)
+    
+    def sign(self, fingerprint: str) -> MemorySignature:
+        """Sign one fingerprint"""
+        return MemorySignature(
+            signature=self._sign(fingerprint.encode('utf-8')),
+            publicKey=self.public_key,
+            algorithm='ed25519',
+            signedBy=self.instance_id,
+            timestamp=datetime.now().timestamp()
+        )
+    
+    def sign_many(
+        self,
+        fingerprints: Sequence[str],
+        max_workers: Optional[int] = None,
+        batch_size: int = 512
+    ) -> List[MemorySignature]:
+        """
+        Sign each fingerprint individually
+        
+        With max_workers > 1, slices of batch_size are signed on a process
+        pool (Ed25519 signing holds the GIL, so threads would not help).
+        """
+        if not max_workers or max_workers <= 1 or len(fingerprints) <= batch_size:
+            return [self.sign(fp) for fp in fingerprints]
+        slices = [list(fingerprints[i:i + batch_size]) for i in range(0, len(fingerprints), batch_size)]
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            signed = pool.map(
+                _sign_batch,
+                [self.private_key] * len(slices),
+                [self.instance_id] * len(slices),
+                slices
+            )
+            return [signature for batch in signed for signature in batch]
+    
+    def sign_merkle_batch(self, fingerprints: Sequence[str]) -> List[MemorySignature]:
+        """
+        Sign a whole batch with one signature over its Merkle root
+        
+        Each returned signature carries the shared root signature plus the
+        item's inclusion proof (log2(n) sibling hashes).
+        """
+        root, proofs = build_merkle_tree(fingerprints)
+        signature = self._sign(merkle_root_message(root))
+        timestamp = datetime.now().timestamp()
+        return [
+            MemorySignature(
+                signature=signature,
+                publicKey=self.public_key,
+                algorithm='ed25519',
+                signedBy=self.instance_id,
+                timestamp=timestamp,
+                merkleRoot=root,
+                merkleProof=proof
+            )
+            for proof in proofs
+        ]
+
+
+class SignatureVerifier:
+    """
+    Pattern #2: Lazy, cached signature verification
+    
+    Results are cached per (fingerprint, signature). Ed25519 checks are
+    cached per signed message, so a Merkle batch costs one signature
+    verification plus a log2(n) proof check per memory.
+    """
+    
+    def __init__(self, max_entries: int = 100_000):
+        self.max_entries = max_entries
+        self._results: "OrderedDict[tuple, bool]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def _cached(self, key: tuple) -> Optional[bool]:
+        with self._lock:
+            result = self._results.get(key)
+            if result is not None:
+                self._results.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+            return result
+    
+    def _remember(self, key: tuple, result: bool) -> bool:
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+        return result
+    
+    def verify(self, fingerprint: str, signature: MemorySignature) -> bool:
+        """Verify a memory signature, reusing earlier results"""
+        key = ("memory", fingerprint, signature.signature, signature.publicKey, signature.merkleRoot)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+        
+        if signature.merkleRoot:
+            if not verify_merkle_proof(fingerprint, signature.merkleProof, signature.merkleRoot):
+                return self._remember(key, False)
+            message = merkle_root_message(signature.merkleRoot)
+        else:
+            message = fingerprint.encode('utf-8')
+        
+        message_key = ("message", message, signature.signature, signature.publicKey)
+        valid = self._cached(message_key)
+        if valid is None:
+            valid = self._remember(message_key, MemoryIdentity.verify_message(message, signature))
+        return self._remember(key, valid)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'entries': len(self._results),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+            }
+
+
 class KeyPairManager:
     """
     Manages Ed25519 keypairs for agent instances
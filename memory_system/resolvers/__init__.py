@@ -18,12 +18,17 @@ Usage:
     
     # Get references
     refs = await resolver.find_references("src/main.py", 10, 5)
+    
+    # Batch lookups; results are cached per file content hash
+    results = await resolver.resolve_many([("definition", "src/main.py", 10, 5)])
 """
 
-from .lsp import LSPResolver, LSPResult, SymbolInfo
+from .lsp import LSPResolver, LSPResult, LSPResultCache, ResolveRequest, SymbolInfo
 
 __all__ = [
     "LSPResolver",
     "LSPResult",
+    "LSPResultCache",
+    "ResolveRequest",
     "SymbolInfo",
 ]
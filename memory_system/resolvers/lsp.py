@@ -11,12 +11,15 @@ Ported from Ludwig's lsp_resolver.py with enhancements.
 """
 
 import asyncio
+import hashlib
 import json
 import logging
-import subprocess
+import sqlite3
+import threading
 from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
@@ -99,6 +102,15 @@ class LSPResult:
         }
 
 
+@dataclass
+class ResolveRequest:
+    """One lookup for LSPResolver.resolve_many."""
+    method: str  # definition, references, hover, symbols
+    file_path: str
+    line: int = 1  # 1-indexed
+    character: int = 0
+
+
 # Symbol kind mapping (LSP spec)
 SYMBOL_KINDS = {
     1: "file",
@@ -130,6 +142,191 @@ SYMBOL_KINDS = {
 }
 
 
+# Language IDs sent with textDocument/didOpen
+LANGUAGE_IDS = {
+    ".py": "python",
+    ".ts": "typescript",
+    ".js": "javascript",
+    ".rs": "rust",
+    ".go": "go",
+    ".java": "java",
+    ".c": "c",
+    ".cpp": "cpp",
+    ".h": "c",
+    ".hpp": "cpp",
+}
+
+
+@dataclass
+class _OpenDocument:
+    """Tracked state of a document and whether the server has it."""
+    version: int  # 0 until didOpen has been sent
+    mtime_ns: int
+    size: int
+    digest: str
+    synced: bool = False  # Server has the content matching digest
+
+
+_MISSING = object()
+
+
+class LSPResultCache:
+    """
+    Cache of LSP results keyed by document content.
+
+    Entries are keyed by workspace, document URI, the SHA-256 of the
+    document content, method and request params, so a result is reused
+    only while the queried file is unchanged. Results are held in memory
+    and, with a cache_path, written through to SQLite so later sessions
+    skip the language server for files that have not changed.
+
+    Results that depend on other files (definitions, references, hover
+    text from imported symbols) are keyed only by the queried document,
+    so LSPResolver caches them only when asked to (cache_methods); call
+    clear() after wide edits.
+
+    Usage:
+        cache = LSPResultCache(Path("./cache/lsp.db"))
+        resolver = LSPResolver(server_cmd=["pylsp"], cache=cache)
+    """
+
+    # Writes buffered before a SQLite commit
+    COMMIT_EVERY = 64
+
+    def __init__(self, cache_path: Optional[Union[str, Path]] = None):
+        """
+        Initialize result cache.
+
+        Args:
+            cache_path: Path to SQLite database (None for memory-only)
+        """
+        self.cache_path = Path(cache_path) if cache_path else None
+        self._entries: Dict[str, Dict[Tuple[str, str, str, str], Any]] = {}
+        self._lock = threading.Lock()
+        self._pending_writes = 0
+        self._hits = 0
+        self._misses = 0
+
+        self._conn: Optional[sqlite3.Connection] = None
+        if self.cache_path:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.cache_path), check_same_thread=False)
+            self._init_schema()
+
+    def _init_schema(self) -> None:
+        """Initialize database schema."""
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS lsp_results (
+                workspace TEXT NOT NULL,
+                uri TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                method TEXT NOT NULL,
+                params TEXT NOT NULL,
+                result TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                PRIMARY KEY (workspace, uri, content_hash, method, params)
+            )
+        """)
+        self._conn.commit()
+
+    def get(self, workspace: str, uri: str, content_hash: str, method: str, params: str) -> Any:
+        """Return the cached result, or the module's _MISSING sentinel."""
+        key = (workspace, content_hash, method, params)
+        with self._lock:
+            entries = self._entries.get(uri)
+            if entries is not None and key in entries:
+                self._hits += 1
+                return entries[key]
+
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT result FROM lsp_results WHERE workspace = ? AND uri = ? "
+                    "AND content_hash = ? AND method = ? AND params = ?",
+                    (workspace, uri, content_hash, method, params),
+                ).fetchone()
+                if row is not None:
+                    result = json.loads(row[0])
+                    self._entries.setdefault(uri, {})[key] = result
+                    self._hits += 1
+                    return result
+
+            self._misses += 1
+            return _MISSING
+
+    def set(self, workspace: str, uri: str, content_hash: str, method: str, params: str, result: Any) -> None:
+        """Store a result."""
+        with self._lock:
+            self._entries.setdefault(uri, {})[(workspace, content_hash, method, params)] = result
+            if self._conn is None:
+                return
+            self._conn.execute(
+                "INSERT OR REPLACE INTO lsp_results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (workspace, uri, content_hash, method, params, json.dumps(result), datetime.now().isoformat()),
+            )
+            self._pending_writes += 1
+            if self._pending_writes >= self.COMMIT_EVERY:
+                self._conn.commit()
+                self._pending_writes = 0
+
+    def invalidate(self, uri: str, keep_hash: Optional[str] = None) -> None:
+        """Drop entries for a document, except those for keep_hash."""
+        with self._lock:
+            entries = self._entries.get(uri)
+            if entries:
+                stale = [key for key in entries if key[1] != keep_hash]
+                for key in stale:
+                    del entries[key]
+            if self._conn is not None:
+                self._conn.execute(
+                    "DELETE FROM lsp_results WHERE uri = ? AND content_hash != ?",
+                    (uri, keep_hash or ""),
+                )
+                self._pending_writes += 1
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM lsp_results")
+                self._conn.commit()
+                self._pending_writes = 0
+
+    def flush(self) -> None:
+        """Commit buffered writes to SQLite."""
+        with self._lock:
+            if self._conn is not None and self._pending_writes:
+                self._conn.commit()
+                self._pending_writes = 0
+
+    def close(self) -> None:
+        """Flush and close the database."""
+        self.flush()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @property
+    def persistent(self) -> bool:
+        """Whether entries are written through to SQLite."""
+        return self._conn is not None
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / total if total else 0.0,
+                "entries": sum(len(entries) for entries in self._entries.values()),
+                "persistent": self._conn is not None,
+            }
+
+
 class LSPResolver:
     """
     Language Server Protocol resolver for symbol analysis.
@@ -141,6 +338,14 @@ class LSPResolver:
     - Hover documentation
     - Type inference
 
+    The server runs as an asyncio subprocess; responses are framed with
+    buffered StreamReader reads and matched to requests by id, so
+    concurrent requests can be pipelined. Each document is sent with
+    didOpen once and re-sent with didChange only when it changes on disk.
+    Results of document-local methods (documentSymbol) are cached
+    by content hash (see LSPResultCache); SQLite reads and writes run in a
+    worker thread.
+
     Supports multiple languages via configurable server commands:
     - Python: pylsp, pyright-langserver
     - TypeScript/JavaScript: typescript-language-server
@@ -159,6 +364,12 @@ class LSPResolver:
         # Find references
         result = await resolver.find_references("src/main.py", 10, 5)
 
+        # Many lookups, at most 16 in flight
+        results = await resolver.resolve_many([
+            ResolveRequest("definition", "src/main.py", 10, 5),
+            ResolveRequest("symbols", "src/util.py"),
+        ], window=16)
+
         await resolver.shutdown()
     """
 
@@ -183,11 +394,21 @@ class LSPResolver:
         "jdtls",
     ])
 
+    # Methods whose results depend only on the queried document; hover
+    # resolves types and docs from other files, so it is opt-in
+    DOCUMENT_LOCAL_METHODS = frozenset([
+        "textDocument/documentSymbol",
+    ])
+
     def __init__(
         self,
         server_cmd: Optional[List[str]] = None,
         workspace_root: Optional[Path] = None,
         timeout: float = 5.0,
+        cache: Optional[LSPResultCache] = None,
+        cache_path: Optional[Union[str, Path]] = None,
+        enable_cache: bool = True,
+        cache_methods: Optional[Iterable[str]] = None,
     ):
         """
         Initialize LSP resolver.
@@ -196,18 +417,37 @@ class LSPResolver:
             server_cmd: Language server command and args
             workspace_root: Root directory of workspace
             timeout: Request timeout in seconds
+            cache: Result cache to use (shared between resolvers)
+            cache_path: SQLite path for a persistent result cache
+            enable_cache: Cache per-document results
+            cache_methods: Methods to cache (default DOCUMENT_LOCAL_METHODS;
+                definition/references/hover results go stale when other
+                files change, so opt in only for read-only workspaces)
         """
         self.server_cmd = server_cmd
         self.workspace_root = workspace_root
         self.timeout = timeout
 
-        self._process: Optional[subprocess.Popen] = None
+        if cache is None and enable_cache:
+            cache = LSPResultCache(cache_path)
+        self.cache = cache if enable_cache else None
+        self.cache_methods = frozenset(
+            self.DOCUMENT_LOCAL_METHODS if cache_methods is None else cache_methods
+        )
+        self._inflight: Dict[Tuple[str, str, str, str], asyncio.Future] = {}
+
+        self._process: Optional[asyncio.subprocess.Process] = None
         self._request_id = 0
         self._initialized = False
         self._pending_requests: Dict[int, asyncio.Future] = {}
         self._read_task: Optional[asyncio.Task] = None
+        self._stderr_task: Optional[asyncio.Task] = None
         self._capabilities: Dict[str, Any] = {}
 
+        # Documents the server currently has open, keyed by URI
+        self._documents: Dict[str, _OpenDocument] = {}
+        self._document_lock: Optional[asyncio.Lock] = None
+
     async def initialize(self, workspace_path: Union[str, Path]) -> LSPResult:
         """
         Initialize connection to language server.
@@ -256,11 +496,11 @@ class LSPResolver:
 
         # Start server process
         try:
-            self._process = subprocess.Popen(
-                self.server_cmd,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+            self._process = await asyncio.create_subprocess_exec(
+                *self.server_cmd,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
                 cwd=str(self.workspace_root),
             )
         except FileNotFoundError:
@@ -270,8 +510,10 @@ class LSPResolver:
                 method="initialize",
             )
 
-        # Start reader task
+        # Start reader tasks
+        self._documents.clear()
         self._read_task = asyncio.create_task(self._read_loop())
+        self._stderr_task = asyncio.create_task(self._drain_stderr())
 
         # Send initialize request
         workspace_uri = f"file://{self.workspace_root}"
@@ -317,20 +559,29 @@ class LSPResolver:
         except Exception:
             pass
 
-        if self._read_task:
-            self._read_task.cancel()
-            try:
-                await self._read_task
-            except asyncio.CancelledError:
-                pass
+        for task in (self._read_task, self._stderr_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
 
         if self._process:
-            self._process.terminate()
-            try:
-                self._process.wait(timeout=2)
-            except subprocess.TimeoutExpired:
-                self._process.kill()
-
+            if self._process.returncode is None:
+                try:
+                    self._process.terminate()
+                    await asyncio.wait_for(self._process.wait(), timeout=2)
+                except ProcessLookupError:
+                    pass
+                except asyncio.TimeoutError:
+                    self._process.kill()
+                    await self._process.wait()
+            self._process = None
+
+        self._documents.clear()
+        if self.cache:
+            await self._cache_io(self.cache.flush)
         self._initialized = False
 
     async def find_definition(
@@ -353,11 +604,8 @@ class LSPResolver:
         if not self._initialized:
             return LSPResult(success=False, error="Not initialized", method="textDocument/definition")
 
-        # Open the document first
-        await self._open_document(file_path)
-
         uri = f"file://{Path(file_path).absolute()}"
-        result = await self._request("textDocument/definition", {
+        result = await self._document_request(file_path, "textDocument/definition", {
             "textDocument": {"uri": uri},
             "position": {"line": line - 1, "character": character},  # Convert to 0-indexed
         })
@@ -390,10 +638,8 @@ class LSPResolver:
         if not self._initialized:
             return LSPResult(success=False, error="Not initialized", method="textDocument/references")
 
-        await self._open_document(file_path)
-
         uri = f"file://{Path(file_path).absolute()}"
-        result = await self._request("textDocument/references", {
+        result = await self._document_request(file_path, "textDocument/references", {
             "textDocument": {"uri": uri},
             "position": {"line": line - 1, "character": character},
             "context": {"includeDeclaration": include_declaration},
@@ -425,10 +671,8 @@ class LSPResolver:
         if not self._initialized:
             return LSPResult(success=False, error="Not initialized", method="textDocument/hover")
 
-        await self._open_document(file_path)
-
         uri = f"file://{Path(file_path).absolute()}"
-        result = await self._request("textDocument/hover", {
+        result = await self._document_request(file_path, "textDocument/hover", {
             "textDocument": {"uri": uri},
             "position": {"line": line - 1, "character": character},
         })
@@ -462,10 +706,8 @@ class LSPResolver:
         if not self._initialized:
             return LSPResult(success=False, error="Not initialized", method="textDocument/documentSymbol")
 
-        await self._open_document(file_path)
-
         uri = f"file://{Path(file_path).absolute()}"
-        result = await self._request("textDocument/documentSymbol", {
+        result = await self._document_request(file_path, "textDocument/documentSymbol", {
             "textDocument": {"uri": uri},
         })
 
@@ -499,40 +741,222 @@ class LSPResolver:
 
         return result
 
-    async def _open_document(self, file_path: str) -> None:
-        """Open a document in the language server."""
+    async def resolve_many(
+        self,
+        requests: Iterable[Union[ResolveRequest, Tuple]],
+        window: int = 16,
+    ) -> List[LSPResult]:
+        """
+        Run many lookups concurrently, at most `window` in flight.
+
+        Args:
+            requests: ResolveRequest objects or (method, file_path, line, character) tuples;
+                method is one of definition, references, hover, symbols
+            window: Maximum concurrent requests to the server
+
+        Returns:
+            One LSPResult per request, in input order
+        """
+        handlers = {
+            "definition": self.find_definition,
+            "references": self.find_references,
+            "hover": self.get_hover,
+        }
+        semaphore = asyncio.Semaphore(max(1, window))
+
+        async def run(request: Union[ResolveRequest, Tuple]) -> LSPResult:
+            if not isinstance(request, ResolveRequest):
+                request = ResolveRequest(*request)
+            async with semaphore:
+                if request.method == "symbols":
+                    return await self.get_document_symbols(request.file_path)
+                handler = handlers.get(request.method)
+                if handler is None:
+                    return LSPResult(success=False, error=f"Unknown method: {request.method}",
+                                     method=request.method)
+                return await handler(request.file_path, request.line, request.character)
+
+        return list(await asyncio.gather(*(run(request) for request in requests)))
+
+    async def prefetch_document_symbols(
+        self,
+        directory: Union[str, Path],
+        suffixes: Optional[Iterable[str]] = None,
+        window: int = 16,
+    ) -> Dict[str, LSPResult]:
+        """
+        Load documentSymbol for every source file under a directory.
+
+        Results land in the result cache, so later get_document_symbols
+        calls for unchanged files are answered without the server.
+
+        Args:
+            directory: Directory to scan recursively
+            suffixes: File suffixes to include (default: the server's languages)
+            window: Maximum concurrent requests to the server
+
+        Returns:
+            Mapping of file path to LSPResult
+        """
+        if suffixes is None:
+            executable = Path(self.server_cmd[0]).name if self.server_cmd else ""
+            suffixes = [ext for ext, cmd in self.SERVER_COMMANDS.items() if cmd[0] == executable]
+        suffixes = set(suffixes or LANGUAGE_IDS)
+
+        paths = sorted(
+            str(path) for path in Path(directory).rglob("*")
+            if path.suffix in suffixes and path.is_file()
+        )
+        results = await self.resolve_many([ResolveRequest("symbols", path) for path in paths], window=window)
+        return dict(zip(paths, results))
+
+    def clear_cache(self) -> None:
+        """Drop all cached results, e.g. after edits across the workspace."""
+        if self.cache:
+            self.cache.clear()
+
+    async def close_document(self, file_path: str) -> None:
+        """Close a document previously opened in the language server."""
+        uri = f"file://{Path(file_path).absolute()}"
+        document = self._documents.pop(uri, None)
+        if document is not None and document.version:
+            await self._notify("textDocument/didClose", {"textDocument": {"uri": uri}})
+
+    async def _document_request(
+        self,
+        file_path: str,
+        method: str,
+        params: Dict[str, Any],
+    ) -> LSPResult:
+        """
+        Send a per-document request, answering from the result cache if possible.
+
+        The document is only synced to the server on a cache miss.
+        Identical requests already in flight share one round trip.
+        """
+        if self.cache is None:
+            await self._open_document(file_path)
+            return await self._request(method, params)
+
+        document = await self._open_document(file_path, sync=False)
+        if document is None:
+            return await self._request(method, params)
+
+        uri = f"file://{Path(file_path).absolute()}"
+        params_key = json.dumps(params, sort_keys=True)
+        workspace = str(self.workspace_root)
+        cacheable = method in self.cache_methods
+        if cacheable:
+            cached = await self._cache_io(self.cache.get, workspace, uri, document.digest, method, params_key)
+            if cached is not _MISSING:
+                return LSPResult(success=True, data=cached, method=method)
+
+        key = (uri, document.digest, method, params_key)
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            try:
+                result = await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The request we were waiting on was cancelled; issue our own
+                return await self._document_request(file_path, method, params)
+            return LSPResult(success=result.success, data=result.data, error=result.error,
+                             method=method, elapsed_ms=result.elapsed_ms)
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            document = await self._open_document(file_path)
+            result = await self._request(method, params)
+            if cacheable and result.success and document is not None:
+                await self._cache_io(self.cache.set, workspace, uri, document.digest, method, params_key, result.data)
+            future.set_result(result)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters get the exception; don't warn about it going unread here
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+        return LSPResult(success=result.success, data=result.data, error=result.error,
+                         method=method, elapsed_ms=result.elapsed_ms)
+
+    async def _cache_io(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a cache operation, in a worker thread if it touches SQLite."""
+        if self.cache.persistent:
+            return await asyncio.to_thread(func, *args)
+        return func(*args)
+
+    async def _open_document(self, file_path: str, sync: bool = True) -> Optional[_OpenDocument]:
+        """
+        Track a document and, with sync, make sure the server has its contents.
+
+        The file is re-hashed only when its mtime or size moved. didOpen is
+        sent the first time a document is synced and didChange when its
+        hash changed since; otherwise nothing is sent.
+
+        Returns:
+            Document state, or None if the file does not exist
+        """
         path = Path(file_path).absolute()
         uri = f"file://{path}"
 
-        try:
-            content = path.read_text()
-        except FileNotFoundError:
-            logger.warning(f"File not found: {file_path}")
-            return
+        if self._document_lock is None:
+            self._document_lock = asyncio.Lock()
 
-        # Detect language ID from extension
-        lang_ids = {
-            ".py": "python",
-            ".ts": "typescript",
-            ".js": "javascript",
-            ".rs": "rust",
-            ".go": "go",
-            ".java": "java",
-            ".c": "c",
-            ".cpp": "cpp",
-            ".h": "c",
-            ".hpp": "cpp",
-        }
-        lang_id = lang_ids.get(path.suffix, "plaintext")
-
-        await self._notify("textDocument/didOpen", {
-            "textDocument": {
-                "uri": uri,
-                "languageId": lang_id,
-                "version": 1,
-                "text": content,
-            }
-        })
+        async with self._document_lock:
+            try:
+                stat = path.stat()
+                document = self._documents.get(uri)
+                content = None
+                if document is None or document.mtime_ns != stat.st_mtime_ns or document.size != stat.st_size:
+                    raw = path.read_bytes()
+                    digest = hashlib.sha256(raw).hexdigest()
+                    content = raw.decode("utf-8", errors="replace")
+                    if document is None:
+                        document = self._documents[uri] = _OpenDocument(0, stat.st_mtime_ns, stat.st_size, digest)
+                        if self.cache:
+                            # Results for older contents can never be hit again
+                            await self._cache_io(self.cache.invalidate, uri, digest)
+                    else:
+                        document.mtime_ns = stat.st_mtime_ns
+                        document.size = stat.st_size
+                        if document.digest != digest:
+                            document.digest = digest
+                            document.synced = False
+                            if self.cache:
+                                await self._cache_io(self.cache.invalidate, uri, digest)
+                if not sync or document.synced:
+                    return document
+                if content is None:
+                    content = path.read_bytes().decode("utf-8", errors="replace")
+            except FileNotFoundError:
+                logger.warning(f"File not found: {file_path}")
+                return None
+
+            document.synced = True
+            if not document.version:
+                document.version = 1
+                await self._notify("textDocument/didOpen", {
+                    "textDocument": {
+                        "uri": uri,
+                        "languageId": LANGUAGE_IDS.get(path.suffix, "plaintext"),
+                        "version": 1,
+                        "text": content,
+                    }
+                })
+                return document
+
+            document.version += 1
+            await self._notify("textDocument/didChange", {
+                "textDocument": {"uri": uri, "version": document.version},
+                "contentChanges": [{"text": content}],
+            })
+            return document
 
     async def _request(
         self,
@@ -554,23 +978,18 @@ class LSPResolver:
         }
 
         # Create future for response
-        future: asyncio.Future = asyncio.Future()
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
         self._pending_requests[request_id] = future
 
         # Send request
-        content = json.dumps(message)
-        if self._process and self._process.stdin:
-            header = f"Content-Length: {len(content)}\r\n\r\n"
-
-            try:
-                self._process.stdin.write((header + content).encode())
-                self._process.stdin.flush()
-            except BrokenPipeError:
-                return LSPResult(
-                    success=False,
-                    error="Server connection lost",
-                    method=method,
-                )
+        reader_alive = self._read_task is not None and not self._read_task.done()
+        if not reader_alive or not await self._send(message):
+            self._pending_requests.pop(request_id, None)
+            return LSPResult(
+                success=False,
+                error="Server connection lost",
+                method=method,
+            )
 
         # Wait for response
         try:
@@ -594,12 +1013,18 @@ class LSPResolver:
             )
 
         except asyncio.TimeoutError:
-            del self._pending_requests[request_id]
+            self._pending_requests.pop(request_id, None)
             return LSPResult(
                 success=False,
                 error="Request timed out",
                 method=method,
             )
+        except ConnectionError:
+            return LSPResult(
+                success=False,
+                error="Server connection lost",
+                method=method,
+            )
 
     async def _notify(
         self,
@@ -613,80 +1038,83 @@ class LSPResolver:
             "params": params or {},
         }
 
-        content = json.dumps(message)
-        if self._process and self._process.stdin:
-            header = f"Content-Length: {len(content)}\r\n\r\n"
+        if not await self._send(message):
+            logger.warning("Server connection lost during notification")
 
-            try:
-                self._process.stdin.write((header + content).encode())
-                self._process.stdin.flush()
-            except BrokenPipeError:
-                logger.warning("Server connection lost during notification")
+    async def _send(self, message: Dict[str, Any]) -> bool:
+        """Write one framed message to the server; False if the pipe is gone."""
+        if not self._process or not self._process.stdin:
+            return False
+
+        body = json.dumps(message).encode("utf-8")
+        # A single write keeps frames from concurrent senders intact
+        self._process.stdin.write(b"Content-Length: %d\r\n\r\n%s" % (len(body), body))
+        try:
+            await self._process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            return False
+        return True
 
     async def _read_loop(self) -> None:
-        """Read responses from language server."""
+        """Read framed messages from the server and resolve requests by id."""
         if not self._process or not self._process.stdout:
             return
 
-        buffer = b""
-
-        while True:
-            try:
+        reader = self._process.stdout
+        try:
+            while True:
                 # Read headers
-                chunk = await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: self._process.stdout.read(1) if self._process and self._process.stdout else b""
-                )
-
-                if not chunk:
+                try:
+                    headers = await reader.readuntil(b"\r\n\r\n")
+                except asyncio.IncompleteReadError:
                     break
 
-                buffer += chunk
-
-                # Check for header separator
-                if b"\r\n\r\n" in buffer:
-                    header_end = buffer.index(b"\r\n\r\n")
-                    headers = buffer[:header_end].decode()
-                    buffer = buffer[header_end + 4:]
-
-                    # Parse content length
-                    content_length = 0
-                    for line in headers.split("\r\n"):
-                        if line.lower().startswith("content-length:"):
-                            content_length = int(line.split(":")[1].strip())
-
-                    # Read content
-                    while len(buffer) < content_length:
-                        chunk = await asyncio.get_event_loop().run_in_executor(
-                            None,
-                            lambda: self._process.stdout.read(content_length - len(buffer)) if self._process and self._process.stdout else b""
-                        )
-                        if not chunk:
-                            break
-                        buffer += chunk
-
-                    content = buffer[:content_length].decode()
-                    buffer = buffer[content_length:]
-
-                    # Parse JSON
-                    try:
-                        message = json.loads(content)
-
-                        # Handle response
-                        if "id" in message:
-                            request_id = message["id"]
-                            if request_id in self._pending_requests:
-                                self._pending_requests[request_id].set_result(message)
-                                del self._pending_requests[request_id]
-
-                    except json.JSONDecodeError:
-                        logger.warning(f"Invalid JSON from server: {content[:100]}")
+                content_length = 0
+                for line in headers.split(b"\r\n"):
+                    if line[:15].lower() == b"content-length:":
+                        content_length = int(line[15:].strip())
 
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Error reading from server: {e}")
-                break
+                # Read content
+                try:
+                    content = await reader.readexactly(content_length)
+                except asyncio.IncompleteReadError:
+                    break
+
+                # Parse JSON
+                try:
+                    message = json.loads(content)
+                except json.JSONDecodeError:
+                    logger.warning(f"Invalid JSON from server: {content[:100]!r}")
+                    continue
+
+                if "method" in message:
+                    if "id" in message:
+                        # Server-to-client request; answer so the server doesn't stall
+                        await self._send({"jsonrpc": "2.0", "id": message["id"], "result": None})
+                    continue
+
+                # Handle response
+                future = self._pending_requests.pop(message.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(message)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error reading from server: {e}")
+        finally:
+            # Fail outstanding requests instead of leaving them to time out
+            pending, self._pending_requests = self._pending_requests, {}
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Server connection lost"))
+
+    async def _drain_stderr(self) -> None:
+        """Consume server stderr so a chatty server never blocks on a full pipe."""
+        if not self._process or not self._process.stderr:
+            return
+        async for line in self._process.stderr:
+            logger.debug(f"LSP server: {line.decode(errors='replace').rstrip()}")
 
     def _parse_locations(
         self,
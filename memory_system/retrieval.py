@@ -2,10 +2,10 @@
 Retrieval engine for memory system
 Handles different retrieval strategies
 """
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 
-from .core import MemoryEntry, RetrievalResult, MemoryStore
+from .core import MemoryEntry, MemoryFilter, RetrievalResult, MemoryStore
 
 
 class RetrievalEngine:
@@ -16,11 +16,58 @@ class RetrievalEngine:
     - Semantic: Vector similarity search
     - Temporal: Time-based filtering
     - Hybrid: Semantic + temporal + metadata
+    
+    Type, metadata and time filters are pushed down to stores that
+    support it. Whatever a store cannot filter natively is applied here
+    with an over-fetch that grows until enough matches are found or the
+    store is exhausted, so selective filters still fill ``limit``.
     """
     
+    # Initial over-fetch factor and growth per round for non-pushdown stores
+    OVERFETCH_FACTOR = 3
+    OVERFETCH_GROWTH = 4
+    
     def __init__(self, vector_store: MemoryStore):
         self.vector_store = vector_store
     
+    def _filtered_retrieve(
+        self,
+        query: str,
+        count: int,
+        memory_filter: MemoryFilter,
+    ) -> Tuple[List[Tuple[MemoryEntry, float]], Dict[str, Any]]:
+        """Retrieve up to count (entry, score) pairs that match the filter"""
+        pushdown = getattr(self.vector_store, "supports_filter_pushdown", False)
+        if memory_filter.is_empty or pushdown:
+            fetch = count
+        else:
+            fetch = count * self.OVERFETCH_FACTOR
+        try:
+            total = self.vector_store.count()
+        except Exception:
+            total = None
+        
+        rounds = 0
+        while True:
+            rounds += 1
+            kwargs = {"memory_filter": memory_filter} if pushdown else {}
+            results = self.vector_store.retrieve(
+                query=query,
+                limit=fetch,
+                memory_types=memory_filter.memory_types,
+                **kwargs
+            )
+            matched = [
+                (entry, score)
+                for entry, score in zip(results.entries, results.scores)
+                if memory_filter.matches(entry)
+            ]
+            exhausted = len(results.entries) < fetch or (total is not None and fetch >= total)
+            if len(matched) >= count or exhausted:
+                metadata = {**results.metadata, "fetch_rounds": rounds, "pushdown": pushdown}
+                return matched[:count], metadata
+            fetch *= self.OVERFETCH_GROWTH
+    
     def semantic_search(
         self,
         query: str,
@@ -73,23 +120,12 @@ class RetrievalEngine:
             time_window: Only return memories within this time window
             recent_first: Sort by recency
         """
-        # Get semantic results
-        results = self.vector_store.retrieve(
-            query=query,
-            limit=limit * 2,  # Get more to filter
-            memory_types=memory_types
+        # Get semantic results within the window (2x pool to re-rank by recency)
+        memory_filter = MemoryFilter(
+            memory_types=memory_types,
+            since=datetime.now() - time_window if time_window else None,
         )
-        
-        # Apply temporal filtering
-        if time_window:
-            cutoff = datetime.now() - time_window
-            filtered = [
-                (entry, score)
-                for entry, score in zip(results.entries, results.scores)
-                if entry.timestamp >= cutoff
-            ]
-        else:
-            filtered = list(zip(results.entries, results.scores))
+        filtered, result_metadata = self._filtered_retrieve(query, limit * 2, memory_filter)
         
         # Sort by recency if requested
         if recent_first:
@@ -102,7 +138,7 @@ class RetrievalEngine:
             entries=[e for e, _ in filtered],
             scores=[s for _, s in filtered],
             metadata={
-                **results.metadata,
+                **result_metadata,
                 "temporal_filter": time_window.total_seconds() if time_window else None
             }
         )
@@ -129,31 +165,19 @@ class RetrievalEngine:
             recency_weight: Weight for recency in scoring
             relevance_weight: Weight for relevance in scoring
         """
-        # Get semantic results (more than needed for filtering)
-        results = self.vector_store.retrieve(
-            query=query,
-            limit=limit * 3,
-            memory_types=memory_types
+        # Get matching semantic results (3x pool to re-rank by hybrid score)
+        now = datetime.now()
+        memory_filter = MemoryFilter(
+            memory_types=memory_types,
+            metadata=dict(metadata_filters or {}),
+            since=now - time_window if time_window else None,
         )
+        candidates, result_metadata = self._filtered_retrieve(query, limit * 3, memory_filter)
         
-        # Apply filters and calculate hybrid scores
+        # Calculate hybrid scores
         filtered = []
-        now = datetime.now()
         
-        for entry, relevance_score in zip(results.entries, results.scores):
-            # Temporal filter
-            if time_window and entry.timestamp < now - time_window:
-                continue
-            
-            # Metadata filters
-            if metadata_filters:
-                match = all(
-                    entry.metadata.get(key) == value
-                    for key, value in metadata_filters.items()
-                )
-                if not match:
-                    continue
-            
+        for entry, relevance_score in candidates:
             # Calculate hybrid score
             # Recency score (0-1, recent = higher)
             age_seconds = (now - entry.timestamp).total_seconds()
@@ -183,7 +207,9 @@ class RetrievalEngine:
                     "recency_weight": recency_weight,
                     "relevance_weight": relevance_weight
                 },
-                "relevance_scores": [rs for _, _, rs in filtered]
+                "relevance_scores": [rs for _, _, rs in filtered],
+                "fetch_rounds": result_metadata["fetch_rounds"],
+                "pushdown": result_metadata["pushdown"]
             }
         )
     
@@ -196,28 +222,32 @@ class RetrievalEngine:
         """
         Get most recent memories
         
-        Note: This requires the vector store to support listing by time
-        For now, retrieves all and sorts (not efficient for large datasets)
+        Stores with filter pushdown answer from a timestamp index, reading
+        only the entries returned. Stores that only list recent entries are
+        filtered here; anything else falls back to retrieving with a
+        generic query and sorting (not efficient for large datasets).
         """
-        # This is a simplified implementation
-        # Production version should use database's temporal indexing
+        memory_filter = MemoryFilter(
+            memory_types=memory_types,
+            since=datetime.now() - time_window if time_window else None,
+        )
+        
+        if getattr(self.vector_store, "supports_filter_pushdown", False):
+            return self.vector_store.list_recent(limit, memory_filter=memory_filter)
         
         if hasattr(self.vector_store, 'list_recent'):
-            return self.vector_store.list_recent(limit)
+            # Recency-ordered already; grow the window until the filter is satisfied
+            fetch = limit
+            while True:
+                recent = self.vector_store.list_recent(fetch)
+                matched = [entry for entry in recent if memory_filter.matches(entry)]
+                if len(matched) >= limit or len(recent) < fetch:
+                    return matched[:limit]
+                fetch *= self.OVERFETCH_GROWTH
         
         # Fallback: retrieve with generic query and sort
-        # This is inefficient but works
-        results = self.vector_store.retrieve(
-            query="recent memories",  # Generic query
-            limit=limit * 2,
-            memory_types=memory_types
-        )
-        
-        # Filter by time window
-        entries = results.entries
-        if time_window:
-            cutoff = datetime.now() - time_window
-            entries = [e for e in entries if e.timestamp >= cutoff]
+        matched, _ = self._filtered_retrieve("recent memories", limit * 2, memory_filter)
+        entries = [entry for entry, _ in matched]
         
         # Sort by timestamp
         entries.sort(key=lambda x: x.timestamp, reverse=True)
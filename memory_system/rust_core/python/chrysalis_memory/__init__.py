@@ -146,6 +146,8 @@ except ImportError:
     MemoryType = None
     SyncStatus = None
 
+from chrysalis_memory.vector_index import NUMPY_AVAILABLE, VectorIndex
+
 
 __all__ = [
     # Rust CRDT types
@@ -166,6 +168,7 @@ __all__ = [
     "AgentMemory",
     "AgentMemoryConfig",
     "SyncManager",
+    "VectorIndex",
     # Utility
     "RUST_AVAILABLE",
 ]
@@ -198,6 +201,9 @@ class AgentMemoryConfig:
     embedding_model: str = "nomic-embed-text"
     embedding_base_url: str = "http://localhost:11434"
 
+    # Recall index (0 disables the FAISS HNSW backend)
+    vector_index_ann_threshold: int = 50_000
+
     @classmethod
     def from_env(cls, agent_id: str) -> "AgentMemoryConfig":
         """Load configuration from environment variables."""
@@ -214,6 +220,7 @@ class AgentMemoryConfig:
             embedding_provider=os.getenv("EMBEDDING_PROVIDER", "ollama"),
             embedding_model=os.getenv("OLLAMA_EMBEDDING_MODEL", "nomic-embed-text"),
             embedding_base_url=os.getenv("OLLAMA_BASE_URL", "http://localhost:11434"),
+            vector_index_ann_threshold=int(os.getenv("VECTOR_INDEX_ANN_THRESHOLD", "50000")),
         )
 
 
@@ -336,6 +343,14 @@ class AgentMemory:
         self._embedding_fn = embedding_fn
         self._embedding_cache: Dict[str, List[float]] = {}
 
+        # Vector index for recall, built from storage on first use
+        self._vector_index: Optional[VectorIndex] = None
+        if NUMPY_AVAILABLE:
+            self._vector_index = VectorIndex(
+                ann_threshold=self.config.vector_index_ann_threshold
+            )
+        self._vector_index_loaded = False
+
     async def __aenter__(self) -> "AgentMemory":
         """Async context manager entry."""
         await self.start()
@@ -407,6 +422,7 @@ class AgentMemory:
                 memory.add_evidence(ev)
 
         # Generate embedding if function provided
+        stored_vector = None
         if self._embedding_fn:
             try:
                 embedding = await self._get_embedding(content)
@@ -418,11 +434,14 @@ class AgentMemory:
                     )
                     self.storage.put_embedding(emb_doc)
                     memory.embedding_ref = emb_doc.id
+                    stored_vector = embedding
             except Exception as e:
                 # Log but continue without embedding
                 print(f"Embedding error: {e}")
 
-        return self.storage.put(memory)
+        memory_id = self.storage.put(memory)
+        self._index_memory(memory, stored_vector)
+        return memory_id
 
     async def recall(
         self,
@@ -435,6 +454,14 @@ class AgentMemory:
         """
         Recall relevant memories.
 
+        With an embedding function, results come from an in-process vector
+        index that is loaded from storage on the first recall and then kept
+        current only by this object's ``learn`` and ``update``.
+        Writes by anything else (another AgentMemory or process on the same
+        database, ``storage.merge_collection``, or a future
+        ``SyncManager.pull`` that applies remote changes) leave it stale
+        until ``refresh_index`` is called.
+
         Args:
             query: Search query
             k: Number of results
@@ -445,6 +472,16 @@ class AgentMemory:
         Returns:
             List of relevant memories
         """
+        if self._embedding_fn and self._vector_index is not None:
+            query_embedding = await self._get_embedding(query)
+            if not self._vector_index_loaded:
+                self.refresh_index()
+            dimension = self._vector_index.dimension
+            if dimension is None or len(query_embedding) == dimension:
+                return self._recall_indexed(
+                    query, query_embedding, k, memory_type, min_importance, tags
+                )
+
         # Get all memories that match filters
         if memory_type:
             memories = self.storage.query_by_type(memory_type)
@@ -463,6 +500,12 @@ class AgentMemory:
         else:
             memories = self.storage.all()
 
+        # Apply the remaining filters
+        if min_importance:
+            memories = [m for m in memories if m.get_importance() >= min_importance]
+        if tags:
+            memories = [m for m in memories if set(tags).issubset(m.get_tags())]
+
         # If we have embedding function, score by similarity
         if self._embedding_fn and memories:
             query_embedding = await self._get_embedding(query)
@@ -496,6 +539,80 @@ class AgentMemory:
         )
         return memories[:k]
 
+    def _recall_indexed(
+        self,
+        query: str,
+        query_embedding: List[float],
+        k: int,
+        memory_type: Optional[str],
+        min_importance: Optional[float],
+        tags: Optional[List[str]],
+    ) -> List[MemoryDocument]:
+        """Top-k recall from the vector index; filters are row masks."""
+        index = self._vector_index
+        scored = []
+        if index.dimension is not None:
+            scored = index.search(query_embedding, k, memory_type, min_importance, tags)
+
+        # Memories without a stored embedding keep the text match score
+        for memory_id in index.unembedded(memory_type, min_importance, tags):
+            memory = self.storage.get(memory_id)
+            if memory is not None:
+                scored.append((memory_id, self._text_match_score(query, memory.content)))
+
+        scored.sort(key=lambda x: x[1], reverse=True)
+        results = []
+        for memory_id, _ in scored[:k]:
+            memory = self.storage.get(memory_id)
+            if memory is not None:
+                results.append(memory)
+        return results
+
+    def refresh_index(self) -> int:
+        """
+        Rebuild the recall index from storage.
+
+        Runs automatically on the first recall. Call it after storage
+        changes outside this object (another writer on the same database,
+        ``storage.merge_collection``, or pulled sync changes); the index
+        does not watch storage.
+
+        Returns:
+            Number of memories indexed
+        """
+        if self._vector_index is None:
+            return 0
+        self._vector_index.clear()
+        memories = self.storage.all()
+        for memory in memories:
+            self._vector_index.upsert(
+                memory.id,
+                self._stored_vector(memory),
+                memory.memory_type,
+                memory.get_importance(),
+                memory.get_tags(),
+            )
+        self._vector_index_loaded = True
+        return len(memories)
+
+    def _index_memory(self, memory: MemoryDocument, vector: Optional[List[float]]):
+        """Add or replace a memory in the recall index once it is built."""
+        if self._vector_index_loaded:
+            self._vector_index.upsert(
+                memory.id,
+                vector,
+                memory.memory_type,
+                memory.get_importance(),
+                memory.get_tags(),
+            )
+
+    def _stored_vector(self, memory: MemoryDocument) -> Optional[List[float]]:
+        """Embedding stored for a memory's current content, if any."""
+        if not getattr(memory, "embedding_ref", None):
+            return None
+        emb_doc = self.storage.get_embedding_by_hash(memory.content_hash)
+        return emb_doc.get_vector() if emb_doc else None
+
     async def get(self, memory_id: str) -> Optional[MemoryDocument]:
         """Get a specific memory by ID."""
         return self.storage.get(memory_id)
@@ -536,6 +653,16 @@ class AgentMemory:
                 memory.remove_tag(tag)
 
         self.storage.put(memory)
+        if self._vector_index_loaded:
+            if content:
+                # New content hash: the old embedding no longer applies
+                self._index_memory(memory, self._stored_vector(memory))
+            else:
+                self._vector_index.set_metadata(
+                    memory.id,
+                    importance=memory.get_importance(),
+                    tags=memory.get_tags(),
+                )
         return memory
 
     async def record_access(self, memory_id: str) -> bool:
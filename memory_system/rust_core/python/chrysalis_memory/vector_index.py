@@ -0,0 +1,319 @@
+"""
+In-process vector index for AgentMemory.recall.
+
+Keeps every stored embedding as an L2-normalized row of one contiguous
+float32 matrix, with an ID map and per-row metadata (memory type,
+importance, tags) so recall filters become boolean masks instead of
+storage queries. Exact top-k uses a matrix-vector product and
+``argpartition``; above ``ann_threshold`` candidate rows an optional
+FAISS HNSW index is used instead.
+
+Requires NumPy; FAISS is optional.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
+NUMPY_AVAILABLE = np is not None
+FAISS_AVAILABLE = faiss is not None
+
+
+class VectorIndex:
+    """
+    Embedding matrix with an ID map and metadata masks.
+
+    Rows are appended in insertion order and never move. Removing a
+    memory only clears its ``alive`` flag, so row numbers stay valid for
+    the ANN index (which cannot delete).
+
+    Example:
+        >>> index = VectorIndex()
+        >>> index.upsert("mem-1", [1.0, 0.0], memory_type="semantic", importance=0.9)
+        >>> index.search([1.0, 0.1], k=1)
+        [('mem-1', 0.995...)]
+    """
+
+    def __init__(
+        self,
+        ann_threshold: int = 50_000,
+        ann_m: int = 32,
+        ann_ef_construction: int = 80,
+        ann_ef_search: int = 128,
+    ):
+        """
+        Create an empty index.
+
+        Args:
+            ann_threshold: Candidate rows above which the FAISS HNSW index
+                is used (0 disables it; ignored without FAISS)
+            ann_m: HNSW graph degree
+            ann_ef_construction: HNSW build-time beam width
+            ann_ef_search: HNSW query-time beam width (at least k)
+        """
+        if np is None:
+            raise ImportError("VectorIndex requires numpy")
+        self.ann_threshold = ann_threshold
+        self.ann_m = ann_m
+        self.ann_ef_construction = ann_ef_construction
+        self.ann_ef_search = ann_ef_search
+        self.clear()
+
+    def clear(self):
+        """Drop all rows."""
+        self.ids: List[str] = []
+        self.dimension: Optional[int] = None
+        self._rows: Dict[str, int] = {}
+        self._capacity = 0
+        self._matrix = None  # (capacity, dimension) float32, allocated on first vector
+        self._has_vector = np.zeros(0, dtype=bool)
+        self._alive = np.zeros(0, dtype=bool)
+        self._importance = np.zeros(0, dtype=np.float64)
+        self._type_codes = np.zeros(0, dtype=np.int32)
+        self._type_ids: Dict[str, int] = {}
+        self._tag_rows: Dict[str, Set[int]] = {}
+        self._row_tags: List[Set[str]] = []
+        self._ann = None
+        self._ann_rows = 0
+
+    def __len__(self) -> int:
+        return int(self._alive[:len(self.ids)].sum())
+
+    def __contains__(self, memory_id: str) -> bool:
+        row = self._rows.get(memory_id)
+        return row is not None and bool(self._alive[row])
+
+    # =========================================================================
+    # Maintenance
+    # =========================================================================
+
+    def upsert(
+        self,
+        memory_id: str,
+        vector: Optional[Sequence[float]],
+        memory_type: str = "",
+        importance: float = 0.0,
+        tags: Optional[Sequence[str]] = None,
+    ):
+        """
+        Add a memory or replace its vector and metadata.
+
+        Memories without a usable vector (missing, zero, or a different
+        dimension than the index) are kept for filtering only; see
+        ``unembedded``.
+        """
+        row = self._rows.get(memory_id)
+        if row is None:
+            row = len(self.ids)
+            self._reserve(row + 1)
+            self.ids.append(memory_id)
+            self._rows[memory_id] = row
+            self._row_tags.append(set())
+        elif row < self._ann_rows:
+            # HNSW cannot update a row in place; rebuild on next search
+            self._ann = None
+            self._ann_rows = 0
+
+        self._alive[row] = True
+        self._set_vector(row, vector)
+        self.set_metadata(memory_id, memory_type, importance, tags or ())
+
+    def set_metadata(
+        self,
+        memory_id: str,
+        memory_type: Optional[str] = None,
+        importance: Optional[float] = None,
+        tags: Optional[Sequence[str]] = None,
+    ) -> bool:
+        """
+        Update filter metadata without touching the vector.
+
+        Arguments left as None are unchanged.
+
+        Returns:
+            False if the memory is not indexed
+        """
+        row = self._rows.get(memory_id)
+        if row is None:
+            return False
+        if memory_type is not None:
+            code = self._type_ids.setdefault(memory_type, len(self._type_ids))
+            self._type_codes[row] = code
+        if importance is not None:
+            self._importance[row] = importance
+        if tags is not None:
+            for tag in self._row_tags[row]:
+                self._tag_rows[tag].discard(row)
+            self._row_tags[row] = set(tags)
+            for tag in self._row_tags[row]:
+                self._tag_rows.setdefault(tag, set()).add(row)
+        return True
+
+    def remove(self, memory_id: str) -> bool:
+        """Exclude a memory from results (its row is kept)."""
+        row = self._rows.get(memory_id)
+        if row is None or not self._alive[row]:
+            return False
+        self._alive[row] = False
+        return True
+
+    def _reserve(self, size: int):
+        if size <= self._capacity:
+            return
+        capacity = max(64, self._capacity * 2, size)
+        for name in ("_has_vector", "_alive", "_importance", "_type_codes"):
+            old = getattr(self, name)
+            grown = np.zeros(capacity, dtype=old.dtype)
+            grown[:len(old)] = old
+            setattr(self, name, grown)
+        if self._matrix is not None:
+            grown = np.zeros((capacity, self.dimension), dtype=np.float32)
+            grown[:self._capacity] = self._matrix
+            self._matrix = grown
+        self._capacity = capacity
+
+    def _set_vector(self, row: int, vector: Optional[Sequence[float]]):
+        if vector is not None and len(vector) and self.dimension is None:
+            self.dimension = len(vector)
+            self._matrix = np.zeros((self._capacity, self.dimension), dtype=np.float32)
+        usable = vector is not None and self.dimension is not None and len(vector) == self.dimension
+        if usable:
+            values = np.asarray(vector, dtype=np.float32)
+            norm = float(np.linalg.norm(values))
+            usable = norm > 0.0
+        if usable:
+            self._matrix[row] = values / norm
+        elif self._matrix is not None:
+            self._matrix[row] = 0.0
+        self._has_vector[row] = usable
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def mask(
+        self,
+        memory_type: Optional[str] = None,
+        min_importance: Optional[float] = None,
+        tags: Optional[Sequence[str]] = None,
+    ):
+        """
+        Boolean mask over rows of live memories matching every filter.
+
+        Args:
+            memory_type: Exact memory type
+            min_importance: Importance >= this value
+            tags: Memories carrying all of these tags
+        """
+        n = len(self.ids)
+        mask = self._alive[:n].copy()
+        if memory_type:
+            code = self._type_ids.get(memory_type)
+            if code is None:
+                return np.zeros(n, dtype=bool)
+            mask &= self._type_codes[:n] == code
+        if min_importance:
+            mask &= self._importance[:n] >= min_importance
+        for tag in tags or ():
+            rows = self._tag_rows.get(tag)
+            if not rows:
+                return np.zeros(n, dtype=bool)
+            tagged = np.zeros(n, dtype=bool)
+            tagged[np.fromiter(rows, dtype=np.int64, count=len(rows))] = True
+            mask &= tagged
+        return mask
+
+    def search(
+        self,
+        query: Sequence[float],
+        k: int = 10,
+        memory_type: Optional[str] = None,
+        min_importance: Optional[float] = None,
+        tags: Optional[Sequence[str]] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        Top-k cosine similarity among memories matching the filters.
+
+        Returns:
+            (memory_id, similarity) pairs, best first
+
+        Raises:
+            ValueError: If the query dimension differs from the index
+        """
+        if self.dimension is None or k <= 0:
+            return []
+        if len(query) != self.dimension:
+            raise ValueError(f"Query has dimension {len(query)}, index has {self.dimension}")
+        unit = np.asarray(query, dtype=np.float32)
+        norm = float(np.linalg.norm(unit))
+        if norm == 0.0:
+            return []
+        unit /= norm
+
+        n = len(self.ids)
+        mask = self.mask(memory_type, min_importance, tags)
+        mask &= self._has_vector[:n]
+        candidates = int(mask.sum())
+        if not candidates:
+            return []
+        if faiss is not None and self.ann_threshold and candidates >= self.ann_threshold:
+            return self._search_ann(unit, min(k, candidates), mask)
+
+        if candidates * 2 < n:
+            # Selective filter: score only the matching rows
+            rows = np.flatnonzero(mask)
+            similarities = self._matrix[rows] @ unit
+        else:
+            rows = None
+            similarities = self._matrix[:n] @ unit
+            similarities[~mask] = -np.inf
+        k = min(k, candidates)
+        top = np.argpartition(-similarities, k - 1)[:k]
+        top = top[np.argsort(-similarities[top], kind="stable")]
+        if rows is not None:
+            return [(self.ids[rows[i]], float(similarities[i])) for i in top]
+        return [(self.ids[i], float(similarities[i])) for i in top]
+
+    def unembedded(
+        self,
+        memory_type: Optional[str] = None,
+        min_importance: Optional[float] = None,
+        tags: Optional[Sequence[str]] = None,
+    ) -> List[str]:
+        """IDs of live memories without a usable vector that match the filters."""
+        n = len(self.ids)
+        mask = self.mask(memory_type, min_importance, tags) & ~self._has_vector[:n]
+        return [self.ids[i] for i in np.flatnonzero(mask)]
+
+    def _search_ann(self, unit, k: int, mask) -> List[Tuple[str, float]]:
+        n = len(self.ids)
+        if self._ann is None:
+            self._ann = faiss.IndexHNSWFlat(self.dimension, self.ann_m, faiss.METRIC_INNER_PRODUCT)
+            self._ann.hnsw.efConstruction = self.ann_ef_construction
+        if self._ann_rows < n:
+            self._ann.add(self._matrix[self._ann_rows:n])
+            self._ann_rows = n
+
+        params = faiss.SearchParametersHNSW()
+        params.efSearch = max(self.ann_ef_search, k)
+        if not mask.all():
+            # Filter inside the graph search rather than over-fetching
+            bitmap = np.packbits(mask, bitorder="little")
+            selector = faiss.IDSelectorBitmap(n, faiss.swig_ptr(bitmap))
+            params.sel = selector
+        similarities, labels = self._ann.search(unit.reshape(1, -1), k, params=params)
+        return [
+            (self.ids[label], float(similarity))
+            for label, similarity in zip(labels[0], similarities[0])
+            if label >= 0
+        ]
@@ -22,6 +22,7 @@ try:
         MemoryCollection,
         MemoryStorage,
         AgentMemory,
+        AgentMemoryConfig,
         RUST_AVAILABLE,
     )
 except ImportError:
@@ -373,6 +374,26 @@ class TestAgentMemory:
                 assert updated.get_importance() >= 0.9
                 assert "updated" in updated.get_tags()
 
+    @pytest.mark.skipif(not RUST_AVAILABLE, reason="Rust bindings required")
+    async def test_recall_ranks_by_embedding_with_filters(self):
+        vectors = {"cats": [1.0, 0.0], "dogs": [0.0, 1.0], "pets": [0.6, 0.8]}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = AgentMemoryConfig(
+                "test-agent",
+                db_path=os.path.join(tmpdir, "agent.db"),
+                sync_enabled=False,
+            )
+
+            async with AgentMemory("test-agent", config, embedding_fn=vectors.get) as memory:
+                await memory.learn("cats", importance=0.9, tags=["animal"])
+                await memory.learn("dogs", importance=0.2, tags=["animal"])
+
+                nearest = await memory.recall("pets", k=1)
+                important = await memory.recall("pets", k=1, min_importance=0.5, tags=["animal"])
+
+                assert [m.content for m in nearest] == ["dogs"]
+                assert [m.content for m in important] == ["cats"]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
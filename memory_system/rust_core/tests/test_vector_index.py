@@ -0,0 +1,223 @@
+"""
+Tests for the AgentMemory recall vector index.
+
+Run with: pytest tests/
+After: maturin develop
+"""
+
+import asyncio
+import hashlib
+import uuid
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+try:
+    import chrysalis_memory
+    from chrysalis_memory import vector_index
+    from chrysalis_memory.vector_index import VectorIndex
+except ImportError:
+    pytest.skip("chrysalis_memory package not importable", allow_module_level=True)
+
+
+def brute_force(vectors, query, k, allowed):
+    """Reference top-k by cosine similarity."""
+    query = np.asarray(query) / np.linalg.norm(query)
+    scored = [
+        (memory_id, float(np.dot(np.asarray(v) / np.linalg.norm(v), query)))
+        for memory_id, v in vectors.items() if memory_id in allowed
+    ]
+    return [memory_id for memory_id, _ in sorted(scored, key=lambda x: -x[1])[:k]]
+
+
+class StubDocument:
+    """Just enough of MemoryDocument for AgentMemory.learn/recall."""
+
+    def __init__(self, id=None, content="", memory_type="episodic", source_instance=""):
+        self.id = id or str(uuid.uuid4())
+        self.content = content
+        self.content_hash = hashlib.sha256(content.encode()).hexdigest()
+        self.memory_type = memory_type
+        self.source_instance = source_instance
+        self.embedding_ref = None
+        self.updated_at = 0.0
+        self._tags = set()
+        self._importance = 0.5
+
+    def add_tag(self, tag):
+        self._tags.add(tag)
+
+    def get_tags(self):
+        return sorted(self._tags)
+
+    def set_importance(self, value, writer):
+        self._importance = value
+
+    def get_importance(self):
+        return self._importance
+
+    def set_confidence(self, value, writer):
+        pass
+
+
+class StubEmbedding:
+    """EmbeddingDocument keyed by the hash of its text."""
+
+    def __init__(self, text, vector, model):
+        self.id = str(uuid.uuid4())
+        self.text_hash = hashlib.sha256(text.encode()).hexdigest()
+        self.vector = list(vector)
+
+    def get_vector(self):
+        return list(self.vector)
+
+
+class StubStorage:
+    """In-memory MemoryStorage with embeddings."""
+
+    def __init__(self, path=None, instance_id=None):
+        self.memories = {}
+        self.embeddings = {}
+
+    def put(self, memory):
+        self.memories[memory.id] = memory
+        return memory.id
+
+    def get(self, memory_id):
+        return self.memories.get(memory_id)
+
+    def all(self):
+        return list(self.memories.values())
+
+    def put_embedding(self, embedding):
+        self.embeddings[embedding.text_hash] = embedding
+        return embedding.id
+
+    def get_embedding_by_hash(self, text_hash):
+        return self.embeddings.get(text_hash)
+
+
+class TestVectorIndex:
+    """Tests for VectorIndex."""
+
+    def test_matches_brute_force_with_filters(self):
+        rng = np.random.default_rng(3)
+        index = VectorIndex(ann_threshold=0)
+        vectors, meta = {}, {}
+        for i in range(300):
+            memory_id = f"m{i}"
+            vectors[memory_id] = rng.normal(size=8).tolist()
+            meta[memory_id] = ("semantic" if i % 3 else "episodic", i / 300, {"even"} if i % 2 == 0 else set())
+            index.upsert(memory_id, vectors[memory_id], meta[memory_id][0], meta[memory_id][1], meta[memory_id][2])
+
+        query = rng.normal(size=8).tolist()
+        for memory_type, min_importance, tags in [
+            (None, None, None),
+            ("episodic", None, None),
+            (None, 0.9, None),
+            ("semantic", 0.5, ["even"]),
+        ]:
+            allowed = {
+                memory_id for memory_id, (t, imp, tg) in meta.items()
+                if (memory_type is None or t == memory_type)
+                and (min_importance is None or imp >= min_importance)
+                and set(tags or ()) <= tg
+            }
+            hits = index.search(query, 5, memory_type, min_importance, tags)
+            assert [memory_id for memory_id, _ in hits] == brute_force(vectors, query, 5, allowed)
+
+    def test_upsert_remove_and_metadata_updates(self):
+        index = VectorIndex(ann_threshold=0)
+        index.upsert("a", [1.0, 0.0], "semantic", 0.1, ["x"])
+        index.upsert("b", [0.0, 1.0], "semantic", 0.9)
+
+        index.upsert("a", [0.0, -1.0], "semantic", 0.1, ["x"])
+        assert [m for m, _ in index.search([0.0, 1.0], 2)] == ["b", "a"]
+
+        index.set_metadata("b", tags=["x"])
+        index.set_metadata("a", tags=[])
+        assert [m for m, _ in index.search([0.0, 1.0], 2, tags=["x"])] == ["b"]
+
+        assert index.remove("b")
+        assert "b" not in index and len(index) == 1
+        assert [m for m, _ in index.search([0.0, 1.0], 2)] == ["a"]
+
+    def test_unembedded_memories_are_filtered_not_scored(self):
+        index = VectorIndex(ann_threshold=0)
+        index.upsert("none", None, "episodic", 0.5)
+        index.upsert("vec", [1.0, 0.0, 0.0], "episodic", 0.5)
+        index.upsert("short", [1.0, 0.0], "episodic", 0.5)
+        index.upsert("zero", [0.0, 0.0, 0.0], "semantic", 0.5)
+
+        assert [m for m, _ in index.search([1.0, 0.0, 0.0], 10)] == ["vec"]
+        assert index.unembedded() == ["none", "short", "zero"]
+        assert index.unembedded(memory_type="semantic") == ["zero"]
+        with pytest.raises(ValueError):
+            index.search([1.0, 0.0], 1)
+
+    @pytest.mark.skipif(not vector_index.FAISS_AVAILABLE, reason="faiss not installed")
+    def test_ann_backend_respects_masks_and_growth(self):
+        rng = np.random.default_rng(5)
+        index = VectorIndex(ann_threshold=50)
+        for i in range(200):
+            index.upsert(f"m{i}", rng.normal(size=16).tolist(), "episodic", i / 200)
+        query = rng.normal(size=16).tolist()
+
+        hits = index.search(query, 5, min_importance=0.5)
+        assert index._ann is not None
+        assert all(int(m[1:]) >= 100 for m, _ in hits) and len(hits) == 5
+
+        index.upsert("new", query, "episodic", 0.9)
+        index.remove("m150")
+        hits = index.search(query, 5)
+        assert hits[0][0] == "new" and "m150" not in {m for m, _ in hits}
+
+
+class TestAgentMemoryRecall:
+    """AgentMemory.recall through the vector index, without the Rust core."""
+
+    @pytest.fixture
+    def memory(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(chrysalis_memory, "RUST_AVAILABLE", True)
+        monkeypatch.setattr(chrysalis_memory, "MemoryDocument", StubDocument)
+        monkeypatch.setattr(chrysalis_memory, "EmbeddingDocument", StubEmbedding)
+        monkeypatch.setattr(chrysalis_memory, "MemoryStorage", StubStorage)
+        vectors = {"cats": [1.0, 0.0], "dogs": [0.0, 1.0], "pets": [0.6, 0.8]}
+        config = chrysalis_memory.AgentMemoryConfig(
+            "test-agent",
+            db_path=str(tmp_path / "agent.db"),
+            sync_enabled=False,
+        )
+        return chrysalis_memory.AgentMemory("test-agent", config, embedding_fn=vectors.get)
+
+    def test_recall_ranks_by_embedding_with_filters(self, memory):
+        async def scenario():
+            await memory.learn("cats", importance=0.9, tags=["animal"])
+            await memory.learn("dogs", importance=0.2, tags=["animal"])
+            nearest = await memory.recall("pets", k=1)
+            important = await memory.recall("pets", k=1, min_importance=0.5, tags=["animal"])
+            return nearest, important
+
+        nearest, important = asyncio.run(scenario())
+
+        assert [m.content for m in nearest] == ["dogs"]
+        assert [m.content for m in important] == ["cats"]
+        assert len(memory._vector_index) == 2
+
+    def test_external_writes_need_refresh_index(self, memory):
+        async def recall():
+            return [m.content for m in await memory.recall("pets", k=1)]
+
+        asyncio.run(memory.learn("cats"))
+        assert asyncio.run(recall()) == ["cats"]
+
+        # Written behind AgentMemory's back, e.g. by a sync pull
+        other = StubDocument(content="dogs", memory_type="episodic")
+        memory.storage.put(other)
+        memory.storage.put_embedding(StubEmbedding("dogs", [0.0, 1.0], "test"))
+        other.embedding_ref = "external"
+        assert asyncio.run(recall()) == ["cats"]
+
+        assert memory.refresh_index() == 2
+        assert asyncio.run(recall()) == ["dogs"]
@@ -2,62 +2,125 @@
 Storage backends for different memory types
 """
 from typing import List, Dict, Any, Optional, Callable
+from collections import deque
 from datetime import datetime
+from itertools import islice
+import atexit
+import bisect
 import json
 import os
+import tempfile
+import threading
+import weakref
 
-from .core import MemoryEntry, RetrievalResult
+from .core import MemoryEntry, MemoryFilter, RetrievalResult, estimate_tokens
 
 
 class WorkingMemory:
     """
     Working memory implementation (in-memory buffer)
     Holds recent context, not persisted
+
+    Entries live in a bounded deque, so eviction is O(1). Each entry's
+    token count is computed once on add and a running total is kept.
     """
     
-    def __init__(self, max_size: int = 10):
+    def __init__(self, max_size: int = 10, tokenizer: Optional[Callable[[str], int]] = None):
         self.max_size = max_size
-        self.buffer: List[MemoryEntry] = []
+        self.tokenizer = tokenizer or estimate_tokens
+        self.buffer: deque = deque(maxlen=max_size)
+        self._tokens: deque = deque(maxlen=max_size)
+        self.total_tokens = 0
     
     def add(self, entry: MemoryEntry):
         """Add entry to working memory"""
+        if self.max_size <= 0:
+            return
+        if len(self.buffer) == self.max_size:
+            # Oldest entry is about to be dropped by the deque
+            self.total_tokens -= self._tokens[0]
+        tokens = self.tokenizer(entry.content)
         self.buffer.append(entry)
-        
-        # Keep only recent entries
-        if len(self.buffer) > self.max_size:
-            self.buffer.pop(0)
+        self._tokens.append(tokens)
+        self.total_tokens += tokens
     
     def get_all(self) -> List[MemoryEntry]:
         """Get all working memory entries"""
-        return self.buffer.copy()
+        return list(self.buffer)
     
     def get_recent(self, n: int) -> List[MemoryEntry]:
         """Get N most recent entries"""
-        return self.buffer[-n:] if len(self.buffer) >= n else self.buffer.copy()
+        if n <= 0:
+            return []
+        return list(islice(self.buffer, max(0, len(self.buffer) - n), None))
+    
+    def iter_newest(self):
+        """Yield (entry, token_count) pairs from newest to oldest"""
+        return zip(reversed(self.buffer), reversed(self._tokens))
     
     def clear(self):
         """Clear working memory"""
         self.buffer.clear()
+        self._tokens.clear()
+        self.total_tokens = 0
+    
+    def __len__(self) -> int:
+        return len(self.buffer)
+
+
+_DELETED = object()
 
 
 class CoreMemory:
     """
     Core memory implementation (persistent blocks)
     Holds agent persona, user facts, critical context
+
+    Changes are tracked as dirty keys and persisted by flush(). With
+    flush_interval > 0, writes within the window are coalesced into one;
+    inside ``with core_memory:`` they are deferred until the block exits.
+    Snapshots are written to a temp file and swapped in with os.replace,
+    so a crash never leaves a partial file. In journal mode each flush
+    appends only the changed keys to ``<persist_path>.journal``, which is
+    folded into the snapshot every ``compact_every`` records.
     """
     
-    def __init__(self, persist_path: Optional[str] = None):
+    def __init__(
+        self,
+        persist_path: Optional[str] = None,
+        flush_interval: float = 0.0,
+        fsync: bool = False,
+        journal: bool = False,
+        compact_every: int = 1000,
+    ):
         self.blocks: Dict[str, str] = {}
         self.persist_path = persist_path
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.journal = journal
+        self.compact_every = compact_every
+        self._pending: Dict[str, Any] = {}
+        self._journal_records = 0
+        self._defer_depth = 0
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.RLock()
         
-        if persist_path and os.path.exists(persist_path):
+        if persist_path and (os.path.exists(persist_path) or os.path.exists(self.journal_path)):
             self.load()
+        self._atexit_hook: Optional[Callable[[], None]] = None
+        if persist_path:
+            self._atexit_hook = _weak_flush(self)
+            atexit.register(self._atexit_hook)
+    
+    @property
+    def journal_path(self) -> str:
+        return f"{self.persist_path}.journal"
     
     def set(self, key: str, value: str):
         """Set a core memory block"""
-        self.blocks[key] = value
-        if self.persist_path:
-            self.save()
+        with self._lock:
+            self.blocks[key] = value
+            self._mark_dirty(key, value)
     
     def get(self, key: str) -> Optional[str]:
         """Get a core memory block"""
@@ -69,34 +132,221 @@ class CoreMemory:
     
     def update(self, key: str, value: str) -> bool:
         """Update existing block"""
-        if key in self.blocks:
-            self.blocks[key] = value
-            if self.persist_path:
-                self.save()
-            return True
+        with self._lock:
+            if key in self.blocks:
+                self.blocks[key] = value
+                self._mark_dirty(key, value)
+                return True
         return False
     
     def delete(self, key: str) -> bool:
         """Delete a block"""
-        if key in self.blocks:
-            del self.blocks[key]
-            if self.persist_path:
-                self.save()
-            return True
+        with self._lock:
+            if key in self.blocks:
+                del self.blocks[key]
+                self._mark_dirty(key, _DELETED)
+                return True
         return False
     
+    @property
+    def dirty(self) -> bool:
+        """Whether there are changes not yet written to disk"""
+        return bool(self._pending)
+    
+    def _mark_dirty(self, key: str, value: Any):
+        if not self.persist_path:
+            return
+        self._pending[key] = value
+        if self._defer_depth:
+            return
+        if self.flush_interval <= 0:
+            self.flush()
+        elif self._timer is None:
+            self._timer = threading.Timer(self.flush_interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+    
+    def flush(self):
+        """Write pending changes to disk"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._pending or not self.persist_path:
+                return
+            pending, self._pending = self._pending, {}
+            if self.journal:
+                self._append_journal(pending)
+                if self._journal_records >= self.compact_every:
+                    self.compact()
+            else:
+                self.save()
+    
+    def close(self):
+        """Flush pending changes and drop the exit hook"""
+        self.flush()
+        if self._atexit_hook is not None:
+            atexit.unregister(self._atexit_hook)
+            self._atexit_hook = None
+    
+    def __enter__(self):
+        with self._lock:
+            self._defer_depth += 1
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        with self._lock:
+            self._defer_depth -= 1
+            if self._defer_depth == 0:
+                self.flush()
+    
     def save(self):
-        """Persist to disk"""
-        if self.persist_path:
-            os.makedirs(os.path.dirname(self.persist_path), exist_ok=True)
-            with open(self.persist_path, 'w') as f:
-                json.dump(self.blocks, f, indent=2)
+        """Persist a full snapshot to disk atomically"""
+        if not self.persist_path:
+            return
+        with self._lock:
+            if self.journal and self._pending:
+                # Journal first: replaying it over the new snapshot is a no-op,
+                # so a crash before the journal is removed loses nothing
+                pending, self._pending = self._pending, {}
+                self._append_journal(pending)
+            directory = os.path.dirname(self.persist_path) or "."
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                prefix=f".{os.path.basename(self.persist_path)}.", dir=directory
+            )
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(self.blocks, f, indent=2)
+                    if self.fsync:
+                        f.flush()
+                        os.fsync(f.fileno())
+                os.replace(tmp_path, self.persist_path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+            self._pending.clear()
+            if os.path.exists(self.journal_path):
+                os.unlink(self.journal_path)
+            self._journal_records = 0
+    
+    def compact(self):
+        """Fold the journal into a fresh snapshot and truncate it"""
+        self.save()
+    
+    def _append_journal(self, pending: Dict[str, Any]):
+        os.makedirs(os.path.dirname(self.persist_path) or ".", exist_ok=True)
+        lines = []
+        for key, value in pending.items():
+            if value is _DELETED:
+                lines.append(json.dumps({"op": "delete", "key": key}))
+            else:
+                lines.append(json.dumps({"op": "set", "key": key, "value": value}))
+        with open(self.journal_path, 'a') as f:
+            f.write("\n".join(lines) + "\n")
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        self._journal_records += len(lines)
     
     def load(self):
-        """Load from disk"""
-        if self.persist_path and os.path.exists(self.persist_path):
-            with open(self.persist_path, 'r') as f:
-                self.blocks = json.load(f)
+        """Load from disk, replaying any journal on top of the snapshot"""
+        if not self.persist_path:
+            return
+        with self._lock:
+            if os.path.exists(self.persist_path):
+                with open(self.persist_path, 'r') as f:
+                    self.blocks = json.load(f)
+            self._journal_records = 0
+            if os.path.exists(self.journal_path):
+                good = 0
+                with open(self.journal_path, 'rb') as f:
+                    for line in f:
+                        try:
+                            if not line.endswith(b"\n"):
+                                raise ValueError("unterminated record")
+                            record = json.loads(line)
+                        except ValueError:
+                            # Torn final write from a crash
+                            break
+                        if record.get("op") == "delete":
+                            self.blocks.pop(record["key"], None)
+                        else:
+                            self.blocks[record["key"]] = record["value"]
+                        self._journal_records += 1
+                        good += len(line)
+                    torn = f.tell() > good or f.read(1)
+                if torn:
+                    # Cut the fragment so later appends start on a clean line
+                    with open(self.journal_path, 'r+b') as f:
+                        f.truncate(good)
+            self._pending.clear()
+
+
+def _weak_flush(core: CoreMemory) -> Callable[[], None]:
+    """Exit hook that flushes core without keeping it alive"""
+    ref = weakref.ref(core)
+    
+    def flush():
+        instance = ref()
+        if instance is not None:
+            instance.flush()
+    return flush
+
+
+def _combine_filter(
+    memory_filter: Optional[MemoryFilter],
+    memory_type: Optional[str],
+    memory_types: Optional[List[str]],
+) -> MemoryFilter:
+    """Fold the legacy memory_type(s) arguments into a MemoryFilter"""
+    memory_filter = memory_filter or MemoryFilter()
+    types = [memory_type] if memory_type else (memory_types or memory_filter.memory_types)
+    return MemoryFilter(
+        memory_types=types,
+        metadata=memory_filter.metadata,
+        since=memory_filter.since,
+        until=memory_filter.until,
+    )
+
+
+class TimeIndex:
+    """
+    Secondary index of (timestamp, id) pairs kept in timestamp order
+    
+    Entries usually arrive in time order, so inserts append at the end;
+    reading the newest N entries touches only N positions.
+    """
+    
+    def __init__(self):
+        self._times: List[float] = []
+        self._ids: List[Any] = []
+    
+    def add(self, timestamp: datetime, entry_id: Any):
+        position = bisect.bisect_right(self._times, timestamp.timestamp())
+        self._times.insert(position, timestamp.timestamp())
+        self._ids.insert(position, entry_id)
+    
+    def remove(self, timestamp: datetime, entry_id: Any):
+        value = timestamp.timestamp()
+        position = bisect.bisect_left(self._times, value)
+        while position < len(self._times) and self._times[position] == value:
+            if self._ids[position] == entry_id:
+                del self._times[position]
+                del self._ids[position]
+                return
+            position += 1
+    
+    def iter_newest(self, since: Optional[datetime] = None, until: Optional[datetime] = None):
+        """Yield ids from newest to oldest within [since, until]"""
+        start = bisect.bisect_left(self._times, since.timestamp()) if since else 0
+        end = bisect.bisect_right(self._times, until.timestamp()) if until else len(self._times)
+        for position in range(end - 1, start - 1, -1):
+            yield self._ids[position]
+    
+    def __len__(self) -> int:
+        return len(self._times)
 
 
 class VectorStore:
@@ -104,8 +354,12 @@ class VectorStore:
     Base class for vector stores.
     
     Implements the MemoryStore protocol for vector-based memory retrieval.
+    Stores that set ``supports_filter_pushdown`` accept a ``memory_filter``
+    keyword in ``retrieve`` and ``list_recent`` and apply it natively.
     """
     
+    supports_filter_pushdown = False
+    
     def store(self, entry: MemoryEntry):
         """Store a memory entry with its embedding"""
         raise NotImplementedError
@@ -125,7 +379,7 @@ class VectorStore:
         """Get specific memory by ID"""
         raise NotImplementedError
     
-    def list_recent(self, limit: int = 10) -> List[MemoryEntry]:
+    def list_recent(self, limit: int = 10, memory_filter: Optional[MemoryFilter] = None) -> List[MemoryEntry]:
         """List recent memories (default: returns empty, override in subclass)"""
         return []
     
@@ -142,8 +396,16 @@ class ChromaVectorStore(VectorStore):
     """
     Chroma vector database implementation
     Lightweight, embedded vector database
+    
+    Filters are pushed down as a ``where`` clause. Each entry also stores
+    a numeric ``timestamp_epoch`` so time ranges can be pushed down;
+    collections created before that field existed filter time in Python
+    until ``backfill_timestamp_epochs()`` is run, and until then the
+    retrieval engine filters (and over-fetches) itself.
     """
     
+    _RESERVED_METADATA = ("memory_type", "timestamp", "timestamp_epoch")
+    
     def __init__(
         self,
         collection_name: str = "agent_memory",
@@ -173,6 +435,66 @@ class ChromaVectorStore(VectorStore):
             name=collection_name,
             metadata={"description": "Agent memory storage"}
         )
+        collection_metadata = self.collection.metadata or {}
+        self.time_pushdown = bool(collection_metadata.get("timestamp_epoch"))
+        if not self.time_pushdown and self.collection.count() == 0:
+            self._mark_time_pushdown()
+        self._time_index: Optional[TimeIndex] = None
+    
+    @property
+    def supports_filter_pushdown(self) -> bool:
+        return self.time_pushdown
+    
+    def _mark_time_pushdown(self):
+        metadata = dict(self.collection.metadata or {})
+        metadata["timestamp_epoch"] = True
+        self.collection.modify(metadata=metadata)
+        self.time_pushdown = True
+    
+    def backfill_timestamp_epochs(self, batch_size: int = 500) -> int:
+        """Add timestamp_epoch to entries stored before it existed; returns count updated"""
+        updated = 0
+        offset = 0
+        while True:
+            batch = self.collection.get(include=["metadatas"], limit=batch_size, offset=offset)
+            if not batch['ids']:
+                break
+            ids, metadatas = [], []
+            for entry_id, metadata in zip(batch['ids'], batch['metadatas']):
+                if "timestamp_epoch" not in metadata and "timestamp" in metadata:
+                    ids.append(entry_id)
+                    metadatas.append({
+                        **metadata,
+                        "timestamp_epoch": datetime.fromisoformat(metadata["timestamp"]).timestamp(),
+                    })
+            if ids:
+                self.collection.update(ids=ids, metadatas=metadatas)
+                updated += len(ids)
+            offset += len(batch['ids'])
+        self._mark_time_pushdown()
+        return updated
+    
+    def _to_entry(self, entry_id: str, document: str, metadata: Dict[str, Any],
+                  embedding: Optional[List[float]] = None) -> MemoryEntry:
+        return MemoryEntry(
+            id=entry_id,
+            content=document,
+            memory_type=metadata.get('memory_type', 'unknown'),
+            timestamp=datetime.fromisoformat(metadata.get('timestamp', datetime.now().isoformat())),
+            metadata={k: v for k, v in metadata.items() if k not in self._RESERVED_METADATA},
+            embedding=embedding
+        )
+    
+    def _ensure_time_index(self) -> TimeIndex:
+        """Build the timestamp index from stored metadata on first use"""
+        if self._time_index is None:
+            index = TimeIndex()
+            batch = self.collection.get(include=["metadatas"])
+            for entry_id, metadata in zip(batch['ids'], batch['metadatas']):
+                if "timestamp" in metadata:
+                    index.add(datetime.fromisoformat(metadata["timestamp"]), entry_id)
+            self._time_index = index
+        return self._time_index
     
     def store(self, entry: MemoryEntry):
         """Store memory entry in Chroma"""
@@ -188,11 +510,14 @@ class ChromaVectorStore(VectorStore):
             embeddings=[entry.embedding],
             documents=[entry.content],
             metadatas=[{
+                **entry.metadata,
                 "memory_type": entry.memory_type,
                 "timestamp": entry.timestamp.isoformat(),
-                **entry.metadata
+                "timestamp_epoch": entry.timestamp.timestamp(),
             }]
         )
+        if self._time_index is not None:
+            self._time_index.add(entry.timestamp, entry.id)
     
     def retrieve(
         self,
@@ -200,6 +525,7 @@ class ChromaVectorStore(VectorStore):
         limit: int = 5,
         memory_type: Optional[str] = None,
         memory_types: Optional[List[str]] = None,
+        memory_filter: Optional[MemoryFilter] = None,
         **kwargs
     ) -> RetrievalResult:
         """Retrieve relevant memories"""
@@ -210,11 +536,8 @@ class ChromaVectorStore(VectorStore):
         query_embedding = self.embedding_function(query)
         
         # Build filter
-        where = None
-        if memory_type:
-            where = {"memory_type": memory_type}
-        elif memory_types:
-            where = {"memory_type": {"$in": memory_types}}
+        memory_filter = _combine_filter(memory_filter, memory_type, memory_types)
+        where = memory_filter.to_chroma_where(include_time=self.time_pushdown)
         
         # Query Chroma
         results = self.collection.query(
@@ -229,15 +552,11 @@ class ChromaVectorStore(VectorStore):
         
         if results['ids'] and results['ids'][0]:
             for i, entry_id in enumerate(results['ids'][0]):
-                metadata = results['metadatas'][0][i]
-                
-                entry = MemoryEntry(
-                    id=entry_id,
-                    content=results['documents'][0][i],
-                    memory_type=metadata.get('memory_type', 'unknown'),
-                    timestamp=datetime.fromisoformat(metadata.get('timestamp', datetime.now().isoformat())),
-                    metadata={k: v for k, v in metadata.items() if k not in ['memory_type', 'timestamp']},
-                    embedding=results.get('embeddings', [[]])[0][i] if results.get('embeddings') else None
+                entry = self._to_entry(
+                    entry_id,
+                    results['documents'][0][i],
+                    results['metadatas'][0][i],
+                    results.get('embeddings', [[]])[0][i] if results.get('embeddings') else None
                 )
                 
                 entries.append(entry)
@@ -254,17 +573,33 @@ class ChromaVectorStore(VectorStore):
         results = self.collection.get(ids=[entry_id])
         
         if results['ids']:
-            metadata = results['metadatas'][0]
-            return MemoryEntry(
-                id=entry_id,
-                content=results['documents'][0],
-                memory_type=metadata.get('memory_type', 'unknown'),
-                timestamp=datetime.fromisoformat(metadata.get('timestamp', datetime.now().isoformat())),
-                metadata={k: v for k, v in metadata.items() if k not in ['memory_type', 'timestamp']}
-            )
+            return self._to_entry(entry_id, results['documents'][0], results['metadatas'][0])
         
         return None
     
+    def list_recent(self, limit: int = 10, memory_filter: Optional[MemoryFilter] = None) -> List[MemoryEntry]:
+        """List most recent memories via the timestamp index"""
+        memory_filter = memory_filter or MemoryFilter()
+        ids = self._ensure_time_index().iter_newest(memory_filter.since, memory_filter.until)
+        entries: List[MemoryEntry] = []
+        batch_size = max(limit, 32)
+        while len(entries) < limit:
+            batch = list(islice(ids, batch_size))
+            if not batch:
+                break
+            found = self.collection.get(ids=batch)
+            by_id = {
+                entry_id: self._to_entry(entry_id, document, metadata)
+                for entry_id, document, metadata in zip(found['ids'], found['documents'], found['metadatas'])
+            }
+            for entry_id in batch:
+                entry = by_id.get(entry_id)
+                if entry is not None and memory_filter.matches(entry):
+                    entries.append(entry)
+                    if len(entries) >= limit:
+                        break
+        return entries
+    
     def count(self) -> int:
         """Count total memories"""
         return self.collection.count()
@@ -272,7 +607,10 @@ class ChromaVectorStore(VectorStore):
     def delete(self, entry_id: str) -> bool:
         """Delete a memory"""
         try:
+            entry = self.get_by_id(entry_id) if self._time_index is not None else None
             self.collection.delete(ids=[entry_id])
+            if entry is not None:
+                self._time_index.remove(entry.timestamp, entry_id)
             return True
         except Exception:
             return False
@@ -282,8 +620,14 @@ class FAISSVectorStore(VectorStore):
     """
     FAISS vector database implementation
     High-performance similarity search
+    
+    Filters are pushed down as an ID-selector mask over the candidates
+    allowed by the filter; time ranges are resolved through a timestamp
+    index, so selective filters do not scan the whole store.
     """
     
+    supports_filter_pushdown = True
+    
     def __init__(
         self,
         dimension: int = 1536,
@@ -313,6 +657,10 @@ class FAISSVectorStore(VectorStore):
         # Load if exists
         os.makedirs(persist_directory, exist_ok=True)
         self._load_index()
+        
+        self._time_index = TimeIndex()
+        for idx, entry in self.metadata_store.items():
+            self._time_index.add(entry.timestamp, idx)
     
     def store(self, entry: MemoryEntry):
         """Store memory entry in FAISS"""
@@ -331,6 +679,7 @@ class FAISSVectorStore(VectorStore):
         # Store metadata
         self.metadata_store[self.next_index] = entry
         self.id_to_index[entry.id] = self.next_index
+        self._time_index.add(entry.timestamp, self.next_index)
         self.next_index += 1
         
         # Persist
@@ -342,6 +691,7 @@ class FAISSVectorStore(VectorStore):
         limit: int = 5,
         memory_type: Optional[str] = None,
         memory_types: Optional[List[str]] = None,
+        memory_filter: Optional[MemoryFilter] = None,
         **kwargs
     ) -> RetrievalResult:
         """Retrieve relevant memories"""
@@ -353,11 +703,18 @@ class FAISSVectorStore(VectorStore):
         # Generate query embedding
         query_embedding = self.embedding_function(query)
         query_array = np.array([query_embedding], dtype=np.float32)
+        memory_filter = _combine_filter(memory_filter, memory_type, memory_types)
         
-        # Search FAISS
-        distances, indices = self.index.search(query_array, min(limit * 2, self.index.ntotal))
+        if memory_filter.is_empty:
+            # Deleted entries stay in the index, so over-fetch past them
+            k = min(limit + self.index.ntotal - len(self.metadata_store), self.index.ntotal)
+            distances, indices = self.index.search(query_array, k) if k > 0 else ([[]], [[]])
+        else:
+            allowed = self._select_indices(memory_filter)
+            if not allowed:
+                return RetrievalResult(entries=[], scores=[], metadata={"query": query, "limit": limit})
+            distances, indices = self._search_subset(query_array, allowed, limit)
         
-        # Filter and format results
         entries = []
         scores = []
         
@@ -366,13 +723,7 @@ class FAISSVectorStore(VectorStore):
                 break
             
             entry = self.metadata_store.get(int(idx))
-            if not entry:
-                continue
-            
-            # Filter by memory type
-            if memory_type and entry.memory_type != memory_type:
-                continue
-            if memory_types and entry.memory_type not in memory_types:
+            if not entry or not memory_filter.matches(entry):
                 continue
             
             entries.append(entry)
@@ -387,6 +738,48 @@ class FAISSVectorStore(VectorStore):
             metadata={"query": query, "limit": limit}
         )
     
+    def _select_indices(self, memory_filter: MemoryFilter) -> List[int]:
+        """Resolve a filter to the FAISS ids it allows"""
+        if memory_filter.since or memory_filter.until:
+            candidates = self._time_index.iter_newest(memory_filter.since, memory_filter.until)
+        else:
+            candidates = iter(self.metadata_store)
+        allowed = []
+        for idx in candidates:
+            entry = self.metadata_store.get(idx)
+            if entry is not None and memory_filter.matches(entry):
+                allowed.append(idx)
+        return allowed
+    
+    def _search_subset(self, query_array, allowed: List[int], limit: int):
+        """Search only the allowed ids, using an ID selector when available"""
+        import faiss
+        import numpy as np
+        
+        k = min(limit, len(allowed))
+        try:
+            selector = faiss.IDSelectorBatch(np.array(allowed, dtype=np.int64))
+            params = faiss.SearchParameters(sel=selector)
+            return self.index.search(query_array, k, params=params)
+        except (AttributeError, TypeError):
+            # Older FAISS without search parameters: brute force the subset
+            vectors = np.vstack([self.index.reconstruct(int(idx)) for idx in allowed])
+            distances = ((vectors - query_array[0]) ** 2).sum(axis=1)
+            order = np.argsort(distances)[:k]
+            return [distances[order].tolist()], [[allowed[i] for i in order]]
+    
+    def list_recent(self, limit: int = 10, memory_filter: Optional[MemoryFilter] = None) -> List[MemoryEntry]:
+        """List most recent memories via the timestamp index"""
+        memory_filter = memory_filter or MemoryFilter()
+        entries: List[MemoryEntry] = []
+        for idx in self._time_index.iter_newest(memory_filter.since, memory_filter.until):
+            entry = self.metadata_store.get(idx)
+            if entry is not None and memory_filter.matches(entry):
+                entries.append(entry)
+                if len(entries) >= limit:
+                    break
+        return entries
+    
     def get_by_id(self, entry_id: str) -> Optional[MemoryEntry]:
         """Get specific memory by ID"""
         idx = self.id_to_index.get(entry_id)
@@ -400,6 +793,7 @@ class FAISSVectorStore(VectorStore):
         """Delete a memory (FAISS doesn't support deletion, mark as deleted)"""
         idx = self.id_to_index.get(entry_id)
         if idx is not None and idx in self.metadata_store:
+            self._time_index.remove(self.metadata_store[idx].timestamp, idx)
             del self.metadata_store[idx]
             del self.id_to_index[entry_id]
             return True
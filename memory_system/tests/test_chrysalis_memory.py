@@ -0,0 +1,140 @@
+from memory_system.chrysalis_index import MemoryIndex
+from memory_system.chrysalis_memory import ChrysalisMemory, create_chrysalis_memory
+from memory_system.chrysalis_types import MemoryFingerprint, MemorySignature, MemoryType, SemanticMemory
+
+
+def _pair() -> tuple:
+    a = create_chrysalis_memory("instance-a", "agent", num_instances=2)
+    b = ChrysalisMemory("instance-b", "agent", instance_index=1, total_instances=2)
+    return a, b
+
+
+def test_search_ranks_by_bm25_and_requires_all_words() -> None:
+    memory = create_chrysalis_memory("instance-a", "agent")
+    memory.create_episodic_memory("Quantum computers use qubits")
+    memory.create_episodic_memory("qubits qubits and more qubits in quantum labs")
+    memory.create_episodic_memory("classical computers use bits")
+    memory.create_episodic_memory("notes", memory_type=MemoryType.KNOWLEDGE)
+
+    contents = [m.content for m in memory.search_by_content("QUANTUM qubits")]
+    ranked = memory.search_episodic("qubits", limit=2)
+    rare_first = memory.search_episodic("qubits bits", limit=1)
+
+    assert contents == ["qubits qubits and more qubits in quantum labs", "Quantum computers use qubits"]
+    assert memory.search_by_content("quantum bits") == []
+    assert ranked[0][0].content.startswith("qubits qubits") and ranked[0][1] > ranked[1][1]
+    assert rare_first[0][0].content == "classical computers use bits"
+    assert memory.search_by_content("notes", memory_types=["observation"]) == []
+    assert len(memory.search_by_content("notes", memory_types=["knowledge", "bogus"])) == 1
+
+
+def test_filters_match_linear_scan() -> None:
+    memory = create_chrysalis_memory("instance-a", "agent")
+    types = list(MemoryType)
+    for i in range(60):
+        memory.create_working_memory(f"w{i}", memory_type=types[i % len(types)], importance=(i % 10) / 10)
+        memory.create_episodic_memory(f"e{i}", memory_type=types[i % 3], importance=(i * 7 % 10) / 10)
+
+    for memory_type in (None, types[0], types[2]):
+        for threshold in (0.0, 0.3, 0.95):
+            expected = [
+                m for m in memory.state.episodicMemories
+                if (memory_type is None or m.memoryType == memory_type) and m.importance >= threshold
+            ]
+            assert memory.get_episodic_memories(memory_type, threshold) == expected
+            expected = [
+                m for m in memory.state.workingMemories
+                if (memory_type is None or m.memoryType == memory_type) and m.importance >= threshold
+            ]
+            assert memory.get_working_memories(memory_type, threshold) == expected
+
+
+def test_indexes_follow_crdt_merge_and_state_reload() -> None:
+    a, b = _pair()
+    a.create_episodic_memory("alpha signal", embedding=[1.0, 0.0])
+    b.create_episodic_memory("beta signal", embedding=[0.0, 1.0], importance=0.9)
+    b.create_working_memory("beta scratch", importance=0.9)
+
+    a.merge_with_instance(b.state)
+    a.merge_with_instance(b.state)  # idempotent
+
+    assert sorted(m.content for m in a.search_by_content("signal")) == ["alpha signal", "beta signal"]
+    assert [m.content for m, _ in a.search_by_embedding([0.1, 1.0], limit=1)] == ["beta signal"]
+    assert [m.content for m in a.get_working_memories(min_importance=0.8)] == ["beta scratch"]
+
+    reloaded = ChrysalisMemory("instance-c", "agent")
+    reloaded.state = a.state
+    assert [m.content for m in reloaded.search_by_content("beta")] == ["beta signal"]
+    assert [m.content for m in reloaded.get_episodic_memories(min_importance=0.8)] == ["beta signal"]
+
+
+def test_embedding_search_skips_missing_and_mismatched_vectors() -> None:
+    memory = create_chrysalis_memory("instance-a", "agent")
+    memory.create_episodic_memory("no vector")
+    memory.create_episodic_memory("east", embedding=[1.0, 0.0, 0.0])
+    memory.create_episodic_memory("wrong dimension", embedding=[1.0, 0.0])
+    memory.create_episodic_memory("north", embedding=[0.0, 1.0, 0.0], memory_type=MemoryType.KNOWLEDGE)
+    for i in range(100):
+        memory.create_episodic_memory(f"filler {i}", embedding=[0.0, 0.0, 1.0])
+
+    hits = memory.search_by_embedding([0.7, 0.7, 0.0], limit=2)
+    filtered = memory.search_by_embedding([1.0, 0.0, 0.0], limit=5, memory_types=["knowledge"])
+
+    assert [m.content for m, _ in hits] == ["east", "north"]
+    assert abs(hits[0][1] - 0.7071) < 1e-3
+    assert [m.content for m, _ in filtered] == ["north"]
+
+
+def test_index_rebuilds_when_store_prefix_changes() -> None:
+    index = MemoryIndex(key=lambda item: item, text=lambda item: item)
+    index.sync(["red apple", "green pear"])
+    assert index.sync(["red apple", "green pear", "red pear"]) == 1
+    assert index.sync(["green pear", "red apple"]) == 2
+
+    assert [index.items[p] for p, _ in index.search("red")] == ["red apple"]
+
+
+def _fact(knowledge_id: str, fact: str, phrasings: list) -> SemanticMemory:
+    fingerprint = MemoryFingerprint(knowledge_id.ljust(96, "0"), "", "")
+    signature = MemorySignature(bytes(64), bytes(32), "test", 0.0)
+    return SemanticMemory(
+        knowledgeId=knowledge_id,
+        fingerprint=fingerprint,
+        fact=fact,
+        alternatePhrasings=phrasings,
+        signature=signature,
+    )
+
+
+def test_merge_reindexes_phrasings_added_in_place() -> None:
+    a, b = _pair()
+    a.state.semanticMemories.append(_fact("k1", "water boils at 100C", ["boiling point of water"]))
+    b.state.semanticMemories.append(_fact("k1", "water boils at 100C", ["sea level steam temperature"]))
+    b.state.semanticMemories.append(_fact("k2", "ice melts at 0C", []))
+    assert [k.knowledgeId for k, _ in a.search_semantic("boiling")] == ["k1"]
+
+    a.merge_with_instance(b.state)
+
+    assert [k.knowledgeId for k, _ in a.search_semantic("steam")] == ["k1"]
+    assert [k.knowledgeId for k, _ in a.search_semantic("boiling")] == ["k1"]
+    assert [k.knowledgeId for k, _ in a.search_semantic("melts")] == ["k2"]
+
+
+def test_sync_reindexes_items_changed_in_place() -> None:
+    items = [{"id": "a", "text": "red apple", "kind": "fruit", "rank": 0.2, "vec": [1.0, 0.0]}]
+    index = MemoryIndex(
+        key=lambda item: item["id"],
+        text=lambda item: item["text"],
+        kind=lambda item: item["kind"],
+        importance=lambda item: item["rank"],
+        embedding=lambda item: item["vec"],
+    )
+    index.sync(items)
+    items[0].update(text="green pear", kind="pear", rank=0.9, vec=[0.0, 1.0])
+
+    assert index.sync(items) == 1
+    assert index.search("apple") == [] and [p for p, _ in index.search("pear")] == [0]
+    assert index.select("fruit") == [] and index.select("pear") == [0]
+    assert index.select(None, 0.5) == [0]
+    assert index.search_vectors([0.0, 1.0])[0][1] > 0.99
+    assert index.sync(items) == 0
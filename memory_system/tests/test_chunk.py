@@ -0,0 +1,88 @@
+import io
+import re
+
+from memory_system.converters.chunk import ChunkConverter, ChunkStrategy, _token_offsets
+
+
+def _words(text: str) -> list:
+    return re.findall(r"\w+|[^\w\s]", text)
+
+
+def _document(paragraphs: int) -> str:
+    parts = []
+    for p in range(paragraphs):
+        if p % 4 == 0:
+            parts.append(f"## Section {p}\n")
+        sentences = [f"Sentence {p}-{s} talks about topic {s} at some length." for s in range(5)]
+        parts.append(" ".join(sentences) + "\n\n")
+    return "".join(parts)
+
+
+def test_stream_matches_in_memory_split() -> None:
+    text = _document(40)
+    for strategy in ChunkStrategy:
+        if strategy == ChunkStrategy.TOKEN:
+            continue
+        chunker = ChunkConverter(chunk_size=200, overlap=20, strategy=strategy, min_chunk_size=10)
+        expected = [c.to_dict() for c in chunker.split(text, "doc")]
+        streamed = [c.to_dict() for c in chunker.iter_split(io.StringIO(text), "doc", block_size=256)]
+
+        assert streamed == expected, strategy
+
+
+def test_iter_split_accepts_small_pieces() -> None:
+    text = _document(10)
+    pieces = (text[i:i + 7] for i in range(0, len(text), 7))
+    chunker = ChunkConverter(chunk_size=150, strategy=ChunkStrategy.PARAGRAPH, min_chunk_size=1)
+
+    contents = [c.content for c in chunker.iter_split(pieces, block_size=64)]
+
+    assert contents == [c.content for c in chunker.split(text)]
+
+
+def test_token_offsets_align_or_give_up() -> None:
+    assert _token_offsets("Hello, world!", ["Hello", ",", "world", "!"]) == [0, 5, 7, 12]
+    # Normalized tokens cannot be mapped back onto the text
+    assert _token_offsets("Hello world", ["hello", "world"]) is None
+
+
+def test_token_chunks_respect_budget_and_offsets() -> None:
+    text = _document(20)
+    chunker = ChunkConverter(
+        chunk_size=40, overlap=8, strategy=ChunkStrategy.TOKEN, min_chunk_size=1, tokenizer=_words
+    )
+    chunks = chunker.split(text)
+
+    assert len(chunks) > 1
+    for chunk in chunks:
+        assert chunk.token_count == len(_words(chunk.content))
+        assert chunk.token_count <= 40
+        assert " ".join(text[chunk.start_char:chunk.end_char].split()) == " ".join(chunk.content.split())
+    # Later chunks start with overlap tokens taken from the previous chunk
+    assert chunks[1].overlap_start > 0
+    overlap = chunks[1].content[:chunks[1].overlap_start].strip()
+    assert chunks[0].content.endswith(overlap)
+    assert " ".join(chunker.merge_chunks(chunks, " ").split()) == " ".join(text.split())
+
+
+def test_token_chunks_without_overlap_match_sentence_counts() -> None:
+    text = _document(5)
+    chunker = ChunkConverter(
+        chunk_size=30, overlap=0, strategy=ChunkStrategy.TOKEN, min_chunk_size=1, tokenizer=_words
+    )
+    streamed = list(chunker.iter_split(io.StringIO(text), block_size=100))
+
+    assert [c.to_dict() for c in streamed] == [c.to_dict() for c in chunker.split(text)]
+
+
+def test_split_many_preserves_order() -> None:
+    texts = [_document(n) for n in (3, 6, 9)]
+    chunker = ChunkConverter(
+        chunk_size=60, overlap=10, strategy=ChunkStrategy.TOKEN, min_chunk_size=1, tokenizer=_words
+    )
+
+    results = chunker.split_many(texts, sources=["a", "b", "c"], max_workers=2)
+
+    assert [[c.to_dict() for c in chunks] for chunks in results] == [
+        [c.to_dict() for c in chunker.split(text, source)] for text, source in zip(texts, "abc")
+    ]
@@ -0,0 +1,150 @@
+import os
+import textwrap
+from pathlib import Path
+
+from memory_system.converters.code import CodeChunkCache, CodeConverter
+
+SOURCE = textwrap.dedent('''
+    """Module docstring."""
+    import os
+    import numpy as np
+    from collections import OrderedDict as OD
+
+
+    @decorator
+    class Store(Base):
+        """A store."""
+
+        def get(self, key):
+            from json import loads
+            return loads(self.read(key))
+
+        async def put(self, key, value):
+            await self.write(key, value)
+            self.write(key, value)
+
+        class Inner:
+            def hidden(self):
+                return helper()
+
+
+    async def main(argv=default()):
+        def nested():
+            return run(argv)
+        return nested()
+''')
+
+
+def _by_name(chunks: list) -> dict:
+    return {chunk.name: chunk for chunk in chunks if chunk.kind != "import"}
+
+
+def test_single_pass_extraction_matches_definitions() -> None:
+    chunks = CodeConverter().extract(SOURCE)
+    definitions = _by_name(chunks)
+
+    assert chunks[0].kind == "docstring"
+    assert [c.content for c in chunks if c.kind == "import"] == [
+        "import os", "import numpy as np", "from collections import OrderedDict as OD", "from json import loads",
+    ]
+    assert list(definitions) == ["__module__", "Store", "get", "put", "main"]
+    assert definitions["Store"].decorators == ["decorator"]
+    assert definitions["Store"].docstring == "A store."
+    assert (definitions["get"].kind, definitions["get"].parent) == ("method", "Store")
+    assert definitions["get"].calls == ["loads", "read"]
+    assert definitions["put"].calls == ["write"]
+    assert definitions["main"].kind == "async_function"
+    assert definitions["main"].calls == ["default", "nested", "run"]
+
+
+def test_imports_and_definitions_share_one_cached_analysis(tmp_path: Path) -> None:
+    source = tmp_path / "store.py"
+    source.write_text(SOURCE)
+    converter = CodeConverter()
+
+    assert converter.get_imports(str(source)) == ["os", "numpy", "collections", "json"]
+    assert converter.get_definitions(str(source))["method"] == ["get", "put"]
+    converter.extract(str(source))[1].calls.append("mutated")
+
+    assert converter.cache.stats()["misses"] == 1
+    assert "mutated" not in converter.extract(str(source))[1].calls
+    # Options that change the output are part of the key
+    assert CodeConverter(extract_calls=False, cache=converter.cache).extract(str(source))[-1].calls == []
+
+
+def test_syntax_errors_fall_back_to_regex_imports() -> None:
+    converter = CodeConverter()
+
+    assert converter.get_imports("import os\nfrom json import loads\ndef broken(:\n") == ["os", "json"]
+
+
+def test_extract_tree_only_reextracts_changed_files(tmp_path: Path) -> None:
+    root = tmp_path / "repo"
+    (root / "pkg").mkdir(parents=True)
+    (root / "node_modules").mkdir()
+    (root / "node_modules" / "dep.js").write_text("function dep() {}\n")
+    for i in range(4):
+        (root / "pkg" / f"mod_{i}.py").write_text(f"def func_{i}():\n    return {i}\n")
+    (root / "pkg" / "notes.txt").write_text("not code")
+    db = tmp_path / "cache" / "code.db"
+
+    first = CodeConverter(cache_path=db).extract_tree(root, max_workers=2)
+    assert [Path(p).name for p in first] == [f"mod_{i}.py" for i in range(4)]
+    assert first[str(root / "pkg" / "mod_2.py")][0].name == "func_2"
+
+    # New converter, same database: nothing is parsed
+    cache = CodeChunkCache(db)
+    second = CodeConverter(cache=cache).extract_tree(root, max_workers=1)
+    assert {p: [c.to_dict() for c in cs] for p, cs in second.items()} == {
+        p: [c.to_dict() for c in cs] for p, cs in first.items()
+    }
+    assert cache.stats()["misses"] == 0
+
+    changed = root / "pkg" / "mod_1.py"
+    stat = changed.stat()
+    changed.write_text("def renamed():\n    return 1\n")
+    os.utime(changed, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    converter = CodeConverter(cache=cache)
+    third = converter.extract_tree(root, max_workers=1)
+    cache.close()
+
+    assert third[str(changed)][0].name == "renamed"
+    assert third[str(root / "pkg" / "mod_3.py")][0].to_dict() == first[str(root / "pkg" / "mod_3.py")][0].to_dict()
+    assert cache.get_file(str(changed))[1] == changed.stat().st_size
+
+
+def test_only_top_level_definitions_are_chunked() -> None:
+    source = textwrap.dedent('''
+        try:
+            import ujson as json
+
+            def loads(data):
+                return json.loads(data)
+        except ImportError:
+            import json
+
+        if json:
+            class Compat:
+                pass
+
+
+        class Store:
+            if True:
+                def win(self):
+                    import ctypes
+
+            def get(self):
+                return 1
+
+
+        def top():
+            pass
+    ''')
+    chunks = CodeConverter().extract(source)
+
+    assert [(c.kind, c.name) for c in chunks if c.kind != "import"] == [
+        ("class", "Store"), ("method", "get"), ("function", "top"),
+    ]
+    assert sorted(c.content for c in chunks if c.kind == "import") == [
+        "import ctypes", "import json", "import ujson as json",
+    ]
@@ -0,0 +1,112 @@
+import json
+import os
+import time
+
+from memory_system.stores import CoreMemory
+
+
+def test_write_through_is_atomic_and_roundtrips(tmp_path) -> None:
+    path = str(tmp_path / "core" / "blocks.json")
+    core = CoreMemory(path)
+    core.set("persona", "helpful")
+    core.set("user", "prefers brevity")
+
+    with open(path) as f:
+        assert json.load(f) == {"persona": "helpful", "user": "prefers brevity"}
+    assert [name for name in os.listdir(tmp_path / "core")] == ["blocks.json"]
+    assert CoreMemory(path).get_all() == core.get_all()
+
+
+def test_context_manager_coalesces_writes(tmp_path, monkeypatch) -> None:
+    path = str(tmp_path / "blocks.json")
+    core = CoreMemory(path)
+    saves = []
+    original = core.save
+    monkeypatch.setattr(core, "save", lambda: (saves.append(1), original()))
+
+    with core:
+        for i in range(10):
+            core.set(f"k{i}", str(i))
+        assert core.dirty
+        assert not os.path.exists(path)
+
+    assert len(saves) == 1
+    assert not core.dirty
+    assert len(CoreMemory(path).get_all()) == 10
+
+
+def test_flush_interval_batches_within_window(tmp_path) -> None:
+    path = str(tmp_path / "blocks.json")
+    core = CoreMemory(path, flush_interval=0.05)
+    core.set("a", "1")
+    core.set("b", "2")
+    assert not os.path.exists(path)
+
+    time.sleep(0.2)
+    assert CoreMemory(path).get_all() == {"a": "1", "b": "2"}
+
+
+def test_journal_appends_changes_and_replays(tmp_path) -> None:
+    path = str(tmp_path / "blocks.json")
+    core = CoreMemory(path, journal=True, compact_every=100)
+    core.set("a", "1")
+    core.set("b", "2")
+    core.delete("a")
+
+    assert not os.path.exists(path)
+    with open(core.journal_path) as f:
+        assert len(f.readlines()) == 3
+    assert CoreMemory(path, journal=True).get_all() == {"b": "2"}
+
+
+def test_journal_compacts_into_snapshot(tmp_path) -> None:
+    path = str(tmp_path / "blocks.json")
+    core = CoreMemory(path, journal=True, compact_every=3)
+    for i in range(3):
+        core.set("counter", str(i))
+
+    assert not os.path.exists(core.journal_path)
+    with open(path) as f:
+        assert json.load(f) == {"counter": "2"}
+
+
+def test_torn_journal_tail_is_ignored(tmp_path) -> None:
+    path = str(tmp_path / "blocks.json")
+    core = CoreMemory(path, journal=True)
+    core.set("a", "1")
+    with open(core.journal_path, "a") as f:
+        f.write('{"op": "set", "key": "b", "val')
+
+    assert CoreMemory(path, journal=True).get_all() == {"a": "1"}
+
+
+def test_writes_after_torn_journal_tail_survive_reload(tmp_path) -> None:
+    path = str(tmp_path / "blocks.json")
+    core = CoreMemory(path, journal=True)
+    core.set("a", "1")
+    with open(core.journal_path, "a") as f:
+        f.write('{"op": "set", "key": "b", "val')
+
+    recovered = CoreMemory(path, journal=True)
+    recovered.set("c", "3")
+    recovered.set("d", "4")
+
+    assert CoreMemory(path, journal=True).get_all() == {"a": "1", "c": "3", "d": "4"}
+
+
+def test_exit_hook_does_not_keep_instance_alive(tmp_path) -> None:
+    import gc
+    import weakref
+
+    core = CoreMemory(str(tmp_path / "blocks.json"))
+    core.set("a", "1")
+    ref = weakref.ref(core)
+    del core
+    gc.collect()
+    closed = CoreMemory(str(tmp_path / "blocks.json"), flush_interval=60)
+    closed.set("b", "2")
+    closed.close()
+
+    assert ref() is None
+    assert closed._atexit_hook is None
+    assert CoreMemory(str(tmp_path / "blocks.json")).get_all() == {"a": "1", "b": "2"}
@@ -0,0 +1,96 @@
+import os
+import time
+from pathlib import Path
+
+from memory_system.converters.document import ConversionResult, DocumentCache, DocumentConverter
+
+
+class _SlowConverter(DocumentConverter):
+    def _convert_text(self, content: str, format: str) -> ConversionResult:
+        if "slow" in content:
+            time.sleep(5)
+        return super()._convert_text(content, format)
+
+
+class _CrashingConverter(DocumentConverter):
+    def _convert_text(self, content: str, format: str) -> ConversionResult:
+        if "crash" in content:
+            os._exit(1)
+        return super()._convert_text(content, format)
+
+
+def _corpus(directory: Path, count: int = 12) -> list:
+    paths = []
+    for i in range(count):
+        if i % 3 == 0:
+            path = directory / f"doc_{i}.html"
+            path.write_text(f"<html><body><h1>Doc {i}</h1><p>Body   of {i}</p><script>x()</script></body></html>")
+        elif i % 3 == 1:
+            path = directory / f"doc_{i}.md"
+            path.write_text(f"# Doc {i}\n\nSome **bold** text for {i}.\n")
+        else:
+            path = directory / f"doc_{i}.txt"
+            path.write_text(f"Plain\t\ttext {i}\n\n\n\nend")
+        paths.append(str(path))
+    return paths
+
+
+def test_convert_many_matches_convert_in_order_and_as_completed(tmp_path: Path) -> None:
+    paths = _corpus(tmp_path)
+    converter = DocumentConverter()
+    expected = [(path, converter.convert(path)) for path in paths]
+
+    ordered = list(converter.convert_many(paths, max_workers=2, chunksize=2))
+    unordered = list(converter.convert_many(paths, max_workers=2, chunksize=1, ordered=False))
+
+    assert ordered == expected
+    assert sorted(unordered, key=lambda item: item[0]) == sorted(expected, key=lambda item: item[0])
+
+
+def test_unchanged_documents_are_served_from_the_cache(tmp_path: Path) -> None:
+    paths = _corpus(tmp_path)
+    db = tmp_path / "cache" / "documents.db"
+    first = list(DocumentConverter(cache_path=db).convert_many(paths, max_workers=2))
+
+    cache = DocumentCache(db)
+    second = list(DocumentConverter(cache=cache).convert_many(paths, max_workers=2))
+    assert second == first
+    assert cache.stats()["misses"] == 0
+
+    # Touched but identical content is matched by hash; edited content is converted
+    touched, edited = Path(paths[0]), Path(paths[2])
+    os.utime(touched, ns=(0, touched.stat().st_mtime_ns + 1_000_000))
+    edited.write_text("Edited text")
+    third = dict(DocumentConverter(cache=cache).convert_many(paths, max_workers=1))
+    cache.close()
+
+    assert third[str(touched)] == first[0][1]
+    assert third[str(edited)].content == "Edited text"
+    assert cache.stats()["misses"] == 1
+
+
+def test_per_file_timeout_fails_only_that_file(tmp_path: Path) -> None:
+    fast, slow = tmp_path / "fast.txt", tmp_path / "slow.txt"
+    fast.write_text("fast")
+    slow.write_text("slow")
+
+    start = time.perf_counter()
+    results = dict(_SlowConverter().convert_many([slow, fast], max_workers=1, timeout=0.2))
+
+    assert time.perf_counter() - start < 2
+    assert not results[str(slow)].success
+    assert "timed out" in results[str(slow)].error
+    assert results[str(fast)].content == "fast"
+
+
+def test_crashed_worker_fails_its_batch_and_the_pool_restarts(tmp_path: Path) -> None:
+    paths = _corpus(tmp_path, 8)
+    Path(paths[5]).write_text("crash")
+
+    results = list(_CrashingConverter().convert_many(paths, max_workers=2, chunksize=1))
+
+    assert [path for path, _ in results] == paths
+    assert not results[5][1].success
+    assert "terminated" in results[5][1].error
+    # Batches that shared the broken pool are retried, not failed
+    assert [result.success for _, result in results] == [i != 5 for i in range(8)]
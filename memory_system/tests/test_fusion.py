@@ -1,3 +1,6 @@
+import asyncio
+import time
+from types import SimpleNamespace
 from typing import Any, Dict, Iterable, List, Optional
 
 from memory_system.beads import BeadsService
@@ -71,4 +74,93 @@ def test_fusion_kg_retrieval(tmp_path):
     assert out["kg"] == {"nodes": [{"id": "n1"}], "edges": []}
     assert zep_hooks.kg_calls[0]["node_ids"] == ["node1"]
     assert zep_hooks.kg_calls[0]["predicates"] == ["rel"]
-    assert zep_hooks.kg_calls[0]["hops"] == 2
\ No newline at end of file
+    assert zep_hooks.kg_calls[0]["hops"] == 2
+
+class SlowZepHooks(FakeZepHooks):
+    def __init__(self, delay: float, fail: bool = False) -> None:
+        super().__init__()
+        self.delay = delay
+        self.fail = fail
+
+    def on_retrieve_embeddings(self, vector: List[float], k: int = 5) -> List[Dict[str, Any]]:
+        time.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("zep unavailable")
+        return super().on_retrieve_embeddings(vector, k)
+
+    def on_retrieve_kg(self, node_ids: List[str], predicates: Optional[Iterable[str]] = None, hops: int = 1) -> Dict[str, Any]:
+        time.sleep(self.delay)
+        return super().on_retrieve_kg(node_ids, predicates, hops)
+
+
+class FakeFireproof:
+    def __init__(self) -> None:
+        self.config = SimpleNamespace(local_vector_cache=True, promotion_enabled=False)
+        self.search_vectors: List[List[float]] = []
+
+    async def query_beads(self, limit: int = 10, min_importance: Optional[float] = None) -> List[Dict[str, Any]]:
+        return [{"id": "durable"}]
+
+    async def local_similarity_search(self, query_vector: List[float], k: int = 5) -> List[Dict[str, Any]]:
+        self.search_vectors.append(query_vector)
+        return [{"id": "local"}]
+
+
+def test_retrieve_async_runs_sources_concurrently(tmp_path):
+    beads = BeadsService(path=str(tmp_path / "beads.db"))
+    beads.append("x")
+    zep_hooks = SlowZepHooks(delay=0.3)
+    fusion = FusionRetriever(beads=beads, embedder=FakeEmbedder(), zep_hooks=zep_hooks, fireproof=FakeFireproof())
+
+    start = time.perf_counter()
+    out = asyncio.run(fusion.retrieve_async("q", kg_node_ids=["node1"]))
+
+    # Remote search and KG each take 0.3s; sequentially that would be 0.6s
+    assert time.perf_counter() - start < 0.55
+    assert out["beads"][0]["content"] == "x"
+    assert out["fireproof"] == [{"id": "durable"}]
+    assert out["remote_embeddings"] == [{"id": "match"}]
+    assert out["kg"] == {"nodes": [{"id": "n1"}], "edges": []}
+    assert out["timed_out"] == []
+
+
+def test_retrieve_async_embeds_once_for_fallback(tmp_path):
+    embedder = FakeEmbedder()
+    fireproof = FakeFireproof()
+    fusion = FusionRetriever(
+        beads=BeadsService(path=str(tmp_path / "beads.db")),
+        embedder=embedder,
+        zep_hooks=SlowZepHooks(delay=0, fail=True),
+        fireproof=fireproof,
+    )
+
+    out = asyncio.run(fusion.retrieve_async("query"))
+
+    assert out["remote_embeddings"] == [{"id": "local"}]
+    assert out["used_fallback"] is True
+    assert embedder.calls == ["query"]
+    assert fireproof.search_vectors == [[0.1, 0.2]]
+
+
+def test_retrieve_async_slow_remote_degrades_to_partial_results(tmp_path):
+    fusion = FusionRetriever(
+        beads=BeadsService(path=str(tmp_path / "beads.db")),
+        embedder=FakeEmbedder(),
+        zep_hooks=SlowZepHooks(delay=1.0),
+        fireproof=FakeFireproof(),
+        source_timeouts={"remote": 0.1, "kg": 0.1},
+    )
+
+    async def timed() -> tuple:
+        start = time.perf_counter()
+        out = await fusion.retrieve_async("q", kg_node_ids=["node1"])
+        return out, time.perf_counter() - start
+
+    # asyncio.run() itself waits for the overrunning threads at loop shutdown
+    out, elapsed = asyncio.run(timed())
+
+    assert elapsed < 0.5
+    assert sorted(out["timed_out"]) == ["kg", "remote"]
+    assert out["kg"] is None
+    assert out["remote_embeddings"] == [{"id": "local"}]
+    assert out["fireproof"] == [{"id": "durable"}]
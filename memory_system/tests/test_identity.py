@@ -0,0 +1,80 @@
+from memory_system.chrysalis_memory import create_chrysalis_memory
+from memory_system.chrysalis_types import MemorySource, MemoryType
+from memory_system.identity import (
+    MemoryIdentity,
+    SignatureVerifier,
+    build_merkle_tree,
+    verify_merkle_proof,
+)
+
+
+def test_batch_fingerprints_match_single() -> None:
+    records = [("alpha", "observation", 1.5, None), ("beta", "knowledge", 2.0, {"b": 1, "a": [2]})]
+
+    batch = MemoryIdentity.generate_fingerprints(records)
+
+    assert [fp.fingerprint for fp in batch] == [
+        MemoryIdentity.generate_fingerprint(*record).fingerprint for record in records
+    ]
+
+
+def test_merkle_proofs_verify_and_detect_tampering() -> None:
+    for size in (1, 2, 5, 8):
+        fingerprints = [f"{i:064x}" for i in range(size)]
+        root, proofs = build_merkle_tree(fingerprints)
+        assert all(verify_merkle_proof(fp, proof, root) for fp, proof in zip(fingerprints, proofs))
+
+    assert not verify_merkle_proof(fingerprints[0], proofs[1], root)
+    assert not verify_merkle_proof(fingerprints[3], proofs[3][:-1], root)
+    assert not verify_merkle_proof(fingerprints[3], ["X" + p[1:] for p in proofs[3]], root)
+
+
+def test_bulk_add_matches_single_create_and_is_indexed() -> None:
+    memory = create_chrysalis_memory("instance-a", "agent")
+    memory.create_episodic_memory("first")
+    added = memory.bulk_add([
+        "quantum qubits",
+        {"content": "classical bits", "memory_type": MemoryType.KNOWLEDGE,
+         "source": MemorySource.USER, "importance": 0.9, "embedding": [1.0, 0.0]},
+    ])
+
+    assert memory.state.episodicMemories[1:] == added
+    assert [m.logicalTime.lamportTime for m in memory.state.episodicMemories] == [1, 2, 3]
+    assert added[1].memoryType == MemoryType.KNOWLEDGE and added[1].source == MemorySource.USER
+    assert added[0].signature.merkleRoot == added[1].signature.merkleRoot != ""
+    assert [m.content for m in memory.search_by_content("qubits")] == ["quantum qubits"]
+    assert [m.content for m in memory.get_episodic_memories(min_importance=0.8)] == ["classical bits"]
+    assert [m.content for m, _ in memory.search_by_embedding([1.0, 0.1])] == ["classical bits"]
+    assert memory.bulk_add([]) == []
+
+
+def test_verification_is_lazy_and_cached() -> None:
+    memory = create_chrysalis_memory("instance-a", "agent")
+    batch = memory.bulk_add([f"memory {i}" for i in range(16)])
+    single = memory.bulk_add(["unbatched"], merkle=False)[0]
+    calls = []
+    original = MemoryIdentity.verify_message
+    MemoryIdentity.verify_message = staticmethod(lambda message, signature: calls.append(message) or original(message, signature))
+    try:
+        assert all(memory.verify_memory(m) for m in batch + [single])
+        assert all(memory.verify_memory(m) for m in batch)
+    finally:
+        MemoryIdentity.verify_message = staticmethod(original)
+
+    assert len(calls) == 2
+    assert single.signature.merkleRoot == "" and MemoryIdentity.verify_signature(single.memoryId, single.signature)
+    assert MemoryIdentity.verify_signature(batch[3].memoryId, batch[3].signature)
+    assert not SignatureVerifier().verify(batch[4].memoryId, batch[3].signature)
+
+
+def test_duplicate_content_gets_distinct_ids() -> None:
+    memory = create_chrysalis_memory("instance-a", "agent")
+
+    batch = memory.bulk_add(["same"] * 200)
+    batch += memory.bulk_add(["same"] * 5, merkle=False)
+    single = memory.create_episodic_memory("same")
+
+    timestamps = [m.logicalTime.wallTime for m in batch + [single]]
+    assert timestamps == sorted(set(timestamps))
+    assert len({m.memoryId for m in batch + [single]}) == 206
+    assert len(memory.search_by_content("same")) == 206
@@ -0,0 +1,246 @@
+import asyncio
+import os
+import sys
+import textwrap
+from pathlib import Path
+
+from memory_system.resolvers.lsp import LSPResolver, LSPResultCache, ResolveRequest
+
+# Minimal stdio language server. It is installed as an executable named
+# "pylsp" so it passes the resolver's executable allowlist.
+STUB_SERVER = textwrap.dedent('''
+    import json, sys
+
+    stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+    counts = {}
+
+    def send(message):
+        body = json.dumps(message).encode()
+        stdout.write(b"Content-Length: %d\\r\\n\\r\\n" % len(body) + body)
+        stdout.flush()
+
+    while True:
+        length = None
+        while True:
+            line = stdin.readline()
+            if not line:
+                sys.exit(0)
+            if line == b"\\r\\n":
+                break
+            if line.lower().startswith(b"content-length:"):
+                length = int(line.split(b":")[1])
+        message = json.loads(stdin.read(length))
+        method = message.get("method")
+        counts[method] = counts.get(method, 0) + 1
+        if "id" not in message:
+            if method == "exit":
+                sys.exit(0)
+            continue
+        params = message.get("params") or {}
+        if method == "initialize":
+            result = {"capabilities": {"definitionProvider": True}}
+        elif method == "textDocument/definition":
+            position = params["position"]
+            result = {
+                "uri": params["textDocument"]["uri"],
+                "range": {"start": position, "end": position},
+            }
+        elif method == "textDocument/documentSymbol":
+            result = [{"name": "main", "kind": 12,
+                       "range": {"start": {"line": 0, "character": 0},
+                                 "end": {"line": 1, "character": 0}}}]
+        elif method == "stub/counts":
+            result = counts
+        else:
+            result = None
+        send({"jsonrpc": "2.0", "id": message["id"], "result": result})
+''')
+
+
+def _install_stub(directory: Path) -> str:
+    server = directory / "pylsp"
+    server.write_text(f"#!{sys.executable}\n{STUB_SERVER}")
+    server.chmod(0o755)
+    return str(server)
+
+
+def test_concurrent_requests_resolve_by_id(tmp_path: Path) -> None:
+    source = tmp_path / "main.py"
+    source.write_text("def main():\n    return 1\n")
+
+    async def run() -> list:
+        resolver = LSPResolver(server_cmd=[_install_stub(tmp_path)])
+        assert (await resolver.initialize(tmp_path)).success
+        try:
+            return await asyncio.gather(*(
+                resolver.find_definition(str(source), line, line % 7) for line in range(1, 51)
+            ))
+        finally:
+            await resolver.shutdown()
+
+    results = asyncio.run(run())
+
+    assert all(result.success for result in results)
+    for line, result in enumerate(results, start=1):
+        start = result.data[0]["range"]["start"]
+        assert (start["line"], start["character"]) == (line - 1, line % 7)
+
+
+def test_documents_are_opened_once_and_changed_on_edit(tmp_path: Path) -> None:
+    source = tmp_path / "main.py"
+    source.write_text("x = 1\n")
+
+    async def run() -> dict:
+        resolver = LSPResolver(server_cmd=[_install_stub(tmp_path)], enable_cache=False)
+        await resolver.initialize(tmp_path)
+        try:
+            for _ in range(5):
+                await resolver.find_definition(str(source), 1, 0)
+
+            # Touch without changing content: no notification
+            stat = source.stat()
+            os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            await resolver.get_hover(str(source), 1, 0)
+
+            source.write_text("x = 2\n")
+            os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000))
+            await resolver.find_references(str(source), 1, 0)
+            await resolver.find_references(str(source), 1, 0)
+            return (await resolver._request("stub/counts", None)).data
+        finally:
+            await resolver.shutdown()
+
+    counts = asyncio.run(run())
+
+    assert counts["textDocument/didOpen"] == 1
+    assert counts["textDocument/didChange"] == 1
+
+
+def test_requests_fail_fast_when_server_exits(tmp_path: Path) -> None:
+    async def run():
+        resolver = LSPResolver(server_cmd=[_install_stub(tmp_path)], timeout=30)
+        await resolver.initialize(tmp_path)
+        await resolver._notify("exit", None)
+        await resolver._read_task
+        result = await resolver.get_workspace_symbols("main")
+        await resolver.shutdown()
+        return result
+
+    result = asyncio.run(asyncio.wait_for(run(), timeout=10))
+
+    assert not result.success
+    assert result.error == "Server connection lost"
+
+
+def test_cached_results_skip_the_server_until_the_file_changes(tmp_path: Path) -> None:
+    source = tmp_path / "main.py"
+    source.write_text("def main():\n    return 1\n")
+
+    async def run() -> tuple:
+        resolver = LSPResolver(server_cmd=[_install_stub(tmp_path)], cache_methods=["textDocument/definition"])
+        await resolver.initialize(tmp_path)
+        try:
+            first = [await resolver.find_definition(str(source), 2, 4) for _ in range(5)]
+            stat = source.stat()
+            source.write_text("def main():\n    return 2\n")
+            os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            await resolver.find_definition(str(source), 2, 4)
+            counts = (await resolver._request("stub/counts", None)).data
+            return first, counts, resolver.cache.stats()
+        finally:
+            await resolver.shutdown()
+
+    first, counts, stats = asyncio.run(run())
+
+    assert all(result.data == first[0].data for result in first)
+    assert counts["textDocument/definition"] == 2
+    assert counts["textDocument/didChange"] == 1
+    assert stats["hits"] == 4
+
+
+def test_resolve_many_keeps_order_and_shares_duplicate_requests(tmp_path: Path) -> None:
+    source = tmp_path / "main.py"
+    source.write_text("def main():\n    return 1\n")
+
+    async def run() -> tuple:
+        resolver = LSPResolver(server_cmd=[_install_stub(tmp_path)], cache_methods=["textDocument/definition"])
+        await resolver.initialize(tmp_path)
+        try:
+            requests = [ResolveRequest("definition", str(source), line % 5 + 1, 0) for line in range(40)]
+            requests.append(("symbols", str(source)))
+            requests.append(("rename", str(source)))
+            results = await resolver.resolve_many(requests, window=4)
+            counts = (await resolver._request("stub/counts", None)).data
+            return results, counts
+        finally:
+            await resolver.shutdown()
+
+    results, counts = asyncio.run(run())
+
+    for line, result in enumerate(results[:40]):
+        assert result.data[0]["range"]["start"]["line"] == line % 5
+    assert results[40].data[0]["name"] == "main"
+    assert not results[41].success
+    assert counts["textDocument/definition"] == 5
+
+
+def test_persistent_cache_serves_prefetched_symbols_in_a_new_session(tmp_path: Path) -> None:
+    package = tmp_path / "pkg"
+    package.mkdir()
+    for name in ("a", "b", "c"):
+        (package / f"{name}.py").write_text(f"def {name}():\n    pass\n")
+    (package / "notes.txt").write_text("not source")
+    server = _install_stub(tmp_path)
+    db = tmp_path / "cache" / "lsp.db"
+
+    async def session(prefetch: bool) -> tuple:
+        cache = LSPResultCache(db)
+        resolver = LSPResolver(server_cmd=[server], cache=cache)
+        await resolver.initialize(tmp_path)
+        try:
+            if prefetch:
+                results = await resolver.prefetch_document_symbols(package)
+            else:
+                results = {path: await resolver.get_document_symbols(path)
+                           for path in sorted(str(p) for p in package.glob("*.py"))}
+            counts = (await resolver._request("stub/counts", None)).data
+            return results, counts
+        finally:
+            await resolver.shutdown()
+            cache.close()
+
+    warm, warm_counts = asyncio.run(session(prefetch=True))
+    cold, cold_counts = asyncio.run(session(prefetch=False))
+
+    assert sorted(Path(path).name for path in warm) == ["a.py", "b.py", "c.py"]
+    assert warm_counts["textDocument/documentSymbol"] == 3
+    assert {path: result.data for path, result in cold.items()} == {
+        path: result.data for path, result in warm.items()
+    }
+    assert "textDocument/documentSymbol" not in cold_counts
+    assert "textDocument/didOpen" not in cold_counts
+
+
+def test_cross_file_results_are_not_cached_by_default(tmp_path: Path) -> None:
+    source = tmp_path / "main.py"
+    source.write_text("def main():\n    return 1\n")
+
+    async def run() -> dict:
+        resolver = LSPResolver(server_cmd=[_install_stub(tmp_path)])
+        await resolver.initialize(tmp_path)
+        try:
+            for _ in range(3):
+                await resolver.find_definition(str(source), 2, 4)
+                await resolver.find_references(str(source), 2, 4)
+                await resolver.get_hover(str(source), 2, 4)
+                await resolver.get_document_symbols(str(source))
+            return (await resolver._request("stub/counts", None)).data
+        finally:
+            await resolver.shutdown()
+
+    counts = asyncio.run(run())
+
+    assert counts["textDocument/definition"] == 3
+    assert counts["textDocument/references"] == 3
+    assert counts["textDocument/hover"] == 3
+    assert counts["textDocument/documentSymbol"] == 1
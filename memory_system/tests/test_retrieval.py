@@ -0,0 +1,158 @@
+import sys
+import types
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from memory_system.core import MemoryEntry, MemoryFilter, RetrievalResult
+from memory_system.retrieval import RetrievalEngine
+from memory_system.stores import ChromaVectorStore, TimeIndex
+
+
+def _entry(i: int, memory_type: str = "episodic", age_hours: float = 0.0, **metadata) -> MemoryEntry:
+    entry = MemoryEntry.create(f"memory {i}", memory_type, metadata)
+    entry.timestamp = datetime.now() - timedelta(hours=age_hours)
+    return entry
+
+
+class FakeStore:
+    """Relevance-ordered store without filter pushdown."""
+
+    def __init__(self, entries: List[MemoryEntry]) -> None:
+        self.entries = entries
+        self.requested: List[int] = []
+
+    def retrieve(self, query: str, limit: int = 5, memory_types: Optional[List[str]] = None, **kwargs):
+        self.requested.append(limit)
+        matches = [e for e in self.entries if not memory_types or e.memory_type in memory_types]
+        selected = matches[:limit]
+        return RetrievalResult(entries=selected, scores=[0.9] * len(selected))
+
+    def count(self) -> int:
+        return len(self.entries)
+
+
+class PushdownStore(FakeStore):
+    supports_filter_pushdown = True
+
+    def retrieve(self, query: str, limit: int = 5, memory_types=None, memory_filter: Optional[MemoryFilter] = None, **kwargs):
+        self.requested.append(limit)
+        selected = [e for e in self.entries if memory_filter is None or memory_filter.matches(e)][:limit]
+        return RetrievalResult(entries=selected, scores=[0.9] * len(selected))
+
+    def list_recent(self, limit: int = 10, memory_filter: Optional[MemoryFilter] = None):
+        ordered = sorted(self.entries, key=lambda e: e.timestamp, reverse=True)
+        return [e for e in ordered if memory_filter is None or memory_filter.matches(e)][:limit]
+
+
+def test_memory_filter_matches_and_translates_to_chroma() -> None:
+    since = datetime(2024, 1, 1)
+    memory_filter = MemoryFilter(memory_types=["episodic"], metadata={"agent": "a1"}, since=since)
+
+    assert memory_filter.matches(_entry(1, agent="a1"))
+    assert not memory_filter.matches(_entry(2, agent="a2"))
+    assert not memory_filter.matches(_entry(3, memory_type="semantic", agent="a1"))
+    assert memory_filter.to_chroma_where() == {"$and": [
+        {"memory_type": "episodic"},
+        {"agent": "a1"},
+        {"timestamp_epoch": {"$gte": since.timestamp()}},
+    ]}
+    assert memory_filter.to_chroma_where(include_time=False) == {"$and": [
+        {"memory_type": "episodic"},
+        {"agent": "a1"},
+    ]}
+    assert MemoryFilter().to_chroma_where() is None
+
+
+def test_hybrid_search_overfetches_until_limit_is_met() -> None:
+    # Only every 20th memory matches the metadata filter
+    entries = [_entry(i, agent="target" if i % 20 == 0 else "other") for i in range(200)]
+    store = FakeStore(entries)
+    engine = RetrievalEngine(store)
+
+    results = engine.hybrid_search("q", limit=5, metadata_filters={"agent": "target"})
+
+    assert len(results.entries) == 5
+    assert all(e.metadata["agent"] == "target" for e in results.entries)
+    assert results.metadata["fetch_rounds"] > 1
+    assert store.requested == sorted(store.requested)
+
+
+def test_hybrid_search_stops_when_store_is_exhausted() -> None:
+    entries = [_entry(i, agent="target" if i == 3 else "other") for i in range(10)]
+    engine = RetrievalEngine(FakeStore(entries))
+
+    results = engine.hybrid_search("q", limit=5, metadata_filters={"agent": "target"})
+
+    assert [e.content for e in results.entries] == ["memory 3"]
+
+
+def test_pushdown_store_receives_filter_in_one_round() -> None:
+    entries = [_entry(i, age_hours=i) for i in range(100)]
+    store = PushdownStore(entries)
+    engine = RetrievalEngine(store)
+
+    results = engine.temporal_search("q", limit=3, time_window=timedelta(hours=10.5))
+
+    assert len(results.entries) == 3
+    assert len(store.requested) == 1
+    assert results.metadata["pushdown"] is True
+
+
+def test_get_recent_uses_filtered_time_index() -> None:
+    entries = [_entry(i, "semantic" if i % 2 else "episodic", age_hours=i) for i in range(50)]
+    engine = RetrievalEngine(PushdownStore(entries))
+
+    recent = engine.get_recent(limit=3, memory_types=["semantic"])
+
+    assert [e.content for e in recent] == ["memory 1", "memory 3", "memory 5"]
+
+
+def test_time_index_iterates_newest_within_range() -> None:
+    index = TimeIndex()
+    base = datetime(2024, 1, 1)
+    for i in [3, 1, 4, 2, 0]:
+        index.add(base + timedelta(minutes=i), i)
+    index.remove(base + timedelta(minutes=4), 4)
+
+    assert list(index.iter_newest()) == [3, 2, 1, 0]
+    assert list(index.iter_newest(since=base + timedelta(minutes=1), until=base + timedelta(minutes=2))) == [2, 1]
+    assert len(index) == 4
+
+
+class _FakeCollection:
+    def __init__(self, metadata: dict, entries: int) -> None:
+        self.metadata = metadata
+        self.entries = entries
+
+    def count(self) -> int:
+        return self.entries
+
+    def modify(self, metadata: dict) -> None:
+        self.metadata = metadata
+
+
+def _chroma_with(monkeypatch, collection: _FakeCollection):
+    def get_or_create_collection(name, metadata=None):
+        # Some Chroma versions apply the given metadata to an existing collection
+        collection.metadata = {**collection.metadata, **(metadata or {})}
+        return collection
+
+    chromadb = types.ModuleType("chromadb")
+    chromadb.Client = lambda settings: types.SimpleNamespace(get_or_create_collection=get_or_create_collection)
+    config = types.ModuleType("chromadb.config")
+    config.Settings = lambda **kwargs: kwargs
+    monkeypatch.setitem(sys.modules, "chromadb", chromadb)
+    monkeypatch.setitem(sys.modules, "chromadb.config", config)
+
+    return ChromaVectorStore()
+
+
+def test_chroma_time_pushdown_only_for_new_or_backfilled_collections(monkeypatch) -> None:
+    legacy = _chroma_with(monkeypatch, _FakeCollection({"description": "old"}, entries=3))
+    fresh = _chroma_with(monkeypatch, _FakeCollection({}, entries=0))
+    marked = _chroma_with(monkeypatch, _FakeCollection({"timestamp_epoch": True}, entries=3))
+
+    assert not legacy.time_pushdown and not legacy.supports_filter_pushdown
+    assert fresh.time_pushdown and fresh.supports_filter_pushdown
+    assert fresh.collection.metadata["timestamp_epoch"] is True
+    assert marked.supports_filter_pushdown
@@ -0,0 +1,81 @@
+from memory_system.core import Memory, MemoryConfig, MemoryEntry, RetrievalResult
+from memory_system.stores import WorkingMemory
+
+
+def _entry(content: str) -> MemoryEntry:
+    return MemoryEntry.create(content, "working")
+
+
+def test_working_memory_evicts_oldest_and_tracks_tokens() -> None:
+    working = WorkingMemory(max_size=3, tokenizer=len)
+    for content in ["a", "bb", "ccc", "dddd"]:
+        working.add(_entry(content))
+
+    assert [e.content for e in working.get_all()] == ["bb", "ccc", "dddd"]
+    assert working.total_tokens == 9
+    assert [e.content for e in working.get_recent(2)] == ["ccc", "dddd"]
+
+    working.clear()
+    assert len(working) == 0
+    assert working.total_tokens == 0
+
+
+def test_get_recent_handles_short_buffer() -> None:
+    working = WorkingMemory(max_size=5)
+    working.add(_entry("only"))
+
+    assert [e.content for e in working.get_recent(3)] == ["only"]
+    assert working.get_recent(0) == []
+
+
+def test_memory_working_memory_respects_config_size() -> None:
+    memory = Memory(MemoryConfig(working_memory_size=2))
+    for content in ["one", "two", "three"]:
+        memory.add_to_working_memory(content)
+
+    assert [e.content for e in memory.get_working_memory()] == ["two", "three"]
+
+
+def test_get_context_without_budget_keeps_recent_five() -> None:
+    memory = Memory(MemoryConfig(working_memory_size=10))
+    for i in range(8):
+        memory.add_to_working_memory(f"item {i}")
+
+    context = memory.get_context()
+
+    assert "- item 2" not in context
+    assert "- item 3" in context
+    assert "- item 7" in context
+
+
+def test_get_context_packs_within_token_budget() -> None:
+    memory = Memory(MemoryConfig(working_memory_size=100), tokenizer=lambda text: len(text.split()))
+    memory.set_core_memory("persona", "agent")
+    for i in range(100):
+        memory.add_to_working_memory(f"item {i} word word")
+
+    # core line costs 2; each working entry costs 4 words + 1
+    context = memory.get_context(token_budget=2 + 5 * 3)
+
+    lines = [line for line in context.splitlines() if line.startswith("- ")]
+    assert lines == ["- item 97 word word", "- item 98 word word", "- item 99 word word"]
+    assert "persona: agent" in context
+
+
+def test_get_context_interleaves_retrieved_by_rank() -> None:
+    memory = Memory(MemoryConfig(working_memory_size=10), tokenizer=lambda text: len(text.split()))
+    memory._initialized = True
+    for i in range(5):
+        memory.add_to_working_memory(f"recent{i}")
+    found = [MemoryEntry.create(f"fact{i}", "semantic") for i in range(3)]
+    memory.search = lambda query, limit=5: RetrievalResult(entries=found, scores=[0.1, 0.2, 0.3])
+
+    # newest working (rank 0) then best match (rank 0), then the next of each
+    context = memory.get_context(query="q", token_budget=2 + 4 + 2 + 4)
+
+    assert "- recent4" in context
+    assert "- recent3" in context
+    assert "- [semantic] fact0" in context
+    assert "- [semantic] fact1" in context
+    assert "fact2" not in context
+    assert "recent2" not in context
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Benchmark for AgentMemory.recall with the vector index
+
+Stores synthetic memories with embeddings and compares the previous
+recall (load every matching memory, per-memory cosine in Python) with
+the NumPy index (exact top-k via argpartition) and, when faiss is
+installed, the HNSW backend. Reports ms/query unfiltered and with a
+memory_type + importance filter, plus HNSW recall@k against exact.
+Embeddings are drawn around random cluster centers, as topic-clustered
+real embeddings are (uniform random vectors are a worst case for HNSW).
+
+Uses the Rust MemoryStorage when the extension is built; otherwise a
+dict-backed storage with the same API (which makes the previous recall
+look faster than it is on SQLite).
+
+Usage:
+    python scripts/bench_agent_memory_recall.py
+    python scripts/bench_agent_memory_recall.py --memories 100000 --dimension 384 --queries 50
+    python scripts/bench_agent_memory_recall.py --clusters 0   # uniform random vectors
+"""
+
+import argparse
+import asyncio
+import hashlib
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Add rust_core Python package to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'memory_system', 'rust_core', 'python')))
+
+import chrysalis_memory
+from chrysalis_memory import AgentMemory, AgentMemoryConfig
+from chrysalis_memory.vector_index import FAISS_AVAILABLE, NUMPY_AVAILABLE
+
+TYPES = ["episodic", "semantic", "procedural", "working"]
+
+
+class BenchDocument:
+    """Minimal MemoryDocument for the dict-backed storage."""
+
+    def __init__(self, id, content, memory_type, importance):
+        self.id = id
+        self.content = content
+        self.content_hash = hashlib.sha256(content.encode()).hexdigest()
+        self.memory_type = memory_type
+        self.embedding_ref = self.content_hash
+        self.updated_at = time.time()
+        self._importance = importance
+
+    def get_importance(self):
+        return self._importance
+
+    def get_tags(self):
+        return []
+
+
+class BenchEmbedding:
+    def __init__(self, vector):
+        self.vector = vector
+
+    def get_vector(self):
+        return list(self.vector)
+
+
+class DictStorage:
+    """Dict-backed stand-in for MemoryStorage (same read API)."""
+
+    def __init__(self):
+        self.memories = {}
+        self.embeddings = {}
+
+    def add(self, memory_id, content, memory_type, importance, vector):
+        memory = BenchDocument(memory_id, content, memory_type, importance)
+        self.memories[memory_id] = memory
+        self.embeddings[memory.content_hash] = BenchEmbedding(vector)
+
+    def get(self, memory_id):
+        return self.memories.get(memory_id)
+
+    def all(self):
+        return list(self.memories.values())
+
+    def query_by_type(self, memory_type):
+        return [m for m in self.memories.values() if m.memory_type == memory_type]
+
+    def query_by_importance(self, min_importance):
+        return [m for m in self.memories.values() if m.get_importance() >= min_importance]
+
+    def get_embedding_by_hash(self, text_hash):
+        return self.embeddings.get(text_hash)
+
+
+def fill(memory: AgentMemory, count: int, embed, rng: random.Random) -> None:
+    if not chrysalis_memory.RUST_AVAILABLE:
+        memory.storage = DictStorage()
+    for i in range(count):
+        content = f"memory {i}"
+        vector = embed(content)
+        memory_type = rng.choice(TYPES)
+        importance = rng.random()
+        if isinstance(memory.storage, DictStorage):
+            memory.storage.add(f"m{i}", content, memory_type, importance, vector)
+            continue
+        document = chrysalis_memory.MemoryDocument(
+            id=f"m{i}", content=content, memory_type=memory_type, source_instance=memory.agent_id
+        )
+        document.set_importance(importance, memory.agent_id)
+        embedding = chrysalis_memory.EmbeddingDocument(content, vector, "bench")
+        memory.storage.put_embedding(embedding)
+        document.embedding_ref = embedding.id
+        memory.storage.put(document)
+
+
+def ms_per_query(memory: AgentMemory, queries: list, k: int, **filters) -> tuple:
+    async def run():
+        results = []
+        start = time.perf_counter()
+        for query in queries:
+            results.append([m.id for m in await memory.recall(query, k=k, **filters)])
+        return (time.perf_counter() - start) / len(queries) * 1e3, results
+    return asyncio.run(run())
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--memories", type=int, default=100_000, help="Stored memories")
+    parser.add_argument("--dimension", type=int, default=128, help="Embedding dimension")
+    parser.add_argument("--clusters", type=int, default=200, help="Embedding cluster centers (0 for uniform)")
+    parser.add_argument("--queries", type=int, default=50, help="Queries per indexed measurement")
+    parser.add_argument("--scan-queries", type=int, default=3, help="Queries for the previous recall")
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    if not NUMPY_AVAILABLE:
+        print("numpy not installed: recall falls back to the linear scan")
+        return 1
+
+    rng = random.Random(args.seed)
+    centers = [[rng.gauss(0, 1) for _ in range(args.dimension)] for _ in range(args.clusters)]
+    vectors = {}
+
+    def embed(text: str) -> list:
+        if text not in vectors:
+            if centers:
+                center = rng.choice(centers)
+                vectors[text] = [c + rng.gauss(0, 0.5) for c in center]
+            else:
+                vectors[text] = [rng.gauss(0, 1) for _ in range(args.dimension)]
+        return vectors[text]
+
+    tmpdir = tempfile.mkdtemp()
+    config = AgentMemoryConfig(
+        "bench-agent", db_path=os.path.join(tmpdir, "bench.db"), sync_enabled=False, vector_index_ann_threshold=0
+    )
+    memory = AgentMemory("bench-agent", config, embedding_fn=embed)
+    start = time.perf_counter()
+    fill(memory, args.memories, embed, rng)
+    print(f"{args.memories} memories, {args.dimension}-d, k={args.k}, "
+          f"{'Rust' if chrysalis_memory.RUST_AVAILABLE else 'dict-backed'} storage "
+          f"(filled in {time.perf_counter() - start:.1f}s), faiss {'installed' if FAISS_AVAILABLE else 'not installed'}")
+
+    start = time.perf_counter()
+    memory.refresh_index()
+    print(f"index build from storage: {time.perf_counter() - start:.2f}s")
+
+    queries = [f"query {i}" for i in range(args.queries)]
+    scan_queries = queries[:args.scan_queries]
+    filters = {"memory_type": "semantic", "min_importance": 0.8}
+    index = memory._vector_index
+
+    print(f"\n{'recall':<28} {'unfiltered ms':>14} {'filtered ms':>12}")
+    memory._vector_index = None
+    scan, scan_results = ms_per_query(memory, scan_queries, args.k)
+    scan_filtered, _ = ms_per_query(memory, scan_queries, args.k, **filters)
+    print(f"{'previous (Python scan)':<28} {scan:>14.1f} {scan_filtered:>12.1f}")
+
+    memory._vector_index = index
+    exact, exact_results = ms_per_query(memory, queries, args.k)
+    exact_filtered, _ = ms_per_query(memory, queries, args.k, **filters)
+    assert exact_results[:len(scan_results)] == scan_results
+    print(f"{'NumPy exact (argpartition)':<28} {exact:>14.2f} {exact_filtered:>12.2f}   {scan / exact:.0f}x")
+
+    if FAISS_AVAILABLE:
+        index.ann_threshold = min(10_000, args.memories)
+        start = time.perf_counter()
+        ms_per_query(memory, queries[:1], args.k)
+        build = time.perf_counter() - start
+        ann, ann_results = ms_per_query(memory, queries, args.k)
+        ann_filtered, _ = ms_per_query(memory, queries, args.k, **filters)
+        recall = sum(len(set(a) & set(e)) for a, e in zip(ann_results, exact_results)) / (args.k * len(queries))
+        print(f"{'FAISS HNSW':<28} {ann:>14.2f} {ann_filtered:>12.2f}   "
+              f"{scan / ann:.0f}x, recall@{args.k} {recall:.3f}, built in {build:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for shared.api_core InMemoryCache
+
+Measures per-operation cost of set-at-capacity (every insert evicts)
+and get at growing cache sizes. With O(1) eviction the cost per
+operation should stay flat from 1k to 100k keys.
+
+Usage:
+    python scripts/bench_api_cache.py
+    python scripts/bench_api_cache.py --sizes 1000 100000 --admission --shards 8
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add shared directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'shared')))
+
+from api_core.caching import CacheConfig, InMemoryCache
+
+
+def bench(size: int, ops: int, admission: bool, shards: int) -> dict:
+    cache = InMemoryCache(CacheConfig(
+        max_entries=size,
+        default_ttl=3600,
+        admission=admission,
+        shards=shards,
+    ))
+    for i in range(size):
+        cache.set(f"warm:{i}", i)
+
+    keys = [f"new:{i}" for i in range(ops)]
+    start = time.perf_counter()
+    for key in keys:
+        cache.set(key, key)
+    set_ns = (time.perf_counter() - start) / ops * 1e9
+
+    hot = [f"new:{i}" for i in range(ops - min(ops, size), ops)] or keys
+    start = time.perf_counter()
+    for i in range(ops):
+        cache.get(hot[i % len(hot)])
+    get_ns = (time.perf_counter() - start) / ops * 1e9
+
+    return {"size": size, "set_ns": set_ns, "get_ns": get_ns}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--ops", type=int, default=50_000, help="Operations per measurement")
+    parser.add_argument("--admission", action="store_true", help="Enable TinyLFU admission")
+    parser.add_argument("--shards", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'keys':>10} {'set@capacity ns/op':>20} {'get ns/op':>12}")
+    for size in args.sizes:
+        result = bench(size, args.ops, args.admission, args.shards)
+        print(f"{result['size']:>10} {result['set_ns']:>20.0f} {result['get_ns']:>12.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark for api_core AuditLogger
+
+Logs audit events from concurrent "request" threads and compares the
+inline writer (serialize, write and flush per event on the request
+thread, the previous behaviour) with the background group-commit writer
+under each durability mode. Reports caller-side throughput, throughput
+until everything is on disk, p99 time spent inside log(), and batch
+statistics. Every run is checked for complete, parseable output.
+
+Usage:
+    python scripts/bench_audit_logger.py
+    python scripts/bench_audit_logger.py --events 100000 --threads 16 --durability fsync
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add shared directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'shared')))
+
+from api_core.audit_logging import DURABILITY_MODES, AuditEvent, AuditLogConfig, AuditLogger
+
+
+def make_events(count: int) -> list:
+    return [
+        AuditEvent(
+            event_type="data_access",
+            user_id=f"user-{i % 97}",
+            username=f"name-{i % 97}",
+            action="read",
+            resource="knowledge",
+            resource_id=str(i),
+            details={"path": f"/api/knowledge/{i}", "status": 200},
+            request_id=f"req-{i}",
+            ip_address="10.0.0.1",
+            user_agent="bench/1.0",
+        )
+        for i in range(count)
+    ]
+
+
+def produce(audit: AuditLogger, events: list, threads: int) -> tuple:
+    per_thread = len(events) // threads
+    latencies = [[] for _ in range(threads)]
+
+    def work(index: int) -> None:
+        record = latencies[index].append
+        for event in events[index * per_thread:(index + 1) * per_thread]:
+            start = time.perf_counter()
+            audit.log(event)
+            record(time.perf_counter() - start)
+
+    workers = [threading.Thread(target=work, args=(t,)) for t in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    samples = sorted(s for thread in latencies for s in thread)
+    return elapsed, samples[int(len(samples) * 0.99)]
+
+
+def count_lines(path: Path) -> int:
+    with path.open(encoding="utf-8") as f:
+        return sum(1 for line in f if json.loads(line))
+
+
+def run(path: Path, events: list, threads: int, config: AuditLogConfig) -> dict:
+    audit = AuditLogger(log_file=str(path), config=config)
+    start = time.perf_counter()
+    enqueue, p99 = produce(audit, events, threads)
+    audit.flush()
+    on_disk = time.perf_counter() - start
+    stats = audit.get_stats()
+    audit.close()
+    expected = len(events) // threads * threads
+    if count_lines(path) != expected:
+        raise SystemExit(f"{path}: expected {expected} lines")
+    return {"caller": expected / enqueue, "disk": expected / on_disk, "p99_us": p99 * 1e6, "stats": stats}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=40_000, help="Events per run")
+    parser.add_argument("--threads", type=int, default=8, help="Concurrent request threads")
+    parser.add_argument("--durability", choices=DURABILITY_MODES, action="append",
+                        help="Durability modes to run (default: all)")
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--flush-interval-ms", type=float, default=100.0)
+    args = parser.parse_args()
+
+    events = make_events(args.events)
+    modes = args.durability or list(DURABILITY_MODES)
+    print(f"{args.events} events from {args.threads} threads")
+    print(f"{'writer':<24} {'caller ev/s':>12} {'on-disk ev/s':>13} {'p99 log() us':>13} {'avg batch':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for durability in modes:
+            for async_writes in (False, True):
+                config = AuditLogConfig(
+                    async_writes=async_writes,
+                    durability=durability,
+                    batch_size=args.batch_size,
+                    flush_interval_ms=args.flush_interval_ms,
+                )
+                name = f"{'background' if async_writes else 'inline'}/{durability}"
+                # Inline fsync per event is slow; keep that run short
+                sample = events[: max(args.threads, len(events) // 20)] if durability == "fsync" and not async_writes else events
+                result = run(Path(tmp) / f"{name.replace('/', '-')}.log", sample, args.threads, config)
+                avg_batch = result["stats"].get("avg_batch_size", 1.0)
+                print(f"{name:<24} {result['caller']:>12,.0f} {result['disk']:>13,.0f} "
+                      f"{result['p99_us']:>13.1f} {avg_batch:>10.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
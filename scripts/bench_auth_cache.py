@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark for api_core authentication with the verified-token cache
+
+Authenticates a stream of requests that reuse a small set of bearer
+credentials (as high-rate clients do) with the token cache disabled and
+enabled, and reports requests/s and cache hit rate. API keys are
+measured against the in-memory store (never cached) and a store with
+simulated lookup latency (cached); JWTs are measured when PyJWT is
+installed. A fraction of requests carry malformed credentials to
+exercise negative caching.
+
+Usage:
+    python scripts/bench_auth_cache.py
+    python scripts/bench_auth_cache.py --requests 200000 --tokens 16 --malformed 0.1
+    python scripts/bench_auth_cache.py --store-latency-us 500
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+# Add shared directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'shared')))
+
+from api_core import auth
+from api_core.models import APIError
+
+
+class SlowKeyStore(auth.InMemoryAPIKeyStore):
+    """In-memory store with a fixed lookup delay, standing in for a database."""
+
+    cacheable = True
+
+    def __init__(self, latency: float):
+        super().__init__()
+        self.latency = latency
+
+    def get(self, key_id: str):
+        time.sleep(self.latency)
+        return super().get(key_id)
+
+
+def make_requests(credentials: list, count: int, malformed: float, rng: random.Random) -> list:
+    garbage = [f"bad key {i}!" for i in range(8)]
+    requests = []
+    for _ in range(count):
+        token = rng.choice(garbage) if rng.random() < malformed else rng.choice(credentials)
+        requests.append(SimpleNamespace(headers={"Authorization": f"Bearer {token}"}))
+    return requests
+
+
+def run(requests: list, cache_size: int) -> tuple:
+    cache = auth.configure_token_cache(max_entries=cache_size)
+    start = time.perf_counter()
+    for req in requests:
+        try:
+            auth.authenticate_request(req=req)
+        except APIError:
+            pass
+    elapsed = time.perf_counter() - start
+    return len(requests) / elapsed, cache.get_stats()["hit_rate"]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=50000, help="Requests per run")
+    parser.add_argument("--tokens", type=int, default=8, help="Distinct credentials in use")
+    parser.add_argument("--malformed", type=float, default=0.05, help="Fraction of malformed credentials")
+    parser.add_argument("--store-latency-us", type=float, default=100.0, help="Simulated key store lookup latency")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    api_keys = [f"svc-{i}.secret_{i}_" + "x" * 32 for i in range(args.tokens)]
+
+    def register(store: auth.APIKeyStore) -> None:
+        auth.set_api_key_store(store)
+        for i in range(args.tokens):
+            auth.register_api_key(f"svc-{i}", f"secret_{i}_" + "x" * 32, roles=["service"])
+
+    suites = [
+        ("api key", api_keys, auth.InMemoryAPIKeyStore()),
+        ("slow store", api_keys, SlowKeyStore(args.store_latency_us / 1e6)),
+    ]
+    if auth.jwt is not None:
+        tokens = [auth.create_jwt_token(f"user-{i}", roles=["user"]) for i in range(args.tokens)]
+        suites.append(("jwt", tokens, auth.InMemoryAPIKeyStore()))
+    else:
+        print("PyJWT not installed: measuring API keys only")
+
+    print(f"{args.requests} requests, {args.tokens} credentials, {args.malformed:.0%} malformed")
+    print(f"{'credential':>10} {'uncached req/s':>15} {'cached req/s':>13} {'speedup':>8} {'hit rate':>9}")
+    for name, credentials, store in suites:
+        register(store)
+        requests = make_requests(credentials, args.requests, args.malformed, rng)
+        uncached, _ = run(requests, 0)
+        cached, hit_rate = run(requests, auth.TOKEN_CACHE_SIZE)
+        print(f"{name:>10} {uncached:>15,.0f} {cached:>13,.0f} {cached / uncached:>7.1f}x {hit_rate:>9.1%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark for bulk episodic memory creation in ChrysalisMemory
+
+Creates the same synthetic memories with the previous per-call path
+(create_episodic_memory with MemoryIdentity.sign_memory, which reloads
+the private key every call), the current create_episodic_memory, and
+bulk_add with per-memory signatures (optionally on a process pool) and
+with one Merkle-root signature per batch. Then compares verifying every
+memory with MemoryIdentity.verify_signature against the cached
+SignatureVerifier (cold and warm).
+
+Usage:
+    python scripts/bench_chrysalis_bulk_add.py
+    python scripts/bench_chrysalis_bulk_add.py --memories 20000 --batch 1000 --workers 4
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# Add repository root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from memory_system.chrysalis_memory import ChrysalisMemory
+from memory_system.identity import HAS_CRYPTO, MemoryIdentity, MemorySigner
+
+WORDS = ("agent memory retrieval gossip vector clock merge quantum signal planner "
+         "context episode summary tool search index latency cache replica peer").split()
+
+
+def legacy_create(memory: ChrysalisMemory, contents: list) -> None:
+    """create_episodic_memory as it signed before MemorySigner"""
+    signer = memory.signer
+    memory.signer = _LegacySigner(memory.private_key, memory.instance_id)
+    try:
+        for content in contents:
+            memory.create_episodic_memory(content)
+    finally:
+        memory.signer = signer
+
+
+class _LegacySigner(MemorySigner):
+    def sign(self, fingerprint: str):
+        return MemoryIdentity.sign_memory(fingerprint, self.private_key, self.instance_id)
+
+
+def per_memory_us(func, count: int) -> float:
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--memories", type=int, default=5000, help="Memories per run")
+    parser.add_argument("--batch", type=int, default=500, help="bulk_add batch size")
+    parser.add_argument("--workers", type=int, default=0, help="Process pool size for per-memory signing")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    contents = [" ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 30))) for _ in range(args.memories)]
+    batches = [contents[i:i + args.batch] for i in range(0, len(contents), args.batch)]
+
+    def fresh() -> ChrysalisMemory:
+        return ChrysalisMemory("bench-a", "bench-agent")
+
+    runs = [
+        ("create (sign_memory)", lambda m: legacy_create(m, contents)),
+        ("create (MemorySigner)", lambda m: [m.create_episodic_memory(c) for c in contents]),
+        ("bulk_add per-memory", lambda m: [m.bulk_add(b, merkle=False, max_workers=args.workers) for b in batches]),
+        ("bulk_add merkle", lambda m: [m.bulk_add(b) for b in batches]),
+    ]
+    print(f"{args.memories} memories, batches of {args.batch}, "
+          f"cryptography {'installed' if HAS_CRYPTO else 'not installed (dummy signatures)'}")
+    print(f"\n{'creation':<24} {'us/memory':>10} {'memories/s':>11}")
+    stores = {}
+    for name, run in runs:
+        memory = fresh()
+        us = per_memory_us(lambda: run(memory), args.memories)
+        stores[name] = memory
+        print(f"{name:<24} {us:>10.1f} {1e6 / us:>11,.0f}")
+
+    print(f"\n{'verification':<24} {'verify_signature':>17} {'cold':>8} {'cached':>8}  (us/memory)")
+    for name in ("bulk_add per-memory", "bulk_add merkle"):
+        memory = stores[name]
+        memories = memory.state.episodicMemories
+        plain = per_memory_us(lambda: [MemoryIdentity.verify_signature(m.memoryId, m.signature) for m in memories], len(memories))
+        cold = per_memory_us(lambda: [memory.verify_memory(m) for m in memories], len(memories))
+        warm = per_memory_us(lambda: [memory.verify_memory(m) for m in memories], len(memories))
+        assert all(memory.verify_memory(m) for m in memories)
+        print(f"{name:<24} {plain:>17.1f} {cold:>8.1f} {warm:>8.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Benchmark for ChrysalisMemory retrieval
+
+Fills a ChrysalisMemory with synthetic episodic memories and compares
+the previous linear scans (substring search, list-comprehension
+filters, Python cosine loop) with the index-backed queries: BM25
+search_by_content, get_episodic_memories with type/importance filters,
+and search_by_embedding. Also reports the cost of keeping the indexes
+up to date on create and across a CRDT merge.
+
+Usage:
+    python scripts/bench_chrysalis_memory.py
+    python scripts/bench_chrysalis_memory.py --memories 50000 --dimension 384 --queries 200
+"""
+
+import argparse
+import heapq
+import math
+import os
+import random
+import sys
+import time
+
+# Add repository root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from memory_system.chrysalis_memory import ChrysalisMemory
+from memory_system.chrysalis_types import MemoryType
+from memory_system import chrysalis_index
+
+WORDS = ("agent memory retrieval gossip vector clock merge quantum signal planner "
+         "context episode summary tool search index latency cache replica peer").split()
+
+
+def make_content(rng: random.Random, vocabulary: list) -> str:
+    return " ".join(rng.choice(vocabulary) for _ in range(rng.randint(8, 30)))
+
+
+def linear_search(memories: list, query: str) -> list:
+    query_lower = query.lower()
+    return [m for m in memories if query_lower in m.content.lower()]
+
+
+def linear_filter(memories: list, memory_type, min_importance: float) -> list:
+    memories = [m for m in memories if m.memoryType == memory_type]
+    return [m for m in memories if m.importance >= min_importance]
+
+
+def linear_cosine(memories: list, query: list, limit: int) -> list:
+    norm = math.sqrt(sum(x * x for x in query))
+    scored = []
+    for m in memories:
+        dot = sum(a * b for a, b in zip(query, m.embedding))
+        scored.append((dot / (norm * math.sqrt(sum(x * x for x in m.embedding))), m))
+    return heapq.nlargest(limit, scored, key=lambda pair: pair[0])
+
+
+def timed(func, runs: int) -> float:
+    start = time.perf_counter()
+    for i in range(runs):
+        func(i)
+    return (time.perf_counter() - start) / runs * 1e3
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--memories", type=int, default=20000, help="Episodic memories to create")
+    parser.add_argument("--dimension", type=int, default=128, help="Embedding dimension")
+    parser.add_argument("--queries", type=int, default=50, help="Queries per measurement")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    vocabulary = WORDS + [f"term{i}" for i in range(2000)]
+    types = list(MemoryType)
+    memory = ChrysalisMemory("bench-a", "bench-agent", total_instances=2)
+
+    start = time.perf_counter()
+    for _ in range(args.memories):
+        memory.create_episodic_memory(
+            make_content(rng, vocabulary),
+            memory_type=rng.choice(types),
+            importance=rng.random(),
+            embedding=[rng.gauss(0, 1) for _ in range(args.dimension)],
+        )
+    create_ms = (time.perf_counter() - start) / args.memories * 1e3
+    memories = memory.state.episodicMemories
+
+    print(f"{args.memories} episodic memories, {args.dimension}-d embeddings, "
+          f"NumPy {'available' if chrysalis_index.np is not None else 'not installed'}")
+    print(f"create_episodic_memory: {create_ms:.3f} ms/memory (including index maintenance)")
+
+    queries = [f"{rng.choice(vocabulary)} {rng.choice(vocabulary)}" for _ in range(args.queries)]
+    single = [rng.choice(vocabulary) for _ in range(args.queries)]
+    vectors = [[rng.gauss(0, 1) for _ in range(args.dimension)] for _ in range(args.queries)]
+    runs = args.queries
+
+    rows = [
+        ("substring/BM25 one word", timed(lambda i: linear_search(memories, single[i]), runs),
+         timed(lambda i: memory.search_by_content(single[i]), runs)),
+        ("top-10 BM25 two words", timed(lambda i: linear_search(memories, queries[i]), runs),
+         timed(lambda i: memory.search_episodic(queries[i], limit=10), runs)),
+        ("type + importance >= 0.9", timed(lambda i: linear_filter(memories, types[i % len(types)], 0.9), runs),
+         timed(lambda i: memory.get_episodic_memories(types[i % len(types)], 0.9), runs)),
+        ("top-10 cosine", timed(lambda i: linear_cosine(memories, vectors[i], 10), max(1, runs // 10)),
+         timed(lambda i: memory.search_by_embedding(vectors[i], limit=10), runs)),
+    ]
+    print(f"\n{'query':<26} {'linear ms':>10} {'indexed ms':>11} {'speedup':>8}")
+    for name, linear, indexed in rows:
+        print(f"{name:<26} {linear:>10.3f} {indexed:>11.3f} {linear / indexed:>7.0f}x")
+
+    other = ChrysalisMemory("bench-b", "bench-agent", instance_index=1, total_instances=2)
+    for _ in range(max(1, args.memories // 10)):
+        other.create_episodic_memory(make_content(rng, vocabulary), importance=rng.random())
+    start = time.perf_counter()
+    memory.merge_with_instance(other.state)
+    merge_ms = (time.perf_counter() - start) * 1e3
+    start = time.perf_counter()
+    memory.sync_indexes()
+    resync_ms = (time.perf_counter() - start) * 1e3
+    start = time.perf_counter()
+    memory._episodic_index.rebuild(memory.state.episodicMemories)
+    rebuild_ms = (time.perf_counter() - start) * 1e3
+    print(f"\nmerge of {len(other.state.episodicMemories)} new memories (incremental index): {merge_ms:.0f} ms")
+    print(f"no-op resync: {resync_ms:.1f} ms, full episodic rebuild: {rebuild_ms:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
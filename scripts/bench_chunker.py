@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark for memory_system ChunkConverter
+
+Chunks a synthetic corpus and reports throughput (MB/s, chunks/s) for
+each strategy, plus the peak Python heap of chunking one large document
+from a file stream versus reading it whole and calling split().
+Optionally fans the corpus out over a process pool with split_many().
+
+Usage:
+    python scripts/bench_chunker.py
+    python scripts/bench_chunker.py --docs 400 --paragraphs 200 --workers 4
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Add repository root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from memory_system.converters.chunk import ChunkConverter, ChunkStrategy
+
+WORDS = ("memory retrieval agent context vector index token chunk stream "
+         "semantic graph query embedding latency corpus document section").split()
+
+_TOKEN = re.compile(r"\w+|[^\w\s]")
+
+
+def tokenize(text: str) -> list:
+    return _TOKEN.findall(text)
+
+
+def make_document(rng: random.Random, paragraphs: int) -> str:
+    parts = []
+    for p in range(paragraphs):
+        if p % 10 == 0:
+            parts.append(f"## Section {p}\n")
+        sentences = []
+        for _ in range(rng.randint(2, 8)):
+            words = [rng.choice(WORDS) for _ in range(rng.randint(6, 24))]
+            sentences.append(" ".join(words).capitalize() + rng.choice(".!?"))
+        parts.append(" ".join(sentences) + "\n\n")
+    return "".join(parts)
+
+
+def make_chunker(strategy: ChunkStrategy) -> ChunkConverter:
+    size = 128 if strategy == ChunkStrategy.TOKEN else 512
+    return ChunkConverter(chunk_size=size, overlap=32, strategy=strategy, tokenizer=tokenize)
+
+
+def bench_throughput(corpus: list, workers: int) -> None:
+    total_mb = sum(len(doc) for doc in corpus) / 1e6
+    print(f"corpus: {len(corpus)} docs, {total_mb:.1f} MB")
+    print(f"{'strategy':>10} {'MB/s':>8} {'chunks/s':>10} {'pool MB/s':>10}")
+    for strategy in ChunkStrategy:
+        chunker = make_chunker(strategy)
+        start = time.perf_counter()
+        count = sum(len(chunker.split(doc)) for doc in corpus)
+        serial = time.perf_counter() - start
+
+        pool = ""
+        if workers > 1:
+            start = time.perf_counter()
+            chunker.split_many(corpus, max_workers=workers, chunksize=8)
+            pool = f"{total_mb / (time.perf_counter() - start):.1f}"
+        print(f"{strategy.value:>10} {total_mb / serial:>8.1f} {count / serial:>10.0f} {pool:>10}")
+
+
+def bench_memory(rng: random.Random, paragraphs: int) -> None:
+    with tempfile.NamedTemporaryFile("w", suffix=".md", delete=False) as f:
+        for _ in range(20):
+            f.write(make_document(rng, paragraphs))
+        path = f.name
+    size_mb = os.path.getsize(path) / 1e6
+    print(f"\nsingle document: {size_mb:.1f} MB (peak traced heap, chunks consumed lazily)")
+    print(f"{'strategy':>10} {'split() MB':>11} {'stream MB':>10}")
+    try:
+        for strategy in ChunkStrategy:
+            chunker = make_chunker(strategy)
+
+            tracemalloc.start()
+            with open(path, encoding="utf-8") as fh:
+                for _ in chunker.split(fh.read()):
+                    pass
+            whole = tracemalloc.get_traced_memory()[1] / 1e6
+            tracemalloc.stop()
+
+            tracemalloc.start()
+            with open(path, encoding="utf-8") as fh:
+                for _ in chunker.iter_split(fh):
+                    pass
+            streamed = tracemalloc.get_traced_memory()[1] / 1e6
+            tracemalloc.stop()
+            print(f"{strategy.value:>10} {whole:>11.1f} {streamed:>10.1f}")
+    finally:
+        os.unlink(path)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=200, help="Documents in the synthetic corpus")
+    parser.add_argument("--paragraphs", type=int, default=100, help="Paragraphs per document")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Process pool size")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    corpus = [make_document(rng, args.paragraphs) for _ in range(args.docs)]
+    bench_throughput(corpus, args.workers)
+    bench_memory(rng, args.paragraphs * 10)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Benchmark for memory_system CodeConverter
+
+Generates a synthetic Python package and measures:
+
+- per-file analysis: a single extract() with the result cache disabled,
+  and extract() + get_imports() + get_definitions() with the default
+  in-memory cache (earlier revisions parse the file for every call)
+- extract_tree() over the package: cold in-process, cold across a process
+  pool, and a warm re-index from the SQLite cache after touching a few files
+
+Usage:
+    python scripts/bench_code_converter.py
+    python scripts/bench_code_converter.py --files 1000 --functions 40 --workers 4
+    # Compare per-file analysis with another revision of the converter
+    git show HEAD~1:memory_system/converters/code.py > /tmp/code_old.py
+    python scripts/bench_code_converter.py --converter-module /tmp/code_old.py
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add repository root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+MODULE_TEMPLATE = '''"""Generated module {index}."""
+import os
+import json
+from collections import OrderedDict
+from typing import Any, Dict, List
+
+
+class Handler{index}:
+    """Handles requests for module {index}."""
+
+    def __init__(self, config: Dict[str, Any]):
+        self.config = OrderedDict(config)
+
+{methods}
+
+{functions}
+'''
+
+METHOD_TEMPLATE = '''    def method_{n}(self, payload: List[str]) -> str:
+        """Method {n}."""
+        values = [item.strip() for item in payload if item]
+        joined = os.path.join(*values) if values else ""
+        return json.dumps({{"n": {n}, "path": joined, "size": len(values)}})
+'''
+
+FUNCTION_TEMPLATE = '''def function_{n}(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Function {n}."""
+    result = {{}}
+    for key, value in sorted(data.items()):
+        if isinstance(value, str):
+            result[key] = value.upper()
+        else:
+            result[key] = str(value)
+    return result
+'''
+
+
+def load_module(module_path: str):
+    if not module_path:
+        from memory_system.converters import code
+        return code
+    spec = importlib.util.spec_from_file_location("bench_code_module", module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_converter(module, **kwargs):
+    try:
+        return module.CodeConverter(**kwargs)
+    except TypeError:
+        # Older revisions without a chunk cache
+        return module.CodeConverter()
+
+
+def make_package(root: Path, files: int, functions: int) -> list:
+    package = root / "pkg"
+    paths = []
+    for i in range(files):
+        directory = package / f"sub_{i % 10}"
+        directory.mkdir(parents=True, exist_ok=True)
+        source = MODULE_TEMPLATE.format(
+            index=i,
+            methods="\n".join(METHOD_TEMPLATE.format(n=n) for n in range(functions // 2)),
+            functions="\n\n".join(FUNCTION_TEMPLATE.format(n=n) for n in range(functions // 2)),
+        )
+        path = directory / f"module_{i}.py"
+        path.write_text(source)
+        paths.append(str(path))
+    return paths
+
+
+def bench_per_file(module, paths: list) -> tuple:
+    converter = make_converter(module, enable_cache=False)
+    start = time.perf_counter()
+    for path in paths:
+        converter.extract(path)
+    extract = time.perf_counter() - start
+
+    converter = make_converter(module)
+    start = time.perf_counter()
+    for path in paths:
+        converter.extract(path)
+        converter.get_imports(path)
+        converter.get_definitions(path)
+    return extract, time.perf_counter() - start
+
+
+def bench_tree(module, root: Path, paths: list, workers: int) -> dict:
+    package = root / "pkg"
+    timings = {}
+
+    converter = module.CodeConverter(enable_cache=False)
+    start = time.perf_counter()
+    converter.extract_tree(package, max_workers=1)
+    timings["cold_serial"] = time.perf_counter() - start
+
+    db = root / "code-cache.db"
+    converter = module.CodeConverter(cache_path=db)
+    start = time.perf_counter()
+    converter.extract_tree(package, max_workers=workers)
+    timings["cold_pool"] = time.perf_counter() - start
+    converter.cache.close()
+
+    # Touch a few files, then re-index from a fresh session
+    edited = paths[:: max(1, len(paths) // 5)]
+    for path in edited:
+        with open(path, "a") as f:
+            f.write("\n# edited\n")
+    converter = module.CodeConverter(cache_path=db)
+    start = time.perf_counter()
+    converter.extract_tree(package, max_workers=workers)
+    timings["warm"] = time.perf_counter() - start
+    timings["edited"] = len(edited)
+    converter.cache.close()
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=300, help="Generated modules")
+    parser.add_argument("--functions", type=int, default=30, help="Functions and methods per module")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Process pool size")
+    parser.add_argument("--converter-module", default="", help="Load CodeConverter from this file instead")
+    args = parser.parse_args()
+
+    module = load_module(args.converter_module)
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        paths = make_package(root, args.files, args.functions)
+        extract, combined = bench_per_file(module, paths)
+        print(f"package: {args.files} files, {args.functions} definitions each")
+        print(f"extract (uncached):                      {extract * 1e3 / len(paths):.2f} ms/file")
+        print(f"extract + get_imports + get_definitions: {combined * 1e3 / len(paths):.2f} ms/file")
+
+        if not hasattr(module.CodeConverter, "extract_tree"):
+            return 0
+        timings = bench_tree(module, root, paths, args.workers)
+        print(f"extract_tree cold, in-process:           {timings['cold_serial'] * 1e3:.0f} ms")
+        print(f"extract_tree cold, {args.workers} worker(s):".ljust(41) + f"{timings['cold_pool'] * 1e3:.0f} ms")
+        print(f"extract_tree warm, new session:          {timings['warm'] * 1e3:.0f} ms "
+              f"({timings['edited']} files edited)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Benchmark for memory_system DocumentConverter batch conversion
+
+Generates a folder of synthetic HTML, Markdown and (when pypdf is
+installed) PDF documents and compares:
+
+- a serial loop over convert()
+- convert_many() across a process pool
+- a second convert_many() from a fresh session using the SQLite result
+  cache after editing a few files
+
+Usage:
+    python scripts/bench_document_converter.py
+    python scripts/bench_document_converter.py --docs 2000 --paragraphs 80 --workers 8
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add repository root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from memory_system.converters.document import PYPDF_AVAILABLE, DocumentConverter
+
+WORDS = ("memory retrieval agent context vector index token chunk stream "
+         "semantic graph query embedding latency corpus document section").split()
+
+
+def sentences(rng: random.Random, count: int) -> list:
+    return [" ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 20))).capitalize() + "."
+            for _ in range(count)]
+
+
+def make_html(rng: random.Random, paragraphs: int) -> str:
+    body = "".join(
+        f"<h2>Section {p}</h2>" if p % 8 == 0 else f"<p>{' '.join(sentences(rng, 4))}&nbsp;<br/></p>\n"
+        for p in range(paragraphs)
+    )
+    return (f"<html><head><title>Doc</title><style>p {{ margin: 0 }}</style></head>"
+            f"<body><nav>menu</nav>{body}<script>track()</script></body></html>")
+
+
+def make_markdown(rng: random.Random, paragraphs: int) -> str:
+    return "".join(
+        f"## Section {p}\n\n" if p % 8 == 0 else f"- **{rng.choice(WORDS)}** {' '.join(sentences(rng, 4))}\n\n"
+        for p in range(paragraphs)
+    )
+
+
+def make_pdf(rng: random.Random, paragraphs: int) -> bytes:
+    """Build a minimal multi-page PDF with Helvetica text."""
+    pages = []
+    lines = [s for _ in range(paragraphs) for s in sentences(rng, 2)]
+    for start in range(0, len(lines), 40):
+        ops = ["BT", "/F1 10 Tf", "12 TL", "50 780 Td"]
+        for line in lines[start:start + 40]:
+            ops.append("(" + line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") + ") Tj T*")
+        ops.append("ET")
+        pages.append("\n".join(ops).encode())
+
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for stream in pages:
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (len(objects)))
+        kids.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), len(kids))
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+def make_corpus(root: Path, docs: int, paragraphs: int, seed: int) -> list:
+    rng = random.Random(seed)
+    kinds = ["html", "md"] + (["pdf"] if PYPDF_AVAILABLE else [])
+    paths = []
+    for i in range(docs):
+        kind = kinds[i % len(kinds)]
+        path = root / f"doc_{i}.{kind}"
+        if kind == "pdf":
+            path.write_bytes(make_pdf(rng, paragraphs))
+        elif kind == "html":
+            path.write_text(make_html(rng, paragraphs))
+        else:
+            path.write_text(make_markdown(rng, paragraphs))
+        paths.append(str(path))
+    return paths
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=600, help="Generated documents")
+    parser.add_argument("--paragraphs", type=int, default=60, help="Paragraphs per document")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Process pool size")
+    parser.add_argument("--chunksize", type=int, default=8, help="Documents per pool task")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        paths = make_corpus(root, args.docs, args.paragraphs, args.seed)
+        total_mb = sum(os.path.getsize(p) for p in paths) / 1e6
+        formats = "HTML, Markdown, PDF" if PYPDF_AVAILABLE else "HTML, Markdown; pypdf not installed"
+        print(f"corpus: {len(paths)} docs, {total_mb:.1f} MB ({formats})")
+
+        converter = DocumentConverter()
+        start = time.perf_counter()
+        serial = [converter.convert(p) for p in paths]
+        elapsed = time.perf_counter() - start
+        print(f"serial convert():           {elapsed * 1e3:7.0f} ms  {len(paths) / elapsed:7.0f} docs/s")
+
+        db = root / "documents.db"
+        converter = DocumentConverter(cache_path=db)
+        start = time.perf_counter()
+        pooled = [r for _, r in converter.convert_many(paths, max_workers=args.workers, chunksize=args.chunksize)]
+        elapsed = time.perf_counter() - start
+        converter.cache.close()
+        assert pooled == serial
+        print(f"convert_many, {args.workers} worker(s):   {elapsed * 1e3:7.0f} ms  {len(paths) / elapsed:7.0f} docs/s")
+
+        edited = paths[:: max(1, len(paths) // 10)]
+        for path in edited:
+            with open(path, "ab") as f:
+                f.write(b"\n")
+        converter = DocumentConverter(cache_path=db)
+        start = time.perf_counter()
+        for _ in converter.convert_many(paths, max_workers=args.workers, chunksize=args.chunksize):
+            pass
+        elapsed = time.perf_counter() - start
+        misses = converter.cache.stats()["misses"]
+        converter.cache.close()
+        print(f"convert_many, warm cache:   {elapsed * 1e3:7.0f} ms  {len(paths) / elapsed:7.0f} docs/s "
+              f"({len(edited)} edited, {misses} converted)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
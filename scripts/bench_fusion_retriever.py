@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark for memory_system FusionRetriever.retrieve_async
+
+Runs retrieve_async against simulated sources with fixed latencies: a
+blocking embedder, blocking Zep embedding and KG calls, and an async
+Fireproof cache. Reports mean latency per query in three scenarios:
+all sources healthy, the remote failing (Fireproof fallback) and the
+remote stalling far beyond its deadline.
+
+Usage:
+    python scripts/bench_fusion_retriever.py
+    python scripts/bench_fusion_retriever.py --embed-ms 20 --remote-ms 80 --kg-ms 60
+    # Compare with another revision of the retriever
+    git show HEAD~1:memory_system/fusion.py > /tmp/fusion_old.py
+    python scripts/bench_fusion_retriever.py --fusion-module /tmp/fusion_old.py
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import logging
+import os
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+# Add repository root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from memory_system.beads import BeadsService
+
+
+class Embedder:
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.calls = 0
+
+    def embed(self, text: str) -> list:
+        self.calls += 1
+        time.sleep(self.delay)
+        return [0.1] * 8
+
+
+class ZepHooks:
+    def __init__(self, remote_delay: float, kg_delay: float, fail: bool = False):
+        self.remote_delay = remote_delay
+        self.kg_delay = kg_delay
+        self.fail = fail
+
+    def on_retrieve_embeddings(self, vector: list, k: int = 5) -> list:
+        time.sleep(self.remote_delay)
+        if self.fail:
+            raise ConnectionError("remote unavailable")
+        return [{"id": f"remote-{i}"} for i in range(k)]
+
+    def on_retrieve_kg(self, node_ids: list, predicates=None, hops: int = 1) -> dict:
+        time.sleep(self.kg_delay)
+        return {"nodes": [{"id": n} for n in node_ids], "edges": []}
+
+
+class Fireproof:
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.config = SimpleNamespace(local_vector_cache=True, promotion_enabled=False)
+
+    async def query_beads(self, limit: int = 10, min_importance=None) -> list:
+        await asyncio.sleep(self.delay)
+        return [{"id": "durable"}]
+
+    async def local_similarity_search(self, query_vector: list, k: int = 5) -> list:
+        await asyncio.sleep(self.delay)
+        return [{"id": f"local-{i}"} for i in range(k)]
+
+
+def load_module(module_path: str):
+    if not module_path:
+        from memory_system import fusion
+        return fusion
+    spec = importlib.util.spec_from_file_location("bench_fusion_module", module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+async def run_queries(retriever, queries: int) -> float:
+    start = time.perf_counter()
+    for i in range(queries):
+        await retriever.retrieve_async(f"query {i}", kg_node_ids=["n1", "n2"])
+    return (time.perf_counter() - start) / queries
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--queries", type=int, default=20, help="Queries per scenario")
+    parser.add_argument("--embed-ms", type=float, default=15, help="Embedder latency")
+    parser.add_argument("--remote-ms", type=float, default=60, help="Zep embedding search latency")
+    parser.add_argument("--kg-ms", type=float, default=40, help="Zep KG latency")
+    parser.add_argument("--fireproof-ms", type=float, default=5, help="Fireproof query latency")
+    parser.add_argument("--stall-ms", type=float, default=1500, help="Remote latency in the stalled scenario")
+    parser.add_argument("--fusion-module", default="", help="Load FusionRetriever from this file instead")
+    args = parser.parse_args()
+
+    logging.getLogger("central_logger").setLevel(logging.ERROR)
+    module = load_module(args.fusion_module)
+    scenarios = [
+        ("healthy", args.remote_ms, False),
+        ("remote failing", args.remote_ms, True),
+        ("remote stalled", args.stall_ms, False),
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        beads = BeadsService(path=os.path.join(tmp, "beads.db"))
+        for i in range(50):
+            beads.append(f"bead {i}", importance=0.5)
+
+        print(f"{'scenario':>16} {'ms/query':>9} {'embeds/query':>13}")
+        for name, remote_ms, fail in scenarios:
+            embedder = Embedder(args.embed_ms / 1e3)
+            kwargs = dict(
+                beads=beads,
+                embedder=embedder,
+                zep_hooks=ZepHooks(remote_ms / 1e3, args.kg_ms / 1e3, fail),
+                fireproof=Fireproof(args.fireproof_ms / 1e3),
+            )
+            try:
+                retriever = module.FusionRetriever(source_timeouts={"remote": 0.25}, **kwargs)
+            except TypeError:
+                # Older revisions without per-source deadlines
+                retriever = module.FusionRetriever(**kwargs)
+            queries = max(1, args.queries // 5) if remote_ms >= 1000 else args.queries
+            latency = asyncio.run(run_queries(retriever, queries))
+            print(f"{name:>16} {latency * 1e3:>9.1f} {embedder.calls / queries:>13.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Benchmark for memory_system LSPResolver transport
+
+Runs symbol lookups (definition, references, hover) against a stub
+stdio language server and reports sequential latency, pipelined
+throughput with asyncio.gather, and how many document sync
+notifications reached the server. These transport phases run with the
+result cache disabled.
+
+With the cache enabled it then measures repeated lookups, resolve_many
+over a window, and a second session that prefetches documentSymbol for
+a directory from a warm SQLite cache.
+
+The stub is installed in a temp directory as an executable named
+"pylsp" so it passes the resolver's executable allowlist.
+
+Usage:
+    python scripts/bench_lsp_resolver.py
+    python scripts/bench_lsp_resolver.py --lookups 2000 --file-kb 256
+    # Compare with another revision of the resolver
+    git show HEAD~1:memory_system/resolvers/lsp.py > /tmp/lsp_old.py
+    python scripts/bench_lsp_resolver.py --resolver-module /tmp/lsp_old.py
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import os
+import sys
+import tempfile
+import textwrap
+import time
+from pathlib import Path
+
+# Add repository root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+STUB_SERVER = textwrap.dedent('''
+    import json, sys
+
+    stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+    counts = {}
+    location = {"uri": "file:///stub.py", "range": {"start": {"line": 3, "character": 4},
+                                                    "end": {"line": 3, "character": 10}}}
+
+    def send(message):
+        body = json.dumps(message).encode()
+        stdout.write(b"Content-Length: %d\\r\\n\\r\\n" % len(body) + body)
+        stdout.flush()
+
+    while True:
+        length = None
+        while True:
+            line = stdin.readline()
+            if not line:
+                sys.exit(0)
+            if line == b"\\r\\n":
+                break
+            if line.lower().startswith(b"content-length:"):
+                length = int(line.split(b":")[1])
+        message = json.loads(stdin.read(length))
+        method = message.get("method")
+        counts[method] = counts.get(method, 0) + 1
+        if "id" not in message:
+            if method == "exit":
+                sys.exit(0)
+            continue
+        if method == "initialize":
+            result = {"capabilities": {}}
+        elif method == "textDocument/definition":
+            result = location
+        elif method == "textDocument/references":
+            result = [location] * 20
+        elif method == "textDocument/hover":
+            result = {"contents": {"kind": "markdown", "value": "def handler(request) -> Response"}}
+        elif method == "textDocument/documentSymbol":
+            result = [{"name": "handler", "kind": 12, "range": location["range"]}] * 10
+        elif method == "stub/counts":
+            result = counts
+        else:
+            result = None
+        send({"jsonrpc": "2.0", "id": message["id"], "result": result})
+''')
+
+
+def load_module(module_path: str):
+    if not module_path:
+        from memory_system.resolvers import lsp
+        return lsp
+    spec = importlib.util.spec_from_file_location("bench_lsp_module", module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+CACHED_METHODS = [
+    "textDocument/definition",
+    "textDocument/references",
+    "textDocument/hover",
+    "textDocument/documentSymbol",
+]
+
+
+def make_resolver(module, server: Path, **kwargs):
+    try:
+        return module.LSPResolver(server_cmd=[str(server)], timeout=60, **kwargs)
+    except TypeError:
+        # Older revisions without a result cache
+        return module.LSPResolver(server_cmd=[str(server)], timeout=60)
+
+
+def install(workdir: Path, file_kb: int, files: int) -> tuple:
+    server = workdir / "pylsp"
+    server.write_text(f"#!{sys.executable}\n{STUB_SERVER}")
+    server.chmod(0o755)
+    line = "def handler(request):\n    return request.respond(status=200)\n"
+    body = line * max(1, file_kb * 1024 // len(line))
+    package = workdir / "pkg"
+    package.mkdir()
+    for i in range(files):
+        (package / f"module_{i}.py").write_text(body)
+    return server, package / "module_0.py", package
+
+
+async def bench_transport(module, workdir: Path, lookups: int, file_kb: int) -> dict:
+    server, source, _ = install(workdir, file_kb, 1)
+    resolver = make_resolver(module, server, enable_cache=False)
+    await resolver.initialize(workdir)
+    calls = (resolver.find_definition, resolver.find_references, resolver.get_hover)
+    try:
+        start = time.perf_counter()
+        for i in range(lookups):
+            result = await calls[i % 3](str(source), 10 + i % 50, 4)
+            assert result.success, result.error
+        sequential = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(
+            calls[i % 3](str(source), 10 + i % 50, 4) for i in range(lookups)
+        ))
+        pipelined = time.perf_counter() - start
+        assert all(r.success for r in results)
+
+        counts = (await resolver._request("stub/counts", None)).data or {}
+    finally:
+        await resolver.shutdown()
+
+    return {
+        "sequential_ms": sequential / lookups * 1e3,
+        "pipelined_per_s": lookups / pipelined,
+        "did_open": counts.get("textDocument/didOpen", 0),
+        "did_change": counts.get("textDocument/didChange", 0),
+    }
+
+
+async def bench_cache(module, workdir: Path, lookups: int, file_kb: int, files: int, window: int) -> dict:
+    server, source, package = install(workdir, file_kb, files)
+    requests = [
+        module.ResolveRequest(("definition", "references", "hover")[i % 3], str(source), 10 + i % 50, 4)
+        for i in range(lookups)
+    ]
+    db = workdir / "lsp-cache.db"
+
+    cache = module.LSPResultCache(db)
+    # Cross-file methods are cached on request only (the stub workspace never changes)
+    resolver = make_resolver(module, server, cache=cache, cache_methods=CACHED_METHODS)
+    await resolver.initialize(workdir)
+    try:
+        start = time.perf_counter()
+        await resolver.resolve_many(requests, window=window)
+        first = time.perf_counter() - start
+        start = time.perf_counter()
+        await resolver.resolve_many(requests, window=window)
+        repeat = time.perf_counter() - start
+        counts = (await resolver._request("stub/counts", None)).data or {}
+        start = time.perf_counter()
+        await resolver.prefetch_document_symbols(package, window=window)
+        prefetch_cold = time.perf_counter() - start
+    finally:
+        await resolver.shutdown()
+        cache.close()
+
+    # New session: documentSymbol for the directory comes from SQLite
+    cache = module.LSPResultCache(db)
+    resolver = make_resolver(module, server, cache=cache)
+    await resolver.initialize(workdir)
+    try:
+        start = time.perf_counter()
+        await resolver.prefetch_document_symbols(package, window=window)
+        prefetch_warm = time.perf_counter() - start
+        warm_counts = (await resolver._request("stub/counts", None)).data or {}
+    finally:
+        await resolver.shutdown()
+        cache.close()
+
+    return {
+        "first_per_s": lookups / first,
+        "repeat_per_s": lookups / repeat,
+        "server_lookups": sum(counts.get(m, 0) for m in (
+            "textDocument/definition", "textDocument/references", "textDocument/hover")),
+        "prefetch_cold_ms": prefetch_cold * 1e3,
+        "prefetch_warm_ms": prefetch_warm * 1e3,
+        "warm_server_requests": warm_counts.get("textDocument/documentSymbol", 0),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lookups", type=int, default=600, help="Lookups per phase")
+    parser.add_argument("--file-kb", type=int, default=64, help="Size of the queried source file")
+    parser.add_argument("--files", type=int, default=200, help="Files in the prefetched directory")
+    parser.add_argument("--window", type=int, default=16, help="resolve_many concurrency window")
+    parser.add_argument("--resolver-module", default="", help="Load LSPResolver from this file instead")
+    args = parser.parse_args()
+
+    module = load_module(args.resolver_module)
+    with tempfile.TemporaryDirectory() as tmp:
+        result = asyncio.run(bench_transport(module, Path(tmp), args.lookups, args.file_kb))
+
+    print(f"lookups per phase:      {args.lookups} on a {args.file_kb} KB file")
+    print(f"sequential latency:     {result['sequential_ms']:.3f} ms/lookup")
+    print(f"pipelined throughput:   {result['pipelined_per_s']:.0f} lookups/s")
+    print(f"didOpen / didChange:    {result['did_open']} / {result['did_change']}")
+
+    if not hasattr(module, "LSPResultCache"):
+        return 0
+    with tempfile.TemporaryDirectory() as tmp:
+        result = asyncio.run(bench_cache(module, Path(tmp), args.lookups, args.file_kb, args.files, args.window))
+    print(f"\nresolve_many (window {args.window}):")
+    print(f"  first pass:           {result['first_per_s']:.0f} lookups/s")
+    print(f"  repeat (cached):      {result['repeat_per_s']:.0f} lookups/s")
+    print(f"  server lookups:       {result['server_lookups']} for {2 * args.lookups} requests")
+    print(f"documentSymbol prefetch of {args.files} files:")
+    print(f"  cold session:         {result['prefetch_cold_ms']:.0f} ms")
+    print(f"  warm SQLite session:  {result['prefetch_warm_ms']:.0f} ms "
+          f"({result['warm_server_requests']} server requests)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Soak test for shared.api_core MetricsCollector
+
+Records a long stream of latency-like observations and reports traced
+memory and p99 at checkpoints. With bounded histograms memory should
+plateau after the first checkpoint instead of growing with the stream.
+
+Usage:
+    python scripts/bench_metrics.py
+    python scripts/bench_metrics.py --observations 1000000 --histogram buckets
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+# Add shared directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'shared')))
+
+from api_core.monitoring import MetricsCollector
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--observations", type=int, default=10_000_000)
+    parser.add_argument("--checkpoints", type=int, default=10)
+    parser.add_argument("--histogram", choices=["ddsketch", "buckets"], default="ddsketch")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    metrics = MetricsCollector(histogram_type=args.histogram)
+    step = max(1, args.observations // args.checkpoints)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    print(f"{'observations':>14} {'traced KiB':>12} {'p99 ms':>10} {'ns/obs':>8}")
+    done = 0
+    while done < args.observations:
+        batch = min(step, args.observations - done)
+        batch_start = time.perf_counter()
+        for _ in range(batch):
+            metrics.observe_histogram("http_request_duration_ms", rng.lognormvariate(3, 1))
+            metrics.increment("http_requests_total")
+        elapsed = time.perf_counter() - batch_start
+        done += batch
+        current, _ = tracemalloc.get_traced_memory()
+        p99 = metrics.histograms["http_request_duration_ms"].quantile(0.99)
+        print(f"{done:>14} {current / 1024:>12.1f} {p99:>10.2f} {elapsed / batch * 1e9:>8.0f}")
+
+    print(f"total {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Contention benchmark for shared.api_core RateLimiter
+
+Runs check_rate_limit from several threads over many distinct client
+keys and reports throughput for each limiter variant: a single shard
+(one global lock) vs. sharded buckets, token bucket vs. GCRA, and the
+shared SQLite store.
+
+Usage:
+    python scripts/bench_rate_limiter.py
+    python scripts/bench_rate_limiter.py --threads 16 --calls 20000 --keys 50000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+# Add shared directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'shared')))
+
+from api_core.rate_limiting import RateLimitConfig, RateLimiter, SQLiteRateLimitStore
+
+
+class _Request:
+    def __init__(self, remote_addr):
+        self.remote_addr = remote_addr
+        self.path = "/bench"
+        self.headers = {}
+        self.endpoint = None
+
+
+def run(limiter: RateLimiter, threads: int, calls: int, keys: int) -> float:
+    requests = [_Request(f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}") for i in range(keys)]
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(offset: int) -> None:
+        barrier.wait()
+        for i in range(calls):
+            limiter.check_rate_limit(requests[(offset + i * 7919) % keys])
+
+    pool = [threading.Thread(target=worker, args=(t * 104729,)) for t in range(threads)]
+    for thread in pool:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    return threads * calls / (time.perf_counter() - start)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--calls", type=int, default=10_000, help="Calls per thread")
+    parser.add_argument("--keys", type=int, default=20_000, help="Distinct client keys")
+    parser.add_argument("--skip-sqlite", action="store_true")
+    args = parser.parse_args()
+
+    variants = [
+        ("token_bucket, 1 shard", RateLimitConfig(limit=100, window=60, shards=1)),
+        ("token_bucket, 16 shards", RateLimitConfig(limit=100, window=60, shards=16)),
+        ("gcra, 16 shards", RateLimitConfig(limit=100, window=60, shards=16, algorithm="gcra")),
+    ]
+    tmpdir = None
+    if not args.skip_sqlite:
+        tmpdir = tempfile.TemporaryDirectory()
+        store = SQLiteRateLimitStore(os.path.join(tmpdir.name, "limits.db"))
+        variants.append(("gcra, sqlite store", RateLimitConfig(limit=100, window=60, algorithm="gcra", store=store)))
+
+    print(f"{args.threads} threads x {args.calls} calls over {args.keys} keys")
+    for name, config in variants:
+        throughput = run(RateLimiter(config), args.threads, args.calls, args.keys)
+        print(f"  {name:<26} {throughput:>12,.0f} checks/s")
+
+    if tmpdir is not None:
+        tmpdir.cleanup()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
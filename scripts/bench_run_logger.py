@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark for universal_adapter run logging
+
+Compares events/sec of the synchronous open/append/close path with the
+background batched writer, using concurrent producer threads. After the
+run it checks that every line parses as JSON (no interleaving).
+
+Usage:
+    python scripts/bench_run_logger.py
+    python scripts/bench_run_logger.py --events 50000 --threads 8 --fsync batch
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from universal_adapter import logger as run_logger
+
+
+def _event(i: int) -> dict:
+    return {
+        "event": "adapter_run",
+        "task": f"task-{i % 17}",
+        "node_count": i % 40,
+        "success": i % 3 != 0,
+        "response": "x" * (i % 400),
+    }
+
+
+def _produce(emit, events: int, threads: int) -> float:
+    per_thread = events // threads
+
+    def work(offset: int) -> None:
+        for i in range(offset, offset + per_thread):
+            emit(_event(i))
+
+    workers = [threading.Thread(target=work, args=(t * per_thread,)) for t in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def _check(path: Path, expected: int) -> int:
+    lines = 0
+    for candidate in [path, *sorted(path.parent.glob(path.name + ".*"))]:
+        with candidate.open(encoding="utf-8") as f:
+            for line in f:
+                json.loads(line)
+                lines += 1
+    if lines != expected:
+        raise SystemExit(f"{path}: expected {expected} lines, found {lines}")
+    return lines
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=20_000)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--fsync", choices=run_logger.RunLogWriter.FSYNC_POLICIES, default="never")
+    parser.add_argument("--max-bytes", type=int, default=0, help="Rotate at this size (0 disables)")
+    args = parser.parse_args()
+    events = args.events // args.threads * args.threads
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sync_path = Path(tmp) / "sync" / "runs.jsonl"
+        run_logger.LOG_DIR = sync_path.parent
+        run_logger.RUN_LOG = sync_path
+        sync_seconds = _produce(run_logger.log_run_event_sync, events, args.threads)
+        _check(sync_path, events)
+
+        async_path = Path(tmp) / "async" / "runs.jsonl"
+        writer = run_logger.RunLogWriter(
+            async_path,
+            max_queue=events,
+            fsync=args.fsync,
+            max_bytes=args.max_bytes,
+            backup_count=1_000,
+        )
+        start = time.perf_counter()
+        enqueue_seconds = _produce(
+            lambda event: writer.write(run_logger._serialize_event(event)), events, args.threads
+        )
+        writer.flush()
+        flushed_seconds = time.perf_counter() - start
+        writer.close()
+        _check(async_path, events)
+
+    print(f"{'mode':<28} {'events/sec':>12}")
+    print(f"{'sync open/append/close':<28} {events / sync_seconds:>12,.0f}")
+    print(f"{'batched (caller side)':<28} {events / enqueue_seconds:>12,.0f}")
+    print(f"{'batched (flushed to disk)':<28} {events / flushed_seconds:>12,.0f}")
+    print(f"dropped={writer.dropped} written={writer.written}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark for memory_system working memory and context assembly
+
+Compares list-based working memory (append + pop(0)) with the
+deque-backed WorkingMemory at 10k entries, and token-budgeted
+get_context with building the full context string and truncating it.
+
+Usage:
+    python scripts/bench_working_memory.py
+    python scripts/bench_working_memory.py --size 50000 --budget 4000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add repository root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from memory_system.core import Memory, MemoryConfig, MemoryEntry, estimate_tokens
+from memory_system.stores import WorkingMemory
+
+
+def bench_add(size: int, adds: int) -> dict:
+    entries = [MemoryEntry.create(f"observation {i} " * 8, "working") for i in range(adds)]
+
+    buffer = []
+    start = time.perf_counter()
+    for entry in entries:
+        buffer.append(entry)
+        if len(buffer) > size:
+            buffer.pop(0)
+    list_ns = (time.perf_counter() - start) / adds * 1e9
+
+    working = WorkingMemory(max_size=size)
+    start = time.perf_counter()
+    for entry in entries:
+        working.add(entry)
+    deque_ns = (time.perf_counter() - start) / adds * 1e9
+    return {"list_ns": list_ns, "deque_ns": deque_ns}
+
+
+def bench_context(size: int, budget: int, rounds: int) -> dict:
+    memory = Memory(MemoryConfig(working_memory_size=size))
+    memory.set_core_memory("persona", "Helpful research agent")
+    for i in range(size):
+        memory.add_to_working_memory(f"observation {i} " * 8)
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        full = "\n".join(f"- {entry.content}" for entry in memory.get_working_memory())
+        full[-budget * 4:]
+    truncate_ms = (time.perf_counter() - start) / rounds * 1e3
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        context = memory.get_context(token_budget=budget)
+    budget_ms = (time.perf_counter() - start) / rounds * 1e3
+    return {"truncate_ms": truncate_ms, "budget_ms": budget_ms, "tokens": estimate_tokens(context)}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=10_000, help="Working memory capacity")
+    parser.add_argument("--adds", type=int, default=100_000)
+    parser.add_argument("--budget", type=int, default=2_000, help="Context token budget")
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    add = bench_add(args.size, args.adds)
+    print(f"add at capacity {args.size}: list {add['list_ns']:.0f} ns/op, deque {add['deque_ns']:.0f} ns/op")
+
+    context = bench_context(args.size, args.budget, args.rounds)
+    print(
+        f"context for {args.size} entries: build+truncate {context['truncate_ms']:.2f} ms, "
+        f"budgeted {context['budget_ms']:.2f} ms (~{context['tokens']} tokens)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
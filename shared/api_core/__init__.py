@@ -77,10 +77,27 @@ except (ImportError, RuntimeError):
 from .validation import validate_request
 # Conditional import for auth - requires Flask
 try:
-    from .auth import authenticate_request, get_current_user, require_auth, AuthContext
+    from .auth import (
+        authenticate_request,
+        get_current_user,
+        require_auth,
+        AuthContext,
+        APIKeyStore,
+        InMemoryAPIKeyStore,
+        VerifiedTokenCache,
+        set_api_key_store,
+        get_token_cache,
+    )
 except ImportError:
     # If Flask not available, create stubs
     AuthContext = None
+    APIKeyStore = None
+    InMemoryAPIKeyStore = None
+    VerifiedTokenCache = None
+    def set_api_key_store(store):
+        raise RuntimeError("Authentication module is unavailable.")
+    def get_token_cache():
+        return None
     def authenticate_request(*args, **kwargs):
         raise RuntimeError("Flask required for authentication. Install Flask to use authentication features.")
     def get_current_user():
@@ -98,6 +115,8 @@ from .middleware import (
 from .rate_limiting import (
     RateLimitConfig,
     RateLimiter,
+    RateLimitStore,
+    SQLiteRateLimitStore,
     create_rate_limit_middleware,
     get_rate_limit_info,
 )
@@ -196,6 +215,11 @@ __all__ = [
     "get_current_user",
     "require_auth",
     "AuthContext",
+    "APIKeyStore",
+    "InMemoryAPIKeyStore",
+    "VerifiedTokenCache",
+    "set_api_key_store",
+    "get_token_cache",
     # Validation
     "validate_request",
     # Middleware
@@ -208,6 +232,8 @@ __all__ = [
     # Rate Limiting
     "RateLimitConfig",
     "RateLimiter",
+    "RateLimitStore",
+    "SQLiteRateLimitStore",
     "create_rate_limit_middleware",
     "get_rate_limit_info",
     # Pydantic Schemas (optional)
@@ -272,6 +298,10 @@ try:
         create_health_check_middleware,
         register_health_check,
         MetricsCollector,
+        Histogram,
+        BucketHistogram,
+        DDSketchHistogram,
+        StripedCounter,
         create_metrics_middleware,
     )
     __all__.extend([
@@ -281,6 +311,10 @@ try:
         'create_health_check_middleware',
         'register_health_check',
         'MetricsCollector',
+        'Histogram',
+        'BucketHistogram',
+        'DDSketchHistogram',
+        'StripedCounter',
         'create_metrics_middleware',
     ])
 except (ImportError, RuntimeError):
@@ -323,13 +357,19 @@ except (ImportError, RuntimeError):
 try:
     from .audit_logging import (
         AuditEvent,
+        AuditLogConfig,
         AuditLogger,
+        AuditLogWriter,
+        close_audit_logger,
         create_audit_logging_middleware,
         get_audit_logger,
     )
     __all__.extend([
         'AuditEvent',
+        'AuditLogConfig',
         'AuditLogger',
+        'AuditLogWriter',
+        'close_audit_logger',
         'create_audit_logging_middleware',
         'get_audit_logger',
     ])
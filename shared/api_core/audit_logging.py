@@ -4,12 +4,26 @@ Audit logging utilities for Flask services.
 Implements audit logging for security-relevant events following the complex
 learner pattern: security events are learning signals that help the system
 understand threats, patterns, and adaptation opportunities.
+
+Events are serialized on the request thread and written by a background
+writer in groups (every N events or T milliseconds), so request handlers
+never wait on disk I/O unless the queue is full.
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Union
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from pathlib import Path
+import atexit
+import gzip
 import json
+import logging
+import os
+import shutil
 import sys
+import threading
+import time
 
 try:
     from flask import Flask, request, g
@@ -91,6 +105,334 @@ class AuditEvent:
         return json.dumps(self.to_dict())
 
 
+DURABILITY_MODES = ("none", "flush", "fsync")
+OVERFLOW_POLICIES = ("block", "drop")
+
+
+@dataclass
+class AuditLogConfig:
+    """Configuration for audit log writing."""
+    async_writes: bool = True  # Write on a background thread (False: inline per event)
+    batch_size: int = 256  # Group-commit once this many events are pending
+    flush_interval_ms: float = 100.0  # ... or once the oldest pending event is this old
+    durability: str = "flush"  # Per batch: "none", "flush" (to the OS) or "fsync" (to disk)
+    max_queue: int = 10000  # Pending events before backpressure applies
+    overflow: str = "block"  # Full queue: "block" the caller or "drop" the event
+    max_bytes: int = 0  # Rotate before the file would exceed this size (0 disables)
+    rotate_interval: float = 0.0  # Rotate files older than this many seconds (0 disables)
+    backup_count: int = 10  # Rotated files to keep
+    compress_rotated: bool = True  # gzip rotated files
+
+    def __post_init__(self):
+        """Validate configuration values."""
+        if self.batch_size <= 0:
+            raise ValueError(f"Audit log 'batch_size' must be positive, got {self.batch_size}")
+        if self.flush_interval_ms < 0:
+            raise ValueError(f"Audit log 'flush_interval_ms' must be non-negative, got {self.flush_interval_ms}")
+        if self.durability not in DURABILITY_MODES:
+            raise ValueError(f"Audit log 'durability' must be one of {DURABILITY_MODES}, got {self.durability!r}")
+        if self.max_queue <= 0:
+            raise ValueError(f"Audit log 'max_queue' must be positive, got {self.max_queue}")
+        if self.overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Audit log 'overflow' must be one of {OVERFLOW_POLICIES}, got {self.overflow!r}")
+        if self.max_bytes < 0 or self.rotate_interval < 0 or self.backup_count < 0:
+            raise ValueError("Audit log rotation settings must be non-negative")
+
+    @classmethod
+    def from_env(cls) -> "AuditLogConfig":
+        """Build a config from AUDIT_LOG_* environment variables."""
+        return cls(
+            async_writes=os.getenv("AUDIT_LOG_SYNC", "false").lower() not in ("1", "true", "yes"),
+            durability=os.getenv("AUDIT_LOG_DURABILITY", "flush"),
+            max_bytes=int(os.getenv("AUDIT_LOG_MAX_BYTES", "0")),
+            rotate_interval=float(os.getenv("AUDIT_LOG_ROTATE_SECONDS", "0")),
+            backup_count=int(os.getenv("AUDIT_LOG_BACKUP_COUNT", "10")),
+        )
+
+
+class AuditLogWriter:
+    """
+    Background audit log writer with group commit.
+
+    Request threads append serialized lines to a deque (no lock on the
+    fast path) and wake the writer only for the first pending line or a
+    full batch. One writer thread commits with a single write() per batch,
+    so lines never interleave. A batch is committed once ``batch_size``
+    lines are pending or the oldest has waited ``flush_interval_ms``, then
+    flushed or fsynced according to ``durability``. Files are rotated by
+    size and/or age; rotated files are gzipped on a helper thread and
+    pruned to ``backup_count``.
+
+    An atexit hook drains the queue on interpreter exit.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]],
+        config: Optional[AuditLogConfig] = None,
+        console: bool = False,
+    ):
+        """
+        Initialize the writer and start its thread.
+
+        Args:
+            path: Audit log file (None for console-only)
+            config: AuditLogConfig instance (uses defaults if None)
+            console: Also write each batch to stdout
+        """
+        self.config = config or AuditLogConfig()
+        self.path = Path(path) if path else None
+        self.console = console
+
+        self._pending: deque = deque()
+        self._cond = threading.Condition(threading.Lock())
+        self._not_full = threading.Condition(self._cond._lock)
+        self._waiting_producers = 0
+        self._stopping = False
+        self._file = None
+        self._size = 0
+        self._opened_at = 0.0
+        self._compressor: Optional[threading.Thread] = None
+
+        # Metrics (writer-side counters are only touched by the writer thread)
+        self._stats_lock = threading.Lock()
+        self.written = 0
+        self.batches = 0
+        self.rotations = 0
+        self.write_errors = 0
+        self.dropped = 0
+        self.blocked = 0
+        self.blocked_seconds = 0.0
+        self.queue_high_water = 0
+        self.last_batch_size = 0
+        self.last_commit_ms = 0.0
+
+        if self.path is not None:
+            self._open_file()
+
+        self._thread = threading.Thread(target=self._run, name="audit-log-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    # =========================================================================
+    # Producer side
+    # =========================================================================
+
+    def write(self, line: str) -> bool:
+        """Queue one serialized line (with trailing newline); returns False if dropped."""
+        if self._stopping:
+            return False
+        pending = self._pending
+        if len(pending) >= self.config.max_queue and not self._wait_for_space():
+            return False
+        pending.append(line)
+        depth = len(pending)
+        if depth > self.queue_high_water:
+            self.queue_high_water = depth
+        if depth == 1 or depth == self.config.batch_size:
+            with self._cond:
+                self._cond.notify()
+        return True
+
+    def _wait_for_space(self) -> bool:
+        if self.config.overflow == "drop":
+            with self._stats_lock:
+                self.dropped += 1
+            return False
+        start = time.perf_counter()
+        with self._cond:
+            self._waiting_producers += 1
+            self._cond.notify()
+            while len(self._pending) >= self.config.max_queue and not self._stopping:
+                self._not_full.wait(0.1)
+            self._waiting_producers -= 1
+        with self._stats_lock:
+            self.blocked += 1
+            self.blocked_seconds += time.perf_counter() - start
+        return not self._stopping
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every line queued so far has been committed."""
+        if not self._thread.is_alive():
+            return not self._pending
+        done = threading.Event()
+        self._pending.append(done)
+        with self._cond:
+            self._cond.notify()
+        return done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """Drain queued lines, stop the writer thread and close the file."""
+        if not self._stopping:
+            atexit.unregister(self.close)
+            with self._cond:
+                self._stopping = True
+                self._cond.notify()
+                self._not_full.notify_all()
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            return False
+        if self._compressor is not None:
+            self._compressor.join(timeout)
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue, backpressure and commit statistics."""
+        with self._stats_lock:
+            return {
+                "queued": len(self._pending),
+                "max_queue": self.config.max_queue,
+                "queue_high_water": self.queue_high_water,
+                "written": self.written,
+                "dropped": self.dropped,
+                "blocked": self.blocked,
+                "blocked_seconds": self.blocked_seconds,
+                "batches": self.batches,
+                "avg_batch_size": self.written / self.batches if self.batches else 0.0,
+                "last_batch_size": self.last_batch_size,
+                "last_commit_ms": self.last_commit_ms,
+                "rotations": self.rotations,
+                "write_errors": self.write_errors,
+                "durability": self.config.durability,
+            }
+
+    # =========================================================================
+    # Writer thread
+    # =========================================================================
+
+    def _run(self) -> None:
+        batch_size = self.config.batch_size
+        interval = self.config.flush_interval_ms / 1000.0
+        pending = self._pending
+        while True:
+            with self._cond:
+                # Producers only signal the first line and full batches, so
+                # waits are timed in case a wakeup raced with an append.
+                while not pending and not self._stopping:
+                    self._cond.wait(interval or None)
+                deadline = time.monotonic() + interval
+                while (len(pending) < batch_size and not self._stopping
+                       and not self._waiting_producers
+                       and not any(isinstance(item, threading.Event) for item in pending)):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                stopping = self._stopping
+
+            depth = len(pending)
+            lines: List[str] = []
+            waiters: List[threading.Event] = []
+            for _ in range(depth):
+                item = pending.popleft()
+                if isinstance(item, str):
+                    lines.append(item)
+                else:
+                    waiters.append(item)
+            if self._waiting_producers:
+                with self._cond:
+                    self._not_full.notify_all()
+
+            for start in range(0, len(lines), batch_size):
+                self._commit(lines[start:start + batch_size])
+            for waiter in waiters:
+                waiter.set()
+            if stopping and not pending:
+                break
+        self._close_file()
+
+    def _commit(self, lines: List[str]) -> None:
+        start = time.perf_counter()
+        text = "".join(lines)
+        if self.console:
+            try:
+                sys.stdout.write(text)
+                sys.stdout.flush()
+            except Exception:
+                pass
+        if self.path is not None:
+            data = text.encode("utf-8")
+            try:
+                if self._file is None:
+                    self._open_file()
+                elif self._should_rotate(len(data)):
+                    self._rotate()
+                self._file.write(data)
+                self._size += len(data)
+                if self.config.durability != "none":
+                    self._file.flush()
+                if self.config.durability == "fsync":
+                    os.fsync(self._file.fileno())
+            except Exception as e:
+                # Audit logging must not break request handling
+                logging.getLogger(__name__).error(f"Failed to write audit log: {e}")
+                with self._stats_lock:
+                    self.write_errors += 1
+                    self.dropped += len(lines)
+                self._close_file()
+                return
+        with self._stats_lock:
+            self.written += len(lines)
+            self.batches += 1
+            self.last_batch_size = len(lines)
+            self.last_commit_ms = (time.perf_counter() - start) * 1000.0
+
+    def _should_rotate(self, incoming: int) -> bool:
+        if not self._size:
+            return False
+        if self.config.max_bytes and self._size + incoming > self.config.max_bytes:
+            return True
+        return bool(self.config.rotate_interval) and time.time() - self._opened_at >= self.config.rotate_interval
+
+    def _open_file(self) -> None:
+        self._file = open(self.path, "ab")
+        self._size = self._file.tell()
+        self._opened_at = time.time()
+
+    def _rotate(self) -> None:
+        self._close_file()
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+        rotated = self.path.with_name(f"{self.path.name}.{stamp}")
+        self.path.replace(rotated)
+        self._open_file()
+        with self._stats_lock:
+            self.rotations += 1
+
+        # One helper at a time, so compression and pruning never race
+        if self._compressor is not None:
+            self._compressor.join()
+        self._compressor = threading.Thread(
+            target=self._finish_rotation, args=(rotated,), name="audit-log-compress", daemon=True
+        )
+        self._compressor.start()
+
+    def _finish_rotation(self, rotated: Path) -> None:
+        if self.config.compress_rotated:
+            try:
+                with open(rotated, "rb") as src, gzip.open(f"{rotated}.gz", "wb") as dst:
+                    shutil.copyfileobj(src, dst, 1024 * 1024)
+                rotated.unlink()
+            except Exception as e:
+                logging.getLogger(__name__).warning(f"Failed to compress audit log {rotated}: {e}")
+        backups = sorted(self.path.parent.glob(f"{self.path.name}.*"))
+        for old in backups[:max(0, len(backups) - self.config.backup_count)]:
+            try:
+                old.unlink()
+            except OSError:
+                pass
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            try:
+                self._file.flush()
+                if self.config.durability == "fsync":
+                    os.fsync(self._file.fileno())
+                self._file.close()
+            except Exception:
+                pass
+            self._file = None
+
+
 class AuditLogger:
     """Audit logger for security events."""
 
@@ -99,6 +441,7 @@ class AuditLogger:
         log_file: Optional[str] = None,
         enable_console: bool = False,
         structured_output: bool = True,
+        config: Optional[AuditLogConfig] = None,
     ):
         """
         Initialize audit logger.
@@ -107,18 +450,30 @@ class AuditLogger:
             log_file: Path to log file (uses syslog if None)
             enable_console: Enable console output
             structured_output: Use structured JSON output
+            config: AuditLogConfig instance (uses defaults if None)
         """
         self.log_file = log_file
         self.enable_console = enable_console
         self.structured_output = structured_output
+        self.config = config or AuditLogConfig()
 
-        # Open log file if specified
+        # Background writer, or an inline file handle when async_writes is off
+        self.writer: Optional[AuditLogWriter] = None
         self.file_handle = None
-        if log_file:
+        self._inline_lock = threading.Lock()
+        if self.config.async_writes:
+            if log_file or enable_console:
+                try:
+                    self.writer = AuditLogWriter(log_file, self.config, console=enable_console)
+                except Exception as e:
+                    logger = logging.getLogger(__name__)
+                    logger.warning(f"Failed to open audit log file {log_file}: {e}")
+                    if enable_console:
+                        self.writer = AuditLogWriter(None, self.config, console=True)
+        elif log_file:
             try:
                 self.file_handle = open(log_file, 'a')
             except Exception as e:
-                import logging
                 logger = logging.getLogger(__name__)
                 logger.warning(f"Failed to open audit log file {log_file}: {e}")
 
@@ -145,13 +500,21 @@ class AuditLogger:
                 f"({event.outcome})"
             )
 
-        # Write to file
+        # Hand off to the background writer (file and console)
+        if self.writer is not None:
+            self.writer.write(output + "\n")
+            return
+
+        # Write to file (file objects are not safe for concurrent writers)
         if self.file_handle:
             try:
-                self.file_handle.write(output + "\n")
-                self.file_handle.flush()
+                with self._inline_lock:
+                    self.file_handle.write(output + "\n")
+                    if self.config.durability != "none":
+                        self.file_handle.flush()
+                    if self.config.durability == "fsync":
+                        os.fsync(self.file_handle.fileno())
             except Exception as e:
-                import logging
                 logger = logging.getLogger(__name__)
                 logger.error(f"Failed to write audit log: {e}")
 
@@ -159,17 +522,36 @@ class AuditLogger:
         if self.enable_console:
             print(output)
 
-    def close(self) -> None:
-        """Close audit logger."""
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every event logged so far has been written."""
+        if self.writer is not None:
+            return self.writer.flush(timeout)
+        if self.file_handle:
+            self.file_handle.flush()
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get writer queue and backpressure statistics."""
+        if self.writer is not None:
+            return self.writer.get_stats()
+        return {"queued": 0, "durability": self.config.durability, "async_writes": False}
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """Drain pending events and close audit logger."""
+        drained = True
+        if self.writer is not None:
+            drained = self.writer.close(timeout)
         if self.file_handle:
             self.file_handle.close()
             self.file_handle = None
+        return drained
 
 
 def create_audit_logging_middleware(
     app: Flask,
     log_file: Optional[str] = None,
     enable_console: bool = False,
+    config: Optional[AuditLogConfig] = None,
 ) -> AuditLogger:
     """
     Create audit logging middleware for Flask app.
@@ -182,6 +564,7 @@ def create_audit_logging_middleware(
         app: Flask application instance
         log_file: Path to audit log file (uses environment variable if None)
         enable_console: Enable console output
+        config: AuditLogConfig instance (uses AUDIT_LOG_* environment variables if None)
 
     Returns:
         AuditLogger instance
@@ -197,6 +580,7 @@ def create_audit_logging_middleware(
     audit_logger = AuditLogger(
         log_file=log_file,
         enable_console=enable_console or os.getenv("AUDIT_LOG_CONSOLE", "false").lower() == "true",
+        config=config or AuditLogConfig.from_env(),
     )
 
     # Store logger in app extensions
@@ -315,12 +699,9 @@ def create_audit_logging_middleware(
             )
             audit_logger.log(event)
 
-    # Cleanup on app teardown
-    @app.teardown_appcontext
-    def close_audit_logger(error):
-        """Close audit logger on app teardown."""
-        # Logger is shared, don't close it here
-        pass
+    # The logger is shared across requests, so it is not closed on
+    # teardown_appcontext; queued events are drained on process shutdown.
+    atexit.register(close_audit_logger, app)
 
     return audit_logger
 
@@ -328,3 +709,23 @@ def create_audit_logging_middleware(
 def get_audit_logger(app: Flask) -> Optional[AuditLogger]:
     """Get audit logger from Flask app."""
     return app.extensions.get('audit_logger')
+
+
+def close_audit_logger(app: Flask, timeout: Optional[float] = 10.0) -> bool:
+    """
+    Drain and close the app's audit logger.
+
+    Registered with atexit by create_audit_logging_middleware; call it
+    from a server's own shutdown hook to drain earlier.
+
+    Args:
+        app: Flask application instance
+        timeout: Seconds to wait for queued events to be written
+
+    Returns:
+        True if every queued event was written
+    """
+    audit_logger = app.extensions.pop('audit_logger', None)
+    if audit_logger is None:
+        return True
+    return audit_logger.close(timeout)
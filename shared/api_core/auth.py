@@ -1,11 +1,25 @@
 """
 Unified authentication framework for Chrysalis services.
+
+Successful verifications are cached in a bounded TTL cache keyed by a
+SHA-256 digest of the credential (never the credential itself), capped at
+the JWT's ``exp``. Malformed JWTs (including API keys sent as bearer
+tokens) are negatively cached for a short TTL so repeated garbage does not
+re-run parsing. API keys are looked up in a pluggable ``APIKeyStore`` (an
+in-memory dict by default); results are cached for stores that are slower
+than a cache probe.
 """
 
+import hashlib
 import os
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from functools import wraps
 import hmac
 
@@ -70,10 +84,196 @@ else:
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRATION_HOURS = int(os.getenv("JWT_EXPIRATION_HOURS", "24"))
 
-# API Key validation (simple for now, can be enhanced with database)
+# API Key validation (simple for now, can be enhanced with database).
+# Backs the default InMemoryAPIKeyStore; change keys through register_api_key /
+# revoke_api_key so cached verifications are dropped.
 API_KEYS: Dict[str, Dict[str, Any]] = {}
 ADMIN_KEY_IDS = set(os.getenv("ADMIN_KEY_IDS", "").split(",") if os.getenv("ADMIN_KEY_IDS") else [])
 
+# keyId.secret: ASCII alphanumerics, underscore and hyphen; the secret may also contain dots
+API_KEY_PATTERN = re.compile(r"([A-Za-z0-9_-]{1,64})\.([A-Za-z0-9._-]{1,256})")
+API_KEY_MAX_LENGTH = 512
+
+# Verified-token cache (AUTH_TOKEN_CACHE_SIZE=0 disables it)
+TOKEN_CACHE_SIZE = int(os.getenv("AUTH_TOKEN_CACHE_SIZE", "10000"))
+TOKEN_CACHE_TTL = float(os.getenv("AUTH_TOKEN_CACHE_TTL", "300"))
+TOKEN_CACHE_NEGATIVE_TTL = float(os.getenv("AUTH_TOKEN_CACHE_NEGATIVE_TTL", "30"))
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU cache of credential verification results.
+
+    Entries are keyed by (kind, SHA-256 of the credential) and expire after
+    ``ttl`` seconds or at the credential's own expiry, whichever is first.
+    Rejections are stored as ``None`` with ``negative_ttl``; callers only
+    negatively cache inputs that are malformed, never a well-formed
+    credential that merely failed a lookup.
+    """
+
+    def __init__(self, max_entries: int = TOKEN_CACHE_SIZE, ttl: float = TOKEN_CACHE_TTL,
+                 negative_ttl: float = TOKEN_CACHE_NEGATIVE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._entries: "OrderedDict[Tuple[str, bytes], Tuple[float, Optional[Dict[str, Any]]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "negative_hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    @staticmethod
+    def key(kind: str, credential: str) -> Tuple[str, bytes]:
+        """Cache key for a credential; the raw value is never stored."""
+        return kind, hashlib.sha256(credential.encode("utf-8", "surrogatepass")).digest()
+
+    def get(self, key: Tuple[str, bytes]) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """Return (found, result); result is None for a cached rejection."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return False, None
+            expires_at, result = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self.stats["expirations"] += 1
+                self.stats["misses"] += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.stats["hits" if result is not None else "negative_hits"] += 1
+            return True, result
+
+    def set(self, key: Tuple[str, bytes], result: Optional[Dict[str, Any]],
+            expires_at: Optional[float] = None) -> None:
+        """Cache a verification result, optionally capped at an absolute expiry."""
+        if not self.enabled:
+            return
+        now = time.time()
+        deadline = now + (self.ttl if result is not None else self.negative_ttl)
+        if expires_at is not None:
+            deadline = min(deadline, expires_at)
+        if deadline <= now:
+            return
+        with self._lock:
+            self._entries[key] = (deadline, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def invalidate(self, kind: Optional[str] = None) -> int:
+        """Drop cached entries (all, or only one kind); return how many."""
+        with self._lock:
+            if kind is None:
+                count = len(self._entries)
+                self._entries.clear()
+                return count
+            stale = [key for key in self._entries if key[0] == kind]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            stats = dict(self.stats)
+            stats["entries"] = len(self._entries)
+        lookups = stats["hits"] + stats["negative_hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["hits"] + stats["negative_hits"]) / lookups if lookups else 0.0
+        return stats
+
+
+class APIKeyStore(ABC):
+    """
+    Backend for API key records.
+
+    ``get`` is called on every uncached API key verification and must be
+    an O(1) (or indexed) lookup by key id. Records hold ``secret``,
+    ``roles`` and ``permissions``. Stores whose lookups cost more than a
+    cache probe (databases, remote services) leave ``cacheable`` set so
+    successful verifications are served from the token cache.
+    """
+
+    cacheable = True
+
+    @abstractmethod
+    def get(self, key_id: str) -> Optional[Dict[str, Any]]:
+        """Return the record for key_id, or None."""
+        ...
+
+    @abstractmethod
+    def set(self, key_id: str, record: Dict[str, Any]) -> None:
+        """Create or replace the record for key_id."""
+        ...
+
+    @abstractmethod
+    def delete(self, key_id: str) -> bool:
+        """Remove key_id; return True if it existed."""
+        ...
+
+
+class InMemoryAPIKeyStore(APIKeyStore):
+    """Dict-backed API key store (for testing/dev, use a database in production)."""
+
+    # A dict lookup is cheaper than hashing the key for the token cache
+    cacheable = False
+
+    def __init__(self, records: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.records = records if records is not None else {}
+
+    def get(self, key_id: str) -> Optional[Dict[str, Any]]:
+        return self.records.get(key_id)
+
+    def set(self, key_id: str, record: Dict[str, Any]) -> None:
+        self.records[key_id] = record
+
+    def delete(self, key_id: str) -> bool:
+        return self.records.pop(key_id, None) is not None
+
+
+_api_key_store: APIKeyStore = InMemoryAPIKeyStore(API_KEYS)
+_token_cache = VerifiedTokenCache()
+
+
+def get_api_key_store() -> APIKeyStore:
+    """Get the active API key store."""
+    return _api_key_store
+
+
+def set_api_key_store(store: APIKeyStore) -> None:
+    """Replace the API key store and drop cached API key verifications."""
+    global _api_key_store
+    _api_key_store = store
+    _token_cache.invalidate("api_key")
+
+
+def get_token_cache() -> VerifiedTokenCache:
+    """Get the verified-token cache (for stats and invalidation)."""
+    return _token_cache
+
+
+def configure_token_cache(
+    max_entries: int = TOKEN_CACHE_SIZE,
+    ttl: float = TOKEN_CACHE_TTL,
+    negative_ttl: float = TOKEN_CACHE_NEGATIVE_TTL,
+) -> VerifiedTokenCache:
+    """Replace the verified-token cache; max_entries=0 disables caching."""
+    global _token_cache
+    _token_cache = VerifiedTokenCache(max_entries, ttl, negative_ttl)
+    return _token_cache
+
+
+def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a cached result so callers cannot mutate the cached lists."""
+    return {k: list(v) if isinstance(v, list) else v for k, v in result.items()}
+
 
 def get_bearer_token(req) -> Optional[str]:
     """Extract Bearer token from request headers."""
@@ -98,9 +298,16 @@ def verify_jwt_token(token: str) -> Optional[Dict[str, Any]]:
     Security:
         - Explicitly validates algorithm to prevent confusion attacks
         - Verifies expiration and issued-at timestamps
+        - Cached results never outlive the token's ``exp``
     """
     if jwt is None:
         return None
+    cache = _token_cache
+    cache_key = cache.key("jwt", token) if cache.enabled else None
+    if cache_key is not None:
+        found, payload = cache.get(cache_key)
+        if found:
+            return _copy_result(payload) if payload is not None else None
     try:
         # First, check the algorithm in the header without verifying signature
         header = jwt.get_unverified_header(token)
@@ -109,9 +316,11 @@ def verify_jwt_token(token: str) -> Optional[Dict[str, Any]]:
         if header.get("alg") != JWT_ALGORITHM:
             import logging
             logging.warning(f"JWT algorithm mismatch: expected {JWT_ALGORITHM}, got {header.get('alg')}")
+            if cache_key is not None:
+                cache.set(cache_key, None)
             return None
 
-        return jwt.decode(
+        payload = jwt.decode(
             token,
             JWT_SECRET,
             algorithms=[JWT_ALGORITHM],
@@ -124,9 +333,20 @@ def verify_jwt_token(token: str) -> Optional[Dict[str, Any]]:
         )
     except jwt.ExpiredSignatureError:
         return None
+    except jwt.DecodeError:
+        # Malformed or badly signed: the result cannot change for this secret.
+        # This also covers API keys sent as bearer tokens.
+        if cache_key is not None:
+            cache.set(cache_key, None)
+        return None
     except jwt.InvalidTokenError:
         return None
 
+    exp = payload.get("exp")
+    if cache_key is not None and isinstance(exp, (int, float)):
+        cache.set(cache_key, _copy_result(payload), expires_at=float(exp))
+    return payload
+
 
 def verify_api_key(key: str) -> Optional[Dict[str, Any]]:
     """
@@ -143,51 +363,43 @@ def verify_api_key(key: str) -> Optional[Dict[str, Any]]:
         return None
     
     # Length limits to prevent memory exhaustion
-    if len(key) > 512:  # Reasonable maximum
-        return None
-    
-    # Restrict to ASCII characters (alphanumeric + dot + underscore + hyphen)
-    if not all(c.isalnum() or c in '._-' for c in key):
-        return None
-    
-    # Verify format
-    if "." not in key:
-        return None
-    
-    parts = key.split(".", 1)
-    if len(parts) != 2:
-        return None
-        
-    key_id, secret = parts
-    
-    # Validate component lengths
-    if len(key_id) > 64 or len(secret) > 256:
-        return None
-    
-    # Prevent empty components
-    if not key_id or not secret:
+    if len(key) > API_KEY_MAX_LENGTH:
         return None
 
-    # Check in-memory store (can be replaced with database)
-    if key_id in API_KEYS:
-        stored_key = API_KEYS[key_id]
-        # Use constant-time comparison to prevent timing attacks
-        if hmac.compare_digest(stored_key["secret"], secret):
-            return {
-                "key_id": key_id,
-                "roles": stored_key.get("roles", ["service"]),
-                "permissions": stored_key.get("permissions", []),
-            }
-
-    # Check admin keys from environment
-    if key_id in ADMIN_KEY_IDS:
-        return {
+    # ASCII alphanumerics plus . _ - with non-empty, length-limited components
+    match = API_KEY_PATTERN.fullmatch(key)
+    if match is None:
+        return None
+    key_id, secret = match.groups()
+
+    store = _api_key_store
+    cache = _token_cache
+    cache_key = cache.key("api_key", key) if store.cacheable and cache.enabled else None
+    if cache_key is not None:
+        found, result = cache.get(cache_key)
+        if found:
+            return _copy_result(result)
+
+    result = None
+    stored_key = store.get(key_id)
+    # Use constant-time comparison to prevent timing attacks
+    if stored_key is not None and hmac.compare_digest(stored_key["secret"], secret):
+        result = {
+            "key_id": key_id,
+            "roles": stored_key.get("roles", ["service"]),
+            "permissions": stored_key.get("permissions", []),
+        }
+    elif key_id in ADMIN_KEY_IDS:
+        # Check admin keys from environment
+        result = {
             "key_id": key_id,
             "roles": ["admin"],
             "permissions": ["*"],
         }
 
-    return None
+    if result is not None and cache_key is not None:
+        cache.set(cache_key, _copy_result(result))
+    return result
 
 
 def authenticate_request(optional: bool = False, req=None) -> Optional[AuthContext]:
@@ -338,9 +550,17 @@ def create_jwt_token(
 
 
 def register_api_key(key_id: str, secret: str, roles: Optional[List[str]] = None, permissions: Optional[List[str]] = None) -> None:
-    """Register API key in memory store (for testing/dev, use database in production)."""
-    API_KEYS[key_id] = {
+    """Register API key in the active store (in memory by default; use a database store in production)."""
+    _api_key_store.set(key_id, {
         "secret": secret,
         "roles": roles or ["service"],
         "permissions": permissions or [],
-    }
+    })
+    _token_cache.invalidate("api_key")
+
+
+def revoke_api_key(key_id: str) -> bool:
+    """Remove an API key from the active store and drop cached verifications."""
+    removed = _api_key_store.delete(key_id)
+    _token_cache.invalidate("api_key")
+    return removed
@@ -5,6 +5,7 @@ Design Pattern: Cache-Aside Pattern
 - Provides caching for API responses
 - Configurable TTL and cache backends
 - Automatic cache key generation
+- O(1) LRU eviction with optional TinyLFU admission, byte bounds and sharding
 
 References:
 - Microsoft Azure Architecture Patterns
@@ -15,7 +16,9 @@ import hashlib
 import json
 import time
 import logging
+import sys
 import threading
+from collections import OrderedDict
 from typing import Dict, Any, Optional, Callable, TypeVar
 from functools import wraps
 from dataclasses import dataclass
@@ -33,6 +36,11 @@ class CacheConfig:
     enabled: bool = True             # Enable/disable caching
     include_query_params: bool = True # Include query params in cache key
     include_headers: Optional[list] = None  # Headers to include in cache key
+    max_bytes: Optional[int] = None  # Approximate size bound across all entries
+    admission: bool = False          # TinyLFU admission filter at capacity
+    shards: int = 1                  # Independently locked segments
+    expiry_tick: float = 1.0         # Expiry sweep resolution in seconds
+    size_func: Optional[Callable[[Any], int]] = None  # Entry size estimator for max_bytes
 
 
 @dataclass
@@ -42,25 +50,146 @@ class CacheEntry:
     expires_at: float
     created_at: float
     hits: int = 0
+    size: int = 0
 
 
-class InMemoryCache:
+def estimate_size(value: Any, _depth: int = 0) -> int:
     """
-    Simple in-memory cache implementation.
-    
-    For production, consider using Redis or Memcached.
+    Approximate the in-memory size of a cached value in bytes.
+
+    Containers are walked two levels deep, which covers cached
+    response dicts without paying for a full traversal on every set.
     """
-    
-    def __init__(self, config: Optional[CacheConfig] = None):
-        self.config = config or CacheConfig()
-        self._cache: Dict[str, CacheEntry] = {}
-        self._lock = threading.RLock()
-        self._stats = {
+    size = sys.getsizeof(value)
+    if _depth >= 2:
+        return size
+    if isinstance(value, dict):
+        size += sum(
+            estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1)
+            for k, v in value.items()
+        )
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(v, _depth + 1) for v in value)
+    return size
+
+
+class _FrequencySketch:
+    """
+    TinyLFU popularity estimate: a 4-row count-min sketch with small
+    saturating counters that are halved periodically so old popularity
+    decays.
+    """
+
+    _ROWS = 4
+    _MAX_COUNT = 15
+
+    def __init__(self, capacity: int):
+        width = 1
+        while width < max(256, 4 * capacity):
+            width <<= 1
+        self._mask = width - 1
+        self._table = [bytearray(width) for _ in range(self._ROWS)]
+        self._sample_size = 10 * max(16, capacity)
+        self._additions = 0
+
+    def _indexes(self, key: str):
+        # Double hashing over the two halves of the 64-bit hash
+        h = hash(key) & 0xFFFFFFFFFFFFFFFF
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        return [(h1 + i * h2) & self._mask for i in range(self._ROWS)]
+
+    def increment(self, key: str) -> None:
+        added = False
+        for row, index in zip(self._table, self._indexes(key)):
+            if row[index] < self._MAX_COUNT:
+                row[index] += 1
+                added = True
+        if added:
+            self._additions += 1
+            if self._additions >= self._sample_size:
+                self._reset()
+
+    def frequency(self, key: str) -> int:
+        return min(row[index] for row, index in zip(self._table, self._indexes(key)))
+
+    def _reset(self) -> None:
+        for row in self._table:
+            row[:] = bytes(count >> 1 for count in row)
+        self._additions //= 2
+
+
+class _CacheShard:
+    """One independently locked LRU segment of an InMemoryCache."""
+
+    def __init__(self, max_entries: int, max_bytes: Optional[int], admission: bool):
+        self.lock = threading.Lock()
+        self.entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.sketch = _FrequencySketch(max_entries) if admission else None
+        # Expiry buckets: tick number -> keys expiring during that tick
+        self.wheel: Dict[int, set] = {}
+        self.swept_tick = 0
+        self.stats = {
             'hits': 0,
             'misses': 0,
             'evictions': 0,
+            'expirations': 0,
+            'rejections': 0,
         }
+
+    def remove(self, key: str) -> Optional[CacheEntry]:
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry.size
+        return entry
+
+    def over_capacity(self, extra_entries: int, extra_bytes: int) -> bool:
+        if len(self.entries) + extra_entries > self.max_entries:
+            return True
+        return self.max_bytes is not None and self.bytes + extra_bytes > self.max_bytes
+
+
+class InMemoryCache:
+    """
+    In-memory LRU cache.
+
+    - O(1) get/set/evict via an OrderedDict kept in recency order
+    - Optional TinyLFU admission: at capacity, a new key only displaces
+      the LRU victim if it has been requested more often, so one-off
+      scans cannot flush the hot set
+    - Expired entries are swept in bulk from per-tick expiry buckets
+      (a timer wheel) instead of lingering until read
+    - Optional approximate byte bound (``max_bytes``)
+    - Optional sharding (``shards``) so threads touching different
+      keys do not contend on a single lock; recency is then per shard
+
+    For production, consider using Redis or Memcached.
+    """
     
+    def __init__(self, config: Optional[CacheConfig] = None):
+        self.config = config or CacheConfig()
+        shard_count = max(1, self.config.shards)
+        per_shard_entries = max(1, -(-self.config.max_entries // shard_count))
+        per_shard_bytes = (
+            -(-self.config.max_bytes // shard_count)
+            if self.config.max_bytes is not None else None
+        )
+        self._shards = [
+            _CacheShard(per_shard_entries, per_shard_bytes, self.config.admission)
+            for _ in range(shard_count)
+        ]
+        self._tick = max(self.config.expiry_tick, 0.001)
+        now_tick = int(time.time() // self._tick)
+        for shard in self._shards:
+            shard.swept_tick = now_tick
+
+    def _shard(self, key: str) -> _CacheShard:
+        if len(self._shards) == 1:
+            return self._shards[0]
+        return self._shards[hash(key) % len(self._shards)]
+
     def get(self, key: str) -> Optional[Any]:
         """
         Get value from cache.
@@ -71,21 +200,26 @@ class InMemoryCache:
         Returns:
             Cached value or None if not found/expired
         """
-        with self._lock:
-            entry = self._cache.get(key)
-            
+        shard = self._shard(key)
+        with shard.lock:
+            if shard.sketch is not None:
+                shard.sketch.increment(key)
+
+            entry = shard.entries.get(key)
             if entry is None:
-                self._stats['misses'] += 1
+                shard.stats['misses'] += 1
                 return None
             
             # Check expiration
             if time.time() > entry.expires_at:
-                del self._cache[key]
-                self._stats['misses'] += 1
+                shard.remove(key)
+                shard.stats['expirations'] += 1
+                shard.stats['misses'] += 1
                 return None
             
+            shard.entries.move_to_end(key)
             entry.hits += 1
-            self._stats['hits'] += 1
+            shard.stats['hits'] += 1
             return entry.value
     
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
@@ -99,18 +233,84 @@ class InMemoryCache:
         """
         if not self.config.enabled:
             return
-        
-        with self._lock:
-            # Evict if at capacity
-            if len(self._cache) >= self.config.max_entries:
-                self._evict_lru()
+
+        size = 0
+        if self.config.max_bytes is not None:
+            size = (self.config.size_func or estimate_size)(value)
+        now = time.time()
+        expires_at = now + (ttl or self.config.default_ttl)
+
+        shard = self._shard(key)
+        with shard.lock:
+            self._sweep(shard, now)
+
+            existing = shard.remove(key)
+            too_large = shard.max_bytes is not None and size > shard.max_bytes
+            if too_large or (existing is None and not self._admit(shard, key, size)):
+                shard.stats['rejections'] += 1
+                return
+
+            # Evict least recently used entries until the new one fits
+            while shard.entries and shard.over_capacity(1, size):
+                _, victim = shard.entries.popitem(last=False)
+                shard.bytes -= victim.size
+                shard.stats['evictions'] += 1
             
-            now = time.time()
-            self._cache[key] = CacheEntry(
+            shard.entries[key] = CacheEntry(
                 value=value,
-                expires_at=now + (ttl or self.config.default_ttl),
+                expires_at=expires_at,
                 created_at=now,
+                size=size,
             )
+            shard.bytes += size
+            shard.wheel.setdefault(int(expires_at // self._tick), set()).add(key)
+
+    def _admit(self, shard: _CacheShard, key: str, size: int) -> bool:
+        """TinyLFU admission check for a new key (True when there is room)."""
+        if shard.sketch is None:
+            return True
+        shard.sketch.increment(key)
+        if not shard.over_capacity(1, size) or not shard.entries:
+            return True
+        victim_key = next(iter(shard.entries))
+        return shard.sketch.frequency(key) > shard.sketch.frequency(victim_key)
+
+    def _sweep(self, shard: _CacheShard, now: float) -> None:
+        """Drop entries whose expiry tick has passed (at most once per tick)."""
+        current = int(now // self._tick)
+        if current <= shard.swept_tick:
+            return
+        if current - shard.swept_tick > len(shard.wheel):
+            ticks = sorted(t for t in shard.wheel if t < current)
+        else:
+            ticks = range(shard.swept_tick, current)
+        for tick in ticks:
+            for key in shard.wheel.pop(tick, ()):
+                entry = shard.entries.get(key)
+                # Keys re-set with a later expiry live in another bucket too
+                if entry is not None and entry.expires_at <= now:
+                    shard.remove(key)
+                    shard.stats['expirations'] += 1
+        shard.swept_tick = current
+
+    def sweep_expired(self) -> int:
+        """
+        Remove all entries whose expiry tick has passed.
+
+        Sweeps also run automatically on ``set``, at most once per
+        ``expiry_tick``.
+
+        Returns:
+            Number of entries removed
+        """
+        now = time.time()
+        removed = 0
+        for shard in self._shards:
+            with shard.lock:
+                before = shard.stats['expirations']
+                self._sweep(shard, now)
+                removed += shard.stats['expirations'] - before
+        return removed
     
     def delete(self, key: str) -> bool:
         """
@@ -122,43 +322,65 @@ class InMemoryCache:
         Returns:
             True if deleted, False if not found
         """
-        with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                return True
-            return False
+        shard = self._shard(key)
+        with shard.lock:
+            return shard.remove(key) is not None
+
+    def delete_matching(self, pattern: str) -> int:
+        """
+        Delete entries whose key contains pattern.
+
+        Args:
+            pattern: Substring to match
+
+        Returns:
+            Number of entries deleted
+        """
+        deleted = 0
+        for shard in self._shards:
+            with shard.lock:
+                for key in [k for k in shard.entries if pattern in k]:
+                    shard.remove(key)
+                    deleted += 1
+        return deleted
     
     def clear(self) -> None:
         """Clear all cache entries."""
-        with self._lock:
-            self._cache.clear()
-    
-    def _evict_lru(self) -> None:
-        """Evict least recently used entry."""
-        if not self._cache:
-            return
-        
-        # Find entry with oldest access (lowest hits / age ratio)
-        oldest_key = min(
-            self._cache.keys(),
-            key=lambda k: self._cache[k].hits / max(1, time.time() - self._cache[k].created_at)
-        )
-        del self._cache[oldest_key]
-        self._stats['evictions'] += 1
+        for shard in self._shards:
+            with shard.lock:
+                shard.entries.clear()
+                shard.wheel.clear()
+                shard.bytes = 0
+
+    def __len__(self) -> int:
+        return sum(len(shard.entries) for shard in self._shards)
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        with self._lock:
-            total = self._stats['hits'] + self._stats['misses']
-            hit_rate = self._stats['hits'] / total if total > 0 else 0
-            
-            return {
-                'entries': len(self._cache),
-                'hits': self._stats['hits'],
-                'misses': self._stats['misses'],
-                'evictions': self._stats['evictions'],
-                'hit_rate': hit_rate,
-            }
+        totals = {name: 0 for name in self._shards[0].stats}
+        entries = 0
+        size = 0
+        for shard in self._shards:
+            with shard.lock:
+                for name, count in shard.stats.items():
+                    totals[name] += count
+                entries += len(shard.entries)
+                size += shard.bytes
+
+        total = totals['hits'] + totals['misses']
+        hit_rate = totals['hits'] / total if total > 0 else 0
+        
+        return {
+            'entries': entries,
+            'hits': totals['hits'],
+            'misses': totals['misses'],
+            'evictions': totals['evictions'],
+            'expirations': totals['expirations'],
+            'rejections': totals['rejections'],
+            'bytes': size,
+            'shards': len(self._shards),
+            'hit_rate': hit_rate,
+        }
 
 
 # Global cache instance
@@ -362,14 +584,4 @@ def invalidate_cache_pattern(pattern: str, cache: Optional[InMemoryCache] = None
         Number of entries invalidated
     """
     cache_instance = cache or get_cache()
-    
-    with cache_instance._lock:
-        keys_to_delete = [
-            key for key in cache_instance._cache.keys()
-            if pattern in key
-        ]
-        
-        for key in keys_to_delete:
-            del cache_instance._cache[key]
-        
-        return len(keys_to_delete)
+    return cache_instance.delete_matching(pattern)
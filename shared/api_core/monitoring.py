@@ -2,12 +2,18 @@
 Monitoring and observability utilities for Flask services.
 
 Provides health checks, metrics collection, and basic observability
-for production Flask applications.
+for production Flask applications. Metrics use bounded memory and can
+be exposed as JSON or in the Prometheus text format.
 """
 
+from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, Callable
 from datetime import datetime, timezone
+import bisect
+import math
+import re
 import sys
+import threading
 
 try:
     from flask import Flask, jsonify, request, g
@@ -172,17 +178,323 @@ def register_health_check(app: Flask, check: HealthCheck):
     registry.register(check)
 
 
-class MetricsCollector:
-    """Basic metrics collector for Flask applications."""
+# =============================================================================
+# Bounded-memory metric primitives
+# =============================================================================
+
+DEFAULT_BUCKETS = (
+    1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000,
+)
+
+SIZE_BUCKETS = tuple(2 ** exponent for exponent in range(6, 25, 2))
+
+DEFAULT_QUANTILES = (0.5, 0.9, 0.95, 0.99)
+
+
+class Histogram(ABC):
+    """
+    Base class for bounded-memory histograms.
+
+    Tracks count, sum, min and max exactly; subclasses provide the
+    distribution (buckets or sketch) used for quantiles.
+    """
+
+    prometheus_type = "summary"
 
     def __init__(self):
-        self.counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def record(self, value: float) -> None:
+        """Record one observation in O(1)."""
+        with self._lock:
+            self.count += 1
+            self.sum += value
+            if value < self.min:
+                self.min = value
+            if value > self.max:
+                self.max = value
+            self._record(value)
+
+    @abstractmethod
+    def _record(self, value: float) -> None:
+        """Add value to the distribution (called with the lock held)."""
+        ...
+
+    @abstractmethod
+    def quantile(self, q: float) -> float:
+        """Estimate the q-quantile (0 <= q <= 1); 0.0 when empty."""
+        ...
+
+    def __len__(self) -> int:
+        return self.count
+
+    def summary(self, quantiles=DEFAULT_QUANTILES) -> Dict[str, Any]:
+        """Return count/sum/min/max/avg plus estimated percentiles."""
+        with self._lock:
+            count, total = self.count, self.sum
+            low, high = self.min, self.max
+        result = {
+            "count": count,
+            "sum": total,
+            "min": low if count else 0,
+            "max": high if count else 0,
+            "avg": total / count if count else 0,
+        }
+        for q in quantiles:
+            result[f"p{q * 100:g}"] = self.quantile(q)
+        return result
+
+    def prometheus_lines(self, name: str) -> list:
+        """Render sample lines (without TYPE header) for this histogram."""
+        lines = [
+            f'{name}{{quantile="{q:g}"}} {_format_value(self.quantile(q))}'
+            for q in DEFAULT_QUANTILES
+        ]
+        lines.append(f"{name}_sum {_format_value(self.sum)}")
+        lines.append(f"{name}_count {self.count}")
+        return lines
+
+
+class BucketHistogram(Histogram):
+    """
+    Fixed-bucket histogram (Prometheus ``histogram`` semantics).
+
+    Memory is one counter per bucket. Quantiles interpolate linearly
+    within the containing bucket, so their error is bounded by bucket
+    width.
+    """
+
+    prometheus_type = "histogram"
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        super().__init__()
+        self.bounds = tuple(sorted(float(b) for b in buckets))
+        if not self.bounds:
+            raise ValueError("BucketHistogram requires at least one bucket")
+        # Last slot is the +Inf overflow bucket
+        self.counts = [0] * (len(self.bounds) + 1)
+
+    def _record(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+
+    def quantile(self, q: float) -> float:
+        with self._lock:
+            if not self.count:
+                return 0.0
+            rank = q * self.count
+            seen = 0
+            for i, bucket_count in enumerate(self.counts):
+                if bucket_count and seen + bucket_count >= rank:
+                    lower = self.bounds[i - 1] if i > 0 else min(self.min, self.bounds[0])
+                    upper = self.bounds[i] if i < len(self.bounds) else self.max
+                    fraction = (rank - seen) / bucket_count
+                    return max(self.min, min(self.max, lower + (upper - lower) * fraction))
+                seen += bucket_count
+            return self.max
+
+    def prometheus_lines(self, name: str) -> list:
+        with self._lock:
+            counts = list(self.counts)
+            total, count = self.sum, self.count
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.bounds, counts):
+            cumulative += bucket_count
+            lines.append(f'{name}_bucket{{le="{_format_value(bound)}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{le="+Inf"}} {count}')
+        lines.append(f"{name}_sum {_format_value(total)}")
+        lines.append(f"{name}_count {count}")
+        return lines
+
+
+class DDSketchHistogram(Histogram):
+    """
+    DDSketch-style histogram with a relative-error guarantee.
+
+    Values map to logarithmic bins (gamma = (1 + a) / (1 - a)), so any
+    quantile is returned within ``relative_accuracy`` of the true
+    value. When more than ``max_bins`` bins exist per sign, the lowest
+    bins are merged, keeping memory bounded while preserving accuracy
+    for the upper quantiles that latency monitoring cares about.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_bins: int = 2048):
+        super().__init__()
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        if max_bins < 2:
+            raise ValueError("max_bins must be at least 2")
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+        self._zero = 0
+
+    def _index(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _value(self, index: int) -> float:
+        # Midpoint of the bin in relative terms
+        return 2 * self._gamma ** index / (self._gamma + 1)
+
+    def _record(self, value: float) -> None:
+        if value > 1e-12:
+            bins = self._positive
+            index = self._index(value)
+        elif value < -1e-12:
+            bins = self._negative
+            index = self._index(-value)
+        else:
+            self._zero += 1
+            return
+        bins[index] = bins.get(index, 0) + 1
+        if len(bins) > self.max_bins:
+            self._collapse(bins)
+
+    def _collapse(self, bins: Dict[int, int]) -> None:
+        """Merge the lowest bins so at most max_bins remain."""
+        ordered = sorted(bins)
+        excess = len(ordered) - self.max_bins + 1
+        target = ordered[excess]
+        merged = sum(bins.pop(index) for index in ordered[:excess])
+        bins[target] += merged
+
+    @property
+    def bin_count(self) -> int:
+        """Number of occupied bins (bounded by 2 * max_bins + 1)."""
+        return len(self._positive) + len(self._negative) + (1 if self._zero else 0)
+
+    def quantile(self, q: float) -> float:
+        with self._lock:
+            if not self.count:
+                return 0.0
+            rank = q * (self.count - 1)
+            seen = 0
+            for index in sorted(self._negative, reverse=True):
+                seen += self._negative[index]
+                if seen > rank:
+                    return max(self.min, -self._value(index))
+            seen += self._zero
+            if seen > rank:
+                return 0.0
+            for index in sorted(self._positive):
+                seen += self._positive[index]
+                if seen > rank:
+                    return min(self.max, self._value(index))
+            return self.max
+
+
+class StripedCounter:
+    """
+    Counter split across lock stripes.
+
+    Threads increment the stripe picked by their thread id, so
+    concurrent increments rarely contend; reads sum all stripes.
+    """
+
+    def __init__(self, stripes: int = 8):
+        self._stripes = max(1, stripes)
+        self._locks = [threading.Lock() for _ in range(self._stripes)]
+        self._values = [0] * self._stripes
+
+    def increment(self, value: int = 1) -> None:
+        stripe = threading.get_ident() % self._stripes
+        with self._locks[stripe]:
+            self._values[stripe] += value
+
+    @property
+    def value(self) -> int:
+        return sum(self._values)
+
+
+_METRIC_NAME_INVALID = re.compile(r"[^a-zA-Z0-9_:]")
+
+
+def _metric_name(name: str) -> str:
+    """Sanitize a metric name for the Prometheus text format."""
+    sanitized = _METRIC_NAME_INVALID.sub("_", name)
+    return f"_{sanitized}" if sanitized[:1].isdigit() else sanitized
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class MetricsCollector:
+    """
+    Metrics collector for Flask applications.
+
+    Memory is bounded: counters are lock-striped totals and histograms
+    are fixed-bucket or DDSketch summaries rather than raw values.
+    """
+
+    PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(
+        self,
+        histogram_type: str = "ddsketch",
+        relative_accuracy: float = 0.01,
+        buckets=DEFAULT_BUCKETS,
+        counter_stripes: int = 8,
+    ):
+        """
+        Args:
+            histogram_type: Default histogram kind, "ddsketch" or "buckets"
+            relative_accuracy: Quantile error bound for DDSketch histograms
+            buckets: Upper bounds for fixed-bucket histograms
+            counter_stripes: Lock stripes per counter
+        """
+        if histogram_type not in ("ddsketch", "buckets"):
+            raise ValueError(f"Unknown histogram_type: {histogram_type}")
+        self.histogram_type = histogram_type
+        self.relative_accuracy = relative_accuracy
+        self.buckets = buckets
+        self.counter_stripes = counter_stripes
+        self._counters: Dict[str, StripedCounter] = {}
+        self._histograms: Dict[str, Histogram] = {}
+        self._registry_lock = threading.Lock()
         self.gauges: Dict[str, float] = {}
-        self.histograms: Dict[str, list[float]] = {}
+
+    @property
+    def counters(self) -> Dict[str, int]:
+        """Snapshot of counter totals."""
+        return {name: counter.value for name, counter in list(self._counters.items())}
+
+    @property
+    def histograms(self) -> Dict[str, Histogram]:
+        """Registered histograms by name."""
+        return dict(self._histograms)
+
+    def _new_histogram(self) -> Histogram:
+        if self.histogram_type == "buckets":
+            return BucketHistogram(self.buckets)
+        return DDSketchHistogram(self.relative_accuracy)
+
+    def register_histogram(self, metric_name: str, histogram: Histogram) -> Histogram:
+        """Use a specific histogram (e.g. custom buckets) for a metric."""
+        with self._registry_lock:
+            self._histograms[metric_name] = histogram
+        return histogram
 
     def increment(self, metric_name: str, value: int = 1):
         """Increment a counter metric."""
-        self.counters[metric_name] = self.counters.get(metric_name, 0) + value
+        counter = self._counters.get(metric_name)
+        if counter is None:
+            with self._registry_lock:
+                counter = self._counters.setdefault(
+                    metric_name, StripedCounter(self.counter_stripes)
+                )
+        counter.increment(value)
 
     def set_gauge(self, metric_name: str, value: float):
         """Set a gauge metric."""
@@ -190,27 +502,42 @@ class MetricsCollector:
 
     def observe_histogram(self, metric_name: str, value: float):
         """Observe a histogram value."""
-        if metric_name not in self.histograms:
-            self.histograms[metric_name] = []
-        self.histograms[metric_name].append(value)
+        histogram = self._histograms.get(metric_name)
+        if histogram is None:
+            with self._registry_lock:
+                histogram = self._histograms.get(metric_name)
+                if histogram is None:
+                    histogram = self._histograms[metric_name] = self._new_histogram()
+        histogram.record(value)
 
     def get_metrics(self) -> Dict[str, Any]:
         """Get all metrics in a dictionary format."""
         return {
-            "counters": self.counters.copy(),
+            "counters": self.counters,
             "gauges": self.gauges.copy(),
             "histograms": {
-                name: {
-                    "count": len(values),
-                    "sum": sum(values),
-                    "min": min(values) if values else 0,
-                    "max": max(values) if values else 0,
-                    "avg": sum(values) / len(values) if values else 0
-                }
-                for name, values in self.histograms.items()
+                name: histogram.summary()
+                for name, histogram in self.histograms.items()
             }
         }
 
+    def render_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines = []
+        for name, value in sorted(self.counters.items()):
+            metric = _metric_name(name)
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+        for name, value in sorted(self.gauges.copy().items()):
+            metric = _metric_name(name)
+            lines.append(f"# TYPE {metric} gauge")
+            lines.append(f"{metric} {_format_value(value)}")
+        for name, histogram in sorted(self.histograms.items()):
+            metric = _metric_name(name)
+            lines.append(f"# TYPE {metric} {histogram.prometheus_type}")
+            lines.extend(histogram.prometheus_lines(metric))
+        return "\n".join(lines) + "\n"
+
 
 def create_metrics_middleware(app: Flask) -> MetricsCollector:
     """
@@ -226,6 +553,8 @@ def create_metrics_middleware(app: Flask) -> MetricsCollector:
         raise RuntimeError("Flask is required for metrics middleware. Install Flask.")
 
     metrics = MetricsCollector()
+    for size_metric in ('http_request_size_bytes', 'http_response_size_bytes'):
+        metrics.register_histogram(size_metric, BucketHistogram(SIZE_BUCKETS))
     app.extensions['metrics'] = metrics
 
     @app.before_request
@@ -257,7 +586,12 @@ def create_metrics_middleware(app: Flask) -> MetricsCollector:
 
     @app.route('/metrics', methods=['GET'])
     def metrics_endpoint():
-        """Metrics endpoint (basic JSON format)."""
+        """Metrics endpoint (JSON, or Prometheus text when requested)."""
+        accept = request.headers.get('Accept', '')
+        if request.args.get('format') == 'prometheus' or 'text/plain' in accept or 'openmetrics' in accept:
+            return metrics.render_prometheus(), 200, {
+                'Content-Type': MetricsCollector.PROMETHEUS_CONTENT_TYPE
+            }
         return jsonify(metrics.get_metrics()), 200
 
     return metrics
@@ -2,13 +2,20 @@
 Rate limiting middleware for Flask applications.
 
 Provides rate limiting with X-RateLimit-* headers and 429 responses.
-Uses token bucket algorithm compatible with existing rate_limiter.py pattern.
+Uses token bucket algorithm compatible with existing rate_limiter.py pattern,
+or GCRA (one timestamp per key). Buckets are sharded by key hash with
+per-shard locks, and a SQLite store lets several worker processes
+enforce one shared limit.
 """
 
+import math
+import os
+import sqlite3
 import time
+from abc import ABC, abstractmethod
 from typing import Optional, Dict, Callable, Tuple, Any
-from dataclasses import dataclass, field
-from threading import Lock
+from dataclasses import dataclass, field, replace
+from threading import Lock, local
 import logging
 
 try:
@@ -21,6 +28,8 @@ from .models import APIError, ErrorCode, ErrorCategory
 
 logger = logging.getLogger(__name__)
 
+ALGORITHMS = ("token_bucket", "gcra")
+
 
 @dataclass
 class RateLimitConfig:
@@ -30,6 +39,11 @@ class RateLimitConfig:
     per_ip: bool = True  # Limit per IP address
     per_endpoint: bool = False  # Limit per endpoint path
     identifier_func: Optional[Callable] = None  # Custom identifier function
+    algorithm: str = "token_bucket"  # "token_bucket" or "gcra"
+    shards: int = 16  # Independently locked bucket shards
+    cleanup_every: int = 10000  # Sweep a shard after this many calls to it
+    store: Optional["RateLimitStore"] = None  # Shared cross-process store (GCRA only)
+    scope: str = ""  # Key prefix separating limiters that share a store
 
     def __post_init__(self):
         """Validate configuration values."""
@@ -39,6 +53,14 @@ class RateLimitConfig:
             raise ValueError(f"Rate limit 'window' must be positive, got {self.window}")
         if self.identifier_func is not None and not callable(self.identifier_func):
             raise ValueError("Rate limit 'identifier_func' must be callable or None")
+        if self.algorithm not in ALGORITHMS:
+            raise ValueError(f"Rate limit 'algorithm' must be one of {ALGORITHMS}, got {self.algorithm!r}")
+        if self.shards <= 0:
+            raise ValueError(f"Rate limit 'shards' must be positive, got {self.shards}")
+        if self.cleanup_every <= 0:
+            raise ValueError(f"Rate limit 'cleanup_every' must be positive, got {self.cleanup_every}")
+        if self.store is not None and self.algorithm != "gcra":
+            raise ValueError("Rate limit 'store' requires algorithm='gcra'")
 
 
 @dataclass
@@ -59,21 +81,176 @@ class RateLimitState:
         self.reset_time = now + window
 
 
+def gcra_update(
+    tat: Optional[float],
+    now: float,
+    limit: int,
+    window: float,
+) -> Tuple[bool, float]:
+    """
+    Apply one request to a GCRA (generic cell rate algorithm) state.
+
+    The only state is the theoretical arrival time (TAT): the moment the
+    key would be fully replenished. Requests are spaced window/limit
+    apart, with a burst of up to ``limit`` allowed.
+
+    Args:
+        tat: Stored TAT (None for a new key)
+        now: Current time
+        limit: Requests per window
+        window: Window size in seconds
+
+    Returns:
+        (allowed, TAT to store)
+    """
+    interval = window / limit
+    new_tat = max(tat or now, now) + interval
+    if new_tat - window > now:
+        return False, max(tat or now, now)
+    return True, new_tat
+
+
+def _gcra_headers(limit: int, window: float, allowed: bool, tat: float, now: float) -> Dict[str, Any]:
+    interval = window / limit
+    remaining = max(0, int((window - (tat - now)) / interval + 1e-9))
+    headers = {
+        'X-RateLimit-Limit': str(limit),
+        'X-RateLimit-Remaining': str(remaining),
+        'X-RateLimit-Reset': str(int(math.ceil(tat))),
+    }
+    if not allowed:
+        # Next request fits once TAT + interval - window has passed
+        headers['Retry-After'] = str(max(1, int(math.ceil(tat + interval - window - now))))
+    return headers
+
+
+class RateLimitStore(ABC):
+    """
+    Shared GCRA state for rate limiters in several processes.
+
+    Implementations must apply ``gcra_update`` atomically per key.
+    """
+
+    @abstractmethod
+    def acquire(self, key: str, now: float, limit: int, window: float) -> Tuple[bool, float]:
+        """Apply one request to key; return (allowed, stored TAT)."""
+        ...
+
+    @abstractmethod
+    def peek(self, key: str) -> Optional[float]:
+        """Return the stored TAT for key without consuming."""
+        ...
+
+    @abstractmethod
+    def cleanup(self, now: float) -> int:
+        """Remove keys that are fully replenished; return how many."""
+        ...
+
+
+class SQLiteRateLimitStore(RateLimitStore):
+    """
+    SQLite-backed rate limit store.
+
+    Each process (and thread) uses its own connection; updates run in
+    ``BEGIN IMMEDIATE`` transactions so concurrent workers serialize on
+    the database write lock.
+    """
+
+    def __init__(self, path: str, busy_timeout_ms: int = 5000):
+        self.path = path
+        self.busy_timeout_ms = busy_timeout_ms
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._local = local()
+        conn = self._conn()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limits ("
+            " key TEXT PRIMARY KEY,"
+            " tat REAL NOT NULL)"
+        )
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, isolation_level=None, timeout=self.busy_timeout_ms / 1000)
+            conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def acquire(self, key: str, now: float, limit: int, window: float) -> Tuple[bool, float]:
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT tat FROM rate_limits WHERE key = ?", (key,)).fetchone()
+            allowed, tat = gcra_update(row[0] if row else None, now, limit, window)
+            if allowed:
+                conn.execute(
+                    "INSERT INTO rate_limits (key, tat) VALUES (?, ?)"
+                    " ON CONFLICT(key) DO UPDATE SET tat = excluded.tat",
+                    (key, tat),
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return allowed, tat
+
+    def peek(self, key: str) -> Optional[float]:
+        row = self._conn().execute("SELECT tat FROM rate_limits WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def cleanup(self, now: float) -> int:
+        return self._conn().execute("DELETE FROM rate_limits WHERE tat <= ?", (now,)).rowcount
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class _LimiterShard:
+    """One lock-guarded slice of a limiter's buckets."""
+
+    __slots__ = ("lock", "buckets", "calls")
+
+    def __init__(self):
+        self.lock = Lock()
+        self.buckets: Dict[str, Any] = {}  # RateLimitState, or TAT float for GCRA
+        self.calls = 0
+
+
 class RateLimiter:
     """
-    Token bucket rate limiter for Flask middleware.
+    Token bucket (or GCRA) rate limiter for Flask middleware.
 
-    Thread-safe implementation using locks.
+    Thread-safe: buckets are sharded by key hash, each shard with its own
+    lock. Expired buckets are swept per shard every ``cleanup_every``
+    calls, and across all shards every ``cleanup_interval`` seconds.
     """
 
     def __init__(self, config: RateLimitConfig):
         """Initialize rate limiter with configuration."""
         self.config = config
-        self.buckets: Dict[str, RateLimitState] = {}
-        self.lock = Lock()
+        self._shards = [_LimiterShard() for _ in range(config.shards)]
         self.cleanup_interval = 3600  # Cleanup old buckets every hour
         self.last_cleanup = time.time()
 
+    @property
+    def buckets(self) -> Dict[str, Any]:
+        """Snapshot of all in-process buckets across shards."""
+        merged: Dict[str, Any] = {}
+        for shard in self._shards:
+            with shard.lock:
+                merged.update(shard.buckets)
+        return merged
+
+    def _shard(self, identifier: str) -> _LimiterShard:
+        return self._shards[hash(identifier) % len(self._shards)]
+
     def _get_identifier(self, req) -> str:
         """Get identifier for rate limiting (IP, endpoint, or custom)."""
         if self.config.identifier_func:
@@ -123,23 +300,43 @@ class RateLimiter:
 
         state.last_refill = now
 
-    def _cleanup_old_buckets(self) -> None:
-        """Remove expired buckets to prevent memory leak."""
-        now = time.time()
-        if now - self.last_cleanup < self.cleanup_interval:
-            return
+    def _bucket_expired(self, state: Any, now: float) -> bool:
+        if isinstance(state, float):
+            # GCRA: a fully replenished key is indistinguishable from a new one
+            return state <= now
+        return now > state.reset_time + self.config.window
 
-        with self.lock:
+    def _sweep_shard(self, shard: _LimiterShard, now: float) -> int:
+        with shard.lock:
             expired = [
                 key
-                for key, state in self.buckets.items()
-                if now > state.reset_time + self.config.window
+                for key, state in shard.buckets.items()
+                if self._bucket_expired(state, now)
             ]
             for key in expired:
-                del self.buckets[key]
+                del shard.buckets[key]
+            shard.calls = 0
+        return len(expired)
 
+    def _cleanup_old_buckets(self) -> None:
+        """Remove expired buckets to prevent memory leak."""
+        now = time.time()
+        if now - self.last_cleanup < self.cleanup_interval:
+            return
         self.last_cleanup = now
 
+        # One shard lock at a time, so sweeps never block each other
+        for shard in self._shards:
+            self._sweep_shard(shard, now)
+        if self.config.store is not None:
+            try:
+                self.config.store.cleanup(now)
+            except Exception as e:
+                logger.warning(f"Rate limit store cleanup failed: {e}")
+
+    def _store_key(self, identifier: str) -> str:
+        return f"{self.config.scope}:{identifier}" if self.config.scope else identifier
+
     def check_rate_limit(self, req) -> Tuple[bool, Dict[str, Any]]:
         """
         Check if request is within rate limit.
@@ -153,56 +350,98 @@ class RateLimiter:
             - X-RateLimit-Reset: Unix timestamp when limit resets
         """
         identifier = self._get_identifier(req)
+        now = time.time()
 
-        with self.lock:
+        if self.config.store is not None:
+            allowed, tat = self.config.store.acquire(
+                self._store_key(identifier), now, self.config.limit, self.config.window
+            )
+            headers = _gcra_headers(self.config.limit, self.config.window, allowed, tat, now)
             self._cleanup_old_buckets()
+            return allowed, headers
 
-            # Get or create bucket for this identifier
-            if identifier not in self.buckets:
-                self.buckets[identifier] = RateLimitState(
-                    self.config.limit,
-                    self.config.window
+        shard = self._shard(identifier)
+        with shard.lock:
+            if self.config.algorithm == "gcra":
+                allowed, tat = gcra_update(
+                    shard.buckets.get(identifier), now, self.config.limit, self.config.window
                 )
+                shard.buckets[identifier] = tat
+                headers = _gcra_headers(self.config.limit, self.config.window, allowed, tat, now)
+            else:
+                allowed, headers = self._consume_token(shard, identifier)
 
-            state = self.buckets[identifier]
-            self._refill_tokens(state)
+            shard.calls += 1
+            sweep_due = shard.calls >= self.config.cleanup_every
 
-            # Check if request is allowed
-            allowed = state.tokens >= 1.0
+        # Sweeps run outside the shard lock taken above
+        if sweep_due:
+            self._sweep_shard(shard, now)
+        self._cleanup_old_buckets()
 
-            if allowed:
-                state.tokens -= 1.0
+        return allowed, headers
 
-            # Calculate headers
-            remaining = max(0, int(state.tokens))
-            reset_timestamp = int(state.reset_time)
+    def _consume_token(self, shard: _LimiterShard, identifier: str) -> Tuple[bool, Dict[str, Any]]:
+        """Token bucket check; caller holds the shard lock."""
+        # Get or create bucket for this identifier
+        state = shard.buckets.get(identifier)
+        if state is None:
+            state = shard.buckets[identifier] = RateLimitState(
+                self.config.limit,
+                self.config.window
+            )
+        self._refill_tokens(state)
 
-            headers = {
-                'X-RateLimit-Limit': str(self.config.limit),
-                'X-RateLimit-Remaining': str(remaining),
-                'X-RateLimit-Reset': str(reset_timestamp),
-            }
+        # Check if request is allowed
+        allowed = state.tokens >= 1.0
 
-            if not allowed:
-                # Add Retry-After header for 429 responses
-                retry_after = max(0, int(state.reset_time - time.time()))
-                headers['Retry-After'] = str(retry_after)
+        if allowed:
+            state.tokens -= 1.0
+
+        # Calculate headers
+        remaining = max(0, int(state.tokens))
+        reset_timestamp = int(state.reset_time)
+
+        headers = {
+            'X-RateLimit-Limit': str(self.config.limit),
+            'X-RateLimit-Remaining': str(remaining),
+            'X-RateLimit-Reset': str(reset_timestamp),
+        }
+
+        if not allowed:
+            # Add Retry-After header for 429 responses
+            retry_after = max(0, int(state.reset_time - time.time()))
+            headers['Retry-After'] = str(retry_after)
 
         return allowed, headers
 
     def get_limit_info(self, req) -> Dict[str, Any]:
         """Get rate limit information without consuming a token (for headers)."""
         identifier = self._get_identifier(req)
+        now = time.time()
+        fresh = {
+            'X-RateLimit-Limit': str(self.config.limit),
+            'X-RateLimit-Remaining': str(self.config.limit),
+            'X-RateLimit-Reset': str(int(now + self.config.window)),
+        }
+
+        if self.config.store is not None:
+            tat = self.config.store.peek(self._store_key(identifier))
+            if tat is None or tat <= now:
+                return fresh
+            return _gcra_headers(self.config.limit, self.config.window, True, tat, now)
 
-        with self.lock:
-            if identifier not in self.buckets:
-                return {
-                    'X-RateLimit-Limit': str(self.config.limit),
-                    'X-RateLimit-Remaining': str(self.config.limit),
-                    'X-RateLimit-Reset': str(int(time.time() + self.config.window)),
-                }
+        shard = self._shard(identifier)
+        with shard.lock:
+            state = shard.buckets.get(identifier)
+            if state is None:
+                return fresh
+
+            if isinstance(state, float):
+                if state <= now:
+                    return fresh
+                return _gcra_headers(self.config.limit, self.config.window, True, state, now)
 
-            state = self.buckets[identifier]
             self._refill_tokens(state)  # Update state but don't consume token
 
             return {
@@ -247,7 +486,10 @@ def create_rate_limit_middleware(
     endpoint_limiters = {}
     if endpoint_configs:
         endpoint_limiters = {
-            pattern: RateLimiter(config)
+            pattern: RateLimiter(
+                replace(config, scope=pattern)
+                if config.store is not None and not config.scope else config
+            )
             for pattern, config in endpoint_configs.items()
         }
 
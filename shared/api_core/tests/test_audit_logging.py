@@ -0,0 +1,180 @@
+"""
+Tests for the background audit log writer.
+"""
+
+import gzip
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add shared directory to path
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+SHARED_PATH = PROJECT_ROOT / "shared"
+if str(SHARED_PATH) not in sys.path:
+    sys.path.insert(0, str(SHARED_PATH))
+
+from api_core.audit_logging import AuditEvent, AuditLogConfig, AuditLogger, AuditLogWriter
+
+
+def _event(i: int) -> AuditEvent:
+    return AuditEvent(event_type="data_access", action="read", resource="agent", resource_id=str(i))
+
+
+def _read_all(path: Path) -> list:
+    lines = []
+    for candidate in sorted(path.parent.glob(path.name + ".*")) + [path]:
+        opener = gzip.open if candidate.suffix == ".gz" else open
+        with opener(candidate, "rt", encoding="utf-8") as f:
+            lines.extend(json.loads(line) for line in f)
+    return lines
+
+
+class TestAuditLogConfig:
+    """Tests for configuration validation."""
+
+    def test_rejects_unknown_modes(self):
+        """Test that durability and overflow are validated."""
+        with pytest.raises(ValueError):
+            AuditLogConfig(durability="sometimes")
+        with pytest.raises(ValueError):
+            AuditLogConfig(overflow="spill")
+
+    def test_from_env(self, monkeypatch):
+        """Test reading AUDIT_LOG_* variables."""
+        monkeypatch.setenv("AUDIT_LOG_SYNC", "true")
+        monkeypatch.setenv("AUDIT_LOG_DURABILITY", "fsync")
+        monkeypatch.setenv("AUDIT_LOG_MAX_BYTES", "4096")
+
+        config = AuditLogConfig.from_env()
+
+        assert not config.async_writes
+        assert config.durability == "fsync"
+        assert config.max_bytes == 4096
+
+    def test_from_env_sync_spellings(self, monkeypatch):
+        """Test that common truthy spellings of AUDIT_LOG_SYNC disable async writes."""
+        for value in ("1", "yes", "TRUE"):
+            monkeypatch.setenv("AUDIT_LOG_SYNC", value)
+            assert not AuditLogConfig.from_env().async_writes, value
+
+    def test_from_env_defaults_to_async(self, monkeypatch):
+        """Test that async writes stay on when AUDIT_LOG_SYNC is unset or false."""
+        monkeypatch.delenv("AUDIT_LOG_SYNC", raising=False)
+        assert AuditLogConfig.from_env().async_writes
+
+        monkeypatch.setenv("AUDIT_LOG_SYNC", "0")
+        assert AuditLogConfig.from_env().async_writes
+
+
+class TestAuditLogger:
+    """Tests for AuditLogger with the background writer."""
+
+    def test_concurrent_events_are_written_whole(self, tmp_path):
+        """Test that events from many threads are all written without interleaving."""
+        path = tmp_path / "audit.log"
+        audit = AuditLogger(log_file=str(path), config=AuditLogConfig(batch_size=64))
+
+        def produce(offset: int) -> None:
+            for i in range(offset, offset + 500):
+                audit.log(_event(i))
+
+        threads = [threading.Thread(target=produce, args=(t * 500,)) for t in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert audit.flush(timeout=5)
+
+        records = _read_all(path)
+        assert sorted(int(r["resource_id"]) for r in records) == list(range(2000))
+        stats = audit.get_stats()
+        assert stats["written"] == 2000
+        assert stats["batches"] < 2000
+        assert audit.close(timeout=5)
+
+    def test_flush_interval_commits_partial_batches(self, tmp_path):
+        """Test that a partial batch is written after flush_interval_ms."""
+        path = tmp_path / "audit.log"
+        audit = AuditLogger(log_file=str(path), config=AuditLogConfig(batch_size=1000, flush_interval_ms=20))
+
+        audit.log(_event(1))
+        deadline = time.monotonic() + 2
+        while not path.read_text() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert json.loads(path.read_text())["resource_id"] == "1"
+        audit.close()
+
+    def test_close_drains_queue(self, tmp_path):
+        """Test that close() writes everything still queued."""
+        path = tmp_path / "audit.log"
+        audit = AuditLogger(log_file=str(path), config=AuditLogConfig(flush_interval_ms=10_000))
+        for i in range(100):
+            audit.log(_event(i))
+
+        assert audit.close(timeout=5)
+        assert len(_read_all(path)) == 100
+
+    def test_sync_mode_writes_inline(self, tmp_path):
+        """Test that async_writes=False keeps the per-event write."""
+        path = tmp_path / "audit.log"
+        audit = AuditLogger(log_file=str(path), config=AuditLogConfig(async_writes=False))
+
+        audit.log(_event(7))
+
+        assert audit.writer is None
+        assert json.loads(path.read_text())["resource_id"] == "7"
+        audit.close()
+
+
+class TestAuditLogWriter:
+    """Tests for rotation and backpressure."""
+
+    def test_size_rotation_compresses_and_prunes(self, tmp_path):
+        """Test that rotated files are gzipped and only backup_count are kept."""
+        path = tmp_path / "audit.log"
+        config = AuditLogConfig(batch_size=10, max_bytes=2000, backup_count=3)
+        writer = AuditLogWriter(path, config)
+        lines = [json.dumps({"n": i, "pad": "x" * 80}) + "\n" for i in range(300)]
+        for line in lines:
+            writer.write(line)
+            if len(line) and lines.index(line) % 10 == 9:
+                writer.flush(timeout=5)
+        assert writer.close(timeout=5)
+
+        rotated = sorted(tmp_path.glob("audit.log.*"))
+        assert len(rotated) == 3
+        assert all(p.suffix == ".gz" for p in rotated)
+        assert writer.get_stats()["rotations"] > 3
+        # The newest records survive, in order
+        numbers = [r["n"] for r in _read_all(path)]
+        assert numbers == sorted(numbers)
+        assert numbers[-1] == 299
+
+    def test_time_rotation(self, tmp_path):
+        """Test that files older than rotate_interval are rotated on the next write."""
+        path = tmp_path / "audit.log"
+        writer = AuditLogWriter(path, AuditLogConfig(rotate_interval=0.05, compress_rotated=False))
+        writer.write("{}\n")
+        writer.flush(timeout=5)
+        time.sleep(0.1)
+        writer.write("{}\n")
+        writer.close(timeout=5)
+
+        assert len(list(tmp_path.glob("audit.log.*"))) == 1
+        assert path.read_text() == "{}\n"
+
+    def test_drop_overflow_counts_dropped_events(self, tmp_path):
+        """Test backpressure metrics when the queue overflows with overflow='drop'."""
+        writer = AuditLogWriter(tmp_path / "audit.log", AuditLogConfig(max_queue=4, overflow="drop"))
+        writer.close(timeout=5)  # stop the writer so the queue fills
+        writer._stopping = False
+        results = [writer.write("{}\n") for _ in range(10)]
+
+        stats = writer.get_stats()
+        assert results.count(False) == stats["dropped"] == 6
+        assert stats["queue_high_water"] == 4
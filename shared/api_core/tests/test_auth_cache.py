@@ -0,0 +1,234 @@
+"""
+Tests for the verified-token cache and API key stores.
+"""
+
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add shared directory to path
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+SHARED_PATH = PROJECT_ROOT / "shared"
+if str(SHARED_PATH) not in sys.path:
+    sys.path.insert(0, str(SHARED_PATH))
+
+from api_core import auth
+from api_core.auth import (
+    APIKeyStore,
+    InMemoryAPIKeyStore,
+    VerifiedTokenCache,
+    configure_token_cache,
+    register_api_key,
+    revoke_api_key,
+    set_api_key_store,
+    verify_api_key,
+    verify_jwt_token,
+)
+
+
+class _InvalidTokenError(Exception):
+    pass
+
+
+class _DecodeError(_InvalidTokenError):
+    pass
+
+
+class _ExpiredSignatureError(_InvalidTokenError):
+    pass
+
+
+class FakeJWT:
+    """Stand-in for PyJWT that counts decode calls."""
+
+    InvalidTokenError = _InvalidTokenError
+    DecodeError = _DecodeError
+    ExpiredSignatureError = _ExpiredSignatureError
+
+    def __init__(self, payloads):
+        self.payloads = payloads
+        self.decodes = 0
+
+    def get_unverified_header(self, token):
+        if token.count(".") != 2:
+            raise _DecodeError("Not enough segments")
+        return {"alg": "none" if token.startswith("none.") else auth.JWT_ALGORITHM}
+
+    def decode(self, token, secret, algorithms, options):
+        self.decodes += 1
+        return dict(self.payloads[token])
+
+
+@pytest.fixture
+def cache():
+    """Fresh token cache and in-memory key store for each test."""
+    previous = auth.get_token_cache()
+    store = auth.get_api_key_store()
+    cache = configure_token_cache(max_entries=100, ttl=60, negative_ttl=60)
+    set_api_key_store(InMemoryAPIKeyStore())
+    yield cache
+    set_api_key_store(store)
+    auth._token_cache = previous
+
+
+class TestJWTCache:
+    """Tests for cached JWT verification."""
+
+    def test_repeated_token_is_decoded_once(self, cache, monkeypatch):
+        """Test that a valid token is verified once and served from cache."""
+        fake = FakeJWT({"a.b.c": {"sub": "user-1", "roles": ["user"], "exp": time.time() + 3600}})
+        monkeypatch.setattr(auth, "jwt", fake)
+
+        results = [verify_jwt_token("a.b.c") for _ in range(5)]
+        results[0]["roles"].append("admin")
+
+        assert fake.decodes == 1
+        assert verify_jwt_token("a.b.c")["roles"] == ["user"]
+        assert cache.get_stats()["hits"] == 5
+
+    def test_cached_entry_does_not_outlive_exp(self, cache, monkeypatch):
+        """Test that cache entries expire at the token's exp claim."""
+        fake = FakeJWT({"a.b.c": {"sub": "user-1", "exp": time.time() + 0.05}})
+        monkeypatch.setattr(auth, "jwt", fake)
+
+        verify_jwt_token("a.b.c")
+        time.sleep(0.1)
+        verify_jwt_token("a.b.c")
+
+        assert fake.decodes == 2
+        assert cache.get_stats()["expirations"] == 1
+
+    def test_malformed_tokens_are_negatively_cached(self, cache, monkeypatch):
+        """Test that malformed and wrong-algorithm tokens skip parsing on repeat."""
+        fake = FakeJWT({})
+        calls = []
+        original = fake.get_unverified_header
+        fake.get_unverified_header = lambda token: calls.append(token) or original(token)
+        monkeypatch.setattr(auth, "jwt", fake)
+
+        for _ in range(3):
+            assert verify_jwt_token("garbage") is None
+            assert verify_jwt_token("none.b.c") is None
+
+        assert calls == ["garbage", "none.b.c"]
+        assert cache.get_stats()["negative_hits"] == 4
+
+    def test_cache_key_is_a_digest(self, cache, monkeypatch):
+        """Test that raw credentials are never stored in the cache."""
+        monkeypatch.setattr(auth, "jwt", FakeJWT({}))
+        verify_jwt_token("secret-looking-token")
+
+        assert all(isinstance(key[1], bytes) and len(key[1]) == 32 for key in cache._entries)
+
+
+class TestAPIKeyCache:
+    """Tests for cached API key verification and stores."""
+
+    def test_valid_key_hits_store_once(self, cache):
+        """Test that repeated verification of a key uses the cache."""
+        lookups = []
+
+        class CountingStore(InMemoryAPIKeyStore):
+            cacheable = True
+
+            def get(self, key_id):
+                lookups.append(key_id)
+                return super().get(key_id)
+
+        set_api_key_store(CountingStore())
+        register_api_key("svc", "s3cret", roles=["service"])
+
+        for _ in range(4):
+            assert verify_api_key("svc.s3cret")["key_id"] == "svc"
+
+        assert lookups == ["svc"]
+
+    def test_unknown_key_is_not_negatively_cached(self, cache):
+        """Test that a well-formed unknown key is accepted once registered."""
+        assert verify_api_key("late.key") is None
+        register_api_key("late", "key")
+
+        assert verify_api_key("late.key") is not None
+
+    def test_revoke_drops_cached_verification(self, cache):
+        """Test that revoking a key invalidates its cached result."""
+        register_api_key("svc", "s3cret")
+        assert verify_api_key("svc.s3cret") is not None
+
+        assert revoke_api_key("svc")
+        assert verify_api_key("svc.s3cret") is None
+
+    def test_malformed_keys_are_rejected(self, cache):
+        """Test format validation at the component length limits."""
+        register_api_key("k" * 64, "s" * 256)
+        assert verify_api_key(f"{'k' * 64}.{'s' * 256}") is not None
+        assert verify_api_key("id.with.dots") is None
+        register_api_key("id", "with.dots")
+        assert verify_api_key("id.with.dots") is not None
+        for key in ("nodot", ".secret", "id.", "id.sec ret", "id.με", "k" * 65 + ".s"):
+            assert verify_api_key(key) is None
+
+    def test_in_memory_store_bypasses_cache(self, cache):
+        """Test that dict-backed keys are not cached (a lookup is cheaper)."""
+        register_api_key("svc", "s3cret")
+        for _ in range(3):
+            assert verify_api_key("svc.s3cret") is not None
+
+        assert len(cache) == 0
+
+    def test_custom_store_backend(self, cache):
+        """Test that verify_api_key reads from a pluggable store."""
+
+        class StaticStore(APIKeyStore):
+            def get(self, key_id):
+                return {"secret": "x", "roles": ["reader"]} if key_id == "ro" else None
+
+            def set(self, key_id, record):
+                raise NotImplementedError
+
+            def delete(self, key_id):
+                return False
+
+        set_api_key_store(StaticStore())
+
+        assert verify_api_key("ro.x")["roles"] == ["reader"]
+        assert verify_api_key("ro.y") is None
+
+    def test_authenticate_request_uses_cache(self, cache, monkeypatch):
+        """Test that API keys sent as bearer tokens skip JWT parsing on repeat."""
+        fake = FakeJWT({})
+        monkeypatch.setattr(auth, "jwt", fake)
+        register_api_key("svc", "s3cret")
+        request = SimpleNamespace(headers={"Authorization": "Bearer svc.s3cret"})
+
+        contexts = [auth.authenticate_request(req=request) for _ in range(3)]
+
+        assert all(context.user_id == "svc" for context in contexts)
+        assert cache.get_stats()["negative_hits"] == 2
+
+
+class TestVerifiedTokenCache:
+    """Tests for VerifiedTokenCache bounds."""
+
+    def test_lru_eviction(self):
+        """Test that the cache is bounded and evicts least recently used."""
+        cache = VerifiedTokenCache(max_entries=2, ttl=60)
+        keys = [cache.key("jwt", str(i)) for i in range(3)]
+        cache.set(keys[0], {"n": 0})
+        cache.set(keys[1], {"n": 1})
+        cache.get(keys[0])
+        cache.set(keys[2], {"n": 2})
+
+        assert cache.get(keys[1]) == (False, None)
+        assert cache.get(keys[0]) == (True, {"n": 0})
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_disabled_cache_stores_nothing(self):
+        """Test that max_entries=0 disables caching."""
+        cache = VerifiedTokenCache(max_entries=0)
+        cache.set(cache.key("jwt", "t"), {"sub": "x"})
+
+        assert len(cache) == 0
@@ -0,0 +1,129 @@
+"""
+Tests for the in-memory response cache.
+"""
+
+import sys
+from pathlib import Path
+import time
+
+# Add shared directory to path
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+SHARED_PATH = PROJECT_ROOT / "shared"
+if str(SHARED_PATH) not in sys.path:
+    sys.path.insert(0, str(SHARED_PATH))
+
+from api_core.caching import CacheConfig, InMemoryCache, invalidate_cache_pattern
+
+
+class TestLRUEviction:
+    """Tests for LRU ordering and eviction."""
+
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently read key is evicted first."""
+        cache = InMemoryCache(CacheConfig(max_entries=3))
+        for key in ("a", "b", "c"):
+            cache.set(key, key)
+        cache.get("a")
+        cache.set("d", "d")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "a"
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_overwrite_does_not_evict(self):
+        """Test that re-setting an existing key at capacity evicts nothing."""
+        cache = InMemoryCache(CacheConfig(max_entries=2))
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 3)
+
+        assert len(cache) == 2
+        assert cache.get("a") == 3
+        assert cache.get_stats()["evictions"] == 0
+
+
+class TestExpiry:
+    """Tests for TTL handling."""
+
+    def test_expired_entry_is_miss(self):
+        """Test that reading an expired entry misses."""
+        cache = InMemoryCache(CacheConfig(expiry_tick=0.01))
+        cache.set("a", 1, ttl=0.01)
+        time.sleep(0.03)
+        assert cache.get("a") is None
+
+    def test_sweep_removes_unread_expired_entries(self):
+        """Test that expired entries are swept without being read."""
+        cache = InMemoryCache(CacheConfig(expiry_tick=0.01))
+        for i in range(20):
+            cache.set(f"k{i}", i, ttl=0.01)
+        cache.set("long", 1, ttl=60)
+        time.sleep(0.03)
+
+        assert cache.sweep_expired() == 20
+        assert len(cache) == 1
+        assert cache.get_stats()["expirations"] == 20
+
+
+class TestByteBound:
+    """Tests for max_bytes bounding."""
+
+    def test_evicts_to_stay_under_max_bytes(self):
+        """Test that total size stays within max_bytes."""
+        cache = InMemoryCache(CacheConfig(max_entries=1000, max_bytes=1000, size_func=len))
+        for i in range(20):
+            cache.set(f"k{i}", "x" * 100)
+
+        stats = cache.get_stats()
+        assert stats["bytes"] <= 1000
+        assert stats["entries"] == 10
+
+    def test_rejects_value_larger_than_bound(self):
+        """Test that a single oversized value is not cached."""
+        cache = InMemoryCache(CacheConfig(max_bytes=100, size_func=len))
+        cache.set("big", "x" * 500)
+        assert cache.get("big") is None
+        assert cache.get_stats()["rejections"] == 1
+
+
+class TestAdmission:
+    """Tests for the TinyLFU admission filter."""
+
+    def test_scan_does_not_flush_hot_keys(self):
+        """Test that one-off keys cannot displace frequently read keys."""
+        cache = InMemoryCache(CacheConfig(max_entries=10, admission=True))
+        for i in range(10):
+            cache.set(f"hot{i}", i)
+            for _ in range(3):
+                cache.get(f"hot{i}")
+
+        for i in range(50):
+            cache.set(f"scan{i}", i)
+
+        # The sketch is probabilistic; a rare hash collision may cost one key
+        survivors = sum(cache.get(f"hot{i}") == i for i in range(10))
+        assert survivors >= 9
+        assert cache.get_stats()["rejections"] >= 40
+
+
+class TestSharding:
+    """Tests for sharded caches."""
+
+    def test_sharded_cache_respects_total_bound(self):
+        """Test that shards together stay within max_entries."""
+        cache = InMemoryCache(CacheConfig(max_entries=64, shards=8))
+        for i in range(500):
+            cache.set(f"k{i}", i)
+
+        assert len(cache) <= 64
+        assert cache.get_stats()["shards"] == 8
+
+    def test_invalidate_pattern_across_shards(self):
+        """Test pattern invalidation on a sharded cache."""
+        cache = InMemoryCache(CacheConfig(max_entries=100, shards=4))
+        for i in range(10):
+            cache.set(f"/users/{i}", i)
+            cache.set(f"/items/{i}", i)
+
+        assert invalidate_cache_pattern("/users/", cache) == 10
+        assert len(cache) == 10
@@ -0,0 +1,165 @@
+"""
+Tests for bounded-memory metric primitives.
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add shared directory to path
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+SHARED_PATH = PROJECT_ROOT / "shared"
+if str(SHARED_PATH) not in sys.path:
+    sys.path.insert(0, str(SHARED_PATH))
+
+from api_core.monitoring import (
+    BucketHistogram,
+    DDSketchHistogram,
+    Histogram,
+    MetricsCollector,
+    StripedCounter,
+)
+
+
+class TestHistogramBase:
+    """Tests for the abstract histogram base."""
+
+    def test_subclasses_must_implement_distribution(self):
+        """Test that the base and incomplete subclasses cannot be instantiated."""
+        class CountOnly(Histogram):
+            def _record(self, value):
+                pass
+
+        with pytest.raises(TypeError):
+            Histogram()
+        with pytest.raises(TypeError):
+            CountOnly()
+
+
+class TestDDSketchHistogram:
+    """Tests for the relative-error sketch."""
+
+    def test_quantiles_within_relative_accuracy(self):
+        """Test that quantiles stay within the configured relative error."""
+        sketch = DDSketchHistogram(relative_accuracy=0.01)
+        values = [float(i) for i in range(1, 10001)]
+        for value in values:
+            sketch.record(value)
+
+        for q in (0.5, 0.9, 0.99):
+            expected = values[int(q * (len(values) - 1))]
+            assert abs(sketch.quantile(q) - expected) <= expected * 0.01 + 1e-9
+
+    def test_memory_is_bounded(self):
+        """Test that bins are collapsed once max_bins is exceeded."""
+        sketch = DDSketchHistogram(relative_accuracy=0.01, max_bins=64)
+        for exponent in range(-300, 300):
+            sketch.record(10.0 ** (exponent / 10))
+
+        assert sketch.bin_count <= 64
+        assert sketch.count == 600
+        assert sketch.quantile(1.0) == pytest.approx(10.0 ** 29.9, rel=0.01)
+
+    def test_zero_and_negative_values(self):
+        """Test that zero and negative observations are ordered correctly."""
+        sketch = DDSketchHistogram()
+        for value in (-10.0, 0.0, 10.0):
+            sketch.record(value)
+
+        assert sketch.quantile(0.0) == pytest.approx(-10.0, rel=0.01)
+        assert sketch.quantile(0.5) == 0.0
+        assert sketch.quantile(1.0) == pytest.approx(10.0, rel=0.01)
+
+    def test_invalid_accuracy(self):
+        """Test that relative_accuracy is validated."""
+        with pytest.raises(ValueError):
+            DDSketchHistogram(relative_accuracy=0)
+
+
+class TestBucketHistogram:
+    """Tests for the fixed-bucket histogram."""
+
+    def test_bucket_counts(self):
+        """Test that values land in the first bucket whose bound covers them."""
+        histogram = BucketHistogram(buckets=(10, 100))
+        for value in (5, 10, 50, 500):
+            histogram.record(value)
+
+        assert histogram.counts == [2, 1, 1]
+        assert len(histogram) == 4
+
+    def test_prometheus_buckets_are_cumulative(self):
+        """Test that rendered buckets are cumulative and end at +Inf."""
+        histogram = BucketHistogram(buckets=(10, 100))
+        for value in (5, 50, 500):
+            histogram.record(value)
+
+        lines = histogram.prometheus_lines("latency")
+        assert 'latency_bucket{le="10.0"} 1' in lines
+        assert 'latency_bucket{le="100.0"} 2' in lines
+        assert 'latency_bucket{le="+Inf"} 3' in lines
+        assert "latency_count 3" in lines
+
+    def test_quantile_interpolates_within_bucket(self):
+        """Test that quantiles fall inside the containing bucket."""
+        histogram = BucketHistogram(buckets=(10, 20, 30))
+        for value in range(1, 31):
+            histogram.record(value)
+
+        assert 10 <= histogram.quantile(0.5) <= 20
+
+
+class TestStripedCounter:
+    """Tests for the lock-striped counter."""
+
+    def test_concurrent_increments(self):
+        """Test that no increments are lost across threads."""
+        counter = StripedCounter(stripes=4)
+
+        def work():
+            for _ in range(10000):
+                counter.increment()
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert counter.value == 80000
+
+
+class TestPrometheusRendering:
+    """Tests for MetricsCollector.render_prometheus."""
+
+    def test_render_all_metric_types(self):
+        """Test the text exposition output for each metric type."""
+        metrics = MetricsCollector()
+        metrics.increment('http_requests_total', 3)
+        metrics.set_gauge('queue.depth', 7)
+        metrics.observe_histogram('latency_ms', 12.0)
+
+        text = metrics.render_prometheus()
+
+        assert '# TYPE http_requests_total counter\nhttp_requests_total 3\n' in text
+        assert '# TYPE queue_depth gauge\nqueue_depth 7\n' in text
+        assert '# TYPE latency_ms summary' in text
+        assert 'latency_ms_count 1' in text
+        assert text.endswith('\n')
+
+    def test_get_metrics_includes_percentiles(self):
+        """Test that histogram summaries expose percentile estimates."""
+        metrics = MetricsCollector(histogram_type="buckets", buckets=(10, 100))
+        for value in (1, 2, 3, 50):
+            metrics.observe_histogram('hist', value)
+
+        summary = metrics.get_metrics()['histograms']['hist']
+        assert summary['count'] == 4
+        assert {'p50', 'p90', 'p95', 'p99'} <= set(summary)
+
+    def test_unknown_histogram_type(self):
+        """Test that an unknown histogram type is rejected."""
+        with pytest.raises(ValueError):
+            MetricsCollector(histogram_type="raw")
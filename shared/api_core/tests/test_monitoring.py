@@ -238,7 +238,10 @@ class TestMetricsCollector:
         metrics.observe_histogram('test_histogram', 30.0)
 
         assert len(metrics.histograms['test_histogram']) == 3
-        assert metrics.histograms['test_histogram'] == [10.0, 20.0, 30.0]
+        summary = metrics.histograms['test_histogram'].summary()
+        assert summary['sum'] == 60.0
+        assert summary['min'] == 10.0
+        assert summary['max'] == 30.0
 
     def test_get_metrics(self):
         """Test getting all metrics."""
@@ -295,3 +298,22 @@ class TestMetricsMiddleware:
             assert 'counters' in data
             assert 'gauges' in data
             assert 'histograms' in data
+
+    def test_metrics_endpoint_prometheus(self):
+        """Test /metrics serves Prometheus text when requested."""
+        app = Flask(__name__)
+        create_metrics_middleware(app)
+
+        @app.route('/test')
+        def test():
+            return {'status': 'ok'}
+
+        with app.test_client() as client:
+            client.get('/test')
+
+            response = client.get('/metrics', headers={'Accept': 'text/plain'})
+            assert response.status_code == 200
+            assert response.content_type.startswith('text/plain')
+            body = response.get_data(as_text=True)
+            assert '# TYPE http_requests_total counter' in body
+            assert '# TYPE http_request_duration_ms summary' in body
@@ -13,7 +13,7 @@ SHARED_PATH = PROJECT_ROOT / "shared"
 if str(SHARED_PATH) not in sys.path:
     sys.path.insert(0, str(SHARED_PATH))
 
-from api_core.rate_limiting import RateLimitConfig, RateLimiter
+from api_core.rate_limiting import RateLimitConfig, RateLimiter, SQLiteRateLimitStore
 
 
 class MockRequest:
@@ -217,5 +217,99 @@ class TestRateLimiter:
         assert len(limiter.buckets) == 0
 
 
+class TestGCRA:
+    """Tests for the GCRA algorithm option."""
+
+    def test_gcra_allows_burst_then_blocks(self):
+        """Test that GCRA allows `limit` requests then returns Retry-After."""
+        limiter = RateLimiter(RateLimitConfig(limit=2, window=60, algorithm="gcra"))
+        req = MockRequest()
+
+        allowed1, headers1 = limiter.check_rate_limit(req)
+        allowed2, _ = limiter.check_rate_limit(req)
+        allowed3, headers3 = limiter.check_rate_limit(req)
+
+        assert allowed1 and allowed2
+        assert headers1['X-RateLimit-Remaining'] == '1'
+        assert allowed3 is False
+        assert headers3['X-RateLimit-Remaining'] == '0'
+        assert int(headers3['Retry-After']) == 30
+
+    def test_gcra_stores_single_timestamp(self):
+        """Test that GCRA keeps one float per key."""
+        limiter = RateLimiter(RateLimitConfig(limit=5, window=60, algorithm="gcra"))
+        limiter.check_rate_limit(MockRequest())
+        assert all(isinstance(v, float) for v in limiter.buckets.values())
+
+    def test_gcra_replenishes(self):
+        """Test that GCRA allows requests again after the emission interval."""
+        limiter = RateLimiter(RateLimitConfig(limit=2, window=1, algorithm="gcra"))
+        req = MockRequest()
+        limiter.check_rate_limit(req)
+        limiter.check_rate_limit(req)
+        assert limiter.check_rate_limit(req)[0] is False
+
+        time.sleep(0.6)
+        assert limiter.check_rate_limit(req)[0] is True
+
+    def test_invalid_algorithm(self):
+        """Test that unknown algorithms are rejected."""
+        with pytest.raises(ValueError):
+            RateLimitConfig(algorithm="leaky")
+
+    def test_store_requires_gcra(self, tmp_path):
+        """Test that a shared store cannot be combined with token buckets."""
+        store = SQLiteRateLimitStore(str(tmp_path / "limits.db"))
+        with pytest.raises(ValueError):
+            RateLimitConfig(store=store)
+
+
+class TestSQLiteStore:
+    """Tests for the shared SQLite store."""
+
+    def test_limiters_share_one_limit(self, tmp_path):
+        """Test that two limiters (e.g. two workers) enforce one limit."""
+        path = str(tmp_path / "limits.db")
+        worker_a = RateLimiter(RateLimitConfig(limit=3, window=60, algorithm="gcra",
+                                               store=SQLiteRateLimitStore(path)))
+        worker_b = RateLimiter(RateLimitConfig(limit=3, window=60, algorithm="gcra",
+                                               store=SQLiteRateLimitStore(path)))
+        req = MockRequest()
+
+        results = [
+            worker_a.check_rate_limit(req)[0],
+            worker_b.check_rate_limit(req)[0],
+            worker_a.check_rate_limit(req)[0],
+            worker_b.check_rate_limit(req)[0],
+        ]
+
+        assert results == [True, True, True, False]
+        assert worker_a.get_limit_info(req)['X-RateLimit-Remaining'] == '0'
+
+
+class TestShardedCleanup:
+    """Tests for sharding and amortized cleanup."""
+
+    def test_cleanup_during_check_does_not_deadlock(self):
+        """Test that time-based cleanup can run from inside check_rate_limit."""
+        limiter = RateLimiter(RateLimitConfig(limit=10, window=1))
+        limiter.cleanup_interval = 0
+        for i in range(5):
+            allowed, _ = limiter.check_rate_limit(MockRequest(remote_addr=f"10.0.0.{i}"))
+            assert allowed
+
+    def test_shard_sweep_every_n_calls(self):
+        """Test that expired buckets are swept after cleanup_every calls."""
+        limiter = RateLimiter(RateLimitConfig(limit=10, window=1, shards=1, cleanup_every=3,
+                                              algorithm="gcra"))
+        limiter.check_rate_limit(MockRequest(remote_addr="10.0.0.1"))
+        time.sleep(0.2)  # one request's emission interval (0.1s) has passed
+
+        limiter.check_rate_limit(MockRequest(remote_addr="10.0.0.2"))
+        limiter.check_rate_limit(MockRequest(remote_addr="10.0.0.3"))
+
+        assert "ip:10.0.0.1" not in limiter.buckets
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
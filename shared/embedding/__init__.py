@@ -7,12 +7,14 @@ Provides unified embedding functionality with:
 - Enhanced logging with error classification
 - Dimension validation
 - Batch processing support
+- Two-tier embedding cache (memory LRU + SQLite)
 
 Public API:
-    from shared.embedding import EmbeddingService, EmbeddingTelemetry
+    from shared.embedding import EmbeddingService, EmbeddingTelemetry, EmbeddingCache
     from shared.embedding.exceptions import EmbeddingError
 """
 
+from .cache import EmbeddingCache, EmbeddingCacheStats, cache_key
 from .service import EmbeddingService
 from .telemetry import EmbeddingTelemetry
 from .exceptions import (
@@ -28,6 +30,9 @@ __version__ = "1.0.0"
 __all__ = [
     "EmbeddingService",
     "EmbeddingTelemetry",
+    "EmbeddingCache",
+    "EmbeddingCacheStats",
+    "cache_key",
     "EmbeddingError",
     "EmbeddingProviderError",
     "EmbeddingDimensionMismatchError",
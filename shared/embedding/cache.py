@@ -0,0 +1,595 @@
+"""
+Content-addressed embedding cache for the shared embedding service.
+
+Two tiers:
+1. In-process LRU (OrderedDict) for hot texts such as repeated queries
+2. Optional persistent SQLite store shared across runs and processes
+
+Keys combine provider, model, dimensions and the SHA-256 of the text, so
+vectors from different providers or dimension settings never mix.
+Persistent vectors are stored as packed float32 BLOBs.
+
+Maintenance tool:
+    python -m shared.embedding.cache stats  --db .cache/embeddings.db
+    python -m shared.embedding.cache export --db .cache/embeddings.db --output vectors.jsonl
+    python -m shared.embedding.cache import --db .cache/embeddings.db --input vectors.jsonl
+    python -m shared.embedding.cache warmup --db .cache/embeddings.db --input texts.txt
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import sqlite3
+import sys
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# SQLite's default host parameter limit is 999
+_SQL_BATCH = 500
+
+
+def cache_key(provider: str, model: str, dimensions: int, text: str) -> str:
+    """Compute the content-addressed cache key for a text.
+
+    Args:
+        provider: Provider name (e.g., "openai")
+        model: Model name
+        dimensions: Requested embedding dimensions
+        text: Text being embedded
+
+    Returns:
+        Key of the form "provider/model/dimensions/sha256"
+    """
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return f"{provider}/{model}/{dimensions}/{digest}"
+
+
+def _split_key(key: str):
+    """Split a cache key into (provider, model, dimensions, digest)."""
+    provider, rest = key.split("/", 1)
+    model, dimensions, digest = rest.rsplit("/", 2)
+    return provider, model, int(dimensions), digest
+
+
+def _pack(vector: List[float]) -> bytes:
+    return array("f", vector).tobytes()
+
+
+def _unpack(blob: bytes) -> List[float]:
+    values = array("f")
+    values.frombytes(blob)
+    return values.tolist()
+
+
+@dataclass
+class EmbeddingCacheStats:
+    """Session counters for an EmbeddingCache."""
+    memory_hits: int = 0
+    persistent_hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    memory_evictions: int = 0
+    persistent_evictions: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.persistent_hits
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "memory_hits": self.memory_hits,
+            "persistent_hits": self.persistent_hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "memory_evictions": self.memory_evictions,
+            "persistent_evictions": self.persistent_evictions,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+class EmbeddingCache:
+    """
+    Two-tier embedding cache.
+
+    Features:
+    - Content-addressed keys (provider/model/dimensions/text hash)
+    - LRU memory tier bounded by ``max_memory_entries``
+    - Optional SQLite tier bounded by ``max_persistent_entries`` with
+      least-recently-used eviction
+    - Optional TTL for persistent entries
+    - Batched lookups and writes
+    - Statistics and JSONL export/import
+
+    Usage:
+        cache = EmbeddingCache(Path(".cache/embeddings.db"))
+        service = EmbeddingService(cache=cache)
+    """
+
+    DEFAULT_MEMORY_ENTRIES = 10_000
+    DEFAULT_PERSISTENT_ENTRIES = 1_000_000
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        max_memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+        max_persistent_entries: int = DEFAULT_PERSISTENT_ENTRIES,
+        ttl_seconds: Optional[float] = None,
+    ):
+        """
+        Initialize embedding cache.
+
+        Args:
+            path: SQLite database path (None for memory-only)
+            max_memory_entries: LRU bound for the in-process tier (0 disables it)
+            max_persistent_entries: Entry bound for the SQLite tier
+            ttl_seconds: Lifetime of persistent entries (None = no expiry)
+        """
+        if max_memory_entries < 0 or max_persistent_entries < 1:
+            raise ValueError("Cache entry bounds must be positive")
+
+        self.path = Path(path) if path else None
+        self.max_memory_entries = max_memory_entries
+        self.max_persistent_entries = max_persistent_entries
+        self.ttl_seconds = ttl_seconds
+        self.stats = EmbeddingCacheStats()
+
+        self._memory: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._persistent_count = 0
+
+        if self.path:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                str(self.path), check_same_thread=False, isolation_level=None
+            )
+            self._init_schema()
+            self._persistent_count = self._count()
+
+    def _init_schema(self) -> None:
+        """Initialize database schema."""
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS embeddings (
+                key TEXT PRIMARY KEY,
+                provider TEXT NOT NULL,
+                model TEXT NOT NULL,
+                dimensions INTEGER NOT NULL,
+                vector BLOB NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_embeddings_accessed
+            ON embeddings(accessed_at)
+        """)
+
+    def _count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    @property
+    def persistent(self) -> bool:
+        """Whether a SQLite tier is configured."""
+        return self._conn is not None
+
+    # =========================================================================
+    # Lookups
+    # =========================================================================
+
+    def get(self, key: str) -> Optional[List[float]]:
+        """Return the cached vector for key, or None on miss."""
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, List[float]]:
+        """
+        Look up many keys at once.
+
+        Memory hits are served first; the rest are fetched from SQLite in
+        batched IN queries and promoted into the memory tier.
+
+        Args:
+            keys: Cache keys (duplicates allowed)
+
+        Returns:
+            Mapping of found keys to vectors
+        """
+        wanted = list(dict.fromkeys(keys))
+        found: Dict[str, List[float]] = {}
+
+        with self._lock:
+            missing = []
+            for key in wanted:
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    found[key] = list(vector)
+                else:
+                    missing.append(key)
+            self.stats.memory_hits += len(found)
+
+            if missing and self._conn is not None:
+                persisted = self._load_persistent(missing)
+                self.stats.persistent_hits += len(persisted)
+                for key, vector in persisted.items():
+                    self._remember(key, vector)
+                found.update(persisted)
+
+            self.stats.misses += len(wanted) - len(found)
+        return found
+
+    def _load_persistent(self, keys: List[str]) -> Dict[str, List[float]]:
+        now = time.time()
+        found: Dict[str, List[float]] = {}
+        expired: List[str] = []
+
+        for start in range(0, len(keys), _SQL_BATCH):
+            batch = keys[start:start + _SQL_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            rows = self._conn.execute(
+                f"SELECT key, vector, created_at FROM embeddings WHERE key IN ({placeholders})",
+                batch,
+            ).fetchall()
+            for key, blob, created_at in rows:
+                if self.ttl_seconds is not None and now - created_at > self.ttl_seconds:
+                    expired.append(key)
+                else:
+                    found[key] = _unpack(blob)
+
+        if found:
+            hit_keys = list(found)
+            for start in range(0, len(hit_keys), _SQL_BATCH):
+                batch = hit_keys[start:start + _SQL_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                self._conn.execute(
+                    f"UPDATE embeddings SET accessed_at = ? WHERE key IN ({placeholders})",
+                    [now, *batch],
+                )
+        if expired:
+            self._delete_persistent(expired)
+        return found
+
+    # =========================================================================
+    # Writes
+    # =========================================================================
+
+    def set(self, key: str, vector: List[float]) -> None:
+        """Store a single vector."""
+        self.set_many({key: vector})
+
+    def set_many(self, vectors: Dict[str, List[float]]) -> None:
+        """
+        Store many vectors in one transaction.
+
+        Args:
+            vectors: Mapping of cache keys (from ``cache_key``) to vectors
+        """
+        if not vectors:
+            return
+        with self._lock:
+            for key, vector in vectors.items():
+                self._remember(key, vector)
+            if self._conn is not None:
+                self._store_persistent(vectors)
+            self.stats.writes += len(vectors)
+
+    def _remember(self, key: str, vector: List[float]) -> None:
+        if self.max_memory_entries == 0:
+            return
+        self._memory[key] = list(vector)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+            self.stats.memory_evictions += 1
+
+    def _store_persistent(self, vectors: Dict[str, List[float]]) -> None:
+        now = time.time()
+        rows = []
+        for key, vector in vectors.items():
+            provider, model, dimensions, _ = _split_key(key)
+            rows.append((key, provider, model, dimensions, _pack(vector), now, now))
+
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings"
+                " (key, provider, model, dimensions, vector, created_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+
+        # Count may overshoot on replaces; re-count only when over the bound
+        self._persistent_count += len(rows)
+        if self._persistent_count > self.max_persistent_entries:
+            self._evict_persistent()
+
+    def _evict_persistent(self) -> None:
+        """Evict least-recently-used entries plus 10% headroom."""
+        self._persistent_count = self._count()
+        overflow = self._persistent_count - self.max_persistent_entries
+        if overflow <= 0:
+            return
+        overflow += self.max_persistent_entries // 10
+        cursor = self._conn.execute(
+            "DELETE FROM embeddings WHERE key IN ("
+            " SELECT key FROM embeddings ORDER BY accessed_at, rowid LIMIT ?)",
+            (overflow,),
+        )
+        self.stats.persistent_evictions += cursor.rowcount
+        self._persistent_count -= cursor.rowcount
+
+    def _delete_persistent(self, keys: List[str]) -> None:
+        for start in range(0, len(keys), _SQL_BATCH):
+            batch = keys[start:start + _SQL_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            cursor = self._conn.execute(
+                f"DELETE FROM embeddings WHERE key IN ({placeholders})", batch
+            )
+            self._persistent_count -= cursor.rowcount
+
+    # =========================================================================
+    # Maintenance
+    # =========================================================================
+
+    def cleanup_expired(self) -> int:
+        """
+        Remove expired persistent entries.
+
+        Returns:
+            Number of entries removed
+        """
+        if self._conn is None or self.ttl_seconds is None:
+            return 0
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM embeddings WHERE created_at < ?",
+                (time.time() - self.ttl_seconds,),
+            )
+            self._persistent_count -= cursor.rowcount
+            return cursor.rowcount
+
+    def clear(self, provider: Optional[str] = None, model: Optional[str] = None) -> int:
+        """
+        Clear cache entries.
+
+        Args:
+            provider: If specified, only clear entries for this provider
+            model: If specified, only clear entries for this model
+
+        Returns:
+            Number of persistent entries cleared
+        """
+        prefix = "/".join(p for p in (provider, model) if p)
+        with self._lock:
+            if prefix:
+                for key in [k for k in self._memory if k.startswith(prefix + "/")]:
+                    del self._memory[key]
+            else:
+                self._memory.clear()
+
+            if self._conn is None:
+                return 0
+            clauses, params = [], []
+            if provider:
+                clauses.append("provider = ?")
+                params.append(provider)
+            if model:
+                clauses.append("model = ?")
+                params.append(model)
+            where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+            cursor = self._conn.execute(f"DELETE FROM embeddings{where}", params)
+            self._persistent_count = self._count()
+            return cursor.rowcount
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            stats = {
+                **self.stats.to_dict(),
+                "memory_entries": len(self._memory),
+                "max_memory_entries": self.max_memory_entries,
+                "persistent": self.persistent,
+            }
+            if self._conn is not None:
+                models = {
+                    f"{provider}/{model}/{dimensions}": count
+                    for provider, model, dimensions, count in self._conn.execute(
+                        "SELECT provider, model, dimensions, COUNT(*)"
+                        " FROM embeddings GROUP BY provider, model, dimensions"
+                    )
+                }
+                stats.update({
+                    "path": str(self.path),
+                    "persistent_entries": self._count(),
+                    "max_persistent_entries": self.max_persistent_entries,
+                    "ttl_seconds": self.ttl_seconds,
+                    "models": models,
+                })
+            return stats
+
+    def iter_entries(self) -> Iterator[Dict[str, Any]]:
+        """Yield every persistent entry (or the memory tier if memory-only)."""
+        if self._conn is None:
+            with self._lock:
+                items = list(self._memory.items())
+            for key, vector in items:
+                provider, model, dimensions, _ = _split_key(key)
+                yield {
+                    "key": key,
+                    "provider": provider,
+                    "model": model,
+                    "dimensions": dimensions,
+                    "vector": vector,
+                }
+            return
+
+        cursor = self._conn.execute(
+            "SELECT key, provider, model, dimensions, vector FROM embeddings ORDER BY key"
+        )
+        for key, provider, model, dimensions, blob in cursor:
+            yield {
+                "key": key,
+                "provider": provider,
+                "model": model,
+                "dimensions": dimensions,
+                "vector": _unpack(blob),
+            }
+
+    def export_jsonl(self, output: Union[str, Path]) -> int:
+        """
+        Export entries to a JSONL file.
+
+        Args:
+            output: Destination path
+
+        Returns:
+            Number of entries written
+        """
+        count = 0
+        with open(output, "w", encoding="utf-8") as f:
+            for entry in self.iter_entries():
+                f.write(json.dumps(entry) + "\n")
+                count += 1
+        return count
+
+    def import_jsonl(self, source: Union[str, Path], batch_size: int = 1000) -> int:
+        """
+        Load entries previously written by ``export_jsonl``.
+
+        Args:
+            source: JSONL path
+            batch_size: Entries per write transaction
+
+        Returns:
+            Number of entries imported
+        """
+        count = 0
+        pending: Dict[str, List[float]] = {}
+        with open(source, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                pending[entry["key"]] = entry["vector"]
+                if len(pending) >= batch_size:
+                    self.set_many(pending)
+                    count += len(pending)
+                    pending = {}
+        self.set_many(pending)
+        return count + len(pending)
+
+    def close(self) -> None:
+        """Close the persistent store."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def warmup(
+    service: Any,
+    texts: Iterable[str],
+    batch_size: int = 256,
+) -> Dict[str, int]:
+    """
+    Pre-populate a service's cache by embedding texts in batches.
+
+    Args:
+        service: EmbeddingService configured with a cache
+        texts: Texts to embed (already-cached texts cost nothing)
+        batch_size: Texts per embed_batch call
+
+    Returns:
+        Counts of texts processed and newly embedded
+    """
+    cache = getattr(service, "cache", None)
+    if cache is None:
+        raise ValueError("warmup requires an EmbeddingService with a cache")
+
+    processed = 0
+    writes_before = cache.stats.writes
+    batch: List[str] = []
+    for text in texts:
+        batch.append(text)
+        if len(batch) >= batch_size:
+            service.embed_batch(batch)
+            processed += len(batch)
+            batch = []
+    if batch:
+        service.embed_batch(batch)
+        processed += len(batch)
+    return {"processed": processed, "embedded": cache.stats.writes - writes_before}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point for cache maintenance."""
+    parser = argparse.ArgumentParser(
+        prog="python -m shared.embedding.cache",
+        description="Inspect, export, import and warm the embedding cache",
+    )
+    parser.add_argument("--db", required=True, help="SQLite cache path")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("stats", help="Print cache statistics")
+
+    export_p = sub.add_parser("export", help="Export entries to JSONL")
+    export_p.add_argument("--output", required=True)
+
+    import_p = sub.add_parser("import", help="Import entries from JSONL")
+    import_p.add_argument("--input", required=True)
+
+    warm_p = sub.add_parser("warmup", help="Embed texts (one per line) into the cache")
+    warm_p.add_argument("--input", required=True, help="Text file, one text per line ('-' for stdin)")
+    warm_p.add_argument("--batch-size", type=int, default=256)
+    warm_p.add_argument("--provider", default=None, help="Force provider (openai, nomic, deterministic)")
+    warm_p.add_argument("--dimensions", type=int, default=None)
+
+    args = parser.parse_args(argv)
+    cache = EmbeddingCache(args.db)
+    try:
+        if args.command == "stats":
+            print(json.dumps(cache.get_stats(), indent=2))
+        elif args.command == "export":
+            print(f"Exported {cache.export_jsonl(args.output)} entries to {args.output}")
+        elif args.command == "import":
+            print(f"Imported {cache.import_jsonl(args.input)} entries from {args.input}")
+        elif args.command == "warmup":
+            from .service import EmbeddingService
+
+            kwargs: Dict[str, Any] = {"cache": cache, "forced_provider": args.provider}
+            if args.dimensions:
+                kwargs["dimensions"] = args.dimensions
+            service = EmbeddingService(**kwargs)
+            source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+            try:
+                texts = (line.rstrip("\n") for line in source if line.strip())
+                result = warmup(service, texts, batch_size=args.batch_size)
+            finally:
+                if source is not sys.stdin:
+                    source.close()
+            print(json.dumps({**result, **cache.stats.to_dict()}, indent=2))
+    finally:
+        cache.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
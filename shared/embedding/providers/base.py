@@ -3,14 +3,22 @@ Abstract base class for embedding providers.
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 
 
 class EmbeddingProvider(ABC):
     """Abstract base class for embedding providers.
     
     All embedding providers must implement this interface.
+
+    Providers with a native batch endpoint override ``embed_batch`` and
+    set ``MAX_BATCH_SIZE``/``MAX_BATCH_TOKENS`` to their request limits;
+    ``batch_chunks`` uses those limits to split large inputs.
     """
+
+    # Per-request limits for native batching (None = unbounded)
+    MAX_BATCH_SIZE: Optional[int] = None
+    MAX_BATCH_TOKENS: Optional[int] = None
     
     @abstractmethod
     def embed(self, text: str) -> List[float]:
@@ -79,6 +87,72 @@ class EmbeddingProvider(ABC):
             List of embedding vectors
         """
         return [self.embed(text) for text in texts]
+
+    def supports_native_batch(self) -> bool:
+        """Check whether ``embed_batch`` issues one request per chunk.
+
+        Returns:
+            True if the provider overrides the sequential default
+        """
+        return type(self).embed_batch is not EmbeddingProvider.embed_batch
+
+    def estimate_tokens(self, text: str) -> int:
+        """Estimate token count for request sizing.
+
+        Conservative heuristic (~3 characters per token) so chunks stay
+        under provider limits without a tokenizer dependency.
+
+        Args:
+            text: Text to estimate
+
+        Returns:
+            Estimated number of tokens (at least 1)
+        """
+        return len(text) // 3 + 1
+
+    def batch_chunks(self, texts: List[str]) -> List[List[int]]:
+        """Split texts into request-sized chunks of indices.
+
+        Chunks respect ``MAX_BATCH_SIZE`` and ``MAX_BATCH_TOKENS``. A
+        single text larger than the token budget gets a chunk of its own.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Lists of indices into ``texts``, in input order
+        """
+        max_size = self.MAX_BATCH_SIZE or len(texts) or 1
+        max_tokens = self.MAX_BATCH_TOKENS
+        chunks: List[List[int]] = []
+        current: List[int] = []
+        current_tokens = 0
+
+        for i, text in enumerate(texts):
+            tokens = self.estimate_tokens(text) if max_tokens else 0
+            if current and (
+                len(current) >= max_size
+                or (max_tokens and current_tokens + tokens > max_tokens)
+            ):
+                chunks.append(current)
+                current, current_tokens = [], 0
+            current.append(i)
+            current_tokens += tokens
+
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def estimate_batch_cost(self, texts: List[str]) -> float:
+        """Estimate API cost in USD for a batch.
+
+        Args:
+            texts: Texts to estimate cost for
+
+        Returns:
+            Summed estimated cost in USD
+        """
+        return sum(self.estimate_cost(text) for text in texts)
     
     def is_available(self) -> bool:
         """Check if provider is available and ready.
@@ -30,14 +30,24 @@ class DeterministicProvider(EmbeddingProvider):
     
     def embed(self, text: str) -> List[float]:
         """Generate deterministic embedding from text hash."""
-        h = hashlib.sha256(text.encode("utf-8")).hexdigest()
-        seed = int(h[:8], 16)
-        rng = np.random.default_rng(seed)
-        vec = rng.random(self._dimensions, dtype=np.float32)
-        norm = np.linalg.norm(vec)
-        if norm > 0:
-            vec = vec / norm
-        return vec.tolist()
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Generate deterministic embeddings as one matrix.
+
+        Rows are seeded per text exactly as ``embed`` does, then
+        normalized together so batch and single results are identical.
+        """
+        if not texts:
+            return []
+        matrix = np.empty((len(texts), self._dimensions), dtype=np.float32)
+        for row, text in enumerate(texts):
+            h = hashlib.sha256(text.encode("utf-8")).hexdigest()
+            rng = np.random.default_rng(int(h[:8], 16))
+            matrix[row] = rng.random(self._dimensions, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix.tolist()
     
     def get_dimensions(self) -> int:
         """Get embedding dimensions."""
@@ -1,6 +1,6 @@
 import os
 import logging
-from typing import List, Optional
+from typing import Any, List, Optional
 
 import requests
 
@@ -28,6 +28,10 @@ class NomicProvider(EmbeddingProvider):
     DEFAULT_API_BASE = "https://api.nomic.ai/v1"
     DEFAULT_MODEL = "nomic-embed-text-v1"
 
+    # Conservative per-request limits for the /embed endpoint
+    MAX_BATCH_SIZE = 256
+    MAX_BATCH_TOKENS = 64_000
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -43,6 +47,34 @@ class NomicProvider(EmbeddingProvider):
         self._dimensions = dimensions  # If None, will be inferred from first response
 
     def embed(self, text: str) -> List[float]:
+        data = self._post([text])
+        try:
+            embeddings = self._parse_embeddings(data)
+            if not embeddings:
+                raise EmbeddingProviderError(f"Nomic response missing embedding: {data}")
+            embedding = embeddings[0]
+            self._dimensions = len(embedding)
+            return embedding
+        except Exception as exc:
+            raise EmbeddingProviderError(f"Nomic parse failed: {exc}") from exc
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embed a chunk of texts with a single /embed request."""
+        if not texts:
+            return []
+        data = self._post(list(texts))
+        try:
+            embeddings = self._parse_embeddings(data)
+        except Exception as exc:
+            raise EmbeddingProviderError(f"Nomic parse failed: {exc}") from exc
+        if len(embeddings) != len(texts):
+            raise EmbeddingProviderError(
+                f"Nomic returned {len(embeddings)} embeddings for {len(texts)} inputs"
+            )
+        self._dimensions = len(embeddings[0])
+        return embeddings
+
+    def _post(self, inputs: List[str]) -> Any:
         url = f"{self._api_base.rstrip('/')}/embed"
         headers = {
             "Authorization": f"Bearer {self._api_key}",
@@ -50,7 +82,7 @@ class NomicProvider(EmbeddingProvider):
         }
         payload = {
             "model": self._model,
-            "input": [text],
+            "input": inputs,
         }
         try:
             resp = requests.post(url, headers=headers, json=payload, timeout=30)
@@ -78,29 +110,34 @@ class NomicProvider(EmbeddingProvider):
             raise EmbeddingProviderError(f"Nomic request failed: {exc}") from exc
 
         try:
-            data = resp.json()
-            # Accept shapes: {data:[{embedding:[]}]}, {embedding:[[]]}, {embedding:[]}
-            embedding: Optional[List[float]] = None
-            if isinstance(data, dict):
-                if "data" in data and isinstance(data["data"], list) and data["data"]:
-                    first = data["data"][0]
-                    if isinstance(first, dict):
-                        embedding = first.get("embedding") or first.get("vector")
-                if embedding is None:
-                    emb_field = data.get("embedding") or data.get("vector")
-                    if isinstance(emb_field, list):
-                        # Some responses may wrap embedding in a list of lists
-                        if emb_field and isinstance(emb_field[0], list):
-                            embedding = emb_field[0]
-                        else:
-                            embedding = emb_field
-            if not embedding or not isinstance(embedding, list):
-                raise EmbeddingProviderError(f"Nomic response missing embedding: {data}")
-            self._dimensions = len(embedding)
-            return embedding
+            return resp.json()
         except Exception as exc:
             raise EmbeddingProviderError(f"Nomic parse failed: {exc}") from exc
 
+    @staticmethod
+    def _parse_embeddings(data: Any) -> List[List[float]]:
+        # Accept shapes: {data:[{embedding:[]}, ...]}, {embeddings:[[]]}, {embedding:[[]]}, {embedding:[]}
+        if not isinstance(data, dict):
+            raise EmbeddingProviderError(f"Nomic response missing embedding: {data}")
+        if isinstance(data.get("data"), list) and data["data"]:
+            items = data["data"]
+            if all(isinstance(item, dict) and "index" in item for item in items):
+                items = sorted(items, key=lambda item: item["index"])
+            embeddings = [
+                item.get("embedding") or item.get("vector")
+                for item in items
+                if isinstance(item, dict)
+            ]
+        else:
+            field = data.get("embeddings") or data.get("embedding") or data.get("vector")
+            if not isinstance(field, list) or not field:
+                raise EmbeddingProviderError(f"Nomic response missing embedding: {data}")
+            # Some responses return a single flat vector
+            embeddings = field if isinstance(field[0], list) else [field]
+        if not embeddings or not all(isinstance(emb, list) and emb for emb in embeddings):
+            raise EmbeddingProviderError(f"Nomic response missing embedding: {data}")
+        return embeddings
+
     def get_dimensions(self) -> int:
         if self._dimensions:
             return self._dimensions
@@ -38,6 +38,10 @@ class OpenAIProvider(EmbeddingProvider):
     
     # Cost estimates (per 1K tokens)
     COST_PER_1K_TOKENS = 0.00013  # USD
+
+    # Embeddings endpoint limits: 2048 inputs and 300K tokens per request
+    MAX_BATCH_SIZE = 2048
+    MAX_BATCH_TOKENS = 300_000
     
     def __init__(
         self,
@@ -91,6 +95,34 @@ class OpenAIProvider(EmbeddingProvider):
             error_class = self._classify_error(exc)
             logger.warning(f"OpenAI embedding failed ({error_class}): {exc}")
             raise error_class(f"OpenAI embedding failed: {exc}") from exc
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Generate embeddings for a chunk of texts in one API request.
+
+        Callers are expected to keep chunks within ``MAX_BATCH_SIZE`` and
+        ``MAX_BATCH_TOKENS`` (see ``batch_chunks``).
+        """
+        if not texts:
+            return []
+        try:
+            resp = self._client.embeddings.create(
+                model=self._model,
+                input=list(texts),
+                dimensions=self._dimensions
+            )
+            # Results carry their input index; don't rely on response order
+            items = sorted(resp.data, key=lambda item: item.index)
+            embeddings = [item.embedding for item in items]
+        except Exception as exc:
+            error_class = self._classify_error(exc)
+            logger.warning(f"OpenAI batch embedding failed ({error_class}): {exc}")
+            raise error_class(f"OpenAI batch embedding failed: {exc}") from exc
+
+        if len(embeddings) != len(texts):
+            raise EmbeddingProviderError(
+                f"OpenAI returned {len(embeddings)} embeddings for {len(texts)} inputs"
+            )
+        return embeddings
     
     def _classify_error(self, exc: Exception) -> type[EmbeddingProviderError]:
         """Classify exception type."""
@@ -17,7 +17,8 @@ import logging
 import os
 import sys
 import time
-from typing import List, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Tuple
 
 # Import Result types from api_core
 # Handle potential circular imports gracefully
@@ -39,6 +40,7 @@ except ImportError:
     Success = Any  # type: ignore
     Failure = Any  # type: ignore
 
+from .cache import EmbeddingCache, cache_key
 from .exceptions import (
     EmbeddingError,
     EmbeddingProviderError,
@@ -53,6 +55,11 @@ from .telemetry import EmbeddingTelemetry
 logger = logging.getLogger(__name__)
 
 
+def _uniform_dimensions(vectors: List[Optional[List[float]]]) -> bool:
+    """True if every present vector has the same length."""
+    return len({len(vector) for vector in vectors if vector is not None}) <= 1
+
+
 class EmbeddingService:
     """
     Embedding service with provider abstraction, telemetry, and enhanced logging.
@@ -64,6 +71,8 @@ class EmbeddingService:
     - Structured logging with error classification
     - Dimension validation
     - Cost estimation
+    - Native, concurrent batch requests with per-item fallback
+    - Optional two-tier content-addressed cache (memory LRU + SQLite)
 
     Provider priority (OpenAI-first):
     1. OpenAI (primary)
@@ -79,6 +88,8 @@ class EmbeddingService:
         fallback_dimensions: int = 768,
         telemetry: Optional[EmbeddingTelemetry] = None,
         forced_provider: Optional[str] = None,
+        batch_concurrency: Optional[int] = None,
+        cache: Optional[EmbeddingCache] = None,
     ):
         """
         Initialize embedding service.
@@ -90,12 +101,22 @@ class EmbeddingService:
             fallback_dimensions: Nomic fallback dimensions
             telemetry: Optional telemetry adapter for tracking
             forced_provider: Force provider ("openai", "nomic", "deterministic")
+            batch_concurrency: Max concurrent provider requests in embed_batch
+                (defaults to EMBEDDING_BATCH_CONCURRENCY or 4)
+            cache: Optional embedding cache (defaults to a persistent cache at
+                EMBEDDING_CACHE_PATH when that variable is set)
         """
         self.model = model
         self.dimensions = dimensions
         self.fallback_model = fallback_model
         self.fallback_dimensions = fallback_dimensions
         self._telemetry = telemetry
+        self.batch_concurrency = max(
+            1, batch_concurrency or int(os.getenv("EMBEDDING_BATCH_CONCURRENCY", "4"))
+        )
+        if cache is None and os.getenv("EMBEDDING_CACHE_PATH"):
+            cache = EmbeddingCache(os.getenv("EMBEDDING_CACHE_PATH"))
+        self._cache = cache
 
         # Provider instances (initialized for fallback support)
         self._openai_provider: Optional[OpenAIProvider] = None
@@ -224,10 +245,14 @@ class EmbeddingService:
             "or force EMBEDDING_PROVIDER=deterministic for tests."
         )
 
-    def embed(self, text: str) -> List[float]:
+    def embed(self, text: str, use_cache: bool = True) -> List[float]:
         """
         Generate embedding for text with telemetry and logging.
 
+        Cached vectors are returned without a provider call. Only vectors
+        from the primary provider are cached, so fallback output never
+        masquerades as primary output.
+
         Provider fallback order:
         1. Primary provider (OpenAI/Nomic/Deterministic)
         2. Fallback providers (in order)
@@ -235,6 +260,7 @@ class EmbeddingService:
 
         Args:
             text: Text to embed
+            use_cache: Consult and populate the cache (if configured)
 
         Returns:
             Embedding vector as list of floats
@@ -245,6 +271,13 @@ class EmbeddingService:
         """
         # Build log context (lightweight hash on truncated text)
         log_context = self._build_log_context(text)
+        key = self._cache_key(text) if use_cache and self._cache is not None else None
+        if key is not None:
+            cached = self._cache_lookup([key]).get(key)
+            if cached is not None:
+                logger.debug("Embedding served from cache", extra=log_context)
+                return cached
+
         logger.debug("Generating embedding", extra=log_context)
 
         start_time = time.perf_counter()
@@ -292,6 +325,9 @@ class EmbeddingService:
                     cost=cost,
                 )
 
+            if key is not None:
+                self._cache_store({key: embedding})
+
             return embedding
 
         except Exception as exc:
@@ -522,21 +558,305 @@ class EmbeddingService:
                     model=model_name,
                 )
 
-    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+    def embed_batch(
+        self,
+        texts: List[str],
+        max_concurrency: Optional[int] = None,
+        use_cache: bool = True,
+    ) -> List[List[float]]:
         """Generate embeddings for multiple texts.
 
+        Cached texts are served from the cache and duplicate texts are
+        embedded once. The rest are split into request-sized chunks (by
+        item count and estimated tokens) and sent through the primary
+        provider's native batch endpoint, several chunks at a time. Only
+        texts whose chunk failed, or whose embedding failed validation,
+        are retried on the fallback providers. A fallback whose vectors
+        differ in size from those already produced re-embeds the whole
+        batch, so one call never returns vectors of mixed dimensions.
+
         Args:
             texts: List of texts to embed
+            max_concurrency: Max concurrent provider requests
+                (defaults to batch_concurrency)
+            use_cache: Consult and populate the cache (if configured)
 
         Returns:
-            List of embedding vectors
+            List of embedding vectors, in input order
+
+        Raises:
+            EmbeddingError: If some texts failed on every provider
         """
-        # Use provider's batch method if available, otherwise sequential
-        if self._primary_provider:
-            return self._primary_provider.embed_batch(texts)
+        texts = list(texts)
+        if not texts:
+            return []
+
+        if not use_cache or self._cache is None:
+            results, _ = self._embed_batch_uncached(texts, max_concurrency)
+            return results
+
+        keys = [self._cache_key(text) for text in texts]
+        vectors = self._cache_lookup(keys)
+        hits = len(vectors)
+
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in vectors:
+                missing.setdefault(key, text)
+
+        if missing:
+            missing_keys = list(missing)
+            computed, primary_indices = self._embed_batch_uncached(
+                list(missing.values()), max_concurrency
+            )
+            vectors.update(zip(missing_keys, computed))
+            self._cache_store({missing_keys[i]: computed[i] for i in primary_indices})
+
+        logger.debug(
+            f"Embedded {len(texts)} texts (cached: {hits}, computed: {len(missing)})",
+            extra={"provider": self._primary_provider.get_provider_name(), "batch_size": len(texts)},
+        )
+        return [vectors[key] for key in keys]
+
+    def _embed_batch_uncached(
+        self,
+        texts: List[str],
+        max_concurrency: Optional[int] = None,
+    ) -> Tuple[List[List[float]], List[int]]:
+        """Embed texts through the providers.
+
+        Returns:
+            (vectors in input order, indices served by the primary provider)
+        """
+        workers = max(1, max_concurrency or self.batch_concurrency)
+        start_time = time.perf_counter()
+        primary = self._primary_provider
+        provider_name = primary.get_provider_name()
+        model_name = primary.get_model_name()
+        log_context = {
+            "provider": provider_name,
+            "model": model_name,
+            "dimensions": self.dimensions,
+            "batch_size": len(texts),
+        }
+
+        results: List[Optional[List[float]]] = [None] * len(texts)
+        served: List[Tuple[EmbeddingProvider, List[int]]] = []
+
+        remaining, chunk_count, last_error = self._embed_indices(
+            primary, texts, list(range(len(texts))), results, workers, log_context, self.dimensions
+        )
+        primary_indices = [i for i in range(len(texts)) if results[i] is not None]
+        served.append((primary, primary_indices))
+
+        fallback_count = 0
+        if remaining:
+            logger.warning(
+                f"Primary provider ({provider_name}) failed for {len(remaining)} of "
+                f"{len(texts)} texts, trying fallbacks",
+                extra={**log_context, "failed_count": len(remaining), "error": str(last_error)},
+            )
+        for fallback in self._fallback_providers:
+            if not remaining:
+                break
+            pending = remaining
+            attempt = list(results)
+            missed, _, error = self._embed_indices(
+                fallback, texts, pending, attempt, workers, log_context, fallback.get_dimensions()
+            )
+            last_error = error or last_error
+            if not _uniform_dimensions(attempt):
+                # Vectors of different sizes cannot share one result; re-embed
+                # the whole batch on this provider instead of mixing them
+                logger.warning(
+                    f"Fallback provider ({fallback.get_provider_name()}) returned vectors of a "
+                    f"different size; re-embedding all {len(texts)} texts with it",
+                    extra=log_context,
+                )
+                pending = list(range(len(texts)))
+                attempt = [None] * len(texts)
+                missed, _, error = self._embed_indices(
+                    fallback, texts, pending, attempt, workers, log_context, fallback.get_dimensions()
+                )
+                if missed or not _uniform_dimensions(attempt):
+                    last_error = error or EmbeddingProviderError(
+                        f"{fallback.get_provider_name()} returned vectors of mixed dimensions"
+                    )
+                    continue
+                primary_indices = []
+            results, remaining = attempt, missed
+            recovered = [i for i in pending if results[i] is not None]
+            fallback_count += len(recovered)
+            served.append((fallback, recovered))
+
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        text_length = sum(len(text) for text in texts)
+
+        if remaining:
+            logger.error(
+                f"All embedding providers failed for {len(remaining)} of {len(texts)} texts",
+                extra={**log_context, "latency_ms": elapsed_ms, "failed_count": len(remaining)},
+            )
+            if self._telemetry:
+                self._telemetry.record_error(
+                    provider=provider_name,
+                    model=model_name,
+                    error_type=self._classify_error(last_error).__name__ if last_error else "unknown",
+                    latency_ms=elapsed_ms,
+                    text_length=text_length,
+                    error_message=str(last_error) if last_error else "All providers failed",
+                )
+            raise EmbeddingError(
+                f"All embedding providers failed for {len(remaining)} of {len(texts)} texts. "
+                f"Last error: {last_error}"
+            ) from last_error
+
+        logger.info(
+            f"Batch of {len(texts)} embeddings generated in {elapsed_ms:.2f}ms "
+            f"({chunk_count} requests, {fallback_count} via fallback)",
+            extra={**log_context, "latency_ms": elapsed_ms, "chunk_count": chunk_count},
+        )
+
+        if self._telemetry:
+            cost = sum(
+                provider.estimate_batch_cost([texts[i] for i in indices])
+                for provider, indices in served
+                if indices
+            )
+            self._telemetry.record_batch(
+                provider=provider_name,
+                model=model_name,
+                dimensions=len(results[0]),
+                latency_ms=elapsed_ms,
+                batch_size=len(texts),
+                chunk_count=chunk_count,
+                text_length=text_length,
+                cost=cost,
+                fallback_count=fallback_count,
+            )
+
+        return results, primary_indices  # type: ignore[return-value]
+
+    def _embed_indices(
+        self,
+        provider: EmbeddingProvider,
+        texts: List[str],
+        indices: List[int],
+        results: List[Optional[List[float]]],
+        workers: int,
+        log_context: Dict[str, Any],
+        expected_dims: int,
+    ) -> Tuple[List[int], int, Optional[Exception]]:
+        """Embed texts[indices] with one provider, filling ``results`` in place.
+
+        Embeddings are validated against expected_dims, the size the
+        provider is configured to return.
+
+        Returns:
+            (indices still missing, number of provider requests, last error)
+        """
+        native = provider.supports_native_batch()
+        subset = [texts[i] for i in indices]
+        if native:
+            chunks = [[indices[j] for j in chunk] for chunk in provider.batch_chunks(subset)]
+        else:
+            # Sequential providers: one text per request isolates failures
+            chunks = [[i] for i in indices]
+
+        def run(chunk: List[int]) -> Tuple[Optional[List[List[float]]], Optional[Exception]]:
+            try:
+                if not native:
+                    return [provider.embed(texts[chunk[0]])], None
+                embeddings = provider.embed_batch([texts[i] for i in chunk])
+                if len(embeddings) != len(chunk):
+                    raise EmbeddingProviderError(
+                        f"{provider.get_provider_name()} returned {len(embeddings)} "
+                        f"embeddings for {len(chunk)} inputs"
+                    )
+                return embeddings, None
+            except Exception as exc:
+                return None, exc
+
+        workers = min(workers, len(chunks))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="embed-batch") as pool:
+                outcomes = list(pool.map(run, chunks))
+        else:
+            outcomes = [run(chunk) for chunk in chunks]
+
+        failed: List[int] = []
+        last_error: Optional[Exception] = None
+        for chunk, (embeddings, error) in zip(chunks, outcomes):
+            if error is not None:
+                last_error = error
+                failed.extend(chunk)
+                logger.warning(
+                    f"Provider ({provider.get_provider_name()}) batch request failed: "
+                    f"{self._classify_error(error).__name__}",
+                    extra={**log_context, "chunk_size": len(chunk), "error": str(error)},
+                )
+                continue
+            for index, embedding in zip(chunk, embeddings):
+                try:
+                    if self._allow_dimension_coercion:
+                        embedding = self._coerce_dimensions(
+                            embedding,
+                            expected_dims=self.dimensions,
+                            provider_name=provider.get_provider_name(),
+                            model_name=provider.get_model_name(),
+                            log_context=log_context,
+                        )
+                    if not embedding:
+                        raise EmbeddingProviderError("Provider returned an empty embedding")
+                    self._validate_dimensions(
+                        embedding,
+                        log_context,
+                        expected=self.dimensions if self._allow_dimension_coercion else expected_dims,
+                    )
+                    results[index] = embedding
+                except Exception as exc:
+                    last_error = exc
+                    failed.append(index)
+
+        return sorted(failed), len(chunks), last_error
+
+    # =========================================================================
+    # Cache
+    # =========================================================================
+
+    @property
+    def cache(self) -> Optional[EmbeddingCache]:
+        """The configured embedding cache, if any."""
+        return self._cache
+
+    def _cache_key(self, text: str) -> str:
+        return cache_key(
+            self._primary_provider.get_provider_name(),
+            self._primary_provider.get_model_name(),
+            self.dimensions,
+            text,
+        )
+
+    def _cache_lookup(self, keys: List[str]) -> Dict[str, List[float]]:
+        """Look up keys, treating cache failures as misses."""
+        try:
+            return self._cache.get_many(keys)
+        except Exception as exc:
+            logger.warning(f"Embedding cache lookup failed: {exc}")
+            return {}
+
+    def _cache_store(self, vectors: Dict[str, List[float]]) -> None:
+        """Store vectors, logging (not raising) cache failures."""
+        try:
+            self._cache.set_many(vectors)
+        except Exception as exc:
+            logger.warning(f"Embedding cache write failed: {exc}")
 
-        # Fallback to sequential
-        return [self.embed(text) for text in texts]
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Return cache statistics ({"enabled": False} without a cache)."""
+        if self._cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self._cache.get_stats()}
 
     def get_provider_info(self) -> Dict[str, Any]:
         """Return information about the current embedding provider and fallbacks."""
@@ -581,7 +901,9 @@ class EmbeddingService:
     # Result-returning Methods (Safe API)
     # =========================================================================
 
-    def embed_safe(self, text: str) -> 'Result[List[float], APIError]':
+    def embed_safe(
+        self, text: str, use_cache: bool = True
+    ) -> 'Result[List[float], APIError]':
         """
         Generate embedding for text with Result-based error handling.
 
@@ -590,6 +912,7 @@ class EmbeddingService:
 
         Args:
             text: Text to embed
+            use_cache: Consult and populate the cache (if configured)
 
         Returns:
             Success with embedding vector, or Failure with APIError
@@ -609,7 +932,7 @@ class EmbeddingService:
             )
 
         try:
-            embedding = self.embed(text)
+            embedding = self.embed(text, use_cache=use_cache)
             return success(embedding)
         except EmbeddingDimensionMismatchError as e:
             return service_failure(
@@ -631,13 +954,14 @@ class EmbeddingService:
             )
 
     def embed_batch_safe(
-        self, texts: List[str]
+        self, texts: List[str], use_cache: bool = True
     ) -> 'Result[List[List[float]], APIError]':
         """
         Generate embeddings for multiple texts with Result-based error handling.
 
         Args:
             texts: List of texts to embed
+            use_cache: Consult and populate the cache (if configured)
 
         Returns:
             Success with list of embedding vectors, or Failure with APIError
@@ -654,7 +978,7 @@ class EmbeddingService:
             )
 
         try:
-            embeddings = self.embed_batch(texts)
+            embeddings = self.embed_batch(texts, use_cache=use_cache)
             return success(embeddings)
         except EmbeddingDimensionMismatchError as e:
             return service_failure(
@@ -159,6 +159,71 @@ class EmbeddingTelemetry:
             except Exception as e:
                 logger.debug(f"Failed to record telemetry: {e}")
     
+    def record_batch(
+        self,
+        provider: str,
+        model: str,
+        dimensions: int,
+        latency_ms: float,
+        batch_size: int,
+        chunk_count: int,
+        text_length: int,
+        cost: float,
+        fallback_count: int = 0,
+    ):
+        """Record a completed batch embedding call.
+        
+        Args:
+            provider: Primary provider name
+            model: Primary model name
+            dimensions: Embedding dimensions
+            latency_ms: Wall-clock latency for the whole batch
+            batch_size: Number of texts embedded
+            chunk_count: Number of provider requests issued
+            text_length: Total text length in characters
+            cost: Estimated cost in USD for the whole batch
+            fallback_count: Texts served by fallback providers
+        """
+        data = {
+            "provider": provider,
+            "model": model,
+            "dimensions": dimensions,
+            "latency_ms": latency_ms,
+            "batch_size": batch_size,
+            "chunk_count": chunk_count,
+            "text_length": text_length,
+            "cost": cost,
+            "fallback_count": fallback_count,
+        }
+
+        # Emit to SkillBuilder JSONL format
+        if self._writer:
+            try:
+                from skill_builder.pipeline.models import TelemetryEvent
+                
+                self._writer.emit(TelemetryEvent(
+                    event_type="embedding.batch",
+                    data=data,
+                ))
+            except Exception as e:
+                logger.debug(f"Failed to emit telemetry to writer: {e}")
+        
+        # Emit to KnowledgeBuilder SQLite format
+        if self._recorder:
+            try:
+                from src.utils.telemetry import ToolCall
+                
+                self._recorder.record(ToolCall(
+                    tool="embedding.batch",
+                    cost=cost,
+                    latency_ms=latency_ms,
+                    success=True,
+                    new_facts=0,
+                    meta={k: v for k, v in data.items() if k not in ("cost", "latency_ms")},
+                ))
+            except Exception as e:
+                logger.debug(f"Failed to record telemetry: {e}")
+    
     def record_dimension_mismatch(
         self,
         provider: str,
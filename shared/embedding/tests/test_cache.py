@@ -0,0 +1,113 @@
+"""
+Tests for the two-tier embedding cache.
+"""
+import time
+
+import pytest
+
+from shared.embedding.cache import EmbeddingCache, cache_key
+
+
+class TestCacheKey:
+    """Test content-addressed keys."""
+
+    def test_key_includes_provider_model_and_dimensions(self):
+        """Test that the same text keys differently per provider/model/dimensions."""
+        base = cache_key("openai", "text-embedding-3-large", 3072, "hello")
+        assert base == cache_key("openai", "text-embedding-3-large", 3072, "hello")
+        assert base != cache_key("nomic", "text-embedding-3-large", 3072, "hello")
+        assert base != cache_key("openai", "text-embedding-3-small", 3072, "hello")
+        assert base != cache_key("openai", "text-embedding-3-large", 1024, "hello")
+
+
+class TestMemoryTier:
+    """Test the in-process LRU tier."""
+
+    def test_get_many_returns_hits_only(self):
+        """Test batched lookup with hits and misses."""
+        cache = EmbeddingCache()
+        cache.set_many({"p/m/2/a": [1.0, 0.0], "p/m/2/b": [0.0, 1.0]})
+
+        found = cache.get_many(["p/m/2/a", "p/m/2/c"])
+
+        assert found == {"p/m/2/a": [1.0, 0.0]}
+        assert cache.stats.memory_hits == 1
+        assert cache.stats.misses == 1
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted."""
+        cache = EmbeddingCache(max_memory_entries=2)
+        cache.set("p/m/1/a", [1.0])
+        cache.set("p/m/1/b", [2.0])
+        cache.get("p/m/1/a")  # a is now most recent
+        cache.set("p/m/1/c", [3.0])
+
+        assert cache.get("p/m/1/b") is None
+        assert cache.get("p/m/1/a") == [1.0]
+        assert cache.stats.memory_evictions == 1
+
+    def test_returned_vectors_are_copies(self):
+        """Test that mutating a returned vector does not corrupt the cache."""
+        cache = EmbeddingCache()
+        cache.set("p/m/1/a", [1.0])
+        cache.get("p/m/1/a").append(99.0)
+        assert cache.get("p/m/1/a") == [1.0]
+
+
+class TestPersistentTier:
+    """Test the SQLite tier."""
+
+    def test_survives_reopen(self, tmp_path):
+        """Test that vectors persist across cache instances."""
+        path = tmp_path / "embeddings.db"
+        cache = EmbeddingCache(path)
+        cache.set("openai/text-embedding-3-large/2/abc", [0.5, 0.25])
+        cache.close()
+
+        reopened = EmbeddingCache(path)
+        assert reopened.get("openai/text-embedding-3-large/2/abc") == [0.5, 0.25]
+        assert reopened.stats.persistent_hits == 1
+        reopened.close()
+
+    def test_model_names_with_slashes(self, tmp_path):
+        """Test that model names containing '/' round-trip through stats."""
+        cache = EmbeddingCache(tmp_path / "embeddings.db")
+        cache.set(cache_key("nomic", "nomic-ai/nomic-embed-text-v1", 2, "x"), [1.0, 0.0])
+        assert cache.get_stats()["models"] == {"nomic/nomic-ai/nomic-embed-text-v1/2": 1}
+        cache.close()
+
+    def test_persistent_eviction(self, tmp_path):
+        """Test that the persistent bound evicts least recently used entries."""
+        cache = EmbeddingCache(tmp_path / "embeddings.db", max_memory_entries=0, max_persistent_entries=3)
+        for i in range(5):
+            cache.set(f"p/m/1/{i}", [float(i)])
+
+        assert cache.get_stats()["persistent_entries"] <= 3
+        assert cache.get("p/m/1/4") == [4.0]
+        assert cache.get("p/m/1/0") is None
+        cache.close()
+
+    def test_ttl_expiry(self, tmp_path):
+        """Test that expired persistent entries are treated as misses."""
+        cache = EmbeddingCache(tmp_path / "embeddings.db", max_memory_entries=0, ttl_seconds=0.01)
+        cache.set("p/m/1/a", [1.0])
+        time.sleep(0.05)
+        assert cache.get("p/m/1/a") is None
+        cache.close()
+
+    def test_export_import_roundtrip(self, tmp_path):
+        """Test JSONL export and import."""
+        source = EmbeddingCache(tmp_path / "a.db")
+        source.set_many({"p/m/2/a": [1.0, 0.0], "p/m/2/b": [0.0, 1.0]})
+        assert source.export_jsonl(tmp_path / "vectors.jsonl") == 2
+        source.close()
+
+        target = EmbeddingCache(tmp_path / "b.db")
+        assert target.import_jsonl(tmp_path / "vectors.jsonl") == 2
+        assert target.get("p/m/2/b") == [0.0, 1.0]
+        target.close()
+
+    def test_invalid_bounds(self):
+        """Test that non-positive bounds are rejected."""
+        with pytest.raises(ValueError):
+            EmbeddingCache(max_persistent_entries=0)
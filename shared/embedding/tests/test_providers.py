@@ -70,6 +70,12 @@ class TestDeterministicProvider:
         assert len(embeddings) == 3
         assert all(len(emb) == 10 for emb in embeddings)
 
+    def test_embed_batch_matches_single(self):
+        """Test that the batch path reproduces single embeddings exactly."""
+        provider = DeterministicProvider(dimensions=10)
+        texts = ["alpha", "beta", ""]
+        assert provider.embed_batch(texts) == [provider.embed(t) for t in texts]
+
 
 class TestOpenAIProvider:
     """Test OpenAI provider."""
@@ -112,6 +118,26 @@ class TestOpenAIProvider:
             assert len(embedding) == 3072
             mock_client.embeddings.create.assert_called_once()
 
+    @patch('shared.embedding.providers.openai._OPENAI_AVAILABLE', True)
+    @patch('shared.embedding.providers.openai.OpenAI')
+    def test_openai_embed_batch_single_request(self, mock_openai_class):
+        """Test that a batch is sent as one request and reordered by index."""
+        mock_client = Mock()
+        mock_response = Mock()
+        mock_response.data = [
+            Mock(index=1, embedding=[0.2] * 8),
+            Mock(index=0, embedding=[0.1] * 8),
+        ]
+        mock_client.embeddings.create.return_value = mock_response
+        mock_openai_class.return_value = mock_client
+
+        provider = OpenAIProvider(api_key="test-key", dimensions=8)
+        embeddings = provider.embed_batch(["first", "second"])
+
+        assert embeddings == [[0.1] * 8, [0.2] * 8]
+        mock_client.embeddings.create.assert_called_once()
+        assert mock_client.embeddings.create.call_args[1]["input"] == ["first", "second"]
+
     def test_openai_not_available_raises_error(self):
         """Test that missing OpenAI SDK raises error."""
         with patch('shared.embedding.providers.openai._OPENAI_AVAILABLE', False):
@@ -127,3 +153,23 @@ class TestOpenAIProvider:
                     provider = OpenAIProvider(api_key="test-key")
                     cost = provider.estimate_cost("test text with multiple words")
                     assert cost >= 0.0
+
+
+class TestBatchChunking:
+    """Test token-aware batch chunking."""
+
+    def test_chunks_respect_size_and_tokens(self):
+        """Test that chunks stay within item and token limits."""
+        provider = DeterministicProvider(dimensions=4)
+        provider.MAX_BATCH_SIZE = 2
+        provider.MAX_BATCH_TOKENS = 10
+        texts = ["a", "b", "c", "x" * 60, "d"]
+
+        chunks = provider.batch_chunks(texts)
+
+        assert chunks == [[0, 1], [2], [3], [4]]
+        assert sorted(i for chunk in chunks for i in chunk) == list(range(len(texts)))
+
+    def test_native_batch_detection(self):
+        """Test that overriding embed_batch marks a provider as native."""
+        assert DeterministicProvider().supports_native_batch()
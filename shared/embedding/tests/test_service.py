@@ -8,7 +8,7 @@ import os
 import pytest
 from unittest.mock import Mock, patch
 
-from shared.embedding import EmbeddingService, EmbeddingTelemetry
+from shared.embedding import EmbeddingCache, EmbeddingService, EmbeddingTelemetry
 from shared.embedding.exceptions import EmbeddingError, EmbeddingDimensionMismatchError
 from shared.embedding.providers.deterministic import DeterministicProvider
 
@@ -197,3 +197,163 @@ class TestEmbeddingServiceProviderInfo:
             service = EmbeddingService()
             cost = service.estimate_cost("test text")
             assert cost == 0.0  # Deterministic is free
+
+
+class TestEmbeddingServiceBatch:
+    """Test native batch embedding with per-item fallback."""
+
+    def _failing_chunk_provider(self, bad_text):
+        """Deterministic provider whose batch requests fail if they contain bad_text."""
+        provider = DeterministicProvider(dimensions=10)
+        provider.MAX_BATCH_SIZE = 2
+        original = provider.embed_batch
+
+        def embed_batch(texts):
+            if bad_text in texts:
+                raise Exception("429 rate limit")
+            return original(texts)
+
+        provider.embed_batch = embed_batch
+        return provider
+
+    def test_embed_batch_preserves_order_across_chunks(self):
+        """Test that chunked, concurrent batches keep input order."""
+        service = EmbeddingService(dimensions=10, forced_provider="deterministic")
+        service._primary_provider.MAX_BATCH_SIZE = 3
+        texts = [f"text {i}" for i in range(10)]
+
+        embeddings = service.embed_batch(texts, max_concurrency=4)
+
+        assert embeddings == [service.embed(t) for t in texts]
+
+    def test_embed_batch_falls_back_for_failed_subset_only(self):
+        """Test that only texts from failed chunks go to fallback providers."""
+        service = EmbeddingService(dimensions=10, forced_provider="deterministic")
+        service._primary_provider = self._failing_chunk_provider("bad")
+        fallback = Mock(spec=DeterministicProvider)
+        fallback.supports_native_batch.return_value = True
+        fallback.batch_chunks.side_effect = lambda texts: [list(range(len(texts)))]
+        fallback.embed_batch.side_effect = lambda texts: [[0.5] * 10 for _ in texts]
+        fallback.estimate_batch_cost.return_value = 0.0
+        service._fallback_providers = [fallback]
+
+        embeddings = service.embed_batch(["a", "b", "c", "bad", "d"])
+
+        fallback.embed_batch.assert_called_once_with(["c", "bad"])
+        assert embeddings[2] == embeddings[3] == [0.5] * 10
+        assert embeddings[0] == DeterministicProvider(dimensions=10).embed("a")
+
+    def test_embed_batch_raises_when_all_providers_fail(self):
+        """Test that texts failing on every provider raise EmbeddingError."""
+        service = EmbeddingService(dimensions=10, forced_provider="deterministic")
+        service._primary_provider = self._failing_chunk_provider("bad")
+        service._fallback_providers = []
+
+        with pytest.raises(EmbeddingError, match="1 of 3 texts"):
+            service.embed_batch(["a", "b", "bad"])
+
+    def test_embed_batch_never_mixes_dimensions(self):
+        """Test that a fallback of another size re-embeds the whole batch and is not cached."""
+        cache = EmbeddingCache()
+        service = EmbeddingService(dimensions=10, forced_provider="deterministic", cache=cache)
+        service._primary_provider = self._failing_chunk_provider("bad")
+        fallback = DeterministicProvider(dimensions=6)
+        service._fallback_providers = [fallback]
+        texts = ["a", "b", "c", "bad", "d"]
+
+        embeddings = service.embed_batch(texts)
+
+        assert embeddings == [fallback.embed(t) for t in texts]
+        assert cache.stats.writes == 0
+
+    def test_embed_batch_rejects_fallback_that_cannot_cover_batch(self):
+        """Test that a differently sized fallback failing part of the rerun is skipped."""
+        service = EmbeddingService(dimensions=10, forced_provider="deterministic")
+        service._primary_provider = self._failing_chunk_provider("bad")
+        fallback = DeterministicProvider(dimensions=6)
+        original = fallback.embed_batch
+
+        def embed_batch(texts):
+            if "a" in texts:
+                raise Exception("503 service unavailable")
+            return original(texts)
+
+        fallback.embed_batch = embed_batch
+        service._fallback_providers = [fallback]
+
+        with pytest.raises(EmbeddingError, match="1 of 3 texts"):
+            service.embed_batch(["a", "b", "bad"])
+
+    def test_embed_batch_validates_fallback_output(self, monkeypatch):
+        """Test that fallback vectors of the wrong size fail in strict mode."""
+        monkeypatch.setenv("EMBEDDING_STRICT_DIMENSIONS", "true")
+        service = EmbeddingService(dimensions=10, forced_provider="deterministic")
+        service._primary_provider = self._failing_chunk_provider("bad")
+        fallback = DeterministicProvider(dimensions=10)
+        fallback.embed_batch = lambda texts: [[0.5] * 7 for _ in texts]
+        service._fallback_providers = [fallback]
+
+        with pytest.raises(EmbeddingError, match="1 of 3 texts"):
+            service.embed_batch(["a", "b", "bad"])
+
+    def test_embed_batch_records_batch_telemetry(self):
+        """Test that telemetry records one batch-level event."""
+        mock_telemetry = Mock(spec=EmbeddingTelemetry)
+        service = EmbeddingService(
+            dimensions=10, forced_provider="deterministic", telemetry=mock_telemetry
+        )
+
+        service.embed_batch(["one", "two", "three"])
+
+        mock_telemetry.record_batch.assert_called_once()
+        call_args = mock_telemetry.record_batch.call_args[1]
+        assert call_args["batch_size"] == 3
+        assert call_args["fallback_count"] == 0
+        assert "latency_ms" in call_args and "cost" in call_args
+        assert not mock_telemetry.record_success.called
+
+
+class TestEmbeddingServiceCache:
+    """Test cache integration."""
+
+    def test_embed_uses_cache(self):
+        """Test that repeated texts are served from the cache."""
+        service = EmbeddingService(
+            dimensions=10, forced_provider="deterministic", cache=EmbeddingCache()
+        )
+        first = service.embed("repeated")
+        service._primary_provider.embed = Mock(side_effect=Exception("should not be called"))
+
+        assert service.embed("repeated") == first
+        assert service.get_cache_stats()["memory_hits"] == 1
+
+    def test_embed_batch_only_embeds_missing_unique_texts(self):
+        """Test that batch calls skip cached and duplicate texts."""
+        service = EmbeddingService(
+            dimensions=10, forced_provider="deterministic", cache=EmbeddingCache()
+        )
+        service.embed("a")
+        provider = service._primary_provider
+        original = provider.embed_batch
+        provider.embed_batch = Mock(side_effect=original)
+
+        embeddings = service.embed_batch(["a", "b", "b", "c"])
+
+        provider.embed_batch.assert_called_once_with(["b", "c"])
+        assert embeddings[1] == embeddings[2]
+        assert embeddings[0] == service.embed("a")
+
+    def test_use_cache_false_bypasses_cache(self):
+        """Test that use_cache=False neither reads nor writes the cache."""
+        cache = EmbeddingCache()
+        service = EmbeddingService(dimensions=10, forced_provider="deterministic", cache=cache)
+
+        service.embed_batch(["a", "b"], use_cache=False)
+
+        assert cache.stats.writes == 0
+        assert service.get_cache_stats()["memory_entries"] == 0
+
+    def test_cache_stats_disabled(self):
+        """Test stats without a cache."""
+        service = EmbeddingService(dimensions=10, forced_provider="deterministic")
+        assert service.get_cache_stats() == {"enabled": False}
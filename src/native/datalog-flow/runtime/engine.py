@@ -3,15 +3,22 @@ Chrysalis Datalog Flow Engine
 
 Python runtime for executing Datalog-specified flow graphs.
 Provides integration between Soufflé and the Universal Adapter.
+
+Small fact sets (and every query when Soufflé is not installed) are
+answered by FlowEvaluator, an indexed in-process evaluator of flow.dl.
+Query results are cached by graph version and execution-state facts so
+unchanged flows are never re-evaluated.
 """
 
 import subprocess
 import tempfile
 import os
 import json
+from collections import OrderedDict, defaultdict
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 from enum import Enum
 
 
@@ -25,7 +32,7 @@ class NodeType(Enum):
     JOIN = "join"
 
 
-@dataclass
+@dataclass(frozen=True)
 class Node:
     """A node in the flow graph."""
     id: str
@@ -34,7 +41,7 @@ class Node:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(frozen=True)
 class Edge:
     """An edge connecting two nodes."""
     from_node: str
@@ -53,24 +60,338 @@ class ExecutionState:
     timestamp: int = 0
 
 
+class FlowEvaluator:
+    """
+    Indexed bottom-up evaluator for the relations in flow.dl.
+
+    Edges are indexed by source and target. The transitive closure
+    (``reachable``) is maintained incrementally as edges are inserted;
+    the other recursive relations are evaluated semi-naively, joining
+    only the previous round's delta against the indexes. Non-recursive
+    relations are computed directly from the indexes.
+
+    Relations are returned as sorted tuples of strings, matching the
+    Soufflé CSV output read by ``DatalogEngine``.
+
+    ``version`` increases whenever a node or edge fact changes; together
+    with ``state_facts`` it identifies everything the rules can observe.
+    """
+
+    def __init__(self):
+        self.nodes: dict[str, tuple[str, str]] = {}
+        self.edges: set[tuple[str, str, str]] = set()
+        self.succ: dict[str, set[str]] = defaultdict(set)
+        self.pred: dict[str, set[str]] = defaultdict(set)
+        self.out_labels: dict[str, dict[str, set[str]]] = defaultdict(lambda: defaultdict(set))
+        self.reach: dict[str, set[str]] = defaultdict(set)
+        self.reach_rev: dict[str, set[str]] = defaultdict(set)
+        self.version = 0
+
+        self.executed: frozenset[str] = frozenset()
+        self.condition_labels: dict[str, set[str]] = {}
+        self.outputs: frozenset[tuple[str, str, str]] = frozenset()
+        self.bindings: frozenset[tuple[str, str, str]] = frozenset()
+        self.state_facts: tuple[frozenset, ...] = (frozenset(),) * 4
+
+    @property
+    def fact_count(self) -> int:
+        return (len(self.nodes) + len(self.edges) + len(self.executed)
+                + len(self.outputs) + len(self.bindings)
+                + sum(len(labels) for labels in self.condition_labels.values()))
+
+    # =========================================================================
+    # Fact insertion
+    # =========================================================================
+
+    def add_node(self, node_id: str, node_type: str, handler: str) -> None:
+        """Insert or replace a node fact."""
+        old = self.nodes.get(node_id)
+        if old == (node_type, handler):
+            return
+        self.nodes[node_id] = (node_type, handler)
+        self.version += 1
+
+    def add_edge(self, from_node: str, to_node: str, label: str = "default") -> None:
+        """Insert an edge fact and extend the transitive closure."""
+        fact = (from_node, to_node, label)
+        if fact in self.edges:
+            return
+        self.edges.add(fact)
+        self.version += 1
+        self.out_labels[from_node][label].add(to_node)
+        if to_node in self.succ[from_node]:
+            return
+        self.succ[from_node].add(to_node)
+        self.pred[to_node].add(from_node)
+
+        # Everything that reaches from_node now reaches everything to_node reaches
+        sources = {from_node} | self.reach_rev[from_node]
+        targets = {to_node} | self.reach[to_node]
+        for source in sources:
+            fresh = targets - self.reach[source]
+            if fresh:
+                self.reach[source] |= fresh
+                for target in fresh:
+                    self.reach_rev[target].add(source)
+
+    def set_state(self, executed, condition_labels: dict[str, set[str]],
+                  outputs, bindings=()) -> None:
+        """Replace the execution-state facts (timestamps are not used by the rules)."""
+        self.executed = frozenset(executed)
+        self.condition_labels = {k: set(v) for k, v in condition_labels.items() if v}
+        self.outputs = frozenset(outputs)
+        self.bindings = frozenset(bindings)
+        conditions = frozenset(
+            (node_id, label) for node_id, labels in self.condition_labels.items() for label in labels
+        )
+        self.state_facts = (self.executed, conditions, self.outputs, self.bindings)
+
+    # =========================================================================
+    # Evaluation
+    # =========================================================================
+
+    def supports(self, relation: str) -> bool:
+        return hasattr(self, f"_rel_{relation}")
+
+    def evaluate(self, relation: str) -> list[tuple[str, ...]]:
+        """Evaluate a relation; unknown relations are empty."""
+        method = getattr(self, f"_rel_{relation}", None)
+        if method is None:
+            return []
+        return sorted(method())
+
+    def _start_ids(self) -> set[str]:
+        return {n for n, (t, _) in self.nodes.items() if t == "start" or not self.pred.get(n)}
+
+    def _end_ids(self) -> set[str]:
+        return {n for n, (t, _) in self.nodes.items() if t == "end" or not self.succ.get(n)}
+
+    def _rel_start_node(self):
+        return {(n,) for n in self._start_ids()}
+
+    def _rel_end_node(self):
+        return {(n,) for n in self._end_ids()}
+
+    def _rel_reachable(self):
+        return {(f, t) for f, targets in self.reach.items() for t in targets}
+
+    _rel_path_exists = _rel_reachable
+
+    def _rel_reachable_if(self):
+        result = set(self.edges)
+        for from_node, mid, label in self.edges:
+            for target in self.reach.get(mid, ()):
+                result.add((from_node, target, label))
+        return result
+
+    def _rel_valid_path(self):
+        ends = self._end_ids()
+        return {(s, t) for s in self._start_ids() for t in self.reach.get(s, ()) if t in ends}
+
+    def _rel_has_self_loop(self):
+        return {(n,) for n, targets in self.succ.items() if n in targets}
+
+    def _in_cycle_ids(self) -> set[str]:
+        return {n for n, targets in self.reach.items() if n in targets}
+
+    def _rel_in_cycle(self):
+        return {(n,) for n in self._in_cycle_ids()}
+
+    def _rel_is_dag(self):
+        return set() if self._in_cycle_ids() else {()}
+
+    def _rel_topo_level(self):
+        """
+        Longest-path level from the start nodes (Kahn's algorithm).
+
+        Nodes on cycles never reach in-degree zero; they take the level
+        at which a breadth-first expansion first derives them.
+        """
+        starts = self._start_ids()
+        levels: dict[str, int] = {}
+        indegree = {
+            n: sum(1 for p in self.pred.get(n, ()) if p in self.nodes) for n in self.nodes
+        }
+        frontier = [n for n in self.nodes if indegree[n] == 0]
+        for n in frontier:
+            levels[n] = 0
+        for n in starts:
+            levels.setdefault(n, 0)
+        while frontier:
+            next_frontier = []
+            for n in frontier:
+                for m in self.succ.get(n, ()):
+                    if m not in indegree:
+                        continue
+                    if levels.get(n) is not None and m not in starts:
+                        levels[m] = max(levels.get(m, 0), levels[n] + 1)
+                    indegree[m] -= 1
+                    if indegree[m] == 0:
+                        next_frontier.append(m)
+            frontier = next_frontier
+
+        delta = set(levels)
+        while delta:
+            fresh = set()
+            for n in delta:
+                for m in self.succ.get(n, ()):
+                    if m in self.nodes and m not in levels:
+                        levels[m] = levels[n] + 1
+                        fresh.add(m)
+            delta = fresh
+        return {(n, str(level)) for n, level in levels.items()}
+
+    def _unexecuted_pred_ids(self) -> set[str]:
+        return {t for f, t, _ in self.edges if f not in self.executed}
+
+    def _rel_has_unexecuted_predecessor(self):
+        return {(n,) for n in self._unexecuted_pred_ids()}
+
+    def _rel_all_predecessors_executed(self):
+        blocked = self._unexecuted_pred_ids()
+        return {(n,) for n in self.nodes if n not in blocked}
+
+    def _rel_can_execute(self):
+        blocked = self._unexecuted_pred_ids()
+        ready = {n for n in self.nodes if n not in blocked} | self._start_ids()
+        return {(n,) for n in ready if n not in self.executed}
+
+    def _matching_condition_ids(self) -> set[str]:
+        return {
+            n for n, labels in self.condition_labels.items()
+            if any(label != "default" and label in self.out_labels.get(n, {}) for label in labels)
+        }
+
+    def _rel_has_matching_condition(self):
+        return {(n,) for n in self._matching_condition_ids()}
+
+    def _rel_next_node(self):
+        matched = self._matching_condition_ids()
+        result = set()
+        for current, by_label in self.out_labels.items():
+            if current not in matched:
+                result.update((current, n) for n in by_label.get("default", ()))
+            for label in self.condition_labels.get(current, ()):
+                if label != "default":
+                    result.update((current, n) for n in by_label.get(label, ()))
+        return result
+
+    def _rel_parallel_branch(self):
+        return {(n, b) for n, (t, _) in self.nodes.items() if t == "parallel"
+                for b in self.succ.get(n, ())}
+
+    def _rel_has_incomplete_branch(self):
+        return {(n,) for n in self._unexecuted_pred_ids()}
+
+    def _rel_all_branches_complete(self):
+        blocked = self._unexecuted_pred_ids()
+        return {(n,) for n, (t, _) in self.nodes.items() if t == "join" and n not in blocked}
+
+    _rel_join_ready = _rel_all_branches_complete
+
+    def _will_terminate_ids(self) -> set[str]:
+        terminating = self._end_ids()
+        delta = set(terminating)
+        while delta:
+            fresh = set()
+            for n in delta:
+                for p in self.pred.get(n, ()):
+                    if p in self.nodes and p not in terminating:
+                        fresh.add(p)
+            terminating |= fresh
+            delta = fresh
+        return terminating
+
+    def _rel_will_terminate(self):
+        return {(n,) for n in self._will_terminate_ids()}
+
+    def _rel_has_non_terminating_start(self):
+        return {()} if self._start_ids() - self._will_terminate_ids() else set()
+
+    def _rel_flow_terminates(self):
+        if self._in_cycle_ids() or self._start_ids() - self._will_terminate_ids():
+            return set()
+        return {()}
+
+    def _rel_available_data(self):
+        result = set()
+        for node_id, key, value in self.outputs:
+            result.add((node_id, key, value))
+            result.update((t, key, value) for t in self.reach.get(node_id, ()))
+        return result
+
+    def _rel_invalid_node(self):
+        return {(n, "missing_type") for n, (t, _) in self.nodes.items() if t == ""}
+
+    def _rel_invalid_edge(self):
+        result = set()
+        for from_node, to_node, _ in self.edges:
+            if to_node not in self.nodes:
+                result.add((from_node, to_node, "target_not_found"))
+            if from_node not in self.nodes:
+                result.add((from_node, to_node, "source_not_found"))
+        return result
+
+    def _unreachable_ids(self) -> set[str]:
+        starts = self._start_ids()
+        return {n for n in self.nodes if n not in starts and not self.reach_rev.get(n)}
+
+    def _rel_unreachable_node(self):
+        return {(n,) for n in self._unreachable_ids()}
+
+    def _rel_graph_valid(self):
+        if (self._in_cycle_ids() or self._rel_invalid_node()
+                or self._rel_invalid_edge() or self._unreachable_ids()):
+            return set()
+        return {()}
+
+
 class DatalogEngine:
     """
     Datalog-based flow graph execution engine.
 
-    Uses Soufflé for graph analysis and routing decisions.
+    Uses Soufflé for graph analysis and routing decisions on large fact
+    sets; smaller ones are evaluated in-process by FlowEvaluator.
+
+    The graph changes only through add_node and add_edge, which keep the
+    evaluator's indexes current; ``nodes`` and ``edges`` are read-only views.
+
+    Args:
+        program_path: Datalog program (defaults to flow.dl)
+        inline_threshold: Fact count up to which queries skip Soufflé
+        cache_size: Number of (facts, relation) results to keep
     """
 
-    def __init__(self, program_path: Optional[str] = None):
+    # Always evaluated in-process: flow.dl cannot express the level of
+    # nodes on cycles, so Soufflé would disagree on cyclic flows
+    IN_PROCESS_RELATIONS = frozenset({"topo_level"})
+
+    def __init__(self, program_path: Optional[str] = None,
+                 inline_threshold: int = 5000, cache_size: int = 256):
         self.program_path = program_path or self._default_program_path()
-        self.nodes: dict[str, Node] = {}
-        self.edges: list[Edge] = []
+        self._nodes: dict[str, Node] = {}
+        self._edges: list[Edge] = []
         self.state = ExecutionState()
+        self.inline_threshold = inline_threshold
+        self.cache_size = cache_size
+        self._evaluator = FlowEvaluator()
+        self._query_cache: OrderedDict[tuple, list[tuple[str, ...]]] = OrderedDict()
         self._souffle_available = self._check_souffle()
 
     def _default_program_path(self) -> str:
         """Get the default Datalog program path."""
         return str(Path(__file__).parent.parent / "flow.dl")
 
+    @property
+    def nodes(self) -> Mapping[str, Node]:
+        """Nodes by id (read-only; use add_node)."""
+        return MappingProxyType(self._nodes)
+
+    @property
+    def edges(self) -> tuple[Edge, ...]:
+        """Edges in insertion order (read-only; use add_edge)."""
+        return tuple(self._edges)
+
     def _check_souffle(self) -> bool:
         """Check if Soufflé is available."""
         try:
@@ -88,33 +409,50 @@ class DatalogEngine:
         """Add a node to the flow graph."""
         if isinstance(node_type, str):
             node_type = NodeType(node_type)
-        self.nodes[node_id] = Node(
+        self._nodes[node_id] = Node(
             id=node_id,
             type=node_type,
             handler=handler,
             metadata=metadata or {}
         )
+        self._evaluator.add_node(node_id, node_type.value, handler)
 
     def add_edge(self, from_node: str, to_node: str,
                  label: str = "default", condition: Optional[str] = None) -> None:
         """Add an edge to the flow graph."""
-        self.edges.append(Edge(
+        self._edges.append(Edge(
             from_node=from_node,
             to_node=to_node,
             label=label,
             condition=condition
         ))
+        self._evaluator.add_edge(from_node, to_node, label)
+
+    def _sync_facts(self) -> FlowEvaluator:
+        """Load the execution state into the evaluator."""
+        evaluator = self._evaluator
+        condition_labels: dict[str, set[str]] = {}
+        outputs = set()
+        for node_id, node_outputs in self.state.outputs.items():
+            for key, value in node_outputs.items():
+                if key == "condition_label":
+                    condition_labels.setdefault(node_id, set()).add(str(value))
+                else:
+                    outputs.add((node_id, key, str(value)))
+        bindings = {("global", name, str(value)) for name, value in self.state.bindings.items()}
+        evaluator.set_state(self.state.executed_nodes, condition_labels, outputs, bindings)
+        return evaluator
 
     def _generate_facts(self, temp_dir: str) -> None:
         """Generate Soufflé fact files from the current graph."""
         # Node facts
         with open(os.path.join(temp_dir, "node.facts"), "w") as f:
-            for node in self.nodes.values():
+            for node in self._nodes.values():
                 f.write(f"{node.id}\t{node.type.value}\t{node.handler}\n")
 
         # Edge facts
         with open(os.path.join(temp_dir, "edge.facts"), "w") as f:
-            for edge in self.edges:
+            for edge in self._edges:
                 f.write(f"{edge.from_node}\t{edge.to_node}\t{edge.label}\n")
 
         # Executed nodes
@@ -170,15 +508,41 @@ class DatalogEngine:
         """
         Query a Datalog relation.
 
+        Results are cached by graph version and execution-state facts, so
+        repeated queries over an unchanged flow are not re-evaluated.
+
         Args:
             relation: Name of the relation to query
 
         Returns:
             List of tuples representing the relation's contents
         """
-        if not self._souffle_available:
-            return self._fallback_query(relation)
+        evaluator = self._sync_facts()
+        key = (evaluator.version, evaluator.state_facts, relation)
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            self._query_cache.move_to_end(key)
+            return list(cached)
+
+        inline = (
+            not self._souffle_available
+            or relation in self.IN_PROCESS_RELATIONS
+            or (evaluator.fact_count <= self.inline_threshold and evaluator.supports(relation))
+        )
+        if inline:
+            results = evaluator.evaluate(relation)
+        else:
+            results = self._query_souffle(relation)
+            if results is None:
+                return []
+
+        self._query_cache[key] = results
+        if len(self._query_cache) > self.cache_size:
+            self._query_cache.popitem(last=False)
+        return list(results)
 
+    def _query_souffle(self, relation: str) -> Optional[list[tuple[str, ...]]]:
+        """Run Soufflé over the current facts; None if it failed."""
         with tempfile.TemporaryDirectory() as temp_dir:
             output_dir = os.path.join(temp_dir, "output")
             os.makedirs(output_dir)
@@ -186,92 +550,10 @@ class DatalogEngine:
             self._generate_facts(temp_dir)
 
             if not self._run_souffle(temp_dir, output_dir):
-                return []
+                return None
 
             return self._read_output(output_dir, relation)
 
-    def _fallback_query(self, relation: str) -> list[tuple[str, ...]]:
-        """Fallback query implementation when Soufflé is not available."""
-        if relation == "start_node":
-            return [(n.id,) for n in self.nodes.values()
-                    if n.type == NodeType.START or
-                    not any(e.to_node == n.id for e in self.edges)]
-
-        elif relation == "end_node":
-            return [(n.id,) for n in self.nodes.values()
-                    if n.type == NodeType.END or
-                    not any(e.from_node == n.id for e in self.edges)]
-
-        elif relation == "can_execute":
-            executable = []
-            for node in self.nodes.values():
-                if node.id in self.state.executed_nodes:
-                    continue
-                predecessors = [e.from_node for e in self.edges if e.to_node == node.id]
-                if not predecessors or all(p in self.state.executed_nodes for p in predecessors):
-                    executable.append((node.id,))
-            return executable
-
-        elif relation == "next_node":
-            if not self.state.current_node:
-                return []
-            current = self.state.current_node
-            outputs = self.state.outputs.get(current, {})
-            condition_label = outputs.get("condition_label")
-
-            for edge in self.edges:
-                if edge.from_node == current:
-                    if condition_label and edge.label == condition_label:
-                        return [(current, edge.to_node)]
-                    elif edge.label == "default" and not condition_label:
-                        return [(current, edge.to_node)]
-            return []
-
-        elif relation == "graph_valid":
-            # Simple validation
-            if self._has_cycles():
-                return []
-            if any(n.type.value == "" for n in self.nodes.values()):
-                return []
-            return [()]
-
-        elif relation == "is_dag":
-            return [] if self._has_cycles() else [()]
-
-        elif relation == "flow_terminates":
-            if self._has_cycles():
-                return []
-            return [()]
-
-        return []
-
-    def _has_cycles(self) -> bool:
-        """Check if the graph has cycles using DFS."""
-        visited = set()
-        rec_stack = set()
-
-        def dfs(node_id: str) -> bool:
-            visited.add(node_id)
-            rec_stack.add(node_id)
-
-            for edge in self.edges:
-                if edge.from_node == node_id:
-                    neighbor = edge.to_node
-                    if neighbor not in visited:
-                        if dfs(neighbor):
-                            return True
-                    elif neighbor in rec_stack:
-                        return True
-
-            rec_stack.remove(node_id)
-            return False
-
-        for node_id in self.nodes:
-            if node_id not in visited:
-                if dfs(node_id):
-                    return True
-        return False
-
     def validate(self) -> tuple[bool, list[str]]:
         """
         Validate the flow graph.
@@ -295,10 +577,10 @@ class DatalogEngine:
             errors.append("No end node found")
 
         # Check edge validity
-        for edge in self.edges:
-            if edge.from_node not in self.nodes:
+        for edge in self._edges:
+            if edge.from_node not in self._nodes:
                 errors.append(f"Edge source not found: {edge.from_node}")
-            if edge.to_node not in self.nodes:
+            if edge.to_node not in self._nodes:
                 errors.append(f"Edge target not found: {edge.to_node}")
 
         return len(errors) == 0, errors
@@ -324,9 +606,10 @@ class DatalogEngine:
 
     def get_next_from_current(self) -> Optional[str]:
         """Get the next node based on current node and conditions."""
-        results = self.query("next_node")
-        if results:
-            return results[0][1]
+        current = self.state.current_node
+        for from_node, next_node in self.query("next_node"):
+            if from_node == current:
+                return next_node
         return None
 
     def reset(self) -> None:
@@ -343,7 +626,7 @@ class DatalogEngine:
                     "handler": n.handler,
                     "metadata": n.metadata
                 }
-                for n in self.nodes.values()
+                for n in self._nodes.values()
             ],
             "edges": [
                 {
@@ -352,7 +635,7 @@ class DatalogEngine:
                     "label": e.label,
                     "condition": e.condition
                 }
-                for e in self.edges
+                for e in self._edges
             ]
         }, indent=2)
 
@@ -97,6 +97,12 @@ from .engine import (
     LLMClient,
     LLMRequest,
     LLMResponse,
+    ResponseCache,
+    MemoryResponseCache,
+    SQLiteResponseCache,
+    DiskResponseCache,
+    CacheStats,
+    create_response_cache,
 )
 
 # Evaluator
@@ -114,7 +120,7 @@ from .verifier import (
 )
 
 # Task Library
-from .task_library import TaskLibrary, DEFAULT_TASK_LIBRARY
+from .task_library import TaskLibrary, TaskMetadata, DEFAULT_TASK_LIBRARY
 
 # CLI
 from .cli import (
@@ -167,6 +173,7 @@ from .api import (
     TaskInfo,
     ProviderInfo,
     FlowAnalysis,
+    BatchTaskResult,
     # Enums
     TaskStatus,
     ValidationLevel,
@@ -174,6 +181,9 @@ from .api import (
     run_task as api_run_task,
     run_task_sync as api_run_task_sync,
     execute_request,
+    run_tasks,
+    run_tasks_sync,
+    load_task_requests,
     validate_task as api_validate_task,
     inspect_task,
     list_available_tasks,
@@ -229,6 +239,12 @@ __all__ = [
     'LLMClient',
     'LLMRequest',
     'LLMResponse',
+    'ResponseCache',
+    'MemoryResponseCache',
+    'SQLiteResponseCache',
+    'DiskResponseCache',
+    'CacheStats',
+    'create_response_cache',
     # Evaluator
     'ResponseCategorizer',
     'CategoryCriteria',
@@ -239,6 +255,7 @@ __all__ = [
     'VerificationResult',
     # Task library
     'TaskLibrary',
+    'TaskMetadata',
     'DEFAULT_TASK_LIBRARY',
     # CLI
     'CLICommands',
@@ -280,6 +297,7 @@ __all__ = [
     'TaskInfo',
     'ProviderInfo',
     'FlowAnalysis',
+    'BatchTaskResult',
     # API Enums
     'TaskStatus',
     'ValidationLevel',
@@ -287,6 +305,9 @@ __all__ = [
     'api_run_task',
     'api_run_task_sync',
     'execute_request',
+    'run_tasks',
+    'run_tasks_sync',
+    'load_task_requests',
     'api_validate_task',
     'inspect_task',
     'list_available_tasks',
@@ -45,15 +45,21 @@ Example usage:
     from universal_adapter.security import create_agent_context
     ctx = create_agent_context(allowed_providers=["anthropic"])
     result = await run_task("simple_qa", security_context=ctx)
+    
+    # Batch execution, streamed as each task finishes
+    async for item in run_tasks(requests, max_concurrency=16,
+                                per_provider_limits={"anthropic": 4}):
+        print(item.index, item.response.success)
 """
 
 from __future__ import annotations
 import asyncio
 import json
-from dataclasses import dataclass, field
+from contextlib import asynccontextmanager, nullcontext
+from dataclasses import dataclass, field, asdict, is_dataclass, replace
 from enum import Enum, auto
 from pathlib import Path
-from typing import Any, Callable, Mapping, Sequence, TypeVar, Generic
+from typing import Any, AsyncIterator, Callable, Iterable, Mapping, Sequence, TypeVar, Generic
 
 from .core import (
     UniversalAdapter,
@@ -75,6 +81,7 @@ from .schema import (
 )
 from .flow.parser import MermaidParser
 from .flow.graph import FlowGraph, NodeType
+from .engine.response_cache import ResponseCache
 from .task_library import TaskLibrary, DEFAULT_TASK_LIBRARY
 from .cli import CLICommands, CLIOutput
 from .security import (
@@ -135,6 +142,7 @@ class TaskRequest:
     model_override: str | None = None
     tags: list[str] = field(default_factory=list)
     metadata: dict[str, Any] = field(default_factory=dict)
+    use_cache: bool = True
     
     def to_config(self) -> AdapterConfig:
         """Convert to AdapterConfig."""
@@ -144,6 +152,33 @@ class TaskRequest:
             strict_validation=self.validation_level in (ValidationLevel.STRICT, ValidationLevel.PARANOID),
             debug_mode=self.debug,
         )
+    
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> TaskRequest:
+        """
+        Create a request from a plain dictionary (e.g. one JSONL line).
+        
+        Accepts ``provider``/``model`` as aliases for the override fields
+        and ``validation_level`` as an enum name.
+        """
+        if "task" not in data:
+            raise ValueError("Task request requires a 'task' field")
+        level = data.get("validation_level", ValidationLevel.STRICT)
+        if isinstance(level, str):
+            level = ValidationLevel[level.upper()]
+        return cls(
+            task=data["task"],
+            variables=dict(data.get("variables") or {}),
+            debug=bool(data.get("debug", False)),
+            max_iterations=int(data.get("max_iterations", 1000)),
+            timeout_seconds=int(data.get("timeout_seconds", 300)),
+            validation_level=level,
+            provider_override=data.get("provider_override", data.get("provider")),
+            model_override=data.get("model_override", data.get("model")),
+            tags=list(data.get("tags") or []),
+            metadata=dict(data.get("metadata") or {}),
+            use_cache=bool(data.get("use_cache", True)),
+        )
 
 
 @dataclass
@@ -298,6 +333,8 @@ async def run_task(
     model: str | None = None,
     task_library: TaskLibrary | None = None,
     security_context: SecurityContext | None = None,
+    http_client: Any = None,
+    response_cache: ResponseCache | None = None,
 ) -> APIResponse[TaskExecutionResult]:
     """
     Execute a task and return structured results.
@@ -316,6 +353,8 @@ async def run_task(
         model: Override LLM model
         task_library: Custom task library
         security_context: Security context for permission control
+        http_client: Shared httpx.AsyncClient reused for provider calls
+        response_cache: Opt-in LLM response cache (see create_response_cache)
     
     Returns:
         APIResponse containing TaskExecutionResult
@@ -363,10 +402,11 @@ async def run_task(
             timeout_ms=timeout_seconds * 1000,
             strict_validation=strict,
             debug_mode=debug,
+            response_cache=response_cache,
         )
         
         library = task_library or DEFAULT_TASK_LIBRARY
-        adapter = UniversalAdapter(config, library)
+        adapter = UniversalAdapter(config, library, http_client=http_client)
         
         # Load task with security validation
         task_schema = _load_task(task, library, ctx)
@@ -392,15 +432,16 @@ async def run_task(
         # Package result
         execution_result = TaskExecutionResult.from_adapter_result(adapter_result)
         
-        return APIResponse.ok(
-            data=execution_result,
-            metadata={
-                "task_name": task_schema.name,
-                "task_version": task_schema.version,
-                "provider_used": task_schema.resource_llm.provider,
-                "security_level": ctx.permission_level.name,
-            }
-        )
+        metadata = {
+            "task_name": task_schema.name,
+            "task_version": task_schema.version,
+            "provider_used": task_schema.resource_llm.provider,
+            "security_level": ctx.permission_level.name,
+        }
+        if "llm_cache" in adapter_result.metadata:
+            metadata["llm_cache"] = adapter_result.metadata["llm_cache"]
+        
+        return APIResponse.ok(data=execution_result, metadata=metadata)
         
     except PermissionError as e:
         return APIResponse.fail(f"Permission denied: {e}")
@@ -425,6 +466,9 @@ def run_task_sync(
 async def execute_request(
     request: TaskRequest,
     task_library: TaskLibrary | None = None,
+    security_context: SecurityContext | None = None,
+    http_client: Any = None,
+    response_cache: ResponseCache | None = None,
 ) -> APIResponse[TaskExecutionResult]:
     """
     Execute a structured TaskRequest.
@@ -432,6 +476,10 @@ async def execute_request(
     Args:
         request: TaskRequest with execution parameters
         task_library: Custom task library
+        security_context: Security context for permission control
+        http_client: Shared httpx.AsyncClient reused for provider calls
+        response_cache: Opt-in LLM response cache; skipped when
+            request.use_cache is False
     
     Returns:
         APIResponse containing TaskExecutionResult
@@ -446,9 +494,152 @@ async def execute_request(
         provider=request.provider_override,
         model=request.model_override,
         task_library=task_library,
+        security_context=security_context,
+        http_client=http_client,
+        response_cache=response_cache if request.use_cache else None,
     )
 
 
+# ============================================================================
+# Batch Execution API
+# ============================================================================
+
+@dataclass
+class BatchTaskResult:
+    """Result of one execution within a batch, tagged with its input position."""
+    index: int
+    provider: str
+    response: APIResponse[TaskExecutionResult]
+    
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        payload = self.response.to_dict()
+        if is_dataclass(payload["data"]):
+            payload["data"] = asdict(payload["data"])
+        return {"index": self.index, "provider": self.provider, **payload}
+
+
+async def run_tasks(
+    requests: Iterable[TaskRequest],
+    max_concurrency: int = 8,
+    per_provider_limits: Mapping[str, int] | None = None,
+    task_library: TaskLibrary | None = None,
+    security_context: SecurityContext | None = None,
+    response_cache: ResponseCache | None = None,
+) -> AsyncIterator[BatchTaskResult]:
+    """
+    Execute many independent tasks concurrently on the current event loop.
+    
+    All executions share one HTTP connection pool. Results are yielded as
+    soon as each execution finishes, so callers can stream them; use
+    ``BatchTaskResult.index`` to correlate with the input order.
+    
+    Args:
+        requests: TaskRequests to execute
+        max_concurrency: Maximum executions in flight across all providers
+        per_provider_limits: Maximum executions in flight per provider name
+            (e.g. ``{"anthropic": 4}``); unlisted providers are bounded only
+            by max_concurrency
+        task_library: Custom task library
+        security_context: Security context applied to every request
+        response_cache: Opt-in LLM response cache shared by all executions
+    
+    Yields:
+        BatchTaskResult for each request, in completion order
+    
+    Example:
+        requests = [TaskRequest(task="simple_qa", variables={"question": q}) for q in qs]
+        async for item in run_tasks(requests, max_concurrency=16):
+            print(item.index, item.response.success)
+    """
+    library = task_library or DEFAULT_TASK_LIBRARY
+    ctx = security_context or get_default_context()
+    
+    global_slots = asyncio.Semaphore(max(1, max_concurrency))
+    provider_slots = {
+        name.lower(): asyncio.Semaphore(max(1, limit))
+        for name, limit in (per_provider_limits or {}).items()
+    }
+    
+    async with _shared_http_client(max_concurrency) as http_client:
+        async def run_one(index: int, request: TaskRequest) -> BatchTaskResult:
+            request, provider = _resolve_batch_request(request, library, ctx)
+            # Take the provider slot first so a throttled provider never
+            # holds global slots that other providers could use.
+            async with provider_slots.get(provider) or nullcontext():
+                async with global_slots:
+                    try:
+                        response = await execute_request(
+                            request,
+                            task_library=library,
+                            security_context=ctx,
+                            http_client=http_client,
+                            response_cache=response_cache,
+                        )
+                    except Exception as e:
+                        # One failed execution must not abort the batch
+                        response = APIResponse.fail(str(e))
+            return BatchTaskResult(index=index, provider=provider, response=response)
+        
+        pending = [
+            asyncio.ensure_future(run_one(index, request))
+            for index, request in enumerate(requests)
+        ]
+        try:
+            for next_done in asyncio.as_completed(pending):
+                yield await next_done
+        finally:
+            for future in pending:
+                if not future.done():
+                    future.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+def run_tasks_sync(
+    requests: Iterable[TaskRequest],
+    **kwargs: Any
+) -> list[BatchTaskResult]:
+    """
+    Synchronous wrapper for run_tasks.
+    
+    Collects every result and returns them in input order.
+    """
+    async def collect() -> list[BatchTaskResult]:
+        return [item async for item in run_tasks(requests, **kwargs)]
+    
+    return sorted(asyncio.run(collect()), key=lambda item: item.index)
+
+
+def load_task_requests(source: str | Path | Iterable[str]) -> list[TaskRequest]:
+    """
+    Parse TaskRequests from JSONL.
+    
+    Each non-blank line is a JSON object accepted by TaskRequest.from_dict.
+    Lines starting with '#' are ignored.
+    
+    Args:
+        source: Path to a JSONL file, or an iterable of lines
+    
+    Returns:
+        List of TaskRequest in file order
+    """
+    if isinstance(source, (str, Path)):
+        lines: Iterable[str] = Path(source).read_text(encoding="utf-8").splitlines()
+    else:
+        lines = source
+    
+    requests: list[TaskRequest] = []
+    for line_no, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            requests.append(TaskRequest.from_dict(json.loads(line)))
+        except (ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"Invalid task request on line {line_no}: {e}") from e
+    return requests
+
+
 # ============================================================================
 # Validation API
 # ============================================================================
@@ -672,12 +863,11 @@ def list_available_tasks(
         APIResponse containing list of TaskInfo
     """
     library = task_library or DEFAULT_TASK_LIBRARY
-    task_names = library.list_tasks()
     
     tasks: list[TaskInfo] = []
     
-    for name in task_names:
-        if not verbose:
+    if not verbose:
+        for name in library.list_tasks():
             tasks.append(TaskInfo(
                 name=name,
                 path=str(library.get_path(name)),
@@ -686,27 +876,19 @@ def list_available_tasks(
                 prompt_count=0,
                 available=True,
             ))
-        else:
-            try:
-                schema = library.load(name)
-                tasks.append(TaskInfo(
-                    name=name,
-                    path=str(library.get_path(name)),
-                    version=schema.version,
-                    description=schema.goal.description,
-                    prompt_count=len(schema.prompts),
-                    available=True,
-                ))
-            except Exception as e:
-                tasks.append(TaskInfo(
-                    name=name,
-                    path=str(library.get_path(name)),
-                    version="",
-                    description="",
-                    prompt_count=0,
-                    available=False,
-                    error=str(e),
-                ))
+        return APIResponse.ok(data=tasks)
+    
+    # Indexed metadata: only files changed since the last listing are re-read
+    for meta in library.describe_all():
+        tasks.append(TaskInfo(
+            name=meta.name,
+            path=meta.path,
+            version=meta.version,
+            description=meta.description,
+            prompt_count=meta.prompt_count,
+            available=meta.available,
+            error=meta.error,
+        ))
     
     return APIResponse.ok(data=tasks)
 
@@ -1043,6 +1225,7 @@ def save_task(
                 "temperature": task.resource_llm.temperature,
                 "max_tokens": task.resource_llm.max_tokens,
                 "api_key_env": task.resource_llm.api_key_env,
+                "cache": task.resource_llm.cache,
             },
             "resource_registry": {
                 "entries": [
@@ -1060,6 +1243,8 @@ def save_task(
                     "template": p.template,
                     "role": p.role,
                     "description": p.description,
+                    "cache": p.cache,
+                    "early_exit": p.early_exit,
                 }
                 for p in task.prompts
             ],
@@ -1129,6 +1314,44 @@ def _load_task(
     raise ValueError(f"Cannot load task: {task}")
 
 
+def _resolve_batch_request(
+    request: TaskRequest,
+    library: TaskLibrary,
+    ctx: SecurityContext,
+) -> tuple[TaskRequest, str]:
+    """
+    Determine the provider a batch request will use.
+    
+    The task is loaded once here and carried forward as a TaskSchema so
+    execution does not read the file a second time. Load failures are left
+    for run_task to report.
+    """
+    try:
+        schema = _load_task(request.task, library, ctx)
+    except Exception:
+        return request, (request.provider_override or "unknown").lower()
+    
+    provider = schema.resource_llm.provider
+    if request.provider_override and ctx.has_permission(Operation.OVERRIDE_PROVIDER):
+        provider = request.provider_override
+    return replace(request, task=schema), provider.lower()
+
+
+@asynccontextmanager
+async def _shared_http_client(max_connections: int) -> AsyncIterator[Any]:
+    """Open one pooled httpx.AsyncClient for a batch, or None without httpx."""
+    try:
+        import httpx
+    except ImportError:
+        yield None
+        return
+    
+    size = max(1, max_connections)
+    limits = httpx.Limits(max_connections=size, max_keepalive_connections=size)
+    async with httpx.AsyncClient(limits=limits) as client:
+        yield client
+
+
 def _apply_overrides(
     schema: TaskSchema,
     provider: str | None,
@@ -1143,6 +1366,7 @@ def _apply_overrides(
         temperature=schema.resource_llm.temperature,
         max_tokens=schema.resource_llm.max_tokens,
         timeout_seconds=schema.resource_llm.timeout_seconds,
+        cache=schema.resource_llm.cache,
     )
     
     return TaskSchema(
@@ -14,6 +14,7 @@ Security:
 Usage:
     # From terminal
     python -m universal_adapter run task.json
+    python -m universal_adapter run-batch requests.jsonl --concurrency 16
     python -m universal_adapter validate task.json
     python -m universal_adapter list
     
@@ -39,6 +40,7 @@ from .schema import TaskSchema, validate_task_schema
 from .flow.parser import MermaidParser
 from .flow.graph import FlowGraph, NodeType
 from .engine.llm_client import LLMClient
+from .engine.response_cache import ResponseCache, create_response_cache
 from .task_library import TaskLibrary, DEFAULT_TASK_LIBRARY
 from .security import (
     SecurityContext,
@@ -205,6 +207,7 @@ class CLICommands:
         strict: bool = True,
         provider_override: str | None = None,
         model_override: str | None = None,
+        response_cache: ResponseCache | None = None,
     ) -> CLIOutput:
         """
         Execute a task asynchronously.
@@ -218,6 +221,7 @@ class CLICommands:
             strict: Enable strict validation
             provider_override: Override the LLM provider
             model_override: Override the LLM model
+            response_cache: Opt-in LLM response cache
         
         Returns:
             CLIOutput with execution results
@@ -252,6 +256,7 @@ class CLICommands:
                 timeout_ms=timeout_seconds * 1000,
                 strict_validation=strict,
                 debug_mode=debug,
+                response_cache=response_cache,
             )
             
             adapter = UniversalAdapter(config, self.task_library)
@@ -292,6 +297,7 @@ class CLICommands:
                     "final_response": result.final_response,
                     "verification": result.goal_verification.summary if result.goal_verification else None,
                     "provider_used": task_schema.resource_llm.provider,
+                    "llm_cache": result.metadata.get("llm_cache"),
                 },
                 errors=list(result.errors),
             )
@@ -329,6 +335,118 @@ class CLICommands:
         """Synchronous wrapper for run_async."""
         return asyncio.run(self.run_async(task, **kwargs))
     
+    # -------------------------------------------------------------------------
+    # run-batch - Execute a JSONL file of task requests concurrently
+    # -------------------------------------------------------------------------
+    
+    async def run_batch_async(
+        self,
+        source: str,
+        max_concurrency: int = 8,
+        provider_limits: dict[str, int] | None = None,
+        stream: bool = True,
+        response_cache: ResponseCache | None = None,
+    ) -> CLIOutput:
+        """
+        Execute every request in a JSONL file concurrently.
+        
+        Each line is a JSON object with at least a ``task`` field plus any
+        TaskRequest options (``variables``, ``provider``, ``model``, ...).
+        
+        Args:
+            source: Path to the JSONL request file
+            max_concurrency: Maximum executions in flight
+            provider_limits: Maximum executions in flight per provider
+            stream: Write one JSON line per result to the output stream
+                as each execution finishes
+            response_cache: Opt-in LLM response cache shared by the batch
+        
+        Returns:
+            CLIOutput with batch summary
+        """
+        # Imported here because api builds on this module
+        from .api import load_task_requests, run_tasks
+        
+        ctx = self.security_context
+        
+        if not ctx.has_permission(Operation.RUN_TASK):
+            return CLIOutput(
+                success=False,
+                message="Permission denied",
+                errors=["Operation RUN_TASK not allowed at current permission level"],
+            )
+        
+        try:
+            if not ctx.can_read_files():
+                raise PermissionError("File read operations not allowed")
+            try:
+                validated_path = ctx.validate_read_path(source)
+            except PathSecurityError as e:
+                raise PermissionError(f"Path security violation: {e}")
+            
+            requests = load_task_requests(validated_path)
+            
+            succeeded = 0
+            failures: list[str] = []
+            async for item in run_tasks(
+                requests,
+                max_concurrency=max_concurrency,
+                per_provider_limits=provider_limits,
+                task_library=self.task_library,
+                security_context=ctx,
+                response_cache=response_cache,
+            ):
+                if item.response.success and item.response.data and item.response.data.success:
+                    succeeded += 1
+                else:
+                    failures.append(f"#{item.index}: {item.response.error or 'task failed'}")
+                if stream:
+                    self.output_stream.write(json.dumps(item.to_dict(), default=str) + "\n")
+                    self.output_stream.flush()
+            
+            data: dict[str, Any] = {
+                "total": len(requests),
+                "succeeded": succeeded,
+                "failed": len(failures),
+                "max_concurrency": max_concurrency,
+            }
+            if response_cache is not None:
+                data["llm_cache"] = response_cache.stats.to_dict()
+            
+            return CLIOutput(
+                success=not failures,
+                message=f"Batch finished: {succeeded}/{len(requests)} tasks succeeded",
+                data=data,
+                errors=failures,
+            )
+        
+        except PermissionError as e:
+            return CLIOutput(
+                success=False,
+                message="Permission denied",
+                errors=[str(e)],
+            )
+        except FileNotFoundError as e:
+            return CLIOutput(
+                success=False,
+                message="Request file not found",
+                errors=[str(e)],
+            )
+        except Exception as e:
+            return CLIOutput(
+                success=False,
+                message="Batch execution failed",
+                errors=[str(e)],
+            )
+    
+    def run_batch(
+        self,
+        source: str,
+        **kwargs: Any
+    ) -> CLIOutput:
+        """Synchronous wrapper for run_batch_async."""
+        return asyncio.run(self.run_batch_async(source, **kwargs))
+    
     # -------------------------------------------------------------------------
     # validate - Validate a task without executing
     # -------------------------------------------------------------------------
@@ -527,24 +645,22 @@ class CLICommands:
                 data={"tasks": tasks},
             )
         
-        # Verbose mode - load and show details
+        # Verbose mode - indexed details, re-reading only changed files
         task_details = []
-        for name in tasks:
-            try:
-                path = self.task_library.get_path(name)
-                schema = self.task_library.load(name)
+        for meta in self.task_library.describe_all():
+            if meta.error is not None:
                 task_details.append({
-                    "name": name,
-                    "path": str(path),
-                    "version": schema.version,
-                    "goal": schema.goal.description[:80] + "..." if len(schema.goal.description) > 80 else schema.goal.description,
-                    "prompts": len(schema.prompts),
-                })
-            except Exception as e:
-                task_details.append({
-                    "name": name,
-                    "error": str(e),
+                    "name": meta.name,
+                    "error": meta.error,
                 })
+                continue
+            task_details.append({
+                "name": meta.name,
+                "path": meta.path,
+                "version": meta.version,
+                "goal": meta.description[:80] + "..." if len(meta.description) > 80 else meta.description,
+                "prompts": meta.prompt_count,
+            })
         
         return CLIOutput(
             success=True,
@@ -961,6 +1077,7 @@ class CLICommands:
             temperature=schema.resource_llm.temperature,
             max_tokens=schema.resource_llm.max_tokens,
             timeout_seconds=schema.resource_llm.timeout_seconds,
+            cache=schema.resource_llm.cache,
         )
         
         return TaskSchema(
@@ -1191,6 +1308,7 @@ def create_parser() -> argparse.ArgumentParser:
 Examples:
   %(prog)s run simple_qa
   %(prog)s run task.json --debug
+  %(prog)s run-batch requests.jsonl --concurrency 16
   %(prog)s validate task.json
   %(prog)s list --verbose
   %(prog)s inspect research_synthesis
@@ -1229,6 +1347,18 @@ Slash Commands (for TUI integration):
     run_parser.add_argument("--model", help="Override LLM model")
     run_parser.add_argument("-v", "--var", action="append", nargs=2, metavar=("KEY", "VALUE"),
                           help="Set context variable (can be repeated)")
+    _add_cache_arguments(run_parser)
+    
+    # run-batch command
+    batch_parser = subparsers.add_parser("run-batch", help="Execute a JSONL file of task requests")
+    batch_parser.add_argument("requests", help="JSONL file with one task request per line")
+    batch_parser.add_argument("--concurrency", "-c", type=int, default=8,
+                              help="Maximum concurrent executions (default: 8)")
+    batch_parser.add_argument("--provider-limit", action="append", nargs=2, metavar=("PROVIDER", "N"),
+                              help="Maximum concurrent executions for a provider (can be repeated)")
+    batch_parser.add_argument("--quiet", "-q", action="store_true",
+                              help="Only print the summary, not per-task results")
+    _add_cache_arguments(batch_parser)
     
     # validate command
     validate_parser = subparsers.add_parser("validate", help="Validate a task")
@@ -1274,6 +1404,30 @@ Slash Commands (for TUI integration):
     return parser
 
 
+def _add_cache_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add LLM response cache options to a subcommand parser."""
+    parser.add_argument("--cache", choices=["memory", "sqlite", "disk"],
+                        help="Enable LLM response caching with the given backend")
+    parser.add_argument("--cache-path", help="SQLite file or cache directory for persistent backends")
+    parser.add_argument("--cache-ttl", type=float, help="Cache entry lifetime in seconds")
+    parser.add_argument("--cache-max-entries", type=int, help="Maximum cached responses (LRU eviction)")
+    parser.add_argument("--cache-sampled", action="store_true",
+                        help="Also cache completions at non-zero temperature (replays one sample)")
+
+
+def _build_response_cache(parsed: argparse.Namespace) -> ResponseCache | None:
+    """Create the response cache requested on the command line, if any."""
+    if not getattr(parsed, "cache", None):
+        return None
+    return create_response_cache(
+        parsed.cache,
+        path=parsed.cache_path,
+        max_entries=parsed.cache_max_entries,
+        ttl_seconds=parsed.cache_ttl,
+        include_sampled=parsed.cache_sampled,
+    )
+
+
 # ============================================================================
 # Main Entry Point
 # ============================================================================
@@ -1313,6 +1467,20 @@ def main(args: Sequence[str] | None = None) -> int:
                 strict=not parsed.no_strict,
                 provider_override=parsed.provider,
                 model_override=parsed.model,
+                response_cache=_build_response_cache(parsed),
+            )
+        
+        elif parsed.command == "run-batch":
+            provider_limits = (
+                {name: int(limit) for name, limit in parsed.provider_limit}
+                if parsed.provider_limit else None
+            )
+            result = cli.run_batch(
+                source=parsed.requests,
+                max_concurrency=parsed.concurrency,
+                provider_limits=provider_limits,
+                stream=not parsed.quiet,
+                response_cache=_build_response_cache(parsed),
             )
         
         elif parsed.command == "validate":
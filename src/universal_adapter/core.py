@@ -38,6 +38,7 @@ from .flow.executor import (
 )
 from .engine.interpolator import TemplateInterpolator, InterpolationContext
 from .engine.llm_client import LLMClient, LLMRequest, LLMResponse, Message
+from .engine.response_cache import ResponseCache
 from .evaluator.categorizer import ResponseCategorizer, EvaluationResult
 from .verifier.goal_verifier import GoalVerifier, VerificationResult
 from .task_library import TaskLibrary, DEFAULT_TASK_LIBRARY
@@ -87,6 +88,7 @@ class AdapterConfig:
     strict_validation: bool = True
     debug_mode: bool = False
     require_all_conditions: bool = True
+    response_cache: ResponseCache | None = None  # Opt-in LLM response cache
 
 
 class UniversalAdapter:
@@ -110,16 +112,19 @@ class UniversalAdapter:
     def __init__(
         self,
         config: AdapterConfig | None = None,
-        task_library: TaskLibrary | None = None
+        task_library: TaskLibrary | None = None,
+        http_client: Any = None
     ) -> None:
         """
         Initialize the Universal Adapter.
 
         Args:
             config: Optional configuration settings
+            http_client: Optional shared httpx.AsyncClient for provider calls
         """
         self.config = config or AdapterConfig()
         self.task_library = task_library or DEFAULT_TASK_LIBRARY
+        self.http_client = http_client
         self.parser = MermaidParser()
         self.interpolator = TemplateInterpolator(strict=self.config.strict_validation)
         self.verifier = GoalVerifier(require_all=self.config.require_all_conditions)
@@ -168,7 +173,11 @@ class UniversalAdapter:
             self._log(f"Flow graph parsed: {len(flow_graph)} nodes")
 
             # Step 3: Create LLM client
-            llm_client = LLMClient(task_schema.resource_llm)
+            llm_client = LLMClient(
+                task_schema.resource_llm,
+                http_client=self.http_client,
+                cache=self.config.response_cache if task_schema.resource_llm.cache else None,
+            )
             client_valid, client_errors = llm_client.validate()
             if not client_valid:
                 errors.extend(client_errors)
@@ -197,6 +206,17 @@ class UniversalAdapter:
                 goal_met = goal_verification.goal_met
                 self._log(f"Goal verification: {'ACHIEVED' if goal_met else 'NOT ACHIEVED'}")
 
+            metadata: dict[str, Any] = {
+                "task_name": task_schema.name,
+                "task_version": task_schema.version,
+                "task_id": task_schema.task_id,
+                "task_type": task_schema.task_type,
+                "priority": task_schema.priority,
+                "nodes_executed": len(execution_result.history),
+            }
+            if llm_client.cache is not None:
+                metadata["llm_cache"] = llm_client.cache_stats.to_dict()
+
             result = AdapterResult(
                 success=execution_result.success and goal_met,
                 goal_met=goal_met,
@@ -207,14 +227,7 @@ class UniversalAdapter:
                 goal_verification=goal_verification,
                 execution_result=execution_result,
                 errors=tuple(errors),
-                metadata={
-                    "task_name": task_schema.name,
-                    "task_version": task_schema.version,
-                    "task_id": task_schema.task_id,
-                    "task_type": task_schema.task_type,
-                    "priority": task_schema.priority,
-                    "nodes_executed": len(execution_result.history),
-                }
+                metadata=metadata
             )
 
             self._log_run(task_schema, result)
@@ -327,16 +340,23 @@ class UniversalAdapter:
             max_tokens=task.resource_llm.max_tokens
         )
 
-        # Execute LLM call
-        response = await llm_client.complete(request)
-        response_content = response.content
-
         # Categorize response for branching
         # Use edge labels from the graph as categories
         categorizer = ResponseCategorizer.from_edge_labels(
             self._extract_edge_labels(task.flow_diagram.mermaid, node.id)
         )
-        evaluation = categorizer.evaluate(response_content)
+
+        # prompt.cache lets a node opt out of response caching
+        if prompt.early_exit:
+            # Router-style node: stream and cancel once the branch is settled
+            evaluation = await categorizer.evaluate_stream(
+                llm_client.stream(request, use_cache=prompt.cache)
+            )
+            response_content = evaluation.response
+        else:
+            response = await llm_client.complete(request, use_cache=prompt.cache)
+            response_content = response.content
+            evaluation = categorizer.evaluate(response_content)
 
         return (response_content, evaluation.category)
 
@@ -7,6 +7,14 @@ with registry-resolved references and context values.
 
 from .interpolator import TemplateInterpolator, InterpolationContext
 from .llm_client import LLMClient, LLMRequest, LLMResponse
+from .response_cache import (
+    ResponseCache,
+    MemoryResponseCache,
+    SQLiteResponseCache,
+    DiskResponseCache,
+    CacheStats,
+    create_response_cache,
+)
 
 __all__ = [
     'TemplateInterpolator',
@@ -14,4 +22,10 @@ __all__ = [
     'LLMClient',
     'LLMRequest',
     'LLMResponse',
+    'ResponseCache',
+    'MemoryResponseCache',
+    'SQLiteResponseCache',
+    'DiskResponseCache',
+    'CacheStats',
+    'create_response_cache',
 ]
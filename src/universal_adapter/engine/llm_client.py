@@ -16,11 +16,13 @@ import os
 import json
 import asyncio
 from abc import ABC, abstractmethod
+from contextlib import aclosing, nullcontext
 from dataclasses import dataclass, field
-from typing import Any, Mapping, Sequence, Protocol, Literal
+from typing import Any, AsyncIterator, Mapping, Sequence, Protocol, Literal
 from enum import Enum, auto
 
 from ..schema import ResourceLLM
+from .response_cache import ResponseCache, CacheStats, cache_key
 
 
 class MessageRole(Enum):
@@ -129,6 +131,19 @@ class LLMResponse:
         return self.usage.get("total_tokens", 0)
 
 
+@dataclass
+class StreamStatus:
+    """
+    Completion state of a streamed response, filled in by the provider.
+
+    ``complete`` is set only when the provider's end-of-stream marker
+    arrived (OpenAI ``[DONE]``, Anthropic ``message_stop``); a stream
+    that stops without it may be truncated.
+    """
+    complete: bool = False
+    finish_reason: str | None = None
+
+
 class LLMError(Exception):
     """Base error for LLM operations."""
     pass
@@ -155,19 +170,59 @@ class LLMProvider(ABC):
 
     Each provider implements this interface to handle
     provider-specific API details.
+
+    HTTP providers reuse ``http_client`` when one is attached, so batch
+    runners can share a single connection pool across executions.
     """
 
+    http_client: Any = None
+
+    def _http_session(self, httpx: Any, **kwargs: Any) -> Any:
+        """Return the shared client (left open on exit) or a fresh one."""
+        if self.http_client is not None:
+            return nullcontext(self.http_client)
+        return httpx.AsyncClient(**kwargs)
+
     @abstractmethod
     async def complete(self, request: LLMRequest) -> LLMResponse:
         """Execute an LLM completion request."""
         ...
 
+    async def stream(
+        self,
+        request: LLMRequest,
+        status: StreamStatus | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Yield completion text deltas as they are generated.
+
+        Closing the iterator early cancels the remaining generation.
+        Providers without native streaming yield the full completion
+        as a single delta. ``status`` is marked complete once the
+        provider confirms the end of the response; error events raise
+        LLMError.
+        """
+        response = await self.complete(request)
+        if status is not None:
+            status.complete = True
+            status.finish_reason = response.finish_reason
+        if response.content:
+            yield response.content
+
     @abstractmethod
     def validate_config(self, config: ResourceLLM) -> tuple[bool, list[str]]:
         """Validate provider-specific configuration."""
         ...
 
 
+def _sse_event(line: str, provider: str) -> Any:
+    """Decode the JSON payload of a server-sent ``data:`` line."""
+    try:
+        return json.loads(line[5:].strip())
+    except json.JSONDecodeError as e:
+        raise LLMError(f"{provider} stream sent malformed event: {e}")
+
+
 class OpenAIProvider(LLMProvider):
     """OpenAI API provider."""
 
@@ -175,21 +230,14 @@ class OpenAIProvider(LLMProvider):
         self.api_key = api_key
         self.endpoint = endpoint or "https://api.openai.com/v1"
 
-    async def complete(self, request: LLMRequest) -> LLMResponse:
-        """Execute completion via OpenAI API."""
-        # Import httpx lazily to avoid hard dependency
-        try:
-            import httpx
-        except ImportError:
-            raise LLMError("httpx not installed. Run: pip install httpx")
-
-        url = f"{self.endpoint}/chat/completions"
-        headers = {
+    def _headers(self) -> dict[str, str]:
+        return {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
 
-        body = {
+    def _body(self, request: LLMRequest) -> dict[str, Any]:
+        body: dict[str, Any] = {
             "model": request.model,
             "messages": [m.to_dict() for m in request.messages],
             "temperature": request.temperature,
@@ -199,12 +247,31 @@ class OpenAIProvider(LLMProvider):
         if request.stop_sequences:
             body["stop"] = list(request.stop_sequences)
 
-        async with httpx.AsyncClient() as client:
+        return body
+
+    def _status_error(self, e: Any) -> LLMError:
+        if e.response.status_code == 401:
+            return LLMAuthError("Invalid OpenAI API key")
+        elif e.response.status_code == 429:
+            return LLMRateLimitError("OpenAI rate limit exceeded")
+        return LLMError(f"OpenAI API error: {e}")
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        """Execute completion via OpenAI API."""
+        # Import httpx lazily to avoid hard dependency
+        try:
+            import httpx
+        except ImportError:
+            raise LLMError("httpx not installed. Run: pip install httpx")
+
+        url = f"{self.endpoint}/chat/completions"
+
+        async with self._http_session(httpx) as client:
             try:
                 response = await client.post(
                     url,
-                    headers=headers,
-                    json=body,
+                    headers=self._headers(),
+                    json=self._body(request),
                     timeout=120.0
                 )
                 response.raise_for_status()
@@ -219,14 +286,71 @@ class OpenAIProvider(LLMProvider):
                 )
 
             except httpx.HTTPStatusError as e:
-                if e.response.status_code == 401:
-                    raise LLMAuthError("Invalid OpenAI API key")
-                elif e.response.status_code == 429:
-                    raise LLMRateLimitError("OpenAI rate limit exceeded")
-                raise LLMError(f"OpenAI API error: {e}")
+                raise self._status_error(e)
             except httpx.RequestError as e:
                 raise LLMConnectionError(f"Connection error: {e}")
 
+    async def stream(
+        self,
+        request: LLMRequest,
+        status: StreamStatus | None = None,
+    ) -> AsyncIterator[str]:
+        """Stream completion deltas via OpenAI server-sent events."""
+        try:
+            import httpx
+        except ImportError:
+            raise LLMError("httpx not installed. Run: pip install httpx")
+
+        url = f"{self.endpoint}/chat/completions"
+        body = self._body(request)
+        body["stream"] = True
+
+        async with self._http_session(httpx) as client:
+            try:
+                async with client.stream(
+                    "POST",
+                    url,
+                    headers=self._headers(),
+                    json=body,
+                    timeout=120.0
+                ) as response:
+                    response.raise_for_status()
+                    async with aclosing(self._parse_stream(response.aiter_lines(), status)) as deltas:
+                        async for text in deltas:
+                            yield text
+
+            except httpx.HTTPStatusError as e:
+                raise self._status_error(e)
+            except httpx.RequestError as e:
+                raise LLMConnectionError(f"Connection error: {e}")
+
+    async def _parse_stream(
+        self,
+        lines: AsyncIterator[str],
+        status: StreamStatus | None = None,
+    ) -> AsyncIterator[str]:
+        """Yield text deltas from OpenAI SSE lines until ``[DONE]``."""
+        async for line in lines:
+            if not line.startswith("data:"):
+                continue
+            if line[5:].strip() == "[DONE]":
+                if status is not None:
+                    status.complete = True
+                return
+            event = _sse_event(line, "OpenAI")
+            if event.get("error"):
+                error = event["error"]
+                message = error.get("message", error) if isinstance(error, dict) else error
+                raise LLMError(f"OpenAI stream error: {message}")
+            choices = event.get("choices") or []
+            if not choices:
+                continue
+            if choices[0].get("finish_reason") and status is not None:
+                status.finish_reason = choices[0]["finish_reason"]
+            text = (choices[0].get("delta") or {}).get("content")
+            if text:
+                yield text
+
     def validate_config(self, config: ResourceLLM) -> tuple[bool, list[str]]:
         errors: list[str] = []
         if not self.api_key:
@@ -243,20 +367,14 @@ class AnthropicProvider(LLMProvider):
         self.api_key = api_key
         self.endpoint = endpoint or "https://api.anthropic.com/v1"
 
-    async def complete(self, request: LLMRequest) -> LLMResponse:
-        """Execute completion via Anthropic API."""
-        try:
-            import httpx
-        except ImportError:
-            raise LLMError("httpx not installed. Run: pip install httpx")
-
-        url = f"{self.endpoint}/messages"
-        headers = {
+    def _headers(self) -> dict[str, str]:
+        return {
             "x-api-key": self.api_key,
             "anthropic-version": "2023-06-01",
             "Content-Type": "application/json"
         }
 
+    def _body(self, request: LLMRequest) -> dict[str, Any]:
         # Anthropic uses separate system parameter
         system_content = None
         messages = []
@@ -278,12 +396,30 @@ class AnthropicProvider(LLMProvider):
         if request.stop_sequences:
             body["stop_sequences"] = list(request.stop_sequences)
 
-        async with httpx.AsyncClient() as client:
+        return body
+
+    def _status_error(self, e: Any) -> LLMError:
+        if e.response.status_code == 401:
+            return LLMAuthError("Invalid Anthropic API key")
+        elif e.response.status_code == 429:
+            return LLMRateLimitError("Anthropic rate limit exceeded")
+        return LLMError(f"Anthropic API error: {e}")
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        """Execute completion via Anthropic API."""
+        try:
+            import httpx
+        except ImportError:
+            raise LLMError("httpx not installed. Run: pip install httpx")
+
+        url = f"{self.endpoint}/messages"
+
+        async with self._http_session(httpx) as client:
             try:
                 response = await client.post(
                     url,
-                    headers=headers,
-                    json=body,
+                    headers=self._headers(),
+                    json=self._body(request),
                     timeout=120.0
                 )
                 response.raise_for_status()
@@ -311,14 +447,72 @@ class AnthropicProvider(LLMProvider):
                 )
 
             except httpx.HTTPStatusError as e:
-                if e.response.status_code == 401:
-                    raise LLMAuthError("Invalid Anthropic API key")
-                elif e.response.status_code == 429:
-                    raise LLMRateLimitError("Anthropic rate limit exceeded")
-                raise LLMError(f"Anthropic API error: {e}")
+                raise self._status_error(e)
             except httpx.RequestError as e:
                 raise LLMConnectionError(f"Connection error: {e}")
 
+    async def stream(
+        self,
+        request: LLMRequest,
+        status: StreamStatus | None = None,
+    ) -> AsyncIterator[str]:
+        """Stream completion deltas via Anthropic server-sent events."""
+        try:
+            import httpx
+        except ImportError:
+            raise LLMError("httpx not installed. Run: pip install httpx")
+
+        url = f"{self.endpoint}/messages"
+        body = self._body(request)
+        body["stream"] = True
+
+        async with self._http_session(httpx) as client:
+            try:
+                async with client.stream(
+                    "POST",
+                    url,
+                    headers=self._headers(),
+                    json=body,
+                    timeout=120.0
+                ) as response:
+                    response.raise_for_status()
+                    async with aclosing(self._parse_stream(response.aiter_lines(), status)) as deltas:
+                        async for text in deltas:
+                            yield text
+
+            except httpx.HTTPStatusError as e:
+                raise self._status_error(e)
+            except httpx.RequestError as e:
+                raise LLMConnectionError(f"Connection error: {e}")
+
+    async def _parse_stream(
+        self,
+        lines: AsyncIterator[str],
+        status: StreamStatus | None = None,
+    ) -> AsyncIterator[str]:
+        """Yield text deltas from Anthropic SSE lines until ``message_stop``."""
+        async for line in lines:
+            if not line.startswith("data:"):
+                continue
+            event = _sse_event(line, "Anthropic")
+            event_type = event.get("type")
+            if event_type == "error":
+                error = event.get("error") or {}
+                message = f"{error.get('type', 'error')}: {error.get('message', '')}"
+                if error.get("type") == "rate_limit_error":
+                    raise LLMRateLimitError(f"Anthropic stream error: {message}")
+                raise LLMError(f"Anthropic stream error: {message}")
+            if event_type == "message_stop":
+                if status is not None:
+                    status.complete = True
+                return
+            if event_type == "message_delta" and status is not None:
+                status.finish_reason = (event.get("delta") or {}).get("stop_reason") or status.finish_reason
+            if event_type == "content_block_delta":
+                text = event.get("delta", {}).get("text")
+                if text:
+                    yield text
+
     def validate_config(self, config: ResourceLLM) -> tuple[bool, list[str]]:
         errors: list[str] = []
         if not self.api_key:
@@ -382,10 +576,11 @@ class OllamaProvider(LLMProvider):
             body["options"]["num_predict"] = request.max_tokens
 
         try:
-            async with httpx.AsyncClient(timeout=120.0) as client:
+            async with self._http_session(httpx) as client:
                 resp = await client.post(
                     f"{self.endpoint}/api/chat",
                     json=body,
+                    timeout=120.0,
                 )
                 resp.raise_for_status()
                 data = resp.json()
@@ -417,6 +612,10 @@ class LLMClient:
     High-level LLM client that routes requests to appropriate providers.
 
     Factory pattern for creating provider instances from ResourceLLM config.
+
+    When a ResponseCache is supplied, completions are memoized by a
+    deterministic request key; ``cache_stats`` counts this client's
+    hits and misses.
     """
 
     PROVIDERS = {
@@ -426,9 +625,17 @@ class LLMClient:
         "template": TemplateProvider,
     }
 
-    def __init__(self, config: ResourceLLM) -> None:
+    def __init__(
+        self,
+        config: ResourceLLM,
+        http_client: Any = None,
+        cache: ResponseCache | None = None,
+    ) -> None:
         self.config = config
         self.provider = self._create_provider()
+        self.provider.http_client = http_client
+        self.cache = cache
+        self.cache_stats = CacheStats()
 
     def _create_provider(self) -> LLMProvider:
         """Create appropriate provider from config."""
@@ -458,9 +665,88 @@ class LLMClient:
         else:
             return provider_class(api_key=api_key, endpoint=self.config.endpoint)  # type: ignore[arg-type]
 
-    async def complete(self, request: LLMRequest) -> LLMResponse:
-        """Execute a completion request."""
-        return await self.provider.complete(request)
+    async def complete(self, request: LLMRequest, use_cache: bool = True) -> LLMResponse:
+        """
+        Execute a completion request.
+
+        With a cache configured, only temperature-0 requests are cached
+        unless the cache was created with ``include_sampled=True``.
+
+        Args:
+            request: The request to send
+            use_cache: Set False to bypass the response cache for this call
+        """
+        if self.cache is None:
+            return await self.provider.complete(request)
+        if not use_cache or not self.cache.accepts(request):
+            self.cache_stats.bypassed += 1
+            return await self.provider.complete(request)
+
+        key = self._cache_key(request)
+        cached = await self._cache_io(self.cache.get, key)
+        if cached is not None:
+            self.cache_stats.hits += 1
+            return cached
+
+        self.cache_stats.misses += 1
+        response = await self.provider.complete(request)
+        await self._cache_io(self.cache.set, key, response)
+        return response
+
+    async def stream(self, request: LLMRequest, use_cache: bool = True) -> AsyncIterator[str]:
+        """
+        Stream completion text deltas.
+
+        A cache hit is replayed as a single delta. A streamed completion is
+        cached only if the provider confirmed its end (``StreamStatus``);
+        closing the iterator early (e.g. after an early-exit categorization),
+        a connection that drops, or a provider error event leaves the cache
+        untouched.
+
+        Args:
+            request: The request to send
+            use_cache: Set False to bypass the response cache for this call
+        """
+        if self.cache is None or not use_cache or not self.cache.accepts(request):
+            if self.cache is not None:
+                self.cache_stats.bypassed += 1
+            async with aclosing(self.provider.stream(request)) as deltas:
+                async for delta in deltas:
+                    yield delta
+            return
+
+        key = self._cache_key(request)
+        cached = await self._cache_io(self.cache.get, key)
+        if cached is not None:
+            self.cache_stats.hits += 1
+            if cached.content:
+                yield cached.content
+            return
+
+        self.cache_stats.misses += 1
+        parts: list[str] = []
+        status = StreamStatus()
+        async with aclosing(self.provider.stream(request, status)) as deltas:
+            async for delta in deltas:
+                parts.append(delta)
+                yield delta
+        if not status.complete:
+            return
+        await self._cache_io(self.cache.set, key, LLMResponse(
+            content="".join(parts),
+            model=request.model,
+            finish_reason=status.finish_reason or "stop",
+            usage={},
+        ))
+
+    def _cache_key(self, request: LLMRequest) -> str:
+        return cache_key(self.config.provider or "", request, self.config.endpoint)
+
+    async def _cache_io(self, func: Any, *args: Any) -> Any:
+        """Run a cache operation, in a worker thread if it touches disk."""
+        if self.cache.persistent:
+            return await asyncio.to_thread(func, *args)
+        return func(*args)
 
     async def prompt(self, prompt: str) -> str:
         """Simple prompt execution, returns content only."""
@@ -0,0 +1,420 @@
+"""
+LLM Response Cache
+
+Opt-in memoization of provider completions so repeated prompts
+(reruns, converging loops, eval reruns) are served without a
+provider round trip.
+
+Keys are deterministic SHA-256 digests of everything that shapes a
+completion: provider, endpoint, model, messages, temperature,
+max_tokens and stop sequences. Only greedy (temperature 0) completions
+are cached unless the cache is created with ``include_sampled=True``;
+replaying one frozen sample for a sampled node would change loop and
+eval behaviour. Three interchangeable backends are provided:
+
+- MemoryResponseCache: in-process LRU, lost on exit
+- SQLiteResponseCache: single-file store shared across runs/processes
+- DiskResponseCache: one JSON file per entry under a directory
+
+All backends support an optional TTL and a max_entries bound with
+least-recently-used eviction. Persistent backends block on file I/O,
+so async callers should run their get/set in a worker thread (see
+``ResponseCache.persistent``).
+"""
+
+from __future__ import annotations
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .llm_client import LLMRequest, LLMResponse
+
+
+def cache_key(provider: str, request: LLMRequest, endpoint: str | None = None) -> str:
+    """Compute the deterministic cache key for a request to an endpoint."""
+    payload = {
+        "provider": provider.lower(),
+        "endpoint": (endpoint or "").rstrip("/"),
+        "model": request.model,
+        "messages": [[m.role.value, m.content] for m in request.messages],
+        "temperature": request.temperature,
+        "max_tokens": request.max_tokens,
+        "stop": list(request.stop_sequences),
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _encode_response(response: LLMResponse) -> str:
+    return json.dumps({
+        "content": response.content,
+        "model": response.model,
+        "finish_reason": response.finish_reason,
+        "usage": dict(response.usage),
+    })
+
+
+def _decode_response(payload: str) -> LLMResponse:
+    from .llm_client import LLMResponse
+
+    data = json.loads(payload)
+    return LLMResponse(
+        content=data["content"],
+        model=data["model"],
+        finish_reason=data["finish_reason"],
+        usage=data.get("usage", {}),
+    )
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a cache or a single execution."""
+    hits: int = 0
+    misses: int = 0
+    bypassed: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypassed": self.bypassed,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+class ResponseCache(ABC):
+    """
+    Abstract base for response cache backends.
+
+    Subclasses store opaque serialized responses; encoding, TTL checks
+    and counters are handled here.
+    """
+
+    # True when get/set block on file I/O and belong off the event loop
+    persistent = False
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        ttl_seconds: float | None = None,
+        include_sampled: bool = False,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.include_sampled = include_sampled
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> LLMResponse | None:
+        """Return the cached response for key, or None on miss/expiry."""
+        with self._lock:
+            entry = self._load(key)
+            if entry is not None and self._expired(entry[0]):
+                self._delete(key)
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self.stats.hits += 1
+        return _decode_response(entry[1])
+
+    def accepts(self, request: LLMRequest) -> bool:
+        """Whether a request may be cached (greedy, or sampled when opted in)."""
+        return self.include_sampled or request.temperature == 0
+
+    def set(self, key: str, response: LLMResponse) -> None:
+        """Store a response, evicting least-recently-used entries if full."""
+        payload = _encode_response(response)
+        with self._lock:
+            self.stats.evictions += self._store(key, payload, time.time())
+
+    def _expired(self, created_at: float) -> bool:
+        return self.ttl_seconds is not None and time.time() - created_at > self.ttl_seconds
+
+    @abstractmethod
+    def _load(self, key: str) -> tuple[float, str] | None:
+        """Return (created_at, payload) and mark the entry recently used."""
+        ...
+
+    @abstractmethod
+    def _store(self, key: str, payload: str, created_at: float) -> int:
+        """Insert or replace an entry; return the number of evictions."""
+        ...
+
+    @abstractmethod
+    def _delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+        ...
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    def close(self) -> None:
+        """Release backend resources."""
+        return None
+
+
+class MemoryResponseCache(ResponseCache):
+    """In-process LRU cache backed by an OrderedDict."""
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        ttl_seconds: float | None = None,
+        include_sampled: bool = False,
+    ) -> None:
+        super().__init__(max_entries, ttl_seconds, include_sampled)
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    def _load(self, key: str) -> tuple[float, str] | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def _store(self, key: str, payload: str, created_at: float) -> int:
+        self._entries[key] = (created_at, payload)
+        self._entries.move_to_end(key)
+        evicted = 0
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            evicted += 1
+        return evicted
+
+    def _delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteResponseCache(ResponseCache):
+    """
+    SQLite-backed cache.
+
+    Survives process restarts and can be shared by concurrent processes
+    (SQLite handles file locking). Recency is tracked in an indexed
+    accessed_at column.
+    """
+
+    persistent = True
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_entries: int = 100000,
+        ttl_seconds: float | None = None,
+        include_sampled: bool = False,
+    ) -> None:
+        super().__init__(max_entries, ttl_seconds, include_sampled)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_responses ("
+            " key TEXT PRIMARY KEY,"
+            " payload TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_responses_accessed ON llm_responses(accessed_at)"
+        )
+        self._count = len(self)
+
+    def _load(self, key: str) -> tuple[float, str] | None:
+        row = self._conn.execute(
+            "SELECT created_at, payload FROM llm_responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is not None:
+            self._conn.execute(
+                "UPDATE llm_responses SET accessed_at = ? WHERE key = ?", (time.time(), key)
+            )
+        return row
+
+    def _store(self, key: str, payload: str, created_at: float) -> int:
+        existed = self._conn.execute(
+            "SELECT 1 FROM llm_responses WHERE key = ?", (key,)
+        ).fetchone() is not None
+        self._conn.execute(
+            "INSERT OR REPLACE INTO llm_responses (key, payload, created_at, accessed_at)"
+            " VALUES (?, ?, ?, ?)",
+            (key, payload, created_at, created_at),
+        )
+        if not existed:
+            self._count += 1
+        if self._count <= self.max_entries:
+            return 0
+        # Other processes may share the file, so re-count before evicting
+        overflow = len(self) - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM llm_responses WHERE key IN ("
+                " SELECT key FROM llm_responses ORDER BY accessed_at LIMIT ?)",
+                (overflow,),
+            )
+        self._count = len(self)
+        return max(overflow, 0)
+
+    def _delete(self, key: str) -> None:
+        cursor = self._conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+        self._count -= max(cursor.rowcount, 0)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_responses")
+            self._count = 0
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class DiskResponseCache(ResponseCache):
+    """
+    Directory-backed cache storing one JSON file per entry.
+
+    File mtimes record recency. When the bound is exceeded the oldest
+    tenth of entries is evicted in one sweep, so directory scans stay
+    rare.
+    """
+
+    persistent = True
+
+    def __init__(
+        self,
+        directory: str | Path,
+        max_entries: int = 100000,
+        ttl_seconds: float | None = None,
+        include_sampled: bool = False,
+    ) -> None:
+        super().__init__(max_entries, ttl_seconds, include_sampled)
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._count = sum(1 for _ in self.directory.glob("*/*.json"))
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _load(self, key: str) -> tuple[float, str] | None:
+        path = self._path(key)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return (data["created_at"], data["payload"])
+
+    def _store(self, key: str, payload: str, created_at: float) -> int:
+        path = self._path(key)
+        is_new = not path.exists()
+        path.parent.mkdir(exist_ok=True)
+        # Unique temp name: concurrent writers of one key must not share it
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=path.parent, suffix=".tmp", delete=False
+        ) as tmp:
+            tmp.write(json.dumps({"created_at": created_at, "payload": payload}))
+        try:
+            os.replace(tmp.name, path)
+        except OSError:
+            os.unlink(tmp.name)
+            raise
+        if is_new:
+            self._count += 1
+        if self._count <= self.max_entries:
+            return 0
+        return self._evict(self._count - self.max_entries + self.max_entries // 10)
+
+    def _evict(self, count: int) -> int:
+        files = sorted(self.directory.glob("*/*.json"), key=lambda p: p.stat().st_mtime)
+        evicted = 0
+        for path in files[:count]:
+            try:
+                path.unlink()
+                evicted += 1
+            except OSError:
+                continue
+        self._count = len(files) - evicted
+        return evicted
+
+    def _delete(self, key: str) -> None:
+        try:
+            self._path(key).unlink()
+            self._count -= 1
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        with self._lock:
+            for path in self.directory.glob("*/*.json"):
+                path.unlink(missing_ok=True)
+            self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+
+def create_response_cache(
+    backend: str = "memory",
+    path: str | Path | None = None,
+    max_entries: int | None = None,
+    ttl_seconds: float | None = None,
+    include_sampled: bool = False,
+) -> ResponseCache:
+    """
+    Create a response cache by backend name.
+
+    Args:
+        backend: "memory", "sqlite" or "disk"
+        path: SQLite file or cache directory (persistent backends only)
+        max_entries: LRU bound (backend default if None)
+        ttl_seconds: Entry lifetime; None keeps entries until evicted
+        include_sampled: Also cache completions requested with a non-zero
+            temperature (each prompt then replays one frozen sample)
+
+    Returns:
+        Configured ResponseCache
+    """
+    backend = backend.lower()
+    kwargs: dict[str, Any] = {"ttl_seconds": ttl_seconds, "include_sampled": include_sampled}
+    if max_entries is not None:
+        kwargs["max_entries"] = max_entries
+
+    if backend == "memory":
+        return MemoryResponseCache(**kwargs)
+    if backend == "sqlite":
+        return SQLiteResponseCache(path or ".cache/universal_adapter/llm_responses.db", **kwargs)
+    if backend == "disk":
+        return DiskResponseCache(path or ".cache/universal_adapter/llm_responses", **kwargs)
+    raise ValueError(f"Unknown response cache backend: {backend}")
@@ -10,6 +10,7 @@ from .categorizer import (
     CategoryCriteria,
     CategoryMatch,
     EvaluationResult,
+    IncrementalEvaluation,
 )
 
 __all__ = [
@@ -17,4 +18,5 @@ __all__ = [
     'CategoryCriteria',
     'CategoryMatch',
     'EvaluationResult',
+    'IncrementalEvaluation',
 ]
@@ -10,16 +10,26 @@ Supports multiple matching strategies:
 - Semantic classification (LLM-based)
 - JSON structure validation
 - Custom predicates
+
+Responses can also be categorized incrementally from a token stream:
+a category is committed as soon as no later text could change the
+outcome, so router-style nodes can stop generation early.
 """
 
 from __future__ import annotations
 import re
 import json
-from dataclasses import dataclass, field
-from typing import Any, Callable, Mapping, Sequence
+from contextlib import aclosing
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable, Mapping, Sequence
 from enum import Enum, auto
 
 
+# Regex constructs whose outcome can depend on text after the match
+_END_SENSITIVE = re.compile(r'\$|\\Z|\\z|\(\?[=!]')
+
+
 class MatchStrategy(Enum):
     """Strategy for matching responses to categories."""
     KEYWORD = auto()      # Match if keywords present
@@ -75,6 +85,79 @@ class CategoryCriteria:
 
         return False
 
+    def prefix_state(self, prefix: str, anchor_window: int = 32) -> bool | None:
+        """
+        Decide this criterion from a response prefix, if possible.
+
+        Returns True if the full response will match whatever follows,
+        False if it cannot match, and None while undecided.
+
+        Anchored patterns (``^...``) are non-matching once the prefix is
+        longer than the longest possible match, or, for unbounded
+        patterns, once ``anchor_window`` characters arrived without one.
+
+        Keyword criteria can only ever become True early (a later keyword
+        may still appear), and JSON fields can only become False early:
+        ``evaluate`` parses the whole response, so text after a complete
+        object, a repeated key or a truncated value can still change a
+        match. A JSON field is excluded once the top-level value is
+        complete and its field differs, or the response is not an object.
+        """
+        if self.strategy == MatchStrategy.ALWAYS:
+            return True
+
+        if self.strategy == MatchStrategy.KEYWORD:
+            return True if self._match_keywords(prefix) else None
+
+        if self.strategy == MatchStrategy.NEGATION:
+            return False if self._match_keywords(prefix) else None
+
+        if self.strategy == MatchStrategy.PATTERN:
+            return self._pattern_prefix_state(prefix, anchor_window)
+
+        if self.strategy == MatchStrategy.JSON_FIELD:
+            return self._json_field_prefix_state(prefix)
+
+        if self.strategy == MatchStrategy.PREDICATE:
+            return None
+
+        return False
+
+    def _pattern_prefix_state(self, prefix: str, anchor_window: int) -> bool | None:
+        if not self.pattern:
+            return False
+        flags = 0 if self.case_sensitive else re.IGNORECASE
+        match = re.search(self.pattern, prefix, flags)
+        # A match that ends before the prefix does is unaffected by later
+        # text unless the pattern looks ahead or anchors to the end.
+        if match and match.end() < len(prefix) and not _END_SENSITIVE.search(self.pattern):
+            return True
+        if not match and _is_start_anchored(self.pattern):
+            max_width = _max_match_width(self.pattern)
+            window = max_width + 1 if max_width is not None else anchor_window
+            if len(prefix) >= window:
+                return False
+        return None
+
+    def _json_field_prefix_state(self, prefix: str) -> bool | None:
+        if not self.json_path:
+            return False
+        stripped = prefix.lstrip()
+        if stripped and not stripped.startswith("{"):
+            return False  # Not a JSON object, so json_path can never resolve
+        try:
+            data, end = json.JSONDecoder().raw_decode(stripped)
+        except json.JSONDecodeError:
+            return None  # Top-level value still incomplete (or invalid)
+        if stripped[end:].strip():
+            return False  # Trailing text: the full response cannot parse
+        try:
+            value = self._navigate_json(data, self.json_path)
+        except (KeyError, IndexError, TypeError, ValueError):
+            return False
+        # A match still depends on nothing but whitespace following
+        return None if value == self.expected_value else False
+
     def _match_keywords(self, response: str) -> bool:
         """Check if any keyword is present."""
         text = response if self.case_sensitive else response.lower()
@@ -154,6 +237,91 @@ class EvaluationResult:
         return self.confidence >= 0.8
 
 
+class IncrementalEvaluation:
+    """
+    Streaming evaluation state for a single response.
+
+    Feed text deltas as they arrive; ``feed`` returns an EvaluationResult
+    the first time the category is settled, i.e. the highest-priority
+    criterion that will match is known and every criterion ahead of it
+    is known not to match. ``finish`` evaluates the complete text.
+    """
+
+    def __init__(
+        self,
+        categorizer: ResponseCategorizer,
+        criteria: Sequence[CategoryCriteria],
+        anchor_window: int = 32,
+        max_prefix_chars: int = 4096,
+    ) -> None:
+        self._categorizer = categorizer
+        self._criteria = criteria
+        self._anchor_window = anchor_window
+        self._max_prefix_chars = max_prefix_chars
+        self._parts: list[str] = []
+        self._length = 0
+        self.committed: EvaluationResult | None = None
+
+    @property
+    def text(self) -> str:
+        """Text received so far."""
+        return "".join(self._parts)
+
+    def feed(self, delta: str) -> EvaluationResult | None:
+        """Add a delta; return the result if the category just settled."""
+        self._parts.append(delta)
+        self._length += len(delta)
+        # Past the decision window, wait for the full response instead
+        # of rescanning an ever-growing prefix.
+        if self.committed is not None or self._length > self._max_prefix_chars:
+            return None
+
+        prefix = self.text
+        for criterion in self._criteria:
+            state = criterion.prefix_state(prefix, self._anchor_window)
+            if state is None:
+                return None
+            if state:
+                self.committed = self._result(prefix, criterion)
+                return self.committed
+        self.committed = self._result(prefix, None)
+        return self.committed
+
+    def finish(self) -> EvaluationResult:
+        """Evaluate the complete response."""
+        result = self._categorizer._evaluate_criteria(self.text, self._criteria)
+        if self.committed is None:
+            return result
+        return replace(result, metadata={
+            **result.metadata,
+            "committed_at_chars": self.committed.metadata["committed_at_chars"],
+        })
+
+    def _result(self, prefix: str, criterion: CategoryCriteria | None) -> EvaluationResult:
+        if criterion is None:
+            return EvaluationResult(
+                response=prefix,
+                category=self._categorizer.default_category,
+                confidence=0.0,
+                matched_criteria=None,
+                all_matches=(),
+                metadata={"committed_at_chars": len(prefix)},
+            )
+        confidence = self._categorizer._calculate_confidence(criterion, prefix)
+        return EvaluationResult(
+            response=prefix,
+            category=criterion.name,
+            confidence=confidence,
+            matched_criteria=criterion,
+            all_matches=(CategoryMatch(
+                category=criterion.name,
+                confidence=confidence,
+                matched_by=criterion.strategy,
+            ),),
+            metadata={"committed_at_chars": len(prefix)},
+        )
+
+
 class ResponseCategorizer:
     """
     Categorizes LLM responses based on defined criteria.
@@ -200,11 +368,14 @@ class ResponseCategorizer:
         Returns:
             EvaluationResult with matched category
         """
-        all_criteria = list(self.criteria)
-        if extra_criteria:
-            all_criteria.extend(extra_criteria)
-            all_criteria.sort(key=lambda c: c.priority, reverse=True)
+        return self._evaluate_criteria(response, self._merged_criteria(extra_criteria))
 
+    def _evaluate_criteria(
+        self,
+        response: str,
+        all_criteria: Sequence[CategoryCriteria]
+    ) -> EvaluationResult:
+        """Evaluate a response against an already merged, sorted criteria list."""
         all_matches: list[CategoryMatch] = []
         matched_criteria: CategoryCriteria | None = None
         matched_category = self.default_category
@@ -233,6 +404,67 @@ class ResponseCategorizer:
             all_matches=tuple(all_matches),
         )
 
+    def incremental(
+        self,
+        extra_criteria: Sequence[CategoryCriteria] | None = None,
+        anchor_window: int = 32,
+        max_prefix_chars: int = 4096,
+    ) -> IncrementalEvaluation:
+        """
+        Start an incremental evaluation for a streamed response.
+
+        Args:
+            extra_criteria: Additional criteria for this evaluation only
+            anchor_window: Characters after which an unmatched ``^`` pattern
+                is considered excluded
+            max_prefix_chars: Stop attempting early commits beyond this length
+        """
+        return IncrementalEvaluation(
+            self,
+            self._merged_criteria(extra_criteria),
+            anchor_window=anchor_window,
+            max_prefix_chars=max_prefix_chars,
+        )
+
+    async def evaluate_stream(
+        self,
+        deltas: AsyncIterator[str],
+        cancel_on_commit: bool = True,
+        extra_criteria: Sequence[CategoryCriteria] | None = None,
+    ) -> EvaluationResult:
+        """
+        Categorize a streamed response, committing as early as possible.
+
+        Args:
+            deltas: Async iterator of text deltas (e.g. LLMClient.stream)
+            cancel_on_commit: Close the stream as soon as the category is
+                settled; the result then carries only the prefix received.
+                When False the stream is drained and the full text evaluated.
+            extra_criteria: Additional criteria for this evaluation only
+
+        Returns:
+            EvaluationResult; ``metadata["committed_at_chars"]`` records
+            where the category settled, and ``metadata["early_exit"]`` is
+            True when generation was cancelled.
+        """
+        state = self.incremental(extra_criteria)
+        async with aclosing(deltas) as stream:
+            async for delta in stream:
+                committed = state.feed(delta)
+                if committed is not None and cancel_on_commit:
+                    return replace(committed, metadata={**committed.metadata, "early_exit": True})
+        return state.finish()
+
+    def _merged_criteria(
+        self,
+        extra_criteria: Sequence[CategoryCriteria] | None
+    ) -> list[CategoryCriteria]:
+        all_criteria = list(self.criteria)
+        if extra_criteria:
+            all_criteria.extend(extra_criteria)
+            all_criteria.sort(key=lambda c: c.priority, reverse=True)
+        return all_criteria
+
     def _calculate_confidence(
         self,
         criterion: CategoryCriteria,
@@ -271,7 +503,10 @@ class ResponseCategorizer:
         Create a simple categorizer from edge labels.
 
         Converts labels like "success", "failure", "retry" into
-        keyword-based criteria.
+        keyword-based criteria. When streamed, only the first
+        (highest-priority) label can be committed early: a keyword
+        criterion is never excluded before the response ends, so lower
+        labels always wait for the full text.
         """
         criteria: list[CategoryCriteria] = []
 
@@ -302,6 +537,46 @@ class ResponseCategorizer:
         return cls(criteria=criteria, default_category=labels[-1] if labels else "unknown")
 
 
+def _is_start_anchored(pattern: str) -> bool:
+    """Check that a pattern can only match at the start of the text."""
+    if not pattern.startswith("^") or "(?m" in pattern:
+        return False
+    # A top-level alternation would let later branches match anywhere
+    depth = 0
+    in_class = False
+    escaped = False
+    for ch in pattern:
+        if escaped:
+            escaped = False
+        elif ch == "\\":
+            escaped = True
+        elif in_class:
+            in_class = ch != "]"
+        elif ch == "[":
+            in_class = True
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == "|" and depth == 0:
+            return False
+    return True
+
+
+@lru_cache(maxsize=256)
+def _max_match_width(pattern: str) -> int | None:
+    """Longest text a pattern can match, or None if unbounded/unknown."""
+    try:
+        from re import _parser as sre_parse  # type: ignore[attr-defined]
+    except ImportError:  # Python < 3.11
+        import sre_parse  # type: ignore[no-redef]
+    try:
+        _, max_width = sre_parse.parse(pattern).getwidth()
+    except Exception:
+        return None
+    return max_width if max_width < sre_parse.MAXREPEAT else None
+
+
 # Convenience factory functions
 def success_failure_categorizer() -> ResponseCategorizer:
     """Create a categorizer for simple success/failure classification."""
@@ -2,12 +2,22 @@
 Universal Adapter JSONL Logger
 
 Writes structured run metadata to disk for later aggregation by agents.
+
+Events are serialized on the caller's thread and handed to a background
+writer that appends them in batches, so callers on the event loop never
+block on file I/O. Set UNIVERSAL_ADAPTER_LOG_SYNC=1 (or true/yes) to
+write inline.
 """
 
 from __future__ import annotations
+import atexit
 import json
 import hashlib
+import logging
 import os
+import queue
+import threading
+import time
 from pathlib import Path
 from typing import Any, Mapping, Sequence
 from datetime import datetime, timezone
@@ -15,6 +25,8 @@ from datetime import datetime, timezone
 LOG_DIR = Path(os.environ.get("UNIVERSAL_ADAPTER_LOG_DIR", "logs/universal_adapter"))
 RUN_LOG = LOG_DIR / "adapter_runs.jsonl"
 
+logger = logging.getLogger("universal_adapter")
+
 
 def _ensure_log_dir() -> None:
     LOG_DIR.mkdir(parents=True, exist_ok=True)
@@ -82,20 +94,281 @@ def _shrink(value: Any, *, max_len: int = 4000, max_items: int = 50, depth: int
         return "<unserializable>"
 
 
-def log_run_event(event: Mapping[str, Any]) -> None:
+def _serialize_event(event: Mapping[str, Any]) -> str:
+    payload = dict(event)
+    payload["@timestamp"] = payload.get("@timestamp") or _iso_now()
+    payload = {k: _shrink(v) for k, v in payload.items()}
+    return json.dumps(payload, ensure_ascii=False) + "\n"
+
+
+class RunLogWriter:
+    """
+    Background JSONL writer with a bounded queue.
+
+    Each event is one pre-serialized line and batches are written with a
+    single write() by a single thread, so lines never interleave.
+
+    Args:
+        path: Target JSONL file
+        max_queue: Queue bound; when full, events are dropped (or the
+            caller blocks if block_on_full is set)
+        batch_size: Flush once this many lines are pending
+        flush_interval: Flush pending lines at least this often (seconds)
+        fsync: "never", "batch" (after every write) or "interval"
+            (at most every fsync_interval seconds)
+        max_bytes: Rotate when the file would exceed this size (0 disables)
+        backup_count: Rotated files to keep (path.1 … path.N)
     """
-    Append a single run event to JSONL log.
+
+    FSYNC_POLICIES = ("never", "batch", "interval")
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        max_queue: int = 10000,
+        batch_size: int = 256,
+        flush_interval: float = 0.5,
+        fsync: str = "never",
+        fsync_interval: float = 5.0,
+        max_bytes: int = 50 * 1024 * 1024,
+        backup_count: int = 5,
+        block_on_full: bool = False,
+    ):
+        if fsync not in self.FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {self.FSYNC_POLICIES}")
+        self.path = Path(path)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.block_on_full = block_on_full
+
+        self.written = 0
+        self.dropped = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._file = None
+        self._size = 0
+        self._last_fsync = time.monotonic()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="universal-adapter-run-log", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    # =========================================================================
+    # Producer side
+    # =========================================================================
+
+    def write(self, line: str) -> bool:
+        """Queue one serialized line; returns False if it was dropped."""
+        if self._closed:
+            return False
+        try:
+            if self.block_on_full:
+                self._queue.put(line)
+            else:
+                self._queue.put_nowait(line)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until every line queued so far has been written."""
+        if self._closed:
+            # close() drains the queue; the stopped writer sets no markers
+            self._thread.join(timeout)
+            return not self._thread.is_alive()
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        if self._closed:
+            # close() raced with us; the marker may sit behind the stop sentinel
+            self._thread.join(timeout)
+            return done.is_set() or not self._thread.is_alive()
+        return done.wait(timeout)
+
+    def close(self) -> None:
+        """Flush remaining lines and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        atexit.unregister(self.close)
+
+    # =========================================================================
+    # Writer thread
+    # =========================================================================
+
+    def _run(self) -> None:
+        pending: list[str] = []
+        waiters: list[threading.Event] = []
+        deadline = None
+        stop = False
+        while not stop:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = False
+            # Drain whatever else is already queued without waiting
+            while True:
+                if item is None:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                elif item is not False:
+                    pending.append(item)
+                    if deadline is None:
+                        deadline = time.monotonic() + self.flush_interval
+                if stop or len(pending) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if pending and (
+                stop or waiters or len(pending) >= self.batch_size
+                or time.monotonic() >= deadline
+            ):
+                self._write_batch(pending)
+                pending = []
+                deadline = None
+            if waiters and not pending:
+                for waiter in waiters:
+                    waiter.set()
+                waiters = []
+        self._close_file()
+
+    def _write_batch(self, lines: list[str]) -> None:
+        data = "".join(lines).encode("utf-8")
+        try:
+            with self._lock:
+                if self._file is None:
+                    self._open_file()
+                elif self.max_bytes and self._size + len(data) > self.max_bytes and self._size:
+                    self._rotate()
+                self._file.write(data)
+                self._file.flush()
+                self._size += len(data)
+                now = time.monotonic()
+                if self.fsync == "batch" or (
+                    self.fsync == "interval" and now - self._last_fsync >= self.fsync_interval
+                ):
+                    os.fsync(self._file.fileno())
+                    self._last_fsync = now
+            self.written += len(lines)
+        except Exception:
+            # Logging must not break execution
+            self.dropped += len(lines)
+            self._close_file()
+
+    def _open_file(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("ab")
+        self._size = self._file.tell()
+
+    def _rotate(self) -> None:
+        self._close_file()
+        if self.backup_count > 0:
+            for index in range(self.backup_count - 1, 0, -1):
+                source = self.path.with_name(f"{self.path.name}.{index}")
+                if source.exists():
+                    source.replace(self.path.with_name(f"{self.path.name}.{index + 1}"))
+            self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink(missing_ok=True)
+        self._open_file()
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            try:
+                if self.fsync != "never":
+                    os.fsync(self._file.fileno())
+                self._file.close()
+            except Exception:
+                pass
+            self._file = None
+
+
+_writer: RunLogWriter | None = None
+_writer_lock = threading.Lock()
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").lower() in ("1", "true", "yes")
+
+
+def _writer_settings() -> dict[str, Any]:
+    """Read writer settings from the environment, falling back on bad values."""
+    fsync = os.environ.get("UNIVERSAL_ADAPTER_LOG_FSYNC", "never").lower()
+    if fsync not in RunLogWriter.FSYNC_POLICIES:
+        logger.warning(
+            "Ignoring UNIVERSAL_ADAPTER_LOG_FSYNC=%r (expected one of %s); using 'never'",
+            fsync, ", ".join(RunLogWriter.FSYNC_POLICIES),
+        )
+        fsync = "never"
+    max_bytes = 50 * 1024 * 1024
+    raw_max_bytes = os.environ.get("UNIVERSAL_ADAPTER_LOG_MAX_BYTES")
+    if raw_max_bytes is not None:
+        try:
+            max_bytes = int(raw_max_bytes)
+        except ValueError:
+            logger.warning(
+                "Ignoring UNIVERSAL_ADAPTER_LOG_MAX_BYTES=%r (expected an integer)", raw_max_bytes
+            )
+    return {"fsync": fsync, "max_bytes": max_bytes}
+
+
+def get_run_writer() -> RunLogWriter:
+    """Return the shared writer for RUN_LOG, starting it on first use."""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = RunLogWriter(RUN_LOG, **_writer_settings())
+    return _writer
+
+
+def flush_run_log(timeout: float | None = 5.0) -> bool:
+    """Wait until queued run events have been written to disk."""
+    return _writer.flush(timeout) if _writer is not None else True
+
+
+def log_run_event_sync(event: Mapping[str, Any]) -> None:
+    """
+    Append a single run event to JSONL log on the calling thread.
 
     Errors are swallowed to avoid impacting execution.
     """
     try:
         _ensure_log_dir()
-        payload = dict(event)
-        payload["@timestamp"] = payload.get("@timestamp") or _iso_now()
-        payload = {k: _shrink(v) for k, v in payload.items()}
         with RUN_LOG.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(payload, ensure_ascii=False))
-            f.write("\n")
+            f.write(_serialize_event(event))
+    except Exception:
+        # Logging must not break execution
+        return
+
+
+def log_run_event(event: Mapping[str, Any]) -> None:
+    """
+    Queue a single run event for the background JSONL writer.
+
+    Errors are swallowed to avoid impacting execution.
+    """
+    if _env_flag("UNIVERSAL_ADAPTER_LOG_SYNC"):
+        log_run_event_sync(event)
+        return
+    try:
+        get_run_writer().write(_serialize_event(event))
     except Exception:
         # Logging must not break execution
         return
@@ -95,6 +95,7 @@ class ResourceLLM:
     max_tokens: int = 4096
     timeout_seconds: int = 120
     assigned_by: str | None = None # 'user' | 'milton' | 'fallback' - tracks who assigned LLM
+    cache: bool = True             # Allow response caching for this task when a cache is configured
 
     def __post_init__(self) -> None:
         # Only validate temperature if provider is specified (execution phase)
@@ -118,7 +119,8 @@ class ResourceLLM:
             temperature=float(data.get('temperature', 0.7)),
             max_tokens=int(data.get('max_tokens', 4096)),
             timeout_seconds=int(data.get('timeout_seconds', 120)),
-            assigned_by=data.get('assigned_by')
+            assigned_by=data.get('assigned_by'),
+            cache=bool(data.get('cache', True))
         )
 
 
@@ -200,6 +202,8 @@ class Prompt:
     template: str              # Prompt template with interpolation markers
     role: str = "user"         # Message role: "user", "assistant", "system"
     description: str = ""      # Human-readable step description
+    cache: bool = True         # Allow response caching for this node
+    early_exit: bool = False   # Stream and stop generation once the branch is decided
 
     def __post_init__(self) -> None:
         if self.index < 0:
@@ -214,7 +218,9 @@ class Prompt:
             index=index,
             template=data.get('template', ''),
             role=data.get('role', 'user'),
-            description=data.get('description', '')
+            description=data.get('description', ''),
+            cache=bool(data.get('cache', True)),
+            early_exit=bool(data.get('early_exit', False))
         )
 
 
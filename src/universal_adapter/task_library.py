@@ -4,20 +4,77 @@ Task Library - Named task registry for the Universal Adapter.
 Provides a lightweight mechanism to load task.json files by task name
 so calling code can invoke `adapter.execute("simple_qa")` instead of
 managing file paths directly.
+
+Parsed tasks are cached in-process and invalidated by file mtime/size.
+An optional JSON index file persists each task's mtime, size, content
+hash, extracted metadata and validated schema, so listing a large
+library reads one file and only changed task files are re-parsed. The
+index is written by refresh() and describe_all(), not by every load().
 """
 
 from __future__ import annotations
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass, field, asdict
 from pathlib import Path
-from typing import Mapping, Iterable
+from typing import Any, Mapping, Iterable
 
 from .schema import TaskSchema
 
+INDEX_VERSION = 1
+
+
+@dataclass
+class TaskMetadata:
+    """Index entry for one task file."""
+    name: str
+    path: str
+    mtime_ns: int = 0
+    size: int = 0
+    sha256: str = ""
+    version: str = ""
+    description: str = ""
+    prompt_count: int = 0
+    error: str | None = None
+    schema: dict[str, Any] | None = field(default=None, repr=False)
+
+    @property
+    def available(self) -> bool:
+        return self.error is None and self.schema is not None
+
+    def matches(self, stat: os.stat_result) -> bool:
+        return self.mtime_ns == stat.st_mtime_ns and self.size == stat.st_size
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> TaskMetadata:
+        return cls(**{k: data[k] for k in cls.__dataclass_fields__ if k in data})
+
 
 class TaskLibrary:
-    """Immutable registry mapping task names to JSON file paths."""
+    """
+    Immutable registry mapping task names to JSON file paths.
 
-    def __init__(self, task_map: Mapping[str, str]) -> None:
+    Args:
+        task_map: Task name to task.json path
+        index_path: Optional JSON index persisted across processes
+    """
+
+    def __init__(self, task_map: Mapping[str, str], index_path: str | Path | None = None) -> None:
         self._tasks = {name: Path(path) for name, path in task_map.items()}
+        self.index_path = Path(index_path) if index_path else None
+        self._lock = threading.RLock()
+        self._meta: dict[str, TaskMetadata] = {}
+        self._schemas: dict[str, TaskSchema] = {}
+        self._index_loaded = False
+        self._index_dirty = False
+        self._watcher = None
+        # Names whose files changed since the watcher last reported
+        self._changed: set[str] = set()
 
     def list_tasks(self) -> list[str]:
         """Return available task names."""
@@ -28,19 +85,228 @@ class TaskLibrary:
         return self._tasks.get(name)
 
     def load(self, name: str) -> TaskSchema:
-        """Load a task by name."""
+        """Load a task by name, reusing the parsed schema while the file is unchanged."""
         path = self.get_path(name)
         if not path:
             raise ValueError(f"Unknown task '{name}'. Available: {', '.join(self.list_tasks())}")
-        if not path.exists():
-            raise FileNotFoundError(f"Task file not found for '{name}': {path}")
-        return TaskSchema.from_file(str(path))
+        meta = self._entry(name)
+        if meta.error is not None:
+            if not path.exists():
+                raise FileNotFoundError(f"Task file not found for '{name}': {path}")
+            raise ValueError(f"Invalid task '{name}': {meta.error}")
+        with self._lock:
+            schema = self._schemas.get(name)
+            if schema is None:
+                schema = self._schemas[name] = TaskSchema.from_dict(meta.schema)
+        return schema
+
+    def describe(self, name: str) -> TaskMetadata:
+        """Return indexed metadata for a task without re-parsing unchanged files."""
+        if name not in self._tasks:
+            raise ValueError(f"Unknown task '{name}'. Available: {', '.join(self.list_tasks())}")
+        return self._entry(name)
+
+    def describe_all(self) -> list[TaskMetadata]:
+        """Return metadata for every task, refreshing only changed files."""
+        self.refresh()
+        with self._lock:
+            return [self._meta[name] for name in self.list_tasks()]
+
+    def refresh(self) -> int:
+        """
+        Bring the index up to date and persist it if anything changed.
+
+        Returns:
+            Number of task files that were re-read
+        """
+        reread = 0
+        for name in self.list_tasks():
+            before = self._meta.get(name)
+            if self._entry(name) is not before:
+                reread += 1
+        self._save_index()
+        return reread
 
     @classmethod
     def from_pairs(cls, pairs: Iterable[tuple[str, str]]) -> TaskLibrary:
         """Create a TaskLibrary from iterable of (name, path)."""
         return cls({name: path for name, path in pairs})
 
+    # =========================================================================
+    # Cache and index
+    # =========================================================================
+
+    def _entry(self, name: str) -> TaskMetadata:
+        """
+        Return the current entry for a task, re-reading the file only if it changed.
+
+        Changes are persisted by the next refresh().
+        """
+        self._load_index()
+        path = self._tasks[name]
+        with self._lock:
+            meta = self._meta.get(name)
+            if meta is not None and self._watcher is not None and name not in self._changed:
+                return meta
+            self._changed.discard(name)
+        try:
+            stat = path.stat()
+        except OSError as e:
+            stat = None
+            missing_error = f"Task file not found: {e}"
+        with self._lock:
+            meta = self._meta.get(name)
+            if stat is None:
+                if meta is None or meta.error != missing_error:
+                    meta = self._meta[name] = TaskMetadata(name=name, path=str(path), error=missing_error)
+                    self._schemas.pop(name, None)
+                    self._index_dirty = True
+                return meta
+            if meta is not None and meta.path == str(path) and meta.matches(stat):
+                return meta
+
+        previous, meta = meta, self._read(name, path, stat, meta)
+        with self._lock:
+            self._meta[name] = meta
+            if previous is None or previous.sha256 != meta.sha256:
+                self._schemas.pop(name, None)
+            self._index_dirty = True
+        return meta
+
+    @staticmethod
+    def _read(name: str, path: Path, stat: os.stat_result,
+              previous: TaskMetadata | None) -> TaskMetadata:
+        raw = path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        if previous is not None and previous.sha256 == digest and previous.path == str(path):
+            # Touched but not modified: keep the parsed result
+            return TaskMetadata(**{**previous.to_dict(), "mtime_ns": stat.st_mtime_ns, "size": stat.st_size})
+        meta = TaskMetadata(name=name, path=str(path), mtime_ns=stat.st_mtime_ns,
+                            size=stat.st_size, sha256=digest)
+        try:
+            data = json.loads(raw.decode("utf-8"))
+            schema = TaskSchema.from_dict(data)
+        except Exception as e:
+            meta.error = str(e)
+            return meta
+        meta.schema = data
+        meta.version = schema.version
+        meta.description = schema.goal.description
+        meta.prompt_count = len(schema.prompts)
+        return meta
+
+    def _load_index(self) -> None:
+        if self._index_loaded:
+            return
+        with self._lock:
+            if self._index_loaded:
+                return
+            self._index_loaded = True
+            if self.index_path is None or not self.index_path.exists():
+                return
+            try:
+                data = json.loads(self.index_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                return
+            if data.get("version") != INDEX_VERSION:
+                return
+            for name, entry in data.get("tasks", {}).items():
+                if name in self._tasks:
+                    self._meta[name] = TaskMetadata.from_dict(entry)
+
+    def _save_index(self) -> None:
+        if self.index_path is None or not self._index_dirty:
+            return
+        with self._lock:
+            payload = {
+                "version": INDEX_VERSION,
+                "tasks": {name: meta.to_dict() for name, meta in self._meta.items()},
+            }
+            self._index_dirty = False
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.index_path.with_name(f".{self.index_path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, self.index_path)
+        except OSError:
+            # The index is an optimization; a failed write only costs a re-read
+            self._index_dirty = True
+
+    # =========================================================================
+    # Filesystem watching
+    # =========================================================================
+
+    def watch(self, poll_interval: float = 2.0) -> None:
+        """
+        Watch task files so cached entries are trusted without a stat per call.
+
+        Uses watchdog when installed, otherwise a polling thread that
+        checks mtimes every poll_interval seconds.
+        """
+        if self._watcher is not None:
+            return
+        by_path = {str(path.resolve()): name for name, path in self._tasks.items()}
+        try:
+            from watchdog.observers import Observer
+            from watchdog.events import FileSystemEventHandler
+        except ImportError:
+            self._watcher = _PollingWatcher(self, poll_interval)
+            self._watcher.start()
+            return
+
+        library = self
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                for attr in ("src_path", "dest_path"):
+                    name = by_path.get(str(Path(getattr(event, attr, "") or "").resolve()))
+                    if name is not None:
+                        library._mark_changed(name)
+
+        observer = Observer()
+        for directory in {str(Path(p).parent) for p in by_path}:
+            observer.schedule(_Handler(), directory, recursive=False)
+        observer.daemon = True
+        observer.start()
+        self._watcher = observer
+
+    def unwatch(self) -> None:
+        """Stop the filesystem watcher; entries are stat-checked again."""
+        watcher, self._watcher = self._watcher, None
+        if watcher is not None:
+            watcher.stop()
+            watcher.join()
+
+    def _mark_changed(self, name: str) -> None:
+        with self._lock:
+            self._changed.add(name)
+
+
+class _PollingWatcher(threading.Thread):
+    """Fallback watcher that polls task file mtimes."""
+
+    def __init__(self, library: TaskLibrary, interval: float) -> None:
+        super().__init__(name="task-library-watcher", daemon=True)
+        self.library = library
+        self.interval = interval
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            with self.library._lock:
+                entries = [(name, path, self.library._meta.get(name))
+                           for name, path in self.library._tasks.items()]
+            for name, path, meta in entries:
+                try:
+                    stat = path.stat()
+                except OSError:
+                    stat = None
+                if meta is None or stat is None or not meta.matches(stat):
+                    self.library._mark_changed(name)
+
+    def stop(self) -> None:
+        self._stopped.set()
+
 
 # Default task library pointing at bundled examples
 BASE_DIR = Path(__file__).parent
@@ -57,4 +323,4 @@ DEFAULT_TASK_LIBRARY = TaskLibrary({
     "agent_registry_bootstrap": str(BASE_DIR / "examples/agent_registry_bootstrap_task.json"),
     "serena_tool_router": str(BASE_DIR / "examples/serena_tool_router_task.json"),
     "converter_pipeline": str(BASE_DIR / "examples/converter_pipeline_task.json"),
-})
+}, index_path=os.environ.get("UNIVERSAL_ADAPTER_TASK_INDEX"))
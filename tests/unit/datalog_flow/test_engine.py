@@ -0,0 +1,178 @@
+"""
+Tests for the Datalog flow engine's in-process evaluator and query cache.
+"""
+
+import dataclasses
+import importlib.util
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# The runtime lives in a hyphenated directory, so load it by path
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+ENGINE_PATH = PROJECT_ROOT / "src" / "native" / "datalog-flow" / "runtime" / "engine.py"
+_spec = importlib.util.spec_from_file_location("datalog_flow_engine", ENGINE_PATH)
+engine_module = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = engine_module
+_spec.loader.exec_module(engine_module)
+
+DatalogEngine = engine_module.DatalogEngine
+FlowEvaluator = engine_module.FlowEvaluator
+NodeType = engine_module.NodeType
+
+
+def _engine(edges, **kwargs) -> DatalogEngine:
+    engine = DatalogEngine(**kwargs)
+    engine._souffle_available = False
+    names = sorted({n for edge in edges for n in edge[:2]})
+    for name in names:
+        engine.add_node(name, NodeType.ACTION, f"{name}_handler")
+    for edge in edges:
+        engine.add_edge(*edge)
+    return engine
+
+
+def _closure(edges) -> set:
+    reach = {(f, t) for f, t, *_ in edges}
+    while True:
+        step = {(f, t2) for f, t in reach for t1, t2 in reach if t == t1} - reach
+        if not step:
+            return reach
+        reach |= step
+
+
+class TestFlowEvaluator:
+    """Relations computed by FlowEvaluator."""
+
+    def test_incremental_closure_matches_brute_force(self):
+        """Test reachable against a brute-force closure on random graphs."""
+        rng = random.Random(7)
+        for _ in range(50):
+            edges = [(f"n{rng.randrange(8)}", f"n{rng.randrange(8)}") for _ in range(rng.randrange(1, 14))]
+            engine = _engine(edges)
+
+            assert set(engine.query("reachable")) == _closure(edges)
+
+    def test_topo_level_is_longest_path(self):
+        """Test that a node joining a short and a long branch takes the deeper level."""
+        engine = _engine([("a", "b"), ("b", "c"), ("c", "d"), ("a", "d")])
+
+        assert dict(engine.query("topo_level")) == {"a": "0", "b": "1", "c": "2", "d": "3"}
+        assert engine.get_execution_order() == ["a", "b", "c", "d"]
+
+    def test_topo_level_covers_cycles(self):
+        """Test that nodes on a cycle take the level at which they are first derived."""
+        engine = _engine([("a", "b"), ("b", "c"), ("c", "b"), ("c", "d")])
+
+        assert dict(engine.query("topo_level")) == {"a": "0", "b": "1", "c": "2", "d": "3"}
+
+    def test_routing_follows_condition_labels(self):
+        """Test can_execute and next_node as execution state changes."""
+        engine = _engine([("start", "check"), ("check", "yes", "yes"), ("check", "no", "no")])
+
+        assert engine.get_next_nodes() == ["start"]
+        engine.mark_executed("start")
+        engine.mark_executed("check", {"condition_label": "no"})
+
+        assert engine.get_next_from_current() == "no"
+        assert sorted(engine.get_next_nodes()) == ["no", "yes"]
+
+
+class TestGraphIsReadOnly:
+    """The graph changes only through add_node and add_edge."""
+
+    def test_direct_edge_replacement_is_rejected(self):
+        """Test that edges cannot be replaced or edited behind the evaluator's back."""
+        engine = _engine([("a", "b"), ("b", "c")])
+        assert engine.query("is_dag") == [()]
+
+        with pytest.raises(TypeError):
+            engine.edges[1] = engine_module.Edge("c", "a")
+        with pytest.raises(AttributeError):
+            engine.edges.append(engine_module.Edge("c", "a"))
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            engine.edges[1].to_node = "a"
+        with pytest.raises(TypeError):
+            engine.nodes["a"] = engine_module.Node("a", NodeType.START, "h")
+
+        assert [(e.from_node, e.to_node) for e in engine.edges] == [("a", "b"), ("b", "c")]
+        assert engine.query("is_dag") == [()]
+
+    def test_add_edge_after_query_is_seen(self):
+        """Test that an edge added after a cached query changes the result."""
+        engine = _engine([("a", "b"), ("b", "c")])
+        assert engine.query("is_dag") == [()]
+
+        engine.add_edge("c", "a")
+
+        assert engine.query("is_dag") == []
+        assert ("c", "b") in engine.query("reachable")
+
+
+class TestQueryCache:
+    """Caching of query results."""
+
+    def _count_evaluations(self, engine, monkeypatch) -> list:
+        calls = []
+        original = FlowEvaluator.evaluate
+        monkeypatch.setattr(FlowEvaluator, "evaluate",
+                            lambda self, relation: calls.append(relation) or original(self, relation))
+        return calls
+
+    def test_repeated_query_is_served_from_cache(self, monkeypatch):
+        """Test that an unchanged flow is evaluated once per relation."""
+        engine = _engine([("a", "b")])
+        calls = self._count_evaluations(engine, monkeypatch)
+
+        first = engine.query("can_execute")
+        first.append(("mutated",))
+
+        assert engine.query("can_execute") == [("a",)]
+        assert calls == ["can_execute"]
+
+    def test_graph_and_state_changes_invalidate(self, monkeypatch):
+        """Test that node replacement and execution state are part of the key."""
+        engine = _engine([("a", "b")])
+        calls = self._count_evaluations(engine, monkeypatch)
+
+        engine.query("end_node")
+        engine.add_node("b", NodeType.PROMPT, "other")
+        engine.query("end_node")
+        engine.add_node("b", NodeType.PROMPT, "other")
+        engine.query("end_node")
+        engine.mark_executed("a")
+        engine.query("end_node")
+        engine.reset()
+        engine.query("end_node")
+
+        assert calls == ["end_node"] * 3
+
+    def test_state_edits_in_place_are_seen(self):
+        """Test that editing state outputs in place changes the cached answer."""
+        engine = _engine([("a", "b"), ("a", "c")])
+
+        engine.mark_executed("a", {"condition_label": "x"})
+        first = engine.query("available_data")
+        engine.state.outputs["a"] = {"k": "v"}
+        second = engine.query("available_data")
+
+        assert first == []
+        assert second == [("a", "k", "v"), ("b", "k", "v"), ("c", "k", "v")]
+
+
+class TestSouffleRouting:
+    """Which queries go to Soufflé."""
+
+    def test_topo_level_never_uses_souffle(self, monkeypatch):
+        """Test that topo_level is evaluated in-process even above the threshold."""
+        engine = _engine([("a", "b"), ("b", "c"), ("a", "c")], inline_threshold=0)
+        engine._souffle_available = True
+        sent = []
+        monkeypatch.setattr(engine, "_query_souffle", lambda relation: sent.append(relation) or [])
+
+        assert dict(engine.query("topo_level")) == {"a": "0", "b": "1", "c": "2"}
+        engine.query("reachable")
+
+        assert sent == ["reachable"]
@@ -0,0 +1,205 @@
+"""
+Tests for the concurrent batch runner and the run-batch command.
+"""
+
+import asyncio
+import io
+import json
+import sys
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+# Add src directory to path
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+SRC_PATH = PROJECT_ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from universal_adapter import api
+from universal_adapter.api import (
+    APIResponse,
+    TaskExecutionResult,
+    TaskRequest,
+    ValidationLevel,
+    load_task_requests,
+    run_tasks,
+    run_tasks_sync,
+)
+from universal_adapter.cli import CLICommands
+from universal_adapter.security import create_admin_context
+
+EXAMPLE_TASK = SRC_PATH / "universal_adapter" / "examples" / "simple_qa_task.json"
+
+
+def _task(provider: str) -> dict:
+    task = json.loads(EXAMPLE_TASK.read_text(encoding="utf-8"))
+    task["resource_llm"]["provider"] = provider
+    return task
+
+
+def _request(provider: str, n: int, delay: float = 0.01, **variables) -> TaskRequest:
+    return TaskRequest(task=_task(provider), variables={"n": n, "delay": delay, **variables})
+
+
+class FakeExecutor:
+    """Stands in for execute_request and records in-flight executions."""
+
+    def __init__(self):
+        self.in_flight = Counter()
+        self.peak = Counter()
+        self.real = api.execute_request
+
+    async def __call__(self, request, **kwargs):
+        if isinstance(request.task, dict):
+            # Unloadable task: let the real code path report it
+            return await self.real(request, **kwargs)
+
+        provider = request.task.resource_llm.provider
+        self.in_flight[provider] += 1
+        self.in_flight["*"] += 1
+        self.peak[provider] = max(self.peak[provider], self.in_flight[provider])
+        self.peak["*"] = max(self.peak["*"], self.in_flight["*"])
+        try:
+            await asyncio.sleep(request.variables["delay"])
+            if request.variables.get("boom"):
+                raise RuntimeError("provider exploded")
+        finally:
+            self.in_flight[provider] -= 1
+            self.in_flight["*"] -= 1
+        return APIResponse.ok(data=TaskExecutionResult(
+            success=True,
+            goal_met=True,
+            status="COMPLETED",
+            final_response=request.variables["n"],
+            execution_time_ms=0.0,
+            iteration_count=1,
+        ))
+
+
+@pytest.fixture
+def executor(monkeypatch):
+    fake = FakeExecutor()
+    monkeypatch.setattr(api, "execute_request", fake)
+    return fake
+
+
+def _collect(requests, **kwargs):
+    async def collect():
+        return [item async for item in run_tasks(requests, security_context=create_admin_context(), **kwargs)]
+    return asyncio.run(collect())
+
+
+class TestRunTasks:
+    """Tests for run_tasks concurrency, ordering and isolation."""
+
+    def test_per_provider_and_global_caps(self, executor):
+        """Test that in-flight executions respect both limits."""
+        requests = [_request("anthropic" if i % 2 else "openai", i) for i in range(12)]
+
+        results = _collect(requests, max_concurrency=3, per_provider_limits={"Anthropic": 1})
+
+        assert len(results) == 12
+        assert executor.peak["anthropic"] == 1
+        assert executor.peak["*"] <= 3
+        assert executor.peak["openai"] >= 2
+        assert {item.provider for item in results} == {"anthropic", "openai"}
+
+    def test_results_stream_in_completion_order(self, executor):
+        """Test that run_tasks yields as executions finish and run_tasks_sync restores input order."""
+        requests = [_request("openai", i, delay=0.05 - 0.01 * i) for i in range(5)]
+
+        streamed = [item.index for item in _collect(requests, max_concurrency=5)]
+        ordered = run_tasks_sync(requests, max_concurrency=5, security_context=create_admin_context())
+
+        assert streamed == [4, 3, 2, 1, 0]
+        assert [item.index for item in ordered] == [0, 1, 2, 3, 4]
+        assert [item.response.data.final_response for item in ordered] == [0, 1, 2, 3, 4]
+
+    def test_failures_are_isolated_per_task(self, executor):
+        """Test that a raising execution and an invalid task do not affect the others."""
+        requests = [
+            _request("openai", 0),
+            _request("openai", 1, boom=True),
+            TaskRequest(task={"name": "broken"}),
+            _request("anthropic", 3),
+        ]
+
+        results = {item.index: item for item in _collect(requests, max_concurrency=2)}
+
+        assert sorted(results) == [0, 1, 2, 3]
+        assert results[0].response.success and results[3].response.success
+        assert not results[1].response.success
+        assert "provider exploded" in results[1].response.error
+        assert not results[2].response.success
+        assert results[2].provider == "unknown"
+
+
+class TestLoadTaskRequests:
+    """Tests for JSONL request parsing."""
+
+    def test_parses_lines_aliases_and_comments(self):
+        """Test that blank and comment lines are skipped and aliases are honoured."""
+        lines = [
+            "# batch file",
+            "",
+            json.dumps({"task": "simple_qa", "variables": {"question": "a"}, "provider": "openai", "model": "gpt-4o"}),
+            json.dumps({"task": "simple_qa", "validation_level": "basic", "use_cache": False, "tags": ["x"]}),
+        ]
+
+        first, second = load_task_requests(lines)
+
+        assert first.variables == {"question": "a"}
+        assert (first.provider_override, first.model_override) == ("openai", "gpt-4o")
+        assert second.validation_level is ValidationLevel.BASIC
+        assert second.use_cache is False and second.tags == ["x"]
+
+    def test_errors_report_line_numbers(self, tmp_path):
+        """Test that bad JSON, missing tasks and bad enum names name the offending line."""
+        for bad_line in ("{not json", json.dumps({"variables": {}}), json.dumps({"task": "t", "validation_level": "loose"})):
+            path = tmp_path / "requests.jsonl"
+            path.write_text(json.dumps({"task": "simple_qa"}) + "\n\n" + bad_line + "\n", encoding="utf-8")
+
+            with pytest.raises(ValueError, match="line 3"):
+                load_task_requests(path)
+
+    def test_from_dict_requires_task(self):
+        """Test that TaskRequest.from_dict rejects requests without a task."""
+        with pytest.raises(ValueError):
+            TaskRequest.from_dict({"variables": {}})
+
+
+class TestRunBatchCommand:
+    """Tests for CLICommands.run_batch."""
+
+    def test_streams_one_line_per_result_and_summarizes(self, executor, tmp_path):
+        """Test the streamed JSONL output and the batch summary."""
+        source = tmp_path / "requests.jsonl"
+        source.write_text("\n".join([
+            json.dumps({"task": _task("openai"), "variables": {"n": 0, "delay": 0.01}}),
+            json.dumps({"task": _task("openai"), "variables": {"n": 1, "delay": 0.01, "boom": True}}),
+            json.dumps({"task": _task("anthropic"), "variables": {"n": 2, "delay": 0.01}}),
+        ]), encoding="utf-8")
+        out = io.StringIO()
+        cli = CLICommands(output_stream=out, security_context=create_admin_context())
+
+        result = cli.run_batch(str(source), max_concurrency=2, provider_limits={"openai": 1})
+
+        streamed = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert sorted(item["index"] for item in streamed) == [0, 1, 2]
+        assert not result.success
+        assert result.data["total"] == 3 and result.data["succeeded"] == 2 and result.data["failed"] == 1
+        assert result.errors == ["#1: provider exploded"]
+        assert executor.peak["openai"] == 1
+
+    def test_invalid_request_file_fails_cleanly(self, tmp_path):
+        """Test that a malformed JSONL file is reported, not raised."""
+        source = tmp_path / "requests.jsonl"
+        source.write_text("{oops\n", encoding="utf-8")
+        cli = CLICommands(output_stream=io.StringIO(), security_context=create_admin_context())
+
+        result = cli.run_batch(str(source))
+
+        assert not result.success
+        assert "line 1" in result.errors[0]
@@ -0,0 +1,270 @@
+"""
+Tests for the LLM response cache backends and LLMClient caching.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add src directory to path
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+SRC_PATH = PROJECT_ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from universal_adapter.cli import _build_response_cache, create_parser
+from universal_adapter.engine import response_cache
+from universal_adapter.engine.llm_client import LLMClient, LLMRequest, LLMResponse
+from universal_adapter.engine.response_cache import (
+    DiskResponseCache,
+    MemoryResponseCache,
+    SQLiteResponseCache,
+    cache_key,
+    create_response_cache,
+)
+from universal_adapter.schema import ResourceLLM
+
+
+class FakeClock:
+    """Replaces the time module inside response_cache."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+def _response(content: str) -> LLMResponse:
+    return LLMResponse(content=content, model="m", finish_reason="stop", usage={"total_tokens": 3})
+
+
+@pytest.fixture(params=["memory", "sqlite", "disk"])
+def make_cache(request, tmp_path):
+    """Factory for each backend, reopening the same storage on repeat calls."""
+    caches = []
+
+    def make(**kwargs):
+        path = tmp_path / ("cache.db" if request.param == "sqlite" else "cache")
+        cache = create_response_cache(request.param, path=path, **kwargs)
+        caches.append(cache)
+        return cache
+
+    make.backend = request.param
+    yield make
+    for cache in caches:
+        cache.close()
+
+
+class TestBackends:
+    """Behaviour shared by every backend."""
+
+    def test_round_trip_and_stats(self, make_cache):
+        """Test that stored responses come back intact and lookups are counted."""
+        cache = make_cache()
+
+        assert cache.get("k") is None
+        cache.set("k", _response("hello"))
+        hit = cache.get("k")
+
+        assert hit.content == "hello" and hit.usage == {"total_tokens": 3}
+        assert len(cache) == 1
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    def test_ttl_expires_entries(self, make_cache, monkeypatch):
+        """Test that entries older than the TTL are misses and are removed."""
+        clock = FakeClock()
+        monkeypatch.setattr(response_cache, "time", clock)
+        cache = make_cache(ttl_seconds=10)
+        cache.set("k", _response("old"))
+
+        clock.now += 5
+        assert cache.get("k").content == "old"
+        clock.now += 10
+        assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self, make_cache, monkeypatch):
+        """Test that the least recently used entry is evicted at the bound."""
+        if make_cache.backend == "disk":
+            pytest.skip("disk backend evicts by file mtime in sweeps")
+        clock = FakeClock()
+        monkeypatch.setattr(response_cache, "time", clock)
+        cache = make_cache(max_entries=2)
+        for key in ("a", "b"):
+            clock.now += 1
+            cache.set(key, _response(key))
+        clock.now += 1
+        cache.get("a")
+        clock.now += 1
+        cache.set("c", _response("c"))
+
+        assert cache.get("b") is None
+        assert cache.get("a").content == "a" and cache.get("c").content == "c"
+        assert cache.stats.evictions == 1
+
+    def test_persistent_backends_survive_reopen(self, make_cache):
+        """Test that SQLite and disk entries are visible to a new instance."""
+        if make_cache.backend == "memory":
+            pytest.skip("memory backend is per process")
+        first = make_cache()
+        first.set("k", _response("kept"))
+        first.close()
+
+        second = make_cache()
+
+        assert second.persistent
+        assert second.get("k").content == "kept"
+        assert len(second) == 1
+
+
+class TestDiskAndSQLite:
+    """Backend-specific behaviour."""
+
+    def test_disk_sweep_evicts_oldest(self, tmp_path):
+        """Test that the disk backend drops the oldest files once over the bound."""
+        cache = DiskResponseCache(tmp_path, max_entries=3)
+        for age, key in enumerate(("k1", "k2", "k3", "k4")):
+            cache.set(key, _response(key))
+            # Explicit mtimes so coarse filesystem clocks cannot tie
+            os.utime(cache._path(key), (1000 + age, 1000 + age))
+
+        assert len(cache) == 3
+        assert cache.get("k1") is None and cache.get("k4") is not None
+
+    def test_sqlite_delete_of_missing_row_keeps_count(self, tmp_path):
+        """Test that deleting an absent key does not let the count drift below the table size."""
+        cache = SQLiteResponseCache(tmp_path / "cache.db", max_entries=1)
+        for _ in range(3):
+            cache._delete("missing")
+        for key in ("a", "b", "c"):
+            cache.set(key, _response(key))
+
+        assert len(cache) == 1
+        cache.close()
+
+
+class TestCacheKey:
+    """Tests for cache_key."""
+
+    def test_key_covers_endpoint_and_sampling(self):
+        """Test that endpoint and temperature change the key; a trailing slash does not."""
+        greedy = LLMRequest.simple("hi", model="m", temperature=0.0)
+        sampled = LLMRequest.simple("hi", model="m", temperature=0.7)
+
+        local = cache_key("ollama", greedy, "http://a:11434")
+        assert local == cache_key("OLLAMA", greedy, "http://a:11434/")
+        assert local != cache_key("ollama", greedy, "http://b:11434")
+        assert local != cache_key("ollama", sampled, "http://a:11434")
+
+
+class CountingProvider:
+    """Provider stub that counts completions."""
+
+    def __init__(self):
+        self.calls = 0
+        self.http_client = None
+
+    async def complete(self, request):
+        self.calls += 1
+        return _response(f"sample {self.calls}")
+
+    async def stream(self, request, status=None):
+        response = await self.complete(request)
+        if status is not None:
+            status.complete = True
+        yield response.content
+
+
+def _client(cache, temperature: float) -> LLMClient:
+    client = LLMClient(ResourceLLM(provider="template", model="m", temperature=temperature), cache=cache)
+    client.provider = CountingProvider()
+    return client
+
+
+async def _complete_twice(client: LLMClient, temperature: float):
+    request = LLMRequest.simple("hi", model="m", temperature=temperature)
+    return [(await client.complete(request)).content for _ in range(2)]
+
+
+class TestLLMClientCaching:
+    """Tests for when LLMClient consults the cache."""
+
+    def test_sampled_requests_bypass_cache_by_default(self):
+        """Test that non-zero temperature completions are not frozen."""
+        client = _client(MemoryResponseCache(), 0.7)
+
+        contents = asyncio.run(_complete_twice(client, 0.7))
+
+        assert contents == ["sample 1", "sample 2"]
+        assert client.cache_stats.bypassed == 2 and client.cache_stats.hits == 0
+
+    def test_greedy_requests_are_cached(self):
+        """Test that temperature 0 completions are served from the cache."""
+        client = _client(MemoryResponseCache(), 0.0)
+
+        contents = asyncio.run(_complete_twice(client, 0.0))
+
+        assert contents == ["sample 1", "sample 1"]
+        assert client.provider.calls == 1 and client.cache_stats.hits == 1
+
+    def test_sampled_requests_cached_when_opted_in(self):
+        """Test that include_sampled caches non-zero temperature completions."""
+        client = _client(MemoryResponseCache(include_sampled=True), 0.7)
+
+        assert asyncio.run(_complete_twice(client, 0.7)) == ["sample 1", "sample 1"]
+
+    def test_persistent_backend_io_runs_off_the_event_loop(self):
+        """Test that persistent cache reads and writes happen in a worker thread."""
+        threads = []
+
+        class RecordingCache(MemoryResponseCache):
+            persistent = True
+
+            def _load(self, key):
+                threads.append(threading.get_ident())
+                return super()._load(key)
+
+            def _store(self, key, payload, created_at):
+                threads.append(threading.get_ident())
+                return super()._store(key, payload, created_at)
+
+        client = _client(RecordingCache(), 0.0)
+
+        asyncio.run(_complete_twice(client, 0.0))
+
+        assert len(threads) == 3
+        assert threading.get_ident() not in threads
+
+
+class TestCLIFlags:
+    """Tests for the --cache command line options."""
+
+    def test_flags_build_configured_cache(self, tmp_path):
+        """Test that every cache flag reaches the backend."""
+        parsed = create_parser().parse_args([
+            "run", "simple_qa",
+            "--cache", "sqlite",
+            "--cache-path", str(tmp_path / "llm.db"),
+            "--cache-ttl", "60",
+            "--cache-max-entries", "5",
+            "--cache-sampled",
+        ])
+
+        cache = _build_response_cache(parsed)
+
+        assert isinstance(cache, SQLiteResponseCache)
+        assert cache.path == tmp_path / "llm.db"
+        assert (cache.ttl_seconds, cache.max_entries, cache.include_sampled) == (60.0, 5, True)
+        cache.close()
+
+    def test_no_cache_flag_means_no_cache(self):
+        """Test that caching stays off without --cache, including for run-batch."""
+        assert _build_response_cache(create_parser().parse_args(["run", "simple_qa"])) is None
+        parsed = create_parser().parse_args(["run-batch", "requests.jsonl", "--cache", "memory"])
+        cache = _build_response_cache(parsed)
+        assert isinstance(cache, MemoryResponseCache) and not cache.include_sampled
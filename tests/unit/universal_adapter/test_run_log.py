@@ -0,0 +1,157 @@
+"""
+Tests for the background JSONL run log writer.
+"""
+
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add src directory to path
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+SRC_PATH = PROJECT_ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from universal_adapter import logger as run_log
+from universal_adapter.logger import RunLogWriter
+
+
+def _lines(path: Path) -> list[str]:
+    return path.read_text(encoding="utf-8").splitlines() if path.exists() else []
+
+
+@pytest.fixture
+def make_writer(tmp_path):
+    """Factory for writers on tmp_path/runs.jsonl, closed after the test."""
+    writers = []
+
+    def make(**kwargs):
+        writer = RunLogWriter(tmp_path / "runs.jsonl", **kwargs)
+        writers.append(writer)
+        return writer
+
+    yield make
+    for writer in writers:
+        writer.close()
+
+
+class TestFlushAndClose:
+    """Ordering guarantees of flush() and close()."""
+
+    def test_flush_waits_for_every_queued_line(self, make_writer):
+        """Test that flush returns only after all earlier lines are on disk, in order."""
+        writer = make_writer(batch_size=7, flush_interval=60)
+        for i in range(50):
+            assert writer.write(f"{i}\n")
+
+        assert writer.flush(timeout=5)
+        assert _lines(writer.path) == [str(i) for i in range(50)]
+        assert writer.written == 50
+
+    def test_close_drains_and_rejects_later_writes(self, make_writer):
+        """Test that close writes pending lines and later writes are dropped."""
+        writer = make_writer(flush_interval=60)
+        writer.write("before\n")
+
+        writer.close()
+
+        assert _lines(writer.path) == ["before"]
+        assert writer.write("after\n") is False
+        assert writer.flush(timeout=1)
+        writer.close()
+        assert _lines(writer.path) == ["before"]
+
+
+class TestRotation:
+    """Size-based rotation."""
+
+    def test_rotates_and_keeps_backup_count(self, make_writer):
+        """Test that full files move to path.1 … path.N and older ones are removed."""
+        writer = make_writer(batch_size=1, max_bytes=10, backup_count=2)
+        for i in range(10):
+            writer.write(f"line-{i}\n")
+        writer.flush(timeout=5)
+
+        path = writer.path
+        assert _lines(path) == ["line-9"]
+        assert _lines(path.with_name("runs.jsonl.1")) == ["line-8"]
+        assert _lines(path.with_name("runs.jsonl.2")) == ["line-7"]
+        assert not path.with_name("runs.jsonl.3").exists()
+
+    def test_no_backups_truncates(self, make_writer):
+        """Test that backup_count=0 starts a fresh file instead of keeping one."""
+        writer = make_writer(batch_size=1, max_bytes=10, backup_count=0)
+        for i in range(3):
+            writer.write(f"line-{i}\n")
+        writer.flush(timeout=5)
+
+        assert _lines(writer.path) == ["line-2"]
+        assert not writer.path.with_name("runs.jsonl.1").exists()
+
+
+class TestQueueFull:
+    """Behaviour when the writer falls behind."""
+
+    def test_full_queue_drops_and_counts(self, make_writer):
+        """Test that writes beyond max_queue are dropped without blocking."""
+        writer = make_writer(max_queue=2, batch_size=1)
+        with writer._lock:
+            writer.write("0\n")
+            deadline = time.monotonic() + 5
+            while not writer._queue.empty() and time.monotonic() < deadline:
+                time.sleep(0.005)
+            # The writer thread now holds "0" and waits for the file lock
+            accepted = [writer.write(f"{i}\n") for i in (1, 2, 3)]
+
+        assert accepted == [True, True, False]
+        assert writer.dropped == 1
+        assert writer.flush(timeout=5)
+        assert _lines(writer.path) == ["0", "1", "2"]
+
+
+class TestEnvironment:
+    """Writer configuration from UNIVERSAL_ADAPTER_LOG_* variables."""
+
+    @pytest.fixture
+    def shared_writer(self, tmp_path, monkeypatch):
+        """Point the shared writer at tmp_path and close it afterwards."""
+        monkeypatch.setattr(run_log, "RUN_LOG", tmp_path / "adapter_runs.jsonl")
+        monkeypatch.setattr(run_log, "_writer", None)
+        monkeypatch.delenv("UNIVERSAL_ADAPTER_LOG_SYNC", raising=False)
+        yield tmp_path / "adapter_runs.jsonl"
+        if run_log._writer is not None:
+            run_log._writer.close()
+
+    def test_invalid_fsync_falls_back_to_never(self, shared_writer, monkeypatch, caplog):
+        """Test that a bad fsync policy warns once and events are still written."""
+        monkeypatch.setenv("UNIVERSAL_ADAPTER_LOG_FSYNC", "always")
+        monkeypatch.setenv("UNIVERSAL_ADAPTER_LOG_MAX_BYTES", "lots")
+
+        with caplog.at_level(logging.WARNING, logger="universal_adapter"):
+            run_log.log_run_event({"event": "a"})
+            run_log.log_run_event({"event": "b"})
+
+        writer = run_log._writer
+        assert (writer.fsync, writer.max_bytes) == ("never", 50 * 1024 * 1024)
+        assert len(caplog.records) == 2
+        assert run_log.flush_run_log()
+        assert [json.loads(line)["event"] for line in _lines(shared_writer)] == ["a", "b"]
+
+    def test_sync_flag_spellings(self, shared_writer, monkeypatch):
+        """Test that 1/true/yes write inline and other values use the writer."""
+        inline = []
+        monkeypatch.setattr(run_log, "log_run_event_sync", inline.append)
+        for value in ("1", "true", "YES"):
+            monkeypatch.setenv("UNIVERSAL_ADAPTER_LOG_SYNC", value)
+            run_log.log_run_event({"event": value})
+        assert run_log._writer is None
+
+        monkeypatch.setenv("UNIVERSAL_ADAPTER_LOG_SYNC", "0")
+        run_log.log_run_event({"event": "queued"})
+
+        assert [event["event"] for event in inline] == ["1", "true", "YES"]
+        assert run_log._writer is not None
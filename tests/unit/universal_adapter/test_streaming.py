@@ -0,0 +1,296 @@
+"""
+Tests for streamed completions, incremental categorization and early exit.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src directory to path
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+SRC_PATH = PROJECT_ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from universal_adapter import core
+from universal_adapter.core import AdapterConfig, UniversalAdapter
+from universal_adapter.engine.llm_client import (
+    AnthropicProvider,
+    LLMClient,
+    LLMError,
+    LLMRateLimitError,
+    LLMRequest,
+    OpenAIProvider,
+    StreamStatus,
+    TemplateProvider,
+)
+from universal_adapter.engine.response_cache import MemoryResponseCache
+from universal_adapter.evaluator.categorizer import CategoryCriteria, MatchStrategy, ResponseCategorizer
+from universal_adapter.schema import ResourceLLM, TaskSchema
+
+
+async def _lines(*lines):
+    for line in lines:
+        yield line
+
+
+async def _deltas(text: str, size: int = 1):
+    for i in range(0, len(text), size):
+        yield text[i:i + size]
+
+
+def _drain(stream) -> list:
+    async def collect():
+        return [delta async for delta in stream]
+    return asyncio.run(collect())
+
+
+def _json_router() -> ResponseCategorizer:
+    return ResponseCategorizer(
+        criteria=[
+            CategoryCriteria(name="ok", strategy=MatchStrategy.JSON_FIELD, json_path="status",
+                             expected_value="ok", priority=2),
+            CategoryCriteria(name="yes", strategy=MatchStrategy.PATTERN, pattern=r"^yes\b", priority=1),
+        ],
+        default_category="other",
+    )
+
+
+class TestIncrementalAgreesWithEvaluate:
+    """Early commits must never disagree with evaluating the full text."""
+
+    RESPONSES = [
+        '{"status": "ok", "x": oops',
+        '{"status": "ok", "status": "fail"}',
+        '{"status": "ok"} and some chatter',
+        '{"status": "ok"',
+        '{"status": "ok"}\n',
+        '{"status": "fail", "detail": {"status": "ok"}}',
+        '{"items": [1, 2], "status": "ok"}',
+        'yes, and {"status": "ok"}',
+        'no',
+    ]
+
+    def test_stream_category_matches_full_evaluation(self):
+        """Test every response split into single characters and into chunks."""
+        categorizer = _json_router()
+        for response in self.RESPONSES:
+            expected = categorizer.evaluate(response).category
+            for size in (1, 3, len(response)):
+                result = asyncio.run(categorizer.evaluate_stream(_deltas(response, size)))
+                assert result.category == expected, (response, size)
+
+    def test_reported_divergence_no_longer_commits_early(self):
+        """Test that an invalid JSON tail is not committed as a match."""
+        categorizer = _json_router()
+        state = categorizer.incremental()
+
+        assert all(state.feed(ch) is None for ch in '{"status": "ok", "x": oops')
+        assert state.finish().category == "other"
+
+    def test_complete_mismatching_object_is_excluded_early(self):
+        """Test that a finished object with another value lets lower criteria decide."""
+        categorizer = ResponseCategorizer(
+            criteria=[
+                CategoryCriteria(name="ok", strategy=MatchStrategy.JSON_FIELD, json_path="result.status",
+                                 expected_value="ok", priority=1),
+                CategoryCriteria(name="fallback", strategy=MatchStrategy.ALWAYS, priority=0),
+            ],
+        )
+        body = '{"result": {"status": "fail"}}'
+        state = categorizer.incremental()
+
+        committed = [state.feed(ch) for ch in body]
+
+        assert committed[-1].category == "fallback"
+        assert all(item is None for item in committed[:-1])
+
+    def test_edge_label_keywords_commit_only_the_first_label(self):
+        """Test that only the highest-priority keyword label settles before the end."""
+        categorizer = ResponseCategorizer.from_edge_labels(["approve", "reject"])
+
+        first = categorizer.incremental()
+        second = categorizer.incremental()
+
+        assert first.feed("I approve") is not None
+        assert second.feed("I reject this") is None
+        assert second.finish().category == "reject"
+
+
+class TestProviderStreams:
+    """SSE parsing, completion markers and error events."""
+
+    def test_anthropic_complete_stream(self):
+        """Test that message_stop marks the stream complete with its stop reason."""
+        status = StreamStatus()
+        lines = _lines(
+            "event: content_block_delta",
+            'data: {"type": "content_block_delta", "delta": {"type": "text_delta", "text": "Hel"}}',
+            'data: {"type": "content_block_delta", "delta": {"type": "text_delta", "text": "lo"}}',
+            'data: {"type": "message_delta", "delta": {"stop_reason": "end_turn"}}',
+            'data: {"type": "message_stop"}',
+        )
+
+        assert _drain(AnthropicProvider("key")._parse_stream(lines, status)) == ["Hel", "lo"]
+        assert status.complete and status.finish_reason == "end_turn"
+
+    def test_anthropic_truncated_stream_is_incomplete(self):
+        """Test that a stream ending without message_stop is not marked complete."""
+        status = StreamStatus()
+        lines = _lines('data: {"type": "content_block_delta", "delta": {"text": "Hel"}}')
+
+        assert _drain(AnthropicProvider("key")._parse_stream(lines, status)) == ["Hel"]
+        assert not status.complete
+
+    def test_anthropic_error_events_raise(self):
+        """Test that error events raise instead of ending the stream quietly."""
+        overloaded = _lines(
+            'data: {"type": "content_block_delta", "delta": {"text": "Hel"}}',
+            'data: {"type": "error", "error": {"type": "overloaded_error", "message": "Overloaded"}}',
+        )
+        limited = _lines('data: {"type": "error", "error": {"type": "rate_limit_error", "message": "slow"}}')
+
+        with pytest.raises(LLMError, match="overloaded_error"):
+            _drain(AnthropicProvider("key")._parse_stream(overloaded))
+        with pytest.raises(LLMRateLimitError):
+            _drain(AnthropicProvider("key")._parse_stream(limited))
+
+    def test_openai_done_and_errors(self):
+        """Test [DONE] completion, error payloads and malformed JSON for OpenAI."""
+        status = StreamStatus()
+        complete = _lines(
+            'data: {"choices": [{"delta": {"content": "Hi"}, "finish_reason": null}]}',
+            'data: {"choices": [{"delta": {}, "finish_reason": "length"}]}',
+            "data: [DONE]",
+        )
+
+        assert _drain(OpenAIProvider("key")._parse_stream(complete, status)) == ["Hi"]
+        assert status.complete and status.finish_reason == "length"
+        with pytest.raises(LLMError, match="server_error"):
+            _drain(OpenAIProvider("key")._parse_stream(_lines('data: {"error": {"message": "server_error"}}')))
+        for provider in (OpenAIProvider("key"), AnthropicProvider("key")):
+            with pytest.raises(LLMError, match="malformed"):
+                _drain(provider._parse_stream(_lines("data: {not json")))
+
+
+class ScriptedProvider(TemplateProvider):
+    """Streams fixed deltas and records whether generation was cut short."""
+
+    def __init__(self, deltas, complete=True, error=None):
+        self.deltas = deltas
+        self.complete_stream = complete
+        self.error = error
+        self.calls = 0
+        self.sent = 0
+        self.closed_early = False
+
+    async def stream(self, request, status=None):
+        self.calls += 1
+        try:
+            for delta in self.deltas:
+                self.sent += 1
+                yield delta
+            if self.error:
+                raise self.error
+            if status is not None and self.complete_stream:
+                status.complete = True
+                status.finish_reason = "end_turn"
+        except GeneratorExit:
+            self.closed_early = True
+            raise
+
+
+def _client(provider) -> LLMClient:
+    client = LLMClient(ResourceLLM(provider="template", model="m", temperature=0.0), cache=MemoryResponseCache())
+    client.provider = provider
+    return client
+
+
+def _request() -> LLMRequest:
+    return LLMRequest.simple("route this", model="m", temperature=0.0)
+
+
+class TestStreamCaching:
+    """LLMClient.stream caches only confirmed-complete responses."""
+
+    def test_complete_stream_is_cached_and_replayed(self):
+        """Test that a confirmed stream is stored with its finish reason."""
+        provider = ScriptedProvider(["a", "b"])
+        client = _client(provider)
+
+        first = _drain(client.stream(_request()))
+        second = _drain(client.stream(_request()))
+
+        assert first == ["a", "b"] and second == ["ab"]
+        assert provider.calls == 1
+        cached = client.cache.get(client._cache_key(_request()))
+        assert cached.finish_reason == "end_turn"
+
+    def test_truncated_stream_is_not_cached(self):
+        """Test that a stream without an end marker is served but not stored."""
+        provider = ScriptedProvider(["partial"], complete=False)
+        client = _client(provider)
+
+        _drain(client.stream(_request()))
+        _drain(client.stream(_request()))
+
+        assert provider.calls == 2
+        assert len(client.cache) == 0
+
+    def test_error_stream_raises_and_is_not_cached(self):
+        """Test that provider errors propagate and leave the cache empty."""
+        client = _client(ScriptedProvider(["partial"], error=LLMError("overloaded")))
+
+        with pytest.raises(LLMError):
+            _drain(client.stream(_request()))
+        assert len(client.cache) == 0
+
+    def test_early_exit_cancels_generation_without_caching(self):
+        """Test that committing a category closes the provider stream and skips the cache."""
+        provider = ScriptedProvider(["approve", " it", " and", " more"])
+        client = _client(provider)
+        categorizer = ResponseCategorizer.from_edge_labels(["approve", "reject"])
+
+        result = asyncio.run(categorizer.evaluate_stream(client.stream(_request())))
+
+        assert result.category == "approve"
+        assert result.response == "approve" and result.metadata["early_exit"]
+        assert provider.closed_early and provider.sent == 1
+        assert len(client.cache) == 0
+
+
+class TestPromptEarlyExit:
+    """The prompt.early_exit path through UniversalAdapter."""
+
+    def test_router_prompt_stores_committed_prefix(self, monkeypatch):
+        """Test that an early-exit prompt branches on the prefix and cancels the stream."""
+        provider = ScriptedProvider(["approve", " this", " and", " keep", " talking"])
+        monkeypatch.setattr(LLMClient, "_create_provider", lambda self: provider)
+        events = []
+        monkeypatch.setattr(core, "log_run_event", events.append)
+        task = TaskSchema.from_dict({
+            "name": "router",
+            "version": "1.0.0",
+            "goal": {
+                "description": "route",
+                "target_conditions": [
+                    {"description": "done", "evaluation_type": "ITERATION_LIMIT", "expected_value": "5"},
+                ],
+            },
+            "resource_llm": {"provider": "template", "model": "t", "temperature": 0},
+            "resource_registry": {"entries": []},
+            "prompts": [{"template": "Approve or reject?", "early_exit": True}],
+            "flow_diagram": {
+                "mermaid": "graph TD\n    START --> P0\n    P0 -->|approve| GOAL\n    P0 -->|reject| GOAL\n"
+                           "    GOAL -->|goal_met| END\n    GOAL -->|goal_failed| END",
+            },
+        })
+
+        result = asyncio.run(UniversalAdapter(AdapterConfig()).execute(task))
+
+        assert result.success
+        assert result.execution_result.final_state.responses["P0"] == "approve"
+        assert provider.closed_early and provider.sent == 1
+        assert len(events) == 1
@@ -0,0 +1,175 @@
+"""
+Tests for the task library cache, persisted index and file watcher.
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add src directory to path
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+SRC_PATH = PROJECT_ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from universal_adapter import task_library
+from universal_adapter.task_library import TaskLibrary
+
+EXAMPLE = SRC_PATH / "universal_adapter" / "examples" / "simple_qa_task.json"
+
+
+def _write_task(path: Path, description: str, mtime: int) -> None:
+    data = json.loads(EXAMPLE.read_text(encoding="utf-8"))
+    data["goal"]["description"] = description
+    path.write_text(json.dumps(data), encoding="utf-8")
+    # Explicit mtimes so coarse filesystem clocks cannot hide an edit
+    os.utime(path, ns=(mtime, mtime))
+
+
+@pytest.fixture
+def task_file(tmp_path):
+    path = tmp_path / "qa.json"
+    _write_task(path, "first", 1_000_000_000)
+    return path
+
+
+def _library(task_file: Path, index_path=None) -> TaskLibrary:
+    return TaskLibrary({"qa": str(task_file)}, index_path=index_path)
+
+
+class TestInvalidation:
+    """Re-reading task files only when they change."""
+
+    def test_unchanged_file_reuses_schema(self, task_file):
+        """Test that repeated loads return the same parsed schema."""
+        library = _library(task_file)
+
+        assert library.load("qa") is library.load("qa")
+
+    def test_edit_is_picked_up(self, task_file):
+        """Test that a new mtime and size trigger a re-read."""
+        library = _library(task_file)
+        assert library.load("qa").goal.description == "first"
+
+        _write_task(task_file, "second, longer", 2_000_000_000)
+
+        assert library.load("qa").goal.description == "second, longer"
+        assert library.describe("qa").description == "second, longer"
+
+    def test_touch_without_edit_keeps_parsed_result(self, task_file):
+        """Test that a changed mtime with identical content is resolved by hash."""
+        library = _library(task_file)
+        schema = library.load("qa")
+        sha = library.describe("qa").sha256
+
+        os.utime(task_file, ns=(3_000_000_000, 3_000_000_000))
+
+        assert library.load("qa") is schema
+        meta = library.describe("qa")
+        assert (meta.sha256, meta.mtime_ns) == (sha, 3_000_000_000)
+
+
+class TestErrors:
+    """Error entries for missing and invalid task files."""
+
+    def test_missing_and_invalid_files(self, task_file):
+        """Test that errors are reported, indexed, and cleared once the file is fixed."""
+        library = _library(task_file)
+        task_file.write_text("{not json", encoding="utf-8")
+
+        with pytest.raises(ValueError, match="Invalid task 'qa'"):
+            library.load("qa")
+        assert not library.describe("qa").available
+
+        task_file.unlink()
+        with pytest.raises(FileNotFoundError):
+            library.load("qa")
+
+        _write_task(task_file, "restored", 4_000_000_000)
+        assert library.load("qa").goal.description == "restored"
+        assert library.describe("qa").available
+
+    def test_unknown_task(self, task_file):
+        """Test that unknown names list the available tasks."""
+        with pytest.raises(ValueError, match="Available: qa"):
+            _library(task_file).load("nope")
+
+
+class TestIndex:
+    """The persisted JSON index."""
+
+    def test_fresh_library_loads_from_index(self, task_file, tmp_path, monkeypatch):
+        """Test that a new library serves unchanged tasks without reading them."""
+        index = tmp_path / "index.json"
+        assert _library(task_file, index).refresh() == 1
+
+        def fail(*args):
+            raise AssertionError("task file re-read")
+
+        monkeypatch.setattr(TaskLibrary, "_read", staticmethod(fail))
+        fresh = _library(task_file, index)
+
+        assert fresh.describe_all()[0].description == "first"
+        assert fresh.load("qa").goal.description == "first"
+        assert fresh.refresh() == 0
+
+    def test_load_does_not_rewrite_index(self, task_file, tmp_path):
+        """Test that only refresh() and describe_all() persist changes."""
+        index = tmp_path / "index.json"
+        library = _library(task_file, index)
+        library.describe_all()
+        saved = index.read_text(encoding="utf-8")
+
+        _write_task(task_file, "edited", 5_000_000_000)
+        assert library.load("qa").goal.description == "edited"
+        assert index.read_text(encoding="utf-8") == saved
+
+        assert library.refresh() == 0
+        assert json.loads(index.read_text(encoding="utf-8"))["tasks"]["qa"]["description"] == "edited"
+
+    def test_stale_index_version_is_ignored(self, task_file, tmp_path):
+        """Test that an index from another format version is not trusted."""
+        index = tmp_path / "index.json"
+        index.write_text(json.dumps({"version": task_library.INDEX_VERSION + 1,
+                                     "tasks": {"qa": {"name": "qa", "path": "x"}}}))
+
+        assert _library(task_file, index).refresh() == 1
+
+
+class TestWatcher:
+    """Watching task files instead of stat-checking every call."""
+
+    def test_polling_watcher_reports_edits(self, task_file, monkeypatch):
+        """Test that the polling watcher marks edited files for re-reading."""
+        monkeypatch.setitem(sys.modules, "watchdog", None)
+        library = _library(task_file)
+        library.load("qa")
+        library.watch(poll_interval=0.01)
+        try:
+            assert isinstance(library._watcher, task_library._PollingWatcher)
+            _write_task(task_file, "watched edit", 6_000_000_000)
+            deadline = time.monotonic() + 5
+            while "qa" not in library._changed and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            assert library.load("qa").goal.description == "watched edit"
+        finally:
+            library.unwatch()
+        assert library._watcher is None
+
+    def test_watched_entries_skip_stat(self, task_file, monkeypatch):
+        """Test that unchanged entries are trusted while a watcher runs."""
+        monkeypatch.setitem(sys.modules, "watchdog", None)
+        library = _library(task_file)
+        schema = library.load("qa")
+        library.watch(poll_interval=60)
+        try:
+            monkeypatch.setattr(Path, "stat", lambda self: pytest.fail("stat while watched"))
+            assert library.load("qa") is schema
+        finally:
+            monkeypatch.undo()
+            library.unwatch()